@@ -0,0 +1,385 @@
+class_name EmojiIndex
+extends RefCounted
+
+## Emoji -> biome / faction inverted index
+## Generated by tools/emoji_index.py from biomes_merged.json and factions_merged.json
+## Do not edit by hand; re-run the tool after changing the merged data.
+
+const BIOMES_SHA256 = "492815ec68e056e28d1b5a7d91bcfe5e4c2d806839ce9648c9abbc9114a54ba3"
+const FACTIONS_SHA256 = "15c3787b435e8e77c98c7e2cb7d6092a726acb80b24185ecc452df7888632136"
+
+const EMOJI_TO_BIOMES = {
+	"everything": ["_orphan_lindblads"],
+	"☀": ["BioticFlux", "FungalNetworks", "StarterForest"],
+	"♟": ["BureaucraticAbyss"],
+	"♻": ["_orphan_lindblads", "Workshop", "ScrapYard"],
+	"⚓": ["Harbor"],
+	"⚔": ["_orphan_lindblads", "Battlefield"],
+	"⚖": ["_orphan_lindblads", "Archives"],
+	"⚙": ["CyberDebtMegacity", "StellarForges", "Village", "PowerStation"],
+	"⚜": ["GildedRot"],
+	"⚡": ["StellarForges", "PowerStation", "MagneticAnomaly", "AntimatterFoundry"],
+	"⚫": ["HorizonFracture", "AntimatterFoundry"],
+	"⚱": ["_orphan_lindblads", "OccultSanctum", "ShrineOfAshes", "Battlefield"],
+	"⛏": ["VolcanicWorlds"],
+	"⛓": ["CyberDebtMegacity", "BureaucraticAbyss", "EnforcementPost"],
+	"✊": ["_orphan_lindblads", "RevolutionSquare"],
+	"✨": ["VolcanicWorlds", "TidalPools", "AntimatterFoundry"],
+	"❄": ["Village"],
+	"⭐": ["_orphan_lindblads", "SatelliteGraveyard", "OrbitalStrike"],
+	"🌀": ["EchoingChasm", "HorizonFracture", "TidalPools", "MagneticAnomaly", "AntimatterFoundry"],
+	"🌊": ["TidalPools", "FreshwaterSpring"],
+	"🌑": ["EchoingChasm", "MirrorChamber"],
+	"🌙": ["BioticFlux", "FungalNetworks", "StarterForest"],
+	"🌠": ["HorizonFracture"],
+	"🌫": ["VolcanicWorlds"],
+	"🌱": ["StarterForest"],
+	"🌲": ["StarterForest", "Woodlot"],
+	"🌹": ["GildedRot"],
+	"🌾": ["BioticFlux", "Apiary"],
+	"🌿": ["StarterForest", "PastoralCommons", "Apiary"],
+	"🍂": ["BioticFlux", "FungalNetworks", "StarterForest"],
+	"🍄": ["BioticFlux", "FungalNetworks"],
+	"🍞": ["Village"],
+	"🍷": ["GildedRot"],
+	"🎭": ["GildedRot"],
+	"🎵": ["_orphan_lindblads", "BroadcastTower"],
+	"🎶": ["EchoingChasm"],
+	"🏚": ["_orphan_lindblads", "AbandonedQuarter"],
+	"🏛": ["_orphan_lindblads", "AbandonedQuarter"],
+	"🏭": ["_orphan_lindblads", "ScrapYard"],
+	"🏮": ["_orphan_lindblads", "MeditationGarden", "OccultSanctum"],
+	"🏰": ["_orphan_lindblads", "ForgottenCastle"],
+	"🏷": ["_orphan_lindblads", "MarketDistrict"],
+	"🏺": ["_orphan_lindblads", "AbandonedQuarter"],
+	"🐂": ["_orphan_lindblads", "MarketDistrict", "TradingFloor"],
+	"🐇": ["StarterForest", "TrappersCamp"],
+	"🐑": ["_orphan_lindblads", "PastoralCommons"],
+	"🐙": ["TidalPools"],
+	"🐚": ["TidalPools"],
+	"🐜": ["FungalNetworks"],
+	"🐝": ["_orphan_lindblads", "PastoralCommons", "Apiary"],
+	"🐠": ["TidalPools"],
+	"🐺": ["StarterForest"],
+	"🐻": ["_orphan_lindblads", "MarketDistrict", "TradingFloor"],
+	"👁": ["TidalPools"],
+	"👑": ["GildedRot"],
+	"👘": ["_orphan_lindblads", "WeaversLoft"],
+	"👤": ["_orphan_lindblads", "MirrorChamber"],
+	"👥": ["CyberDebtMegacity", "Village", "BureaucraticAbyss"],
+	"💀": ["BioticFlux", "CyberDebtMegacity", "BureaucraticAbyss", "ShrineOfAshes", "Battlefield"],
+	"💃": ["GildedRot"],
+	"💉": ["_orphan_lindblads", "Clinic"],
+	"💊": ["_orphan_lindblads", "Clinic"],
+	"💎": ["VolcanicWorlds"],
+	"💥": ["Battlefield", "OrbitalStrike", "DemolitionSite", "AntimatterFoundry"],
+	"💧": ["_orphan_lindblads", "Harbor", "FreshwaterSpring"],
+	"💨": ["Village"],
+	"💫": ["EchoingChasm"],
+	"💰": ["CyberDebtMegacity", "Village", "MarketDistrict"],
+	"💱": ["_orphan_lindblads", "MarketDistrict", "TradingFloor"],
+	"💳": ["_orphan_lindblads", "MarketDistrict"],
+	"💸": ["CyberDebtMegacity"],
+	"📊": ["_orphan_lindblads", "TradingFloor"],
+	"📋": ["_orphan_lindblads", "Archives", "EnforcementPost"],
+	"📍": ["HorizonFracture"],
+	"📐": ["_orphan_lindblads", "Archives"],
+	"📒": ["_orphan_lindblads", "Archives"],
+	"📖": ["BureaucraticAbyss"],
+	"📘": ["_orphan_lindblads", "Archives"],
+	"📜": ["TidalPools", "BureaucraticAbyss", "GildedRot", "RevolutionSquare", "ForgottenCastle"],
+	"📡": ["_orphan_lindblads", "BroadcastTower", "MagneticAnomaly"],
+	"📦": ["_orphan_lindblads", "MarketDistrict"],
+	"📶": ["_orphan_lindblads", "BroadcastTower"],
+	"📼": ["_orphan_lindblads", "SatelliteGraveyard"],
+	"📿": ["_orphan_lindblads", "BindingCircle", "MeditationGarden", "ShrineOfAshes"],
+	"🔇": ["EchoingChasm"],
+	"🔊": ["_orphan_lindblads", "BroadcastTower"],
+	"🔋": ["StellarForges", "PowerStation"],
+	"🔌": ["_orphan_lindblads", "Workshop", "PowerStation"],
+	"🔓": ["_orphan_lindblads", "EnforcementPost"],
+	"🔔": ["EchoingChasm"],
+	"🔥": ["Village", "VolcanicWorlds", "DemolitionSite", "Woodlot"],
+	"🔧": ["_orphan_lindblads", "Workshop"],
+	"🔨": ["_orphan_lindblads", "Workshop"],
+	"🔩": ["StellarForges"],
+	"🔭": ["HorizonFracture"],
+	"🕯": ["EchoingChasm", "BindingCircle", "MeditationGarden", "OccultSanctum", "ShrineOfAshes", "MirrorChamber"],
+	"🕰": ["BureaucraticAbyss"],
+	"🕳": ["HorizonFracture", "AntimatterFoundry"],
+	"🕴": ["_orphan_lindblads", "MarketDistrict"],
+	"🕵": ["CyberDebtMegacity"],
+	"🕸": ["EchoingChasm"],
+	"🖋": ["BureaucraticAbyss"],
+	"🗃": ["BureaucraticAbyss"],
+	"🗑": ["_orphan_lindblads", "ScrapYard"],
+	"🗝": ["CyberDebtMegacity"],
+	"🗣": ["_orphan_lindblads", "BroadcastTower", "RevolutionSquare"],
+	"🗺": ["HorizonFracture"],
+	"🚀": ["CyberDebtMegacity", "StellarForges", "OrbitalStrike"],
+	"🚔": ["_orphan_lindblads", "EnforcementPost"],
+	"🚧": ["_orphan_lindblads", "ScrapYard"],
+	"🚩": ["_orphan_lindblads", "RevolutionSquare"],
+	"🚫": ["_orphan_lindblads", "Clinic"],
+	"🛡": ["_orphan_lindblads", "Battlefield"],
+	"🛰": ["_orphan_lindblads", "SatelliteGraveyard"],
+	"🛶": ["_orphan_lindblads", "Harbor"],
+	"🛸": ["StellarForges", "OrbitalStrike"],
+	"🤲": ["_orphan_lindblads", "PastoralCommons"],
+	"🥀": ["GildedRot", "ForgottenCastle"],
+	"🥣": ["_orphan_lindblads", "PastoralCommons"],
+	"🦀": ["TidalPools"],
+	"🦅": ["StarterForest", "GildedRot", "ForgottenCastle"],
+	"🦌": ["StarterForest"],
+	"🦗": ["FungalNetworks"],
+	"🦠": ["FungalNetworks"],
+	"🦴": ["TrappersCamp"],
+	"🧂": ["TidalPools"],
+	"🧊": ["_orphan_lindblads", "Harbor", "FreshwaterSpring"],
+	"🧘": ["_orphan_lindblads", "MeditationGarden"],
+	"🧤": ["_orphan_lindblads", "ScrapYard"],
+	"🧨": ["_orphan_lindblads", "DemolitionSite"],
+	"🧩": ["_orphan_lindblads", "BroadcastTower", "SatelliteGraveyard"],
+	"🧪": ["_orphan_lindblads", "Clinic"],
+	"🧫": ["FungalNetworks"],
+	"🧬": ["_orphan_lindblads", "Clinic"],
+	"🧭": ["HorizonFracture"],
+	"🧮": ["_orphan_lindblads", "Archives"],
+	"🧰": ["_orphan_lindblads", "Workshop"],
+	"🧱": ["_orphan_lindblads", "ScrapYard", "DemolitionSite"],
+	"🧲": ["_orphan_lindblads", "MagneticAnomaly"],
+	"🧵": ["_orphan_lindblads", "WeaversLoft", "BindingCircle"],
+	"🧶": ["_orphan_lindblads", "WeaversLoft"],
+	"🧷": ["_orphan_lindblads", "WeaversLoft"],
+	"🧺": ["Village"],
+	"🧿": ["_orphan_lindblads", "OccultSanctum"],
+	"🩸": ["CyberDebtMegacity", "GildedRot", "Battlefield"],
+	"🩺": ["_orphan_lindblads", "Clinic"],
+	"🪐": ["HorizonFracture"],
+	"🪓": ["Woodlot"],
+	"🪛": ["_orphan_lindblads", "Workshop"],
+	"🪝": ["_orphan_lindblads", "Harbor", "TrappersCamp"],
+	"🪞": ["_orphan_lindblads", "MirrorChamber"],
+	"🪡": ["WeaversLoft"],
+	"🪢": ["_orphan_lindblads", "WeaversLoft", "BindingCircle"],
+	"🪣": ["_orphan_lindblads", "Harbor"],
+	"🪤": ["_orphan_lindblads", "TrappersCamp"],
+	"🪦": ["EchoingChasm", "BureaucraticAbyss"],
+	"🪨": ["VolcanicWorlds", "TidalPools", "AbandonedQuarter"],
+	"🪵": ["_orphan_lindblads", "Woodlot"],
+	"🪸": ["TidalPools"],
+	"🫙": ["_orphan_lindblads", "PastoralCommons", "Apiary"],
+	"🫥": ["EchoingChasm", "HorizonFracture"],
+	"🫧": ["_orphan_lindblads", "FreshwaterSpring"],
+}
+
+const EMOJI_TO_FACTIONS = {
+	"☀": ["Celestial Archons"],
+	"♟": ["Void Emperors"],
+	"♻": ["Locusts", "Terrarium Collective", "Tinker Team"],
+	"⚓": ["Quay Rooks"],
+	"⚔": ["Brotherhood of Ash", "Children of the Ember", "Fencebreakers", "Iron Shepherds", "Locusts", "Order of the Crimson Scale", "Rose Wardens", "Scythe Provosts"],
+	"⚖": ["Carrion Throne", "House of Thorns", "Irrigation Jury", "Ledger Bailiffs", "The Indelible Precept", "The Opalescent Hegemon"],
+	"⚗": ["Helix Conservatory"],
+	"⚙": ["Chop Docs", "Gearwright Circle", "Kilowatt Collective", "Millwright's Union", "Rocketwright Institute", "Starforge Reliquary", "Symphony Smiths"],
+	"⚜": ["Carrion Throne", "Void Emperors"],
+	"⚡": ["Kilowatt Collective"],
+	"⚫": ["Black Horizon", "The Opalescent Hegemon", "Void Emperors"],
+	"⚱": ["Brotherhood of Ash", "Cult of the Drowned Star"],
+	"⛏": ["Clan of the Hidden Root", "The Gilded Legacy"],
+	"⛓": ["Debt Wardens", "Fencebreakers", "Ink Wardens", "Obsidian Will", "Salt-Runners", "Void Serfs"],
+	"⛪": ["Iron Confessors", "Sacred Flame Keepers", "Yeast Prophets"],
+	"⛰": ["Celestial Archons"],
+	"✊": ["Children of the Ember", "Fencebreakers"],
+	"✨": ["Reality Midwives", "The Gilded Legacy", "Volcanic Foundry", "Vortex Readers"],
+	"❄": ["Hearth Keepers"],
+	"⭐": ["Cult of the Drowned Star"],
+	"🌀": ["Black Horizon", "Starforge Reliquary", "Vortex Readers"],
+	"🌊": ["The Submersed"],
+	"🌋": ["Volcanic Foundry"],
+	"🌑": ["Memory Weavers"],
+	"🌙": ["Celestial Archons", "Mycelial Web"],
+	"🌞": ["Starforge Reliquary"],
+	"🌠": ["Reality Midwives", "Star-Charter Enclave", "The Opalescent Hegemon"],
+	"🌫": ["Brotherhood of Ash", "Volcanic Foundry"],
+	"🌬": ["Celestial Archons", "Wildfire"],
+	"🌱": ["Clan of the Hidden Root", "Granary Guilds", "Irrigation Jury", "Pollinator Guild", "Scythe Provosts", "Seedvault Curators", "Verdant Pulse"],
+	"🌲": ["Verdant Pulse", "Wildfire"],
+	"🌹": ["House of Thorns", "Rose Wardens"],
+	"🌺": ["Rose Wardens"],
+	"🌾": ["Plague Vectors", "Pollinator Guild", "Verdant Pulse"],
+	"🌿": ["Hearth Witches", "Mossline Brokers", "Pollinator Guild", "Swift Herd", "Terrarium Collective", "Verdant Pulse", "Wildfire"],
+	"🍂": ["Mycelial Web", "Verdant Pulse", "Wildfire"],
+	"🍄": ["Mycelial Web"],
+	"🍞": ["Granary Guilds", "Hearth Keepers", "Millwright's Union", "Yeast Prophets"],
+	"🍷": ["House of Thorns", "Laughing Court"],
+	"🍼": ["Reality Midwives"],
+	"🎭": ["Laughing Court"],
+	"🎵": ["Symphony Smiths"],
+	"🎶": ["Chorus of Oblivion"],
+	"🎸": ["Void Troubadours"],
+	"🎼": ["Resonance Dancers", "Void Troubadours"],
+	"🏇": ["Scythe Provosts"],
+	"🏚": ["Market Spirits"],
+	"🏛": ["Market Spirits", "Monolith Masons"],
+	"🏜": ["Hearth Keepers"],
+	"🏢": ["Station Lords"],
+	"🏭": ["Millwright's Union"],
+	"🏮": ["Lantern Cant", "The Liminal Taper", "Void Troubadours"],
+	"🏰": ["Carrion Throne"],
+	"🏷": ["Gearwright Circle"],
+	"🏺": ["Monolith Masons"],
+	"🐂": ["Market Spirits"],
+	"🐇": ["Pack Lords", "Plague Vectors", "Swift Herd"],
+	"🐉": ["Order of the Crimson Scale"],
+	"🐑": ["Iron Shepherds"],
+	"🐙": ["Vortex Readers"],
+	"🐚": ["Salt Scribes"],
+	"🐜": ["Locusts"],
+	"🐝": ["Plague Vectors", "Pollinator Guild"],
+	"🐠": ["The Submersed"],
+	"🐺": ["Pack Lords"],
+	"🐻": ["Market Spirits"],
+	"👁": ["Vortex Readers"],
+	"👘": ["Loom Priests", "Seamstress Syndicate"],
+	"👤": ["Veiled Sisters"],
+	"👥": ["Carrion Throne", "Debt Wardens", "Void Serfs"],
+	"💀": ["Debt Wardens", "Mycelial Web", "Pack Lords", "Plague Vectors", "The Scavenged Psithurism", "Umbra Exchange", "Void Serfs"],
+	"💃": ["Laughing Court", "Resonance Dancers"],
+	"💉": ["Bone Merchants", "Chop Docs"],
+	"💊": ["The Sovereign Ukase"],
+	"💎": ["Syndicate of Glass", "The Gilded Legacy", "Volcanic Foundry"],
+	"💧": ["Celestial Archons", "Hearth Keepers", "Irrigation Jury", "Salt-Runners", "Terrarium Collective"],
+	"💨": ["Hearth Keepers", "Millwright's Union"],
+	"💫": ["Reality Midwives", "Void Troubadours"],
+	"💰": ["Bone Merchants", "Granary Guilds", "Ledger Bailiffs", "Market Spirits", "Memory Merchants", "Quay Rooks", "Station Lords", "Syndicate of Glass", "The Gilded Legacy", "Umbra Exchange"],
+	"💱": ["Order of the Crimson Scale"],
+	"💳": ["The Indelible Precept"],
+	"💸": ["Debt Wardens", "Void Serfs"],
+	"💾": ["Engram Freighters", "Memory Merchants"],
+	"📊": ["Measure Scribes"],
+	"📋": ["Measure Scribes", "Nexus Wardens", "Rocketwright Institute", "The Indelible Precept"],
+	"📍": ["Cartographers", "Cartographers of the Impossible"],
+	"📐": ["Measure Scribes", "Monolith Masons", "The Vitreous Scrutiny"],
+	"📒": ["Ledger Bailiffs"],
+	"📖": ["Chronicle Keepers"],
+	"📘": ["Ledger Bailiffs", "Measure Scribes", "Obsidian Will"],
+	"📜": ["Carrion Throne", "Ink Wardens", "Salt Scribes", "The Indelible Precept"],
+	"📡": ["Engram Freighters", "Relay Lattice", "Resonance Dancers", "Seamstress Syndicate", "Star-Charter Enclave", "Symphony Smiths", "The Liminal Osmosis"],
+	"📦": ["Market Spirits", "The Sovereign Ukase"],
+	"📵": ["Keepers of Silence"],
+	"📶": ["Engram Freighters", "Relay Lattice", "The Liminal Osmosis"],
+	"📻": ["The Liminal Osmosis"],
+	"📼": ["Memory Merchants"],
+	"📿": ["Iron Confessors", "Knot-Shriners"],
+	"🔇": ["Keepers of Silence"],
+	"🔊": ["Resonance Dancers", "Symphony Smiths"],
+	"🔋": ["Kilowatt Collective"],
+	"🔌": ["Kilowatt Collective", "Tinker Team"],
+	"🔍": ["Syndicate of Glass"],
+	"🔓": ["Salt-Runners"],
+	"🔔": ["Chorus of Oblivion", "Knot-Shriners"],
+	"🔥": ["Celestial Archons", "Children of the Ember", "Fencebreakers", "Hearth Keepers", "Sacred Flame Keepers", "Volcanic Foundry", "Wildfire"],
+	"🔦": ["Lantern Cant"],
+	"🔧": ["Bone Merchants", "Chop Docs"],
+	"🔨": ["Millwright's Union", "Symphony Smiths"],
+	"🔩": ["Gearwright Circle"],
+	"🔬": ["Helix Conservatory", "Rocketwright Institute", "Seedvault Curators", "The Vitreous Scrutiny"],
+	"🔭": ["Cartographers", "Cartographers of the Impossible", "Star-Charter Enclave", "The Opalescent Hegemon", "The Vitreous Scrutiny"],
+	"🕯": ["Chorus of Oblivion", "Hearth Witches", "Lantern Cant", "Sacred Flame Keepers", "The Liminal Taper"],
+	"🕰": ["Chronicle Keepers", "Void Emperors"],
+	"🕳": ["Black Horizon", "Cult of the Drowned Star", "Helix Conservatory"],
+	"🕴": ["Obsidian Will"],
+	"🕵": ["Salt-Runners", "Umbra Exchange", "Veiled Sisters"],
+	"🕸": ["Memory Weavers"],
+	"🖋": ["Ink Wardens"],
+	"🗃": ["Chronicle Keepers", "Ink Wardens"],
+	"🗑": ["The Scavenged Psithurism"],
+	"🗝": ["Iron Confessors", "Knot-Shriners", "Memory Merchants", "Nexus Wardens", "Umbra Exchange"],
+	"🗣": ["The Liminal Osmosis"],
+	"🗺": ["Cartographers", "Cartographers of the Impossible", "Relay Lattice"],
+	"😂": ["Laughing Court"],
+	"🚀": ["Rocketwright Institute", "Starforge Reliquary", "Station Lords"],
+	"🚐": ["Tinker Team"],
+	"🚔": ["Ledger Bailiffs"],
+	"🚛": ["The Sovereign Ukase"],
+	"🚢": ["Quay Rooks"],
+	"🚧": ["Nexus Wardens"],
+	"🚩": ["Children of the Ember"],
+	"🚪": ["Nexus Wardens"],
+	"🚫": ["Quarantine Sealwrights"],
+	"🛂": ["Nexus Wardens", "Station Lords"],
+	"🛑": ["Keepers of Silence"],
+	"🛠": ["Gearwright Circle"],
+	"🛡": ["Iron Shepherds", "Order of the Crimson Scale", "Scythe Provosts"],
+	"🛰": ["Star-Charter Enclave"],
+	"🛶": ["Salt-Runners"],
+	"🛸": ["Iron Shepherds"],
+	"🤖": ["Iron Confessors"],
+	"🤫": ["Keepers of Silence", "Veiled Sisters"],
+	"🤲": ["Reality Midwives"],
+	"🥀": ["Rose Wardens"],
+	"🥖": ["Yeast Prophets"],
+	"🥣": ["Hearth Witches"],
+	"🦀": ["The Submersed"],
+	"🦅": ["Carrion Throne", "Pack Lords"],
+	"🦌": ["Pack Lords", "Swift Herd"],
+	"🦗": ["Locusts", "Quarantine Sealwrights"],
+	"🦠": ["Locusts", "Mossline Brokers", "Plague Vectors"],
+	"🦴": ["Bone Merchants", "Chop Docs"],
+	"🧂": ["Salt Scribes", "Salt-Runners"],
+	"🧊": ["Syndicate of Glass"],
+	"🧘": ["Iron Confessors", "Keepers of Silence"],
+	"🧤": ["The Scavenged Psithurism"],
+	"🧨": ["Children of the Ember", "Fencebreakers"],
+	"🧩": ["Engram Freighters", "Memory Merchants", "Relay Lattice"],
+	"🧪": ["Helix Conservatory", "Quarantine Sealwrights", "Seedvault Curators", "The Sovereign Ukase", "Yeast Prophets"],
+	"🧫": ["Flesh Architects", "Helix Conservatory", "Locusts", "Mossline Brokers", "Quarantine Sealwrights", "Seedvault Curators"],
+	"🧬": ["Flesh Architects", "Helix Conservatory", "Quarantine Sealwrights", "Seedvault Curators"],
+	"🧭": ["Cartographers", "Cartographers of the Impossible", "Iron Shepherds", "Relay Lattice"],
+	"🧮": ["Measure Scribes", "The Vitreous Scrutiny"],
+	"🧯": ["Brotherhood of Ash", "Sacred Flame Keepers"],
+	"🧰": ["Gearwright Circle", "Tinker Team"],
+	"🧱": ["Monolith Masons", "Obsidian Will"],
+	"🧲": ["The Vitreous Scrutiny"],
+	"🧵": ["Flesh Architects", "Knot-Shriners", "Loom Priests", "Seamstress Syndicate", "The Liminal Taper"],
+	"🧶": ["Seamstress Syndicate"],
+	"🧷": ["Veiled Sisters"],
+	"🧺": ["Granary Guilds"],
+	"🧿": ["Hearth Witches", "Lantern Cant", "Mossline Brokers", "Veiled Sisters"],
+	"🩰": ["Resonance Dancers"],
+	"🩸": ["Carrion Throne", "Flesh Architects", "Order of the Crimson Scale"],
+	"🩹": ["Brotherhood of Ash"],
+	"🩺": ["Quarantine Sealwrights"],
+	"🪐": ["Black Horizon"],
+	"🪓": ["Fencebreakers"],
+	"🪛": ["Tinker Team"],
+	"🪝": ["Quay Rooks"],
+	"🪞": ["House of Thorns", "Syndicate of Glass", "Veiled Sisters"],
+	"🪡": ["Knot-Shriners", "Loom Priests", "Seamstress Syndicate", "The Liminal Taper"],
+	"🪢": ["Knot-Shriners", "Loom Priests"],
+	"🪣": ["Irrigation Jury"],
+	"🪤": ["Clan of the Hidden Root"],
+	"🪦": ["Chronicle Keepers", "Memory Weavers"],
+	"🪨": ["Clan of the Hidden Root", "Obsidian Will", "Salt Scribes", "Volcanic Foundry"],
+	"🪵": ["Sacred Flame Keepers"],
+	"🪸": ["The Submersed"],
+	"🫀": ["Flesh Architects"],
+	"🫖": ["Hearth Witches"],
+	"🫙": ["Terrarium Collective", "Yeast Prophets"],
+	"🫥": ["Chorus of Oblivion", "Memory Weavers"],
+	"🫧": ["Cult of the Drowned Star"],
+}
+
+
+## Keys have variation selectors stripped (tools/emoji_registry.py)
+static func normalize_emoji(emoji: String) -> String:
+	return emoji.replace("\uFE0F", "").replace("\uFE0E", "")
+
+
+static func get_biomes_for_emoji(emoji: String) -> Array:
+	return EMOJI_TO_BIOMES.get(normalize_emoji(emoji), [])
+
+
+static func get_factions_for_emoji(emoji: String) -> Array:
+	return EMOJI_TO_FACTIONS.get(normalize_emoji(emoji), [])
@@ -0,0 +1,66 @@
+class_name FactionPackedData
+extends RefCounted
+
+## Faction physics data as packed struct-of-arrays
+## Generated from Core/Factions/data/factions_merged.json by convert_faction_lexicon_v2_1.py --packed
+## Row i of every table is faction i. Variable-length fields use *_OFFSETS:
+## faction i owns [offsets[i], offsets[i + 1]) of the matching data arrays.
+## Emojis are IDs into EMOJI_TABLE; bits are packed (axis 1 = lowest bit).
+
+const FORMAT = 1
+const FACTION_COUNT = 89
+const BITS_WIDTH = 12
+const COUPLING_STRIDE = 4  # source id, target id, re, im
+
+const EMOJI_TABLE = PackedStringArray(["☀", "♟", "♻", "⚓", "⚔", "⚖", "⚗", "⚙", "⚜", "⚡", "⚫", "⚱", "⛏", "⛓", "⛪", "⛰", "✊", "✨", "❄", "⭐", "🌀", "🌊", "🌋", "🌑", "🌙", "🌞", "🌠", "🌫", "🌬", "🌱", "🌲", "🌹", "🌺", "🌾", "🌿", "🍂", "🍄", "🍞", "🍷", "🍼", "🎭", "🎵", "🎶", "🎸", "🎼", "🏇", "🏚", "🏛", "🏜", "🏢", "🏭", "🏮", "🏰", "🏷", "🏺", "🐂", "🐇", "🐉", "🐑", "🐙", "🐚", "🐜", "🐝", "🐠", "🐺", "🐻", "👁", "👘", "👤", "👥", "💀", "💃", "💉", "💊", "💎", "💧", "💨", "💫", "💰", "💱", "💳", "💸", "💾", "📊", "📋", "📍", "📐", "📒", "📖", "📘", "📜", "📡", "📦", "📵", "📶", "📻", "📼", "📿", "🔇", "🔊", "🔋", "🔌", "🔍", "🔓", "🔔", "🔥", "🔦", "🔧", "🔨", "🔩", "🔬", "🔭", "🕯", "🕰", "🕳", "🕴", "🕵", "🕸", "🖋", "🗃", "🗑", "🗝", "🗣", "🗺", "😂", "🚀", "🚐", "🚔", "🚛", "🚢", "🚧", "🚩", "🚪", "🚫", "🛂", "🛑", "🛠", "🛡", "🛰", "🛶", "🛸", "🤖", "🤫", "🤲", "🥀", "🥖", "🥣", "🦀", "🦅", "🦌", "🦗", "🦠", "🦴", "🧂", "🧊", "🧘", "🧤", "🧨", "🧩", "🧪", "🧫", "🧬", "🧭", "🧮", "🧯", "🧰", "🧱", "🧲", "🧵", "🧶", "🧷", "🧺", "🧿", "🩰", "🩸", "🩹", "🩺", "🪐", "🪓", "🪛", "🪝", "🪞", "🪡", "🪢", "🪣", "🪤", "🪦", "🪨", "🪵", "🪸", "🫀", "🫖", "🫙", "🫥", "🫧"])
+const NAMES = PackedStringArray(["Black Horizon", "Bone Merchants", "Brotherhood of Ash", "Carrion Throne", "Cartographers", "Cartographers of the Impossible", "Celestial Archons", "Children of the Ember", "Chop Docs", "Chorus of Oblivion", "Chronicle Keepers", "Clan of the Hidden Root", "Cult of the Drowned Star", "Debt Wardens", "Engram Freighters", "Fencebreakers", "Flesh Architects", "Gearwright Circle", "Granary Guilds", "Hearth Keepers", "Hearth Witches", "Helix Conservatory", "House of Thorns", "Ink Wardens", "Iron Confessors", "Iron Shepherds", "Irrigation Jury", "Keepers of Silence", "Kilowatt Collective", "Knot-Shriners", "Lantern Cant", "Laughing Court", "Ledger Bailiffs", "Locusts", "Loom Priests", "Market Spirits", "Measure Scribes", "Memory Merchants", "Memory Weavers", "Millwright's Union", "Monolith Masons", "Mossline Brokers", "Mycelial Web", "Nexus Wardens", "Obsidian Will", "Order of the Crimson Scale", "Pack Lords", "Plague Vectors", "Pollinator Guild", "Quarantine Sealwrights", "Quay Rooks", "Reality Midwives", "Relay Lattice", "Resonance Dancers", "Rocketwright Institute", "Rose Wardens", "Sacred Flame Keepers", "Salt Scribes", "Salt-Runners", "Scythe Provosts", "Seamstress Syndicate", "Seedvault Curators", "Star-Charter Enclave", "Starforge Reliquary", "Station Lords", "Swift Herd", "Symphony Smiths", "Syndicate of Glass", "Terrarium Collective", "The Gilded Legacy", "The Indelible Precept", "The Liminal Osmosis", "The Liminal Taper", "The Opalescent Hegemon", "The Scavenged Psithurism", "The Sovereign Ukase", "The Submersed", "The Vitreous Scrutiny", "Tinker Team", "Umbra Exchange", "Veiled Sisters", "Verdant Pulse", "Void Emperors", "Void Serfs", "Void Troubadours", "Volcanic Foundry", "Vortex Readers", "Wildfire", "Yeast Prophets"])
+const RINGS = PackedStringArray(["outer", "second", "second", "outer", "second", "second", "outer", "second", "third", "third", "third", "center", "third", "third", "first", "second", "third", "center", "center", "center", "second", "second", "second", "third", "second", "second", "center", "third", "center", "second", "second", "second", "first", "second", "second", "second", "first", "second", "third", "center", "second", "second", "center", "first", "second", "second", "second", "second", "center", "first", "second", "outer", "center", "third", "first", "second", "second", "third", "second", "first", "second", "center", "second", "second", "second", "center", "second", "second", "center", "first", "first", "second", "third", "third", "second", "second", "third", "third", "center", "second", "second", "center", "third", "fourth", "second", "second", "third", "second", "third"])
+const DOMAINS = PackedStringArray(["Boundary", "Commerce", "Military", "Civic", "Scavenger", "Navigation", "Mystic", "Military", "Medicine", "Dissolution", "Knowledge", "Civic", "Horror", "Enforcement", "Infrastructure", "Criminal", "Horror", "Infrastructure", "Commerce", "Civic", "Mystic", "Science", "Civic", "Administration", "Mystic", "Military", "Civic", "Mystic", "Infrastructure", "Mystic", "Mystic", "Aristocracy", "Civic", "Scavenger", "Mystic", "Commerce", "Civic", "Commerce", "Predation", "Infrastructure", "Infrastructure", "Mystic", "Mystic", "Commerce", "Infrastructure", "Military", "Military", "Horror", "Civic", "Civic", "Criminal", "Mystic", "Infrastructure", "Art-Signal", "Science", "Security", "Mystic", "Commerce", "Criminal", "Military", "Infrastructure", "Science", "Infrastructure", "Infrastructure", "Infrastructure", "Civic", "Infrastructure", "Criminal", "Civic", "Commerce", "Civic/Administrative", "Art-Signal", "Mystic/Infrastructure", "Imperial/Horror", "Infrastructure/Scavenger", "Imperial/Executive", "Ecology", "Science/Deep-Math", "Infrastructure", "Intelligence", "Criminal", "Civic", "Civic", "Labor", "Art-Signal", "Infrastructure", "Mystic", "Horror", "Mystic"])
+const BITS = PackedInt64Array([254, 330, 2057, 3357, 955, 3067, 3999, 2049, 0, 250, 3505, 329, 926, 3089, 2764, 1088, 2396, 3457, 3513, 2305, 994, 3090, 3735, 3249, 3253, 3099, 3553, 3263, 465, 423, 2562, 756, 3329, 74, 2278, 3838, 3237, 1215, 763, 2059, 1623, 486, 1522, 2039, 3097, 3375, 2053, 192, 832, 3800, 864, 4095, 4035, 4079, 3883, 2711, 2391, 2481, 704, 3333, 3251, 2977, 556, 3129, 3085, 3008, 3851, 1613, 3953, 788, 1680, 376, 3042, 1581, 2176, 1420, 1010, 3259, 328, 2295, 1123, 1360, 3135, 1216, 1018, 3861, 2291, 64, 3062])
+const SIG_OFFSETS = PackedInt32Array([0, 4, 8, 13, 20, 24, 28, 34, 39, 43, 47, 51, 55, 59, 63, 67, 73, 78, 83, 87, 93, 98, 104, 108, 112, 117, 122, 126, 131, 135, 141, 145, 149, 154, 160, 164, 170, 175, 180, 184, 189, 193, 197, 201, 206, 211, 216, 221, 226, 230, 236, 240, 245, 250, 255, 259, 263, 268, 272, 278, 282, 287, 292, 296, 300, 304, 307, 312, 317, 321, 325, 329, 333, 337, 341, 344, 348, 352, 357, 362, 366, 372, 377, 381, 385, 389, 395, 399, 404, 409])
+const SIG_IDS = PackedInt32Array([10, 114, 177, 20, 152, 72, 107, 78, 4, 27, 11, 175, 164, 69, 5, 148, 8, 174, 52, 90, 123, 162, 111, 85, 162, 85, 123, 111, 0, 24, 105, 75, 15, 28, 4, 105, 16, 131, 157, 7, 72, 107, 152, 42, 104, 193, 112, 119, 186, 113, 88, 29, 12, 187, 185, 19, 194, 114, 11, 13, 81, 69, 70, 91, 82, 158, 94, 4, 157, 105, 178, 16, 13, 190, 161, 174, 160, 168, 7, 136, 109, 165, 53, 29, 37, 78, 171, 105, 18, 75, 48, 76, 37, 34, 112, 191, 146, 172, 159, 110, 161, 160, 6, 114, 31, 181, 38, 5, 118, 90, 119, 13, 141, 14, 97, 121, 155, 4, 137, 58, 140, 162, 29, 75, 5, 184, 98, 142, 155, 135, 93, 100, 101, 7, 9, 183, 168, 97, 104, 182, 121, 51, 106, 112, 172, 40, 38, 71, 124, 5, 78, 87, 89, 127, 150, 61, 4, 2, 160, 151, 168, 182, 67, 183, 55, 65, 78, 92, 47, 46, 86, 83, 163, 89, 84, 78, 82, 96, 158, 121, 117, 193, 186, 23, 7, 50, 76, 37, 108, 166, 47, 54, 86, 34, 151, 160, 172, 36, 35, 24, 70, 134, 84, 130, 121, 132, 187, 13, 166, 89, 115, 4, 57, 174, 79, 137, 64, 148, 56, 149, 70, 151, 56, 33, 62, 70, 62, 34, 33, 29, 159, 150, 160, 133, 176, 161, 129, 3, 78, 180, 17, 77, 26, 143, 39, 91, 158, 123, 94, 162, 71, 44, 99, 91, 173, 125, 110, 7, 84, 31, 144, 32, 4, 105, 112, 14, 188, 164, 153, 60, 187, 90, 153, 139, 75, 13, 103, 116, 29, 4, 137, 45, 182, 168, 169, 91, 67, 29, 110, 159, 160, 161, 111, 26, 138, 91, 25, 20, 7, 125, 125, 49, 78, 134, 56, 149, 34, 41, 99, 108, 7, 91, 78, 74, 181, 102, 154, 34, 192, 2, 75, 12, 74, 78, 17, 84, 80, 5, 90, 94, 95, 91, 122, 112, 168, 182, 51, 111, 10, 26, 5, 156, 120, 70, 159, 73, 92, 128, 21, 189, 147, 63, 110, 167, 86, 163, 111, 165, 179, 101, 2, 126, 121, 116, 70, 78, 68, 142, 116, 181, 170, 172, 29, 34, 33, 30, 35, 10, 8, 1, 113, 69, 13, 81, 70, 43, 44, 77, 51, 22, 105, 187, 74, 27, 17, 20, 59, 17, 66, 105, 34, 30, 35, 28, 37, 145, 159, 14, 192])
+const SELF_ENERGY_OFFSETS = PackedInt32Array([0, 4, 8, 13, 20, 24, 28, 34, 39, 43, 47, 51, 55, 59, 63, 67, 73, 78, 83, 87, 93, 98, 104, 108, 112, 117, 122, 126, 131, 135, 141, 145, 149, 154, 160, 164, 170, 175, 180, 184, 189, 193, 197, 200, 205, 210, 215, 220, 221, 222, 228, 232, 237, 242, 247, 251, 255, 260, 264, 270, 274, 279, 284, 288, 292, 296, 299, 304, 309, 313, 317, 321, 325, 329, 333, 336, 340, 344, 349, 354, 358, 364, 369, 373, 377, 381, 387, 391, 391, 396])
+const SELF_ENERGY_IDS = PackedInt32Array([10, 114, 177, 20, 72, 78, 107, 152, 4, 11, 27, 164, 175, 5, 8, 52, 69, 90, 148, 174, 85, 111, 123, 162, 162, 85, 123, 111, 0, 15, 24, 28, 75, 105, 4, 16, 105, 131, 157, 7, 72, 107, 152, 42, 104, 193, 112, 119, 186, 113, 88, 12, 29, 185, 187, 11, 19, 114, 194, 13, 81, 69, 70, 82, 91, 94, 158, 4, 13, 16, 105, 157, 178, 160, 161, 168, 174, 190, 7, 53, 109, 136, 165, 29, 37, 78, 171, 18, 37, 48, 75, 76, 105, 34, 112, 146, 172, 191, 6, 110, 114, 159, 160, 161, 5, 31, 38, 181, 118, 90, 119, 13, 14, 97, 121, 141, 155, 4, 58, 137, 140, 162, 5, 29, 75, 184, 93, 98, 135, 142, 155, 7, 9, 100, 101, 97, 104, 121, 168, 182, 183, 51, 106, 112, 172, 40, 38, 71, 124, 5, 78, 87, 89, 127, 2, 4, 61, 150, 151, 160, 67, 168, 182, 183, 46, 47, 55, 65, 78, 92, 83, 84, 86, 89, 163, 78, 82, 96, 121, 158, 117, 193, 186, 23, 7, 37, 50, 76, 108, 47, 54, 86, 166, 34, 151, 160, 172, 35, 36, 70, 84, 121, 130, 132, 134, 13, 89, 115, 166, 187, 4, 57, 79, 137, 174, 56, 64, 70, 148, 149, 151, 62, 133, 150, 159, 160, 161, 176, 3, 78, 129, 180, 17, 26, 77, 143, 39, 91, 94, 123, 158, 162, 44, 71, 91, 99, 173, 7, 84, 110, 125, 31, 144, 32, 4, 14, 105, 112, 164, 188, 153, 60, 187, 90, 13, 75, 103, 116, 139, 153, 4, 29, 45, 137, 67, 91, 168, 169, 182, 29, 110, 159, 160, 161, 26, 91, 111, 138, 7, 20, 25, 125, 125, 49, 78, 134, 34, 56, 149, 7, 41, 91, 99, 108, 74, 78, 102, 154, 181, 2, 34, 75, 192, 12, 17, 74, 78, 5, 80, 84, 90, 91, 94, 95, 122, 51, 112, 168, 182, 5, 10, 26, 111, 70, 120, 156, 73, 92, 128, 159, 21, 189, 147, 63, 86, 110, 111, 163, 167, 2, 101, 126, 165, 179, 121, 116, 70, 78, 68, 116, 142, 170, 172, 181, 29, 30, 33, 34, 35, 1, 8, 10, 113, 69, 13, 81, 70, 43, 44, 77, 51, 17, 22, 27, 74, 105, 187, 20, 59, 17, 66, 14, 37, 145, 159, 192])
+const SELF_ENERGY_VALUES = PackedFloat64Array([0.4, 0.35, 0.1, 0.2, 0.15, 0.3, 0.15, 0.2, 0.15, 0.25, 0.2, 0.2, 0.15, 0.25, 0.4, 0.5, 0.02, 0.15, 0.2, 0.1, 0.15, 0.2, 0.25, 0.3, 0.3, 0.15, 0.25, 0.2, 1.0, 0.2, 0.8, 0.1, 0.3, 0.6, 0.15, 0.3, 0.25, 0.2, 0.05, 0.15, 0.15, 0.15, 0.2, 0.2, 0.2, -0.1, 0.2, 0.1, 0.15, 0.2, 0.25, 0.2, 0.1, 0.15, 0.25, 0.2, -0.1, 0.3, 0.15, 0.1, -0.3, 0.02, 0.1, 0.3, 0.25, 0.1, 0.15, 0.15, -0.1, 0.25, 0.2, 0.1, 0.2, 0.2, 0.25, 0.15, 0.15, 0.2, 0.2, 0.25, 0.1, 0.15, 0.2, 0.05, 0.1, 0.3, 0.2, -0.3, 0.0, 0.0, 0.0, 0.1, 0.8, 0.2, 0.25, 0.2, 0.25, 0.3, 0.2, 0.3, -0.15, 0.2, 0.25, 0.35, 0.2, 0.25, 0.3, 0.2, 0.15, 0.2, -0.1, 0.25, 0.3, 0.2, 0.2, 0.25, 0.25, 0.2, 0.1, 0.35, 0.2, 0.25, 0.25, 0.1, 0.3, 0.15, 0.2, 0.3, 0.25, 0.25, 0.2, 0.15, 0.2, 0.3, 0.1, 0.25, 0.2, 0.2, 0.15, 0.15, 0.3, 0.3, 0.2, 0.15, 0.2, 0.3, 0.25, 0.2, 0.35, 0.25, 0.3, 0.2, 0.1, 0.15, 0.2, 0.05, 0.15, 0.1, -0.05, 0.1, 0.3, 0.2, 0.25, 0.25, -0.1, 0.2, 0.5, -0.5, 0.1, 0.0, 0.25, 0.15, 0.3, 0.35, 0.2, 0.2, 0.3, 0.15, 0.25, 0.15, 0.15, -0.1, 0.15, -0.1, 0.15, 0.1, 0.25, 0.1, 0.1, 0.5, 0.35, 0.4, 0.3, 0.25, 0.15, 0.2, 0.2, 0.0, 0.05, -0.1, 0.15, 0.3, 0.2, 0.1, 0.25, 0.1, 0.3, 0.2, 0.25, 0.35, 0.2, 0.35, 0.25, 0.2, 0.15, 0.02, -0.05, -0.1, -0.03, 0.01, -0.05, 0.02, 0.3, -0.1, 0.2, 0.25, 0.15, 0.2, 0.2, 0.3, 0.25, 0.15, 0.25, 0.3, 0.2, 0.25, 0.2, 0.3, 0.1, 0.2, 0.15, 0.2, 0.25, 0.3, 0.2, 0.2, 0.25, 0.15, 0.2, 0.25, 0.35, 0.25, 0.15, 0.2, 0.3, 0.3, 0.35, 0.25, 0.2, 0.15, 0.3, -0.1, 0.15, 0.2, 0.05, 0.1, 0.25, 0.15, 0.2, 0.15, 0.2, 0.1, 0.15, 0.25, 0.25, 0.08, 0.1, 0.12, 0.15, 0.1, 0.3, 0.2, 0.25, 0.35, 0.2, 0.15, 0.3, 0.25, 0.25, 0.2, 0.4, 0.3, 0.3, 0.25, 0.3, 0.2, 0.1, 0.02, 0.01, 0.15, 0.2, 0.1, 0.15, 0.2, 0.35, 0.25, 0.15, 0.2, 0.2, 0.15, 0.2, 0.1, 0.3, 0.15, 0.2, 0.4, 0.3, 0.2, 0.25, 0.2, 0.15, 0.25, 0.15, 0.2, 0.1, 0.25, 0.2, 0.2, 0.15, 0.3, 0.3, 0.2, 0.25, -0.15, -0.1, 0.0, 0.3, 0.15, 0.2, 0.2, 0.1, 0.2, 0.25, 0.15, 0.25, 0.2, 0.2, 0.2, 0.15, 0.05, 0.1, 0.2, 0.25, 0.15, 0.3, 0.2, 0.1, 0.3, 0.15, 0.15, 0.2, 0.2, 0.15, 0.1, 0.05, 0.3, 0.1, 0.1, 0.0, 0.2, 0.25, 0.35, 0.15, 0.05, 0.2, -0.15, 0.1, 0.2, 0.25, 0.15, 0.2, 0.3, 0.0, 0.1, 0.5, 0.3, -0.2, 0.0, 0.3, 0.35, 0.25, 0.3, 0.1, 0.12, 0.15, 0.2])
+const COUPLING_OFFSETS = PackedInt32Array([0, 12, 25, 37, 66, 78, 90, 116, 129, 141, 152, 162, 174, 184, 195, 205, 222, 236, 250, 260, 274, 288, 305, 319, 331, 346, 359, 371, 383, 392, 407, 417, 431, 443, 459, 469, 485, 500, 514, 523, 535, 547, 557, 565, 580, 594, 608, 622, 626, 629, 646, 658, 672, 686, 699, 710, 723, 735, 745, 758, 768, 783, 798, 808, 820, 830, 836, 847, 860, 872, 882, 894, 904, 913, 923, 930, 940, 952, 966, 980, 995, 1010, 1024, 1036, 1046, 1056, 1074, 1086, 1090, 1105])
+const COUPLINGS = PackedFloat64Array([10.0, 114.0, 0.7, 0.0, 10.0, 20.0, 0.5, 0.0, 10.0, 177.0, 0.4, 0.5, 114.0, 10.0, 0.7, 0.0, 114.0, 20.0, 0.6, 0.0, 114.0, 177.0, 0.5, 0.0, 20.0, 10.0, 0.5, 0.0, 20.0, 114.0, 0.6, 0.0, 20.0, 177.0, 0.5, 0.0, 177.0, 10.0, 0.4, -0.5, 177.0, 114.0, 0.5, 0.0, 177.0, 20.0, 0.5, 0.0, 72.0, 78.0, 0.3, 0.0, 72.0, 107.0, 0.4, 0.0, 72.0, 152.0, 0.5, 0.0, 72.0, 159.0, 0.4, 0.0, 78.0, 72.0, 0.3, 0.0, 78.0, 152.0, 0.4, 0.0, 107.0, 7.0, 0.4, 0.0, 107.0, 72.0, 0.4, 0.0, 107.0, 152.0, 0.6, 0.0, 152.0, 69.0, 0.5, 0.0, 152.0, 72.0, 0.5, 0.0, 152.0, 78.0, 0.4, 0.0, 152.0, 107.0, 0.6, 0.0, 4.0, 11.0, 0.5, 0.0, 4.0, 27.0, 0.4, 0.0, 11.0, 4.0, 0.5, 0.0, 11.0, 27.0, 0.6, 0.0, 11.0, 175.0, 0.4, 0.0, 27.0, 4.0, 0.4, 0.0, 27.0, 11.0, 0.6, 0.0, 27.0, 164.0, 0.4, 0.0, 164.0, 27.0, 0.4, 0.0, 164.0, 175.0, 0.4, 0.0, 175.0, 11.0, 0.4, 0.0, 175.0, 164.0, 0.4, 0.0, 5.0, 8.0, 0.7, 0.0, 5.0, 69.0, 0.6, 0.0, 5.0, 90.0, 0.5, 0.0, 5.0, 174.0, 0.4, 0.0, 8.0, 5.0, 0.7, 0.0, 8.0, 52.0, 0.8, 0.0, 8.0, 69.0, 0.4, 0.0, 8.0, 90.0, 0.6, 0.0, 8.0, 148.0, 0.6, 0.0, 8.0, 174.0, 0.5, 0.0, 52.0, 5.0, 0.5, 0.0, 52.0, 8.0, 0.8, 0.0, 52.0, 90.0, 0.6, 0.0, 52.0, 148.0, 0.4, 0.0, 69.0, 5.0, 0.6, 0.0, 69.0, 8.0, 0.4, 0.0, 69.0, 174.0, 0.6, 0.0, 90.0, 5.0, 0.5, 0.0, 90.0, 8.0, 0.6, 0.0, 90.0, 49.0, 0.4, 0.0, 90.0, 52.0, 0.6, 0.0, 148.0, 8.0, 0.6, 0.0, 148.0, 69.0, 0.5, 0.0, 148.0, 70.0, 0.5, 0.0, 148.0, 174.0, 0.4, 0.0, 174.0, 5.0, 0.4, 0.0, 174.0, 8.0, 0.5, 0.0, 174.0, 69.0, 0.6, 0.0, 174.0, 70.0, 0.4, 0.0, 85.0, 111.0, 0.4, 0.0, 85.0, 123.0, 0.7, 0.0, 85.0, 162.0, 0.5, 0.0, 111.0, 85.0, 0.4, 0.0, 111.0, 123.0, 0.5, 0.0, 111.0, 162.0, 0.4, 0.0, 123.0, 85.0, 0.7, 0.0, 123.0, 111.0, 0.5, 0.0, 123.0, 162.0, 0.6, 0.0, 162.0, 85.0, 0.5, 0.0, 162.0, 111.0, 0.4, 0.0, 162.0, 123.0, 0.6, 0.0, 162.0, 85.0, 0.5, 0.0, 162.0, 123.0, 0.6, 0.0, 162.0, 111.0, 0.4, 0.0, 85.0, 162.0, 0.5, 0.0, 85.0, 123.0, 0.7, 0.0, 85.0, 111.0, 0.4, 0.0, 123.0, 162.0, 0.6, 0.0, 123.0, 85.0, 0.7, 0.0, 123.0, 111.0, 0.5, 0.0, 111.0, 162.0, 0.4, 0.0, 111.0, 85.0, 0.4, 0.0, 111.0, 123.0, 0.5, 0.0, 0.0, 15.0, 0.3, 0.0, 0.0, 24.0, 0.025, 0.0, 0.0, 28.0, 0.4, 0.0, 0.0, 75.0, 0.4, 0.0, 0.0, 105.0, 0.7, 0.0, 15.0, 0.0, 0.3, 0.0, 15.0, 28.0, 0.5, 0.0, 15.0, 75.0, 0.4, 0.0, 15.0, 105.0, 0.3, 0.0, 24.0, 0.0, 0.025, 0.0, 24.0, 28.0, 0.3, 0.0, 24.0, 75.0, 0.5, 0.0, 28.0, 0.0, 0.4, 0.0, 28.0, 15.0, 0.5, 0.0, 28.0, 24.0, 0.3, 0.0, 28.0, 75.0, 0.6, 0.0, 28.0, 105.0, 0.5, 0.0, 75.0, 0.0, 0.4, 0.0, 75.0, 15.0, 0.4, 0.0, 75.0, 24.0, 0.5, 0.0, 75.0, 28.0, 0.6, 0.0, 75.0, 105.0, 0.6, 0.0, 105.0, 0.0, 0.7, 0.0, 105.0, 15.0, 0.3, 0.0, 105.0, 28.0, 0.5, 0.0, 105.0, 75.0, 0.6, 0.0, 4.0, 16.0, 0.4, 0.0, 4.0, 105.0, 0.5, 0.0, 4.0, 131.0, 0.4, 0.0, 16.0, 4.0, 0.4, 0.0, 16.0, 131.0, 0.6, 0.0, 105.0, 4.0, 0.5, 0.0, 105.0, 131.0, 0.5, 0.0, 105.0, 157.0, 0.6, 0.0, 131.0, 4.0, 0.4, 0.0, 131.0, 16.0, 0.6, 0.0, 131.0, 105.0, 0.5, 0.0, 157.0, 4.0, 0.3, 0.0, 157.0, 105.0, 0.6, 0.0, 7.0, 72.0, 0.4, 0.0, 7.0, 107.0, 0.5, 0.0, 7.0, 152.0, 0.4, 0.0, 72.0, 7.0, 0.4, 0.0, 72.0, 152.0, 0.5, 0.0, 72.0, 107.0, 0.4, 0.0, 107.0, 7.0, 0.5, 0.0, 107.0, 72.0, 0.4, 0.0, 107.0, 152.0, 0.6, 0.0, 152.0, 7.0, 0.4, 0.0, 152.0, 72.0, 0.5, 0.0, 152.0, 107.0, 0.6, 0.0, 42.0, 104.0, 0.6, 0.0, 42.0, 112.0, 0.4, 0.0, 42.0, 193.0, 0.5, 0.4, 104.0, 42.0, 0.6, 0.0, 104.0, 186.0, 0.4, 0.0, 104.0, 193.0, 0.4, 0.0, 193.0, 42.0, 0.5, -0.4, 193.0, 104.0, 0.4, 0.0, 193.0, 186.0, 0.5, 0.0, 112.0, 42.0, 0.4, 0.0, 112.0, 186.0, 0.5, 0.0, 119.0, 186.0, 0.5, 0.0, 119.0, 113.0, 0.4, 0.0, 119.0, 88.0, 0.55, 0.0, 186.0, 119.0, 0.5, 0.0, 186.0, 88.0, 0.45, 0.0, 113.0, 119.0, 0.4, 0.0, 113.0, 88.0, 0.35, 0.0, 88.0, 119.0, 0.55, 0.0, 88.0, 186.0, 0.45, 0.0, 88.0, 113.0, 0.35, 0.0, 12.0, 29.0, 0.5, 0.0, 12.0, 185.0, 0.3, 0.0, 12.0, 187.0, 0.7, 0.0, 29.0, 12.0, 0.5, 0.0, 29.0, 185.0, 0.2, 0.0, 29.0, 187.0, 0.4, 0.0, 185.0, 12.0, 0.3, 0.0, 185.0, 29.0, 0.2, 0.0, 185.0, 56.0, 0.4, 0.0, 187.0, 12.0, 0.7, 0.0, 187.0, 15.0, 0.5, 0.0, 187.0, 29.0, 0.4, 0.0, 11.0, 19.0, 0.3, 0.0, 11.0, 114.0, 0.4, 0.0, 19.0, 11.0, 0.3, 0.0, 19.0, 114.0, 0.600000023841858, 0.5, 19.0, 194.0, 0.4, 0.0, 114.0, 11.0, 0.4, 0.0, 114.0, 19.0, 0.600000023841858, -0.5, 114.0, 194.0, 0.5, 0.0, 194.0, 19.0, 0.4, 0.0, 194.0, 114.0, 0.5, 0.0, 13.0, 69.0, 0.7, 0.0, 13.0, 81.0, 0.6, 0.0, 13.0, 70.0, 0.35, 0.0, 81.0, 13.0, 0.6, 0.0, 81.0, 69.0, 0.5, 0.0, 81.0, 78.0, -0.8, 0.0, 69.0, 13.0, 0.7, 0.0, 69.0, 81.0, 0.5, 0.0, 69.0, 70.0, 0.3, 0.0, 70.0, 13.0, 0.4, 0.0, 70.0, 69.0, 0.3, 0.0, 82.0, 91.0, 0.5, 0.0, 82.0, 158.0, 0.6, 0.0, 91.0, 82.0, 0.5, 0.0, 91.0, 94.0, 0.7, 0.0, 91.0, 158.0, 0.4, 0.0, 94.0, 91.0, 0.7, 0.0, 94.0, 158.0, 0.5, 0.0, 158.0, 82.0, 0.6, 0.0, 158.0, 91.0, 0.4, 0.0, 158.0, 94.0, 0.5, 0.0, 4.0, 13.0, 0.5, 0.0, 4.0, 16.0, 0.4, 0.0, 4.0, 178.0, 0.5, 0.0, 13.0, 4.0, 0.5, 0.0, 13.0, 157.0, 0.6, 0.0, 13.0, 178.0, 0.6, 0.0, 16.0, 4.0, 0.4, 0.0, 16.0, 178.0, 0.4, 0.0, 105.0, 157.0, 0.7, 0.0, 105.0, 178.0, 0.3, 0.0, 157.0, 13.0, 0.6, 0.0, 157.0, 105.0, 0.7, 0.0, 157.0, 178.0, 0.3, 0.0, 178.0, 4.0, 0.5, 0.0, 178.0, 13.0, 0.6, 0.0, 178.0, 16.0, 0.4, 0.0, 178.0, 157.0, 0.3, 0.0, 160.0, 161.0, 0.6, 0.0, 160.0, 168.0, 0.3, 0.0, 160.0, 174.0, 0.4, 0.0, 161.0, 160.0, 0.6, 0.0, 161.0, 168.0, 0.4, 0.0, 161.0, 190.0, 0.5, 0.0, 168.0, 160.0, 0.3, 0.0, 168.0, 161.0, 0.4, 0.0, 168.0, 190.0, 0.3, 0.0, 174.0, 160.0, 0.4, 0.0, 174.0, 190.0, 0.7, 0.0, 190.0, 161.0, 0.5, 0.0, 190.0, 168.0, 0.3, 0.0, 190.0, 174.0, 0.7, 0.0, 7.0, 53.0, 0.5, 0.0, 7.0, 109.0, 0.5, 0.0, 7.0, 136.0, 0.6, 0.0, 7.0, 165.0, 0.4, 0.0, 53.0, 7.0, 0.5, 0.0, 53.0, 136.0, 0.3, 0.0, 109.0, 7.0, 0.5, 0.0, 109.0, 136.0, 0.5, 0.0, 136.0, 7.0, 0.6, 0.0, 136.0, 109.0, 0.5, 0.0, 136.0, 165.0, 0.6, 0.0, 165.0, 7.0, 0.4, 0.0, 165.0, 109.0, 0.4, 0.0, 165.0, 136.0, 0.6, 0.0, 29.0, 78.0, 0.3, 0.0, 29.0, 171.0, 0.5, 0.0, 37.0, 78.0, 0.5, 0.0, 37.0, 171.0, 0.6, 0.0, 78.0, 29.0, 0.3, 0.0, 78.0, 37.0, 0.5, 0.0, 78.0, 171.0, 0.4, 0.0, 171.0, 29.0, 0.5, 0.0, 171.0, 37.0, 0.6, 0.0, 171.0, 78.0, 0.4, 0.0, 18.0, 75.0, 0.3, 0.0, 18.0, 105.0, 0.8, 0.0, 37.0, 75.0, 0.3, 0.0, 37.0, 76.0, 0.4, 0.0, 37.0, 105.0, 0.4, 0.0, 48.0, 105.0, 0.3, 0.0, 75.0, 18.0, 0.3, 0.0, 75.0, 37.0, 0.3, 0.0, 75.0, 48.0, 0.0, 0.0, 75.0, 105.0, 0.2, 0.0, 76.0, 37.0, 0.4, 0.0, 105.0, 18.0, 0.8, 0.0, 105.0, 37.0, 0.5, 0.0, 105.0, 75.0, 0.2, 0.0, 34.0, 146.0, 0.5, 0.0, 34.0, 172.0, 0.3, 0.0, 34.0, 191.0, 0.6, 0.0, 112.0, 172.0, 0.5, 0.0, 112.0, 191.0, 0.4, 0.0, 146.0, 34.0, 0.5, 0.0, 146.0, 172.0, 0.3, 0.0, 146.0, 191.0, 0.5, 0.0, 172.0, 34.0, 0.3, 0.0, 172.0, 112.0, 0.5, 0.0, 172.0, 146.0, 0.3, 0.0, 191.0, 34.0, 0.6, 0.0, 191.0, 112.0, 0.4, 0.0, 191.0, 146.0, 0.5, 0.0, 6.0, 159.0, 0.7, 0.0, 6.0, 161.0, 0.4, 0.0, 110.0, 114.0, 0.3, 0.0, 110.0, 159.0, 0.5, 0.0, 110.0, 160.0, 0.6, 0.0, 110.0, 161.0, 0.7, 0.0, 114.0, 110.0, 0.3, 0.0, 114.0, 161.0, 0.4, 0.0, 159.0, 6.0, 0.7, 0.0, 159.0, 110.0, 0.5, 0.0, 159.0, 160.0, 0.6, 0.0, 160.0, 110.0, 0.6, 0.0, 160.0, 159.0, 0.6, 0.0, 160.0, 161.0, 0.5, 0.0, 161.0, 110.0, 0.7, 0.0, 161.0, 114.0, 0.4, 0.0, 161.0, 160.0, 0.5, 0.0, 5.0, 31.0, 0.4, 0.0, 5.0, 90.0, 0.4, 0.0, 5.0, 181.0, 0.3, 0.0, 31.0, 5.0, 0.4, 0.0, 31.0, 8.0, 0.5, 0.0, 31.0, 38.0, 0.6, 0.0, 31.0, 181.0, 0.5, 0.0, 38.0, 5.0, 0.3, 0.0, 38.0, 31.0, 0.6, 0.0, 38.0, 78.0, 0.5, 0.0, 38.0, 181.0, 0.4, 0.0, 181.0, 5.0, 0.3, 0.0, 181.0, 31.0, 0.5, 0.0, 181.0, 38.0, 0.4, 0.0, 118.0, 90.0, 0.6, 0.0, 118.0, 119.0, 0.5, 0.0, 118.0, 13.0, 0.4, 0.0, 90.0, 118.0, 0.6, 0.0, 90.0, 119.0, 0.45, 0.0, 90.0, 13.0, 0.5, 0.0, 119.0, 118.0, 0.5, 0.0, 119.0, 90.0, 0.45, 0.0, 119.0, 186.0, 0.3, 0.0, 13.0, 118.0, 0.4, 0.0, 13.0, 90.0, 0.5, 0.0, 13.0, 69.0, 0.55, 0.0, 14.0, 97.0, 0.6, 0.0, 14.0, 141.0, 0.5, 0.0, 14.0, 155.0, 0.4, 0.0, 97.0, 14.0, 0.6, 0.0, 97.0, 141.0, 0.4, 0.0, 97.0, 155.0, 0.5, 0.0, 121.0, 14.0, 0.3, 0.0, 121.0, 141.0, 0.5, 0.0, 141.0, 14.0, 0.5, 0.0, 141.0, 97.0, 0.4, 0.0, 141.0, 121.0, 0.5, 0.0, 141.0, 155.0, 0.4, 0.0, 155.0, 14.0, 0.4, 0.0, 155.0, 97.0, 0.5, 0.0, 155.0, 141.0, 0.4, 0.0, 4.0, 58.0, 0.4, 0.0, 4.0, 137.0, 0.7, 0.0, 58.0, 4.0, 0.4, 0.0, 58.0, 137.0, 0.6, 0.0, 58.0, 140.0, 0.5, 0.0, 137.0, 4.0, 0.7, 0.0, 137.0, 58.0, 0.6, 0.0, 137.0, 140.0, 0.4, 0.0, 140.0, 58.0, 0.5, 0.0, 140.0, 137.0, 0.4, 0.0, 140.0, 162.0, 0.6, 0.0, 162.0, 137.0, 0.3, 0.0, 162.0, 140.0, 0.6, 0.0, 5.0, 75.0, 0.6, 0.0, 5.0, 90.0, 0.3, 0.0, 5.0, 184.0, 0.4, 0.0, 29.0, 75.0, 0.5, 0.0, 29.0, 184.0, 0.4, 0.0, 75.0, 5.0, 0.6, 0.0, 75.0, 29.0, 0.5, 0.0, 75.0, 105.0, -0.6, 0.0, 75.0, 184.0, 0.5, 0.0, 184.0, 29.0, 0.4, 0.0, 184.0, 33.0, 0.4, 0.0, 184.0, 75.0, 0.5, 0.0, 93.0, 98.0, 0.5, 0.0, 93.0, 135.0, 0.5, 0.0, 98.0, 93.0, 0.5, 0.0, 98.0, 142.0, 0.7, 0.0, 98.0, 155.0, 0.5, 0.0, 135.0, 93.0, 0.5, 0.0, 135.0, 142.0, 0.4, 0.0, 142.0, 98.0, 0.7, 0.0, 142.0, 135.0, 0.4, 0.0, 142.0, 155.0, 0.4, 0.0, 155.0, 98.0, 0.5, 0.0, 155.0, 142.0, 0.4, 0.0, 7.0, 50.0, 0.5, 0.0, 7.0, 101.0, 0.4, 0.0, 9.0, 100.0, 0.8, 0.0, 9.0, 101.0, 0.5, 0.0, 100.0, 9.0, 0.8, 0.0, 100.0, 101.0, 0.7, 0.0, 101.0, 7.0, 0.4, 0.0, 101.0, 9.0, 0.5, 0.0, 101.0, 100.0, 0.7, 0.0, 97.0, 104.0, 0.4, 0.0, 97.0, 168.0, 0.3, 0.0, 97.0, 183.0, 0.5, 0.0, 104.0, 97.0, 0.4, 0.0, 104.0, 121.0, 0.3, 0.0, 121.0, 104.0, 0.3, 0.0, 121.0, 183.0, 0.4, 0.0, 168.0, 97.0, 0.3, 0.0, 168.0, 182.0, 0.5, 0.0, 168.0, 183.0, 0.6, 0.0, 182.0, 168.0, 0.5, 0.0, 182.0, 183.0, 0.4, 0.0, 183.0, 97.0, 0.5, 0.0, 183.0, 121.0, 0.4, 0.0, 183.0, 168.0, 0.6, 0.0, 51.0, 106.0, 0.5, 0.0, 51.0, 112.0, 0.6, 0.0, 51.0, 172.0, 0.4, 0.0, 106.0, 51.0, 0.5, 0.0, 106.0, 112.0, 0.4, 0.0, 106.0, 172.0, 0.5, 0.0, 112.0, 51.0, 0.6, 0.0, 112.0, 106.0, 0.4, 0.0, 172.0, 51.0, 0.4, 0.0, 172.0, 106.0, 0.5, 0.0, 40.0, 38.0, 0.6, 0.0, 40.0, 71.0, 0.55, 0.0, 40.0, 124.0, 0.5, 0.0, 38.0, 40.0, 0.6, 0.0, 38.0, 71.0, 0.5, 0.0, 38.0, 31.0, 0.4, 0.0, 71.0, 40.0, 0.55, 0.0, 71.0, 38.0, 0.5, 0.0, 71.0, 124.0, 0.45, 0.0, 124.0, 40.0, 0.5, 0.0, 124.0, 71.0, 0.45, 0.0, 124.0, 174.0, 0.3, 0.0, 31.0, 38.0, 0.4, 0.0, 174.0, 124.0, 0.3, 0.0, 5.0, 87.0, 0.5, 0.0, 5.0, 89.0, 0.6, 0.0, 5.0, 127.0, 0.5, 0.0, 78.0, 69.0, 0.4, 0.0, 78.0, 87.0, 0.6, 0.0, 87.0, 78.0, 0.6, 0.0, 87.0, 81.0, 0.7, 0.0, 87.0, 89.0, 0.5, 0.0, 87.0, 127.0, 0.4, 0.0, 127.0, 5.0, 0.5, 0.0, 127.0, 69.0, 0.5, 0.0, 127.0, 87.0, 0.4, 0.0, 2.0, 61.0, 0.5, 0.0, 2.0, 150.0, 0.5, 0.0, 2.0, 160.0, 0.4, 0.0, 4.0, 61.0, 0.3, 0.0, 4.0, 150.0, 0.4, 0.0, 61.0, 2.0, 0.5, 0.0, 61.0, 150.0, 0.6, 0.0, 61.0, 151.0, 0.3, 0.0, 150.0, 2.0, 0.5, 0.0, 150.0, 61.0, 0.6, 0.0, 150.0, 160.0, 0.4, 0.0, 151.0, 61.0, 0.3, 0.0, 151.0, 160.0, 0.5, 0.0, 160.0, 2.0, 0.4, 0.0, 160.0, 150.0, 0.4, 0.0, 160.0, 151.0, 0.5, 0.0, 67.0, 168.0, 0.5, 0.0, 67.0, 182.0, 0.5, 0.0, 168.0, 67.0, 0.5, 0.0, 168.0, 182.0, 0.6, 0.0, 168.0, 183.0, 0.300000011920929, 0.200000002980232, 182.0, 67.0, 0.5, 0.0, 182.0, 168.0, 0.6, 0.0, 182.0, 183.0, 0.4, 0.0, 183.0, 168.0, 0.300000011920929, -0.200000002980232, 183.0, 182.0, 0.4, 0.0, 46.0, 47.0, 0.7, 0.0, 46.0, 65.0, 0.4, 0.0, 47.0, 46.0, 0.7, 0.0, 47.0, 55.0, 0.2, 0.0, 47.0, 78.0, 0.3, 0.0, 55.0, 47.0, 0.3, 0.0, 55.0, 65.0, 0.9, 0.0, 55.0, 78.0, 0.4, 0.0, 65.0, 46.0, 0.3, 0.0, 65.0, 55.0, 0.9, 0.0, 65.0, 92.0, 0.4, 0.0, 78.0, 47.0, 0.2, 0.0, 78.0, 55.0, 0.3, 0.0, 78.0, 92.0, 0.6, 0.0, 92.0, 65.0, 0.2, 0.0, 92.0, 78.0, 0.6, 0.0, 83.0, 84.0, 0.4, 0.0, 83.0, 86.0, 0.5, 0.0, 83.0, 163.0, 0.5, 0.0, 84.0, 83.0, 0.4, 0.0, 84.0, 89.0, 0.3, 0.0, 84.0, 163.0, 0.3, 0.0, 86.0, 83.0, 0.5, 0.0, 86.0, 89.0, 0.4, 0.0, 86.0, 163.0, 0.6, 0.0, 89.0, 84.0, 0.3, 0.0, 89.0, 86.0, 0.4, 0.0, 89.0, 163.0, 0.5, 0.0, 163.0, 83.0, 0.5, 0.0, 163.0, 86.0, 0.6, 0.0, 163.0, 89.0, 0.5, 0.0, 78.0, 82.0, 0.5, 0.0, 78.0, 96.0, 0.4, 0.0, 78.0, 121.0, 0.5, 0.0, 82.0, 78.0, 0.5, 0.0, 82.0, 96.0, 0.6, 0.0, 82.0, 158.0, 0.5, 0.0, 96.0, 78.0, 0.4, 0.0, 96.0, 82.0, 0.6, 0.0, 96.0, 158.0, 0.5, 0.0, 121.0, 78.0, 0.5, 0.0, 121.0, 158.0, 0.4, 0.0, 158.0, 82.0, 0.5, 0.0, 158.0, 96.0, 0.5, 0.0, 158.0, 121.0, 0.4, 0.0, 117.0, 193.0, 0.4, 0.0, 117.0, 112.0, 0.3, 0.0, 117.0, 23.0, 0.35, 0.0, 193.0, 117.0, 0.4, 0.0, 193.0, 186.0, 0.5, 0.0, 186.0, 193.0, 0.5, 0.0, 186.0, 112.0, 0.5, 0.0, 23.0, 117.0, 0.35, 0.0, 23.0, 193.0, 0.3, 0.0, 7.0, 50.0, 0.7, 0.0, 7.0, 76.0, 0.3, 0.0, 7.0, 108.0, 0.5, 0.0, 37.0, 50.0, 0.6, 0.0, 37.0, 76.0, 0.4, 0.0, 50.0, 7.0, 0.7, 0.0, 50.0, 37.0, 0.6, 0.0, 50.0, 76.0, 0.5, 0.0, 76.0, 37.0, 0.4, 0.0, 76.0, 50.0, 0.5, 0.0, 108.0, 7.0, 0.5, 0.0, 108.0, 50.0, 0.3, 0.0, 47.0, 54.0, 0.5, 0.0, 47.0, 86.0, 0.6, 0.0, 47.0, 166.0, 0.6, 0.0, 54.0, 47.0, 0.5, 0.0, 54.0, 86.0, 0.4, 0.0, 54.0, 166.0, 0.3, 0.0, 86.0, 47.0, 0.6, 0.0, 86.0, 54.0, 0.4, 0.0, 86.0, 166.0, 0.5, 0.0, 166.0, 47.0, 0.6, 0.0, 166.0, 54.0, 0.3, 0.0, 166.0, 86.0, 0.5, 0.0, 34.0, 151.0, 0.6, 0.0, 34.0, 160.0, 0.5, 0.0, 34.0, 172.0, 0.3, 0.0, 151.0, 34.0, 0.6, 0.0, 151.0, 160.0, 0.7, 0.0, 160.0, 34.0, 0.5, 0.0, 160.0, 151.0, 0.7, 0.0, 160.0, 172.0, 0.3, 0.0, 172.0, 34.0, 0.3, 0.0, 172.0, 160.0, 0.3, 0.0, 24.0, 36.0, 0.6, 0.0, 35.0, 36.0, 0.5, 0.0, 35.0, 70.0, 0.3, 0.0, 36.0, 24.0, 0.6, 0.0, 36.0, 35.0, 0.5, 0.0, 36.0, 70.0, 0.4, 0.0, 70.0, 35.0, 0.3, 0.0, 70.0, 36.0, 0.4, 0.0, 84.0, 130.0, 0.4, 0.0, 84.0, 132.0, 0.3, 0.0, 84.0, 134.0, 0.6, 0.0, 121.0, 130.0, 0.3, 0.0, 121.0, 132.0, 0.7, 0.0, 121.0, 134.0, 0.4, 0.0, 130.0, 84.0, 0.4, 0.0, 130.0, 132.0, 0.6, 0.0, 130.0, 134.0, 0.5, 0.0, 132.0, 84.0, 0.3, 0.0, 132.0, 121.0, 0.7, 0.0, 132.0, 130.0, 0.6, 0.0, 134.0, 84.0, 0.6, 0.0, 134.0, 121.0, 0.4, 0.0, 134.0, 130.0, 0.5, 0.0, 13.0, 89.0, 0.4, 0.0, 13.0, 115.0, 0.5, 0.0, 13.0, 187.0, 0.5, 0.0, 89.0, 13.0, 0.4, 0.0, 89.0, 115.0, 0.5, 0.0, 89.0, 166.0, 0.4, 0.0, 89.0, 187.0, 0.3, 0.0, 115.0, 13.0, 0.5, 0.0, 115.0, 89.0, 0.5, 0.0, 166.0, 89.0, 0.4, 0.0, 166.0, 187.0, 0.6, 0.0, 187.0, 13.0, 0.5, 0.0, 187.0, 89.0, 0.3, 0.0, 187.0, 166.0, 0.6, 0.0, 4.0, 57.0, 0.5, 0.0, 4.0, 137.0, 0.5, 0.0, 4.0, 174.0, 0.4, 0.0, 57.0, 4.0, 0.5, 0.0, 57.0, 79.0, 0.4, 0.0, 57.0, 174.0, 0.6, 0.0, 79.0, 57.0, 0.4, 0.0, 79.0, 137.0, 0.3, 0.0, 79.0, 174.0, 0.5, 0.0, 137.0, 4.0, 0.5, 0.0, 137.0, 79.0, 0.3, 0.0, 174.0, 4.0, 0.4, 0.0, 174.0, 57.0, 0.6, 0.0, 174.0, 79.0, 0.5, 0.0, 56.0, 64.0, 0.6, 0.0, 56.0, 148.0, 0.5, 0.0, 64.0, 56.0, 0.6, 0.0, 64.0, 148.0, 0.2, 0.0, 64.0, 149.0, 0.5, 0.0, 70.0, 56.0, 0.4, 0.0, 70.0, 64.0, 0.3, 0.0, 70.0, 148.0, 0.3, 0.0, 70.0, 149.0, 0.4, 0.0, 148.0, 56.0, 0.5, 0.0, 148.0, 64.0, 0.2, 0.0, 148.0, 149.0, 0.3, 0.0, 149.0, 64.0, 0.5, 0.0, 149.0, 148.0, 0.3, 0.0, 151.0, 33.0, 0.4, 0.0, 151.0, 56.0, 0.5, 0.0, 151.0, 62.0, 0.6, 0.0, 151.0, 70.0, 0.3, 0.0, 62.0, 29.0, 0.3, 0.0, 62.0, 33.0, 0.4, 0.0, 62.0, 34.0, 0.5, 0.0, 133.0, 150.0, 0.5, 0.0, 133.0, 176.0, 0.4, 0.0, 150.0, 133.0, 0.5, 0.0, 150.0, 159.0, 0.4, 0.0, 150.0, 160.0, 0.3, 0.0, 159.0, 150.0, 0.4, 0.0, 159.0, 160.0, 0.6, 0.0, 159.0, 161.0, 0.5, 0.0, 160.0, 150.0, 0.3, 0.0, 160.0, 159.0, 0.6, 0.0, 160.0, 161.0, 0.5, 0.0, 161.0, 159.0, 0.5, 0.0, 161.0, 160.0, 0.5, 0.0, 161.0, 176.0, 0.3, 0.0, 176.0, 133.0, 0.4, 0.0, 176.0, 159.0, 0.4, 0.0, 176.0, 161.0, 0.3, 0.0, 3.0, 78.0, 0.3, 0.0, 3.0, 129.0, 0.6, 0.0, 3.0, 180.0, 0.5, 0.0, 78.0, 3.0, 0.3, 0.0, 78.0, 129.0, 0.5, 0.0, 129.0, 3.0, 0.6, 0.0, 129.0, 75.0, 0.3, 0.0, 129.0, 78.0, 0.5, 0.0, 129.0, 180.0, 0.4, 0.0, 180.0, 3.0, 0.5, 0.0, 180.0, 78.0, 0.3, 0.0, 180.0, 129.0, 0.4, 0.0, 17.0, 26.0, 0.5, 0.0, 17.0, 77.0, 0.6, 0.0, 17.0, 143.0, 0.400000005960464, 0.300000011920929, 26.0, 17.0, 0.5, 0.0, 26.0, 77.0, 0.5, 0.0, 26.0, 143.0, 0.5, 0.0, 77.0, 17.0, 0.6, 0.0, 77.0, 26.0, 0.5, 0.0, 77.0, 143.0, 0.4, 0.0, 143.0, 17.0, 0.400000005960464, -0.300000011920929, 143.0, 26.0, 0.5, 0.0, 143.0, 77.0, 0.4, 0.0, 143.0, 39.0, 0.35, 0.0, 39.0, 143.0, 0.35, 0.0, 91.0, 94.0, 0.7, 0.0, 91.0, 123.0, 0.4, 0.0, 91.0, 158.0, 0.5, 0.0, 94.0, 91.0, 0.7, 0.0, 94.0, 158.0, 0.6, 0.0, 94.0, 162.0, 0.4, 0.0, 123.0, 91.0, 0.4, 0.0, 123.0, 158.0, 0.5, 0.0, 123.0, 162.0, 0.6, 0.0, 158.0, 91.0, 0.5, 0.0, 158.0, 94.0, 0.6, 0.0, 158.0, 123.0, 0.5, 0.0, 162.0, 94.0, 0.4, 0.0, 162.0, 123.0, 0.6, 0.0, 44.0, 71.0, 0.7, 0.0, 44.0, 99.0, 0.6, 0.0, 44.0, 173.0, 0.4, 0.0, 71.0, 44.0, 0.7, 0.0, 71.0, 99.0, 0.4, 0.0, 71.0, 173.0, 0.6, 0.0, 91.0, 44.0, 0.3, 0.0, 91.0, 99.0, 0.5, 0.0, 99.0, 44.0, 0.6, 0.0, 99.0, 71.0, 0.4, 0.0, 99.0, 91.0, 0.5, 0.0, 173.0, 44.0, 0.4, 0.0, 173.0, 71.0, 0.6, 0.0, 7.0, 110.0, 0.3, 0.0, 7.0, 125.0, 0.5, 0.0, 84.0, 110.0, 0.4, 0.0, 84.0, 125.0, 0.5, 0.0, 110.0, 84.0, 0.4, 0.0, 110.0, 125.0, 0.6, 0.0, 110.0, 159.0, 0.3, 0.0, 125.0, 7.0, 0.5, 0.0, 125.0, 9.0, 0.4, 0.0, 125.0, 84.0, 0.5, 0.0, 125.0, 110.0, 0.6, 0.0, 31.0, 144.0, 0.5, 0.0, 31.0, 32.0, 0.4, 0.0, 31.0, 4.0, 0.35, 0.0, 144.0, 31.0, 0.5, 0.0, 144.0, 70.0, 0.45, 0.0, 144.0, 4.0, 0.4, 0.0, 32.0, 31.0, 0.4, 0.0, 32.0, 38.0, 0.3, 0.0, 4.0, 31.0, 0.35, 0.0, 4.0, 144.0, 0.4, 0.0, 4.0, 70.0, 0.5, 0.0, 70.0, 144.0, 0.45, 0.0, 70.0, 4.0, 0.5, 0.0, 14.0, 105.0, 0.5, 0.0, 14.0, 112.0, 0.5, 0.0, 14.0, 164.0, 0.3, 0.0, 105.0, 14.0, 0.5, 0.0, 105.0, 112.0, 0.6, 0.0, 105.0, 188.0, 0.5, 0.0, 112.0, 14.0, 0.5, 0.0, 112.0, 105.0, 0.6, 0.0, 164.0, 14.0, 0.3, 0.0, 164.0, 105.0, 0.4, 0.0, 188.0, 105.0, 0.5, 0.0, 188.0, 112.0, 0.3, 0.0, 153.0, 60.0, 0.4, 0.0, 153.0, 187.0, 0.35, 0.0, 153.0, 90.0, 0.3, 0.0, 60.0, 153.0, 0.4, 0.0, 60.0, 187.0, 0.45, 0.0, 60.0, 90.0, 0.5, 0.0, 187.0, 153.0, 0.35, 0.0, 187.0, 60.0, 0.45, 0.0, 90.0, 153.0, 0.3, 0.0, 90.0, 60.0, 0.5, 0.0, 13.0, 103.0, 0.7, 0.0, 75.0, 139.0, 0.7, 0.0, 75.0, 153.0, 0.4, 0.0, 103.0, 13.0, 0.7, 0.0, 103.0, 116.0, 0.5, 0.0, 103.0, 139.0, 0.3, 0.0, 116.0, 103.0, 0.5, 0.0, 116.0, 139.0, 0.4, 0.0, 139.0, 75.0, 0.7, 0.0, 139.0, 116.0, 0.4, 0.0, 139.0, 153.0, 0.6, 0.0, 153.0, 75.0, 0.4, 0.0, 153.0, 139.0, 0.6, 0.0, 4.0, 45.0, 0.5, 0.0, 4.0, 137.0, 0.6, 0.0, 29.0, 45.0, 0.3, 0.0, 29.0, 137.0, 0.5, 0.0, 45.0, 4.0, 0.5, 0.0, 45.0, 29.0, 0.3, 0.0, 45.0, 137.0, 0.4, 0.0, 137.0, 4.0, 0.6, 0.0, 137.0, 29.0, 0.5, 0.0, 137.0, 45.0, 0.4, 0.0, 67.0, 91.0, 0.5, 0.0, 67.0, 168.0, 0.5, 0.0, 67.0, 182.0, 0.6, 0.0, 91.0, 67.0, 0.5, 0.0, 91.0, 168.0, 0.3, 0.0, 168.0, 67.0, 0.5, 0.0, 168.0, 91.0, 0.3, 0.0, 168.0, 169.0, 0.4, 0.0, 168.0, 182.0, 0.7, 0.0, 169.0, 67.0, 0.4, 0.0, 169.0, 168.0, 0.4, 0.0, 169.0, 182.0, 0.5, 0.0, 182.0, 67.0, 0.6, 0.0, 182.0, 168.0, 0.7, 0.0, 182.0, 169.0, 0.5, 0.0, 29.0, 110.0, 0.3, 0.0, 29.0, 160.0, 0.6, 0.0, 29.0, 161.0, 0.5, 0.0, 110.0, 159.0, 0.4, 0.0, 110.0, 160.0, 0.5, 0.0, 110.0, 161.0, 0.7, 0.0, 159.0, 110.0, 0.4, 0.0, 159.0, 160.0, 0.5, 0.0, 159.0, 161.0, 0.4, 0.0, 160.0, 29.0, 0.6, 0.0, 160.0, 110.0, 0.5, 0.0, 160.0, 161.0, 0.6, 0.0, 161.0, 29.0, 0.5, 0.0, 161.0, 110.0, 0.7, 0.0, 161.0, 160.0, 0.6, 0.0, 26.0, 111.0, 0.7, 0.0, 26.0, 138.0, 0.4, 0.0, 91.0, 111.0, 0.3, 0.0, 91.0, 138.0, 0.6, 0.0, 111.0, 26.0, 0.7, 0.0, 111.0, 91.0, 0.3, 0.0, 111.0, 138.0, 0.5, 0.0, 138.0, 26.0, 0.4, 0.0, 138.0, 91.0, 0.6, 0.0, 138.0, 111.0, 0.5, 0.0, 7.0, 20.0, 0.6, 0.0, 7.0, 25.0, 0.5, 0.0, 7.0, 125.0, 0.6, 0.0, 20.0, 7.0, 0.6, 0.0, 20.0, 25.0, 0.7, 0.0, 20.0, 125.0, 0.5, 0.0, 25.0, 7.0, 0.5, 0.0, 25.0, 20.0, 0.7, 0.0, 25.0, 125.0, 0.4, 0.0, 125.0, 7.0, 0.6, 0.0, 125.0, 20.0, 0.5, 0.0, 125.0, 25.0, 0.4, 0.0, 125.0, 49.0, 0.5, 0.0, 125.0, 78.0, 0.4, 0.0, 125.0, 134.0, 0.6, 0.0, 49.0, 125.0, 0.5, 0.0, 49.0, 78.0, 0.45, 0.0, 49.0, 134.0, 0.4, 0.0, 78.0, 125.0, 0.4, 0.0, 78.0, 49.0, 0.45, 0.0, 134.0, 125.0, 0.6, 0.0, 134.0, 49.0, 0.4, 0.0, 34.0, 56.0, 0.5, 0.0, 34.0, 149.0, 0.6, 0.0, 56.0, 34.0, 0.5, 0.0, 56.0, 149.0, 0.3, 0.0, 149.0, 34.0, 0.6, 0.0, 149.0, 56.0, 0.3, 0.0, 7.0, 99.0, 0.3, 0.0, 7.0, 108.0, 0.6, 0.0, 41.0, 91.0, 0.4, 0.0, 41.0, 99.0, 0.8, 0.0, 91.0, 41.0, 0.4, 0.0, 91.0, 99.0, 0.5, 0.0, 99.0, 41.0, 0.8, 0.0, 99.0, 91.0, 0.5, 0.0, 99.0, 108.0, 0.5, 0.0, 108.0, 7.0, 0.6, 0.0, 108.0, 99.0, 0.5, 0.0, 74.0, 78.0, 0.6, 0.0, 74.0, 154.0, 0.5, 0.0, 74.0, 181.0, 0.5, 0.0, 78.0, 74.0, 0.6, 0.0, 78.0, 181.0, 0.4, 0.0, 102.0, 78.0, 0.3, 0.0, 102.0, 154.0, 0.4, 0.0, 102.0, 181.0, 0.6, 0.0, 154.0, 74.0, 0.5, 0.0, 154.0, 102.0, 0.4, 0.0, 181.0, 74.0, 0.5, 0.0, 181.0, 78.0, 0.4, 0.0, 181.0, 102.0, 0.6, 0.0, 2.0, 34.0, 0.4, 0.0, 2.0, 75.0, 0.6, 0.0, 2.0, 192.0, 0.5, 0.0, 34.0, 2.0, 0.4, 0.0, 34.0, 75.0, 0.7, 0.0, 34.0, 192.0, 0.6, 0.0, 75.0, 2.0, 0.6, 0.0, 75.0, 34.0, 0.7, 0.0, 75.0, 192.0, 0.5, 0.0, 192.0, 2.0, 0.5, 0.0, 192.0, 34.0, 0.6, 0.0, 192.0, 75.0, 0.5, 0.0, 12.0, 15.0, 0.5, 0.0, 12.0, 17.0, 0.3, 0.0, 12.0, 74.0, 0.6, 0.0, 17.0, 74.0, 0.5, 0.0, 17.0, 78.0, 0.4, 0.0, 74.0, 12.0, 0.6, 0.0, 74.0, 17.0, 0.5, 0.0, 74.0, 78.0, 0.7, 0.0, 78.0, 17.0, 0.4, 0.0, 78.0, 74.0, 0.7, 0.0, 5.0, 80.0, 0.4, 0.0, 5.0, 84.0, 0.5, 0.0, 5.0, 90.0, 0.5, 0.0, 80.0, 5.0, 0.4, 0.0, 80.0, 69.0, 0.6, 0.0, 80.0, 84.0, 0.6, 0.0, 84.0, 5.0, 0.5, 0.0, 84.0, 80.0, 0.6, 0.0, 84.0, 90.0, 0.5, 0.0, 90.0, 5.0, 0.5, 0.0, 90.0, 52.0, 0.4, 0.0, 90.0, 84.0, 0.5, 0.0, 91.0, 94.0, 0.6, 0.0, 91.0, 95.0, 0.5, 0.0, 94.0, 91.0, 0.6, 0.0, 94.0, 95.0, 0.7, 0.0, 94.0, 122.0, 0.4, 0.0, 95.0, 91.0, 0.5, 0.0, 95.0, 94.0, 0.7, 0.0, 95.0, 122.0, 0.5, 0.0, 122.0, 94.0, 0.4, 0.0, 122.0, 95.0, 0.5, 0.0, 51.0, 112.0, 0.6, 0.0, 51.0, 168.0, 0.300000011920929, -0.200000002980232, 112.0, 51.0, 0.6, 0.0, 112.0, 168.0, 0.5, 0.300000011920929, 168.0, 51.0, 0.300000011920929, 0.200000002980232, 168.0, 112.0, 0.5, -0.300000011920929, 168.0, 182.0, 0.5, 0.0, 182.0, 112.0, 0.3, 0.0, 182.0, 168.0, 0.5, 0.0, 5.0, 10.0, 0.5, 0.0, 5.0, 111.0, 0.4, 0.0, 10.0, 5.0, 0.5, 0.0, 10.0, 26.0, 0.400000005960464, 0.300000011920929, 10.0, 111.0, 0.5, -0.400000005960464, 26.0, 10.0, 0.400000005960464, -0.300000011920929, 26.0, 111.0, 0.6, 0.0, 111.0, 5.0, 0.4, 0.0, 111.0, 10.0, 0.5, 0.400000005960464, 111.0, 26.0, 0.6, 0.0, 70.0, 10.0, 0.5, 0.0, 70.0, 120.0, 0.3, 0.0, 70.0, 156.0, 0.4, 0.0, 120.0, 70.0, 0.3, 0.0, 120.0, 156.0, 0.6, 0.0, 156.0, 70.0, 0.4, 0.0, 156.0, 120.0, 0.6, 0.0, 73.0, 92.0, 0.6, 0.0, 73.0, 128.0, 0.4, 0.0, 73.0, 159.0, 0.7, 0.0, 92.0, 73.0, 0.6, 0.0, 92.0, 128.0, 0.7, 0.0, 92.0, 159.0, 0.4, 0.0, 128.0, 73.0, 0.4, 0.0, 128.0, 92.0, 0.7, 0.0, 159.0, 73.0, 0.7, 0.0, 159.0, 92.0, 0.4, 0.0, 21.0, 189.0, 0.55, 0.0, 21.0, 147.0, 0.4, 0.0, 21.0, 63.0, 0.35, 0.0, 189.0, 21.0, 0.55, 0.0, 189.0, 147.0, 0.3, 0.0, 189.0, 63.0, 0.4, 0.0, 147.0, 21.0, 0.4, 0.0, 147.0, 189.0, 0.3, 0.0, 147.0, 63.0, 0.25, 0.0, 63.0, 21.0, 0.35, 0.0, 63.0, 189.0, 0.4, 0.0, 63.0, 147.0, 0.25, 0.0, 86.0, 110.0, 0.5, 0.0, 86.0, 111.0, 0.4, 0.0, 86.0, 163.0, 0.6, 0.0, 110.0, 86.0, 0.5, 0.0, 110.0, 111.0, 0.5, 0.0, 110.0, 167.0, 0.4, 0.0, 111.0, 86.0, 0.4, 0.0, 111.0, 110.0, 0.5, 0.0, 111.0, 163.0, 0.4, 0.0, 163.0, 86.0, 0.6, 0.0, 163.0, 111.0, 0.4, 0.0, 163.0, 167.0, 0.3, 0.0, 167.0, 110.0, 0.4, 0.0, 167.0, 163.0, 0.3, 0.0, 2.0, 120.0, 0.5, 0.0, 2.0, 165.0, 0.3, 0.0, 2.0, 179.0, 0.4, 0.0, 101.0, 126.0, 0.3, 0.0, 101.0, 165.0, 0.4, 0.0, 101.0, 179.0, 0.6, 0.0, 126.0, 101.0, 0.3, 0.0, 126.0, 165.0, 0.4, 0.0, 165.0, 2.0, 0.3, 0.0, 165.0, 101.0, 0.4, 0.0, 165.0, 179.0, 0.5, 0.0, 179.0, 2.0, 0.4, 0.0, 179.0, 101.0, 0.6, 0.0, 179.0, 165.0, 0.5, 0.0, 121.0, 116.0, 0.5, 0.0, 121.0, 70.0, 0.3, 0.0, 121.0, 13.0, 0.5, 0.0, 121.0, 78.0, 0.5, 0.0, 116.0, 121.0, 0.5, 0.0, 116.0, 70.0, 0.4, 0.0, 116.0, 13.0, 0.3, 0.0, 116.0, 78.0, 0.5, 0.0, 70.0, 121.0, 0.3, 0.0, 70.0, 116.0, 0.4, 0.0, 70.0, 13.0, 0.4, 0.0, 78.0, 121.0, 0.5, 0.0, 78.0, 116.0, 0.5, 0.0, 78.0, 13.0, 0.5, 0.0, 78.0, 81.0, 0.5, 0.0, 68.0, 116.0, 0.5, 0.0, 68.0, 142.0, 0.7, 0.0, 68.0, 181.0, 0.4, 0.0, 116.0, 68.0, 0.5, 0.0, 116.0, 142.0, 0.6, 0.0, 116.0, 172.0, 0.5, 0.0, 142.0, 68.0, 0.7, 0.0, 142.0, 116.0, 0.6, 0.0, 142.0, 170.0, 0.4, 0.0, 170.0, 68.0, 0.4, 0.0, 170.0, 142.0, 0.4, 0.0, 172.0, 116.0, 0.5, 0.0, 172.0, 181.0, 0.5, 0.0, 181.0, 68.0, 0.4, 0.0, 181.0, 172.0, 0.5, 0.0, 29.0, 30.0, 0.4, 0.0, 29.0, 33.0, 0.3, 0.0, 29.0, 34.0, 0.6, 0.0, 30.0, 29.0, 0.4, 0.0, 30.0, 35.0, 0.2, 0.0, 33.0, 29.0, 0.3, 0.0, 33.0, 35.0, 0.5, 0.0, 34.0, 29.0, 0.6, 0.0, 34.0, 33.0, 0.4, 0.0, 34.0, 35.0, 0.4, 0.0, 35.0, 29.0, 0.5, 0.0, 35.0, 30.0, 0.2, 0.0, 35.0, 33.0, 0.5, 0.0, 35.0, 34.0, 0.4, 0.0, 1.0, 8.0, 0.5, 0.0, 1.0, 10.0, 0.4, 0.0, 1.0, 113.0, 0.4, 0.0, 8.0, 1.0, 0.5, 0.0, 8.0, 10.0, 0.5, 0.0, 8.0, 113.0, 0.3, 0.0, 10.0, 1.0, 0.4, 0.0, 10.0, 8.0, 0.5, 0.0, 10.0, 113.0, 0.300000011920929, 0.5, 113.0, 1.0, 0.4, 0.0, 113.0, 8.0, 0.3, 0.0, 113.0, 10.0, 0.300000011920929, -0.5, 69.0, 13.0, 0.7, 0.0, 69.0, 81.0, 0.5, 0.0, 69.0, 70.0, 0.35, 0.0, 13.0, 69.0, 0.7, 0.0, 13.0, 81.0, 0.4, 0.0, 81.0, 69.0, 0.5, 0.0, 81.0, 13.0, 0.4, 0.0, 81.0, 70.0, 0.3, 0.0, 70.0, 69.0, 0.35, 0.0, 70.0, 81.0, 0.3, 0.0, 43.0, 44.0, 0.6, 0.0, 43.0, 51.0, 0.3, 0.0, 43.0, 77.0, 0.3, 0.4, 44.0, 43.0, 0.6, 0.0, 44.0, 51.0, 0.4, 0.0, 44.0, 77.0, 0.5, 0.3, 51.0, 43.0, 0.3, 0.0, 51.0, 44.0, 0.4, 0.0, 77.0, 43.0, 0.3, -0.4, 77.0, 44.0, 0.5, -0.3, 17.0, 27.0, 0.2, 0.0, 17.0, 74.0, 0.25, 0.0, 17.0, 105.0, 0.35, 0.0, 22.0, 27.0, 0.3, 0.0, 22.0, 105.0, 0.4, 0.0, 22.0, 187.0, 0.2, 0.0, 27.0, 17.0, 0.2, 0.0, 27.0, 22.0, 0.3, 0.0, 27.0, 105.0, 0.3, 0.0, 74.0, 17.0, 0.25, 0.0, 74.0, 187.0, 0.15, 0.0, 105.0, 17.0, 0.35, 0.0, 105.0, 22.0, 0.4, 0.0, 105.0, 27.0, 0.3, 0.0, 105.0, 187.0, 0.2, 0.0, 187.0, 22.0, 0.2, 0.0, 187.0, 74.0, 0.15, 0.0, 187.0, 105.0, 0.2, 0.0, 20.0, 59.0, 0.5, 0.0, 20.0, 17.0, 0.45, 0.0, 20.0, 66.0, 0.35, 0.0, 59.0, 20.0, 0.5, 0.0, 59.0, 17.0, 0.3, 0.0, 59.0, 147.0, 0.55, 0.0, 17.0, 20.0, 0.45, 0.0, 17.0, 59.0, 0.3, 0.0, 17.0, 66.0, 0.4, 0.0, 66.0, 20.0, 0.35, 0.0, 66.0, 17.0, 0.4, 0.0, 147.0, 59.0, 0.55, 0.0, 105.0, 28.0, 0.6, 0.0, 105.0, 30.0, 0.4, 0.0, 105.0, 34.0, 0.5, 0.0, 105.0, 35.0, 0.7, 0.0, 14.0, 24.0, 0.3, 0.0, 14.0, 159.0, 0.3, 0.0, 14.0, 192.0, 0.4, 0.0, 37.0, 145.0, 0.5, 0.0, 37.0, 192.0, 0.6, 0.0, 145.0, 37.0, 0.5, 0.0, 145.0, 192.0, 0.7, 0.0, 159.0, 36.0, 0.4, 0.0, 159.0, 37.0, 0.4, 0.0, 159.0, 145.0, 0.5, 0.0, 159.0, 192.0, 0.5, 0.0, 192.0, 14.0, 0.4, 0.0, 192.0, 37.0, 0.6, 0.0, 192.0, 145.0, 0.7, 0.0, 192.0, 159.0, 0.5, 0.0])
+
+
+static func get_bits(index: int) -> Array:
+	"""Unpacked 12-bit axial array"""
+	var result: Array = []
+	for axis in range(BITS_WIDTH):
+		result.append((BITS[index] >> axis) & 1)
+	return result
+
+
+static func get_signature(index: int) -> Array:
+	var result: Array = []
+	for k in range(SIG_OFFSETS[index], SIG_OFFSETS[index + 1]):
+		result.append(EMOJI_TABLE[SIG_IDS[k]])
+	return result
+
+
+static func get_self_energies(index: int) -> Dictionary:
+	var result: Dictionary = {}
+	for k in range(SELF_ENERGY_OFFSETS[index], SELF_ENERGY_OFFSETS[index + 1]):
+		result[EMOJI_TABLE[SELF_ENERGY_IDS[k]]] = SELF_ENERGY_VALUES[k]
+	return result
+
+
+static func get_hamiltonian(index: int) -> Dictionary:
+	"""Same shape as Faction.hamiltonian: float, or Vector2(re, im) when complex"""
+	var result: Dictionary = {}
+	for k in range(COUPLING_OFFSETS[index], COUPLING_OFFSETS[index + 1]):
+		var base = k * COUPLING_STRIDE
+		var source = EMOJI_TABLE[int(COUPLINGS[base])]
+		var target = EMOJI_TABLE[int(COUPLINGS[base + 1])]
+		var im = COUPLINGS[base + 3]
+		if not result.has(source):
+			result[source] = {}
+		result[source][target] = Vector2(COUPLINGS[base + 2], im) if im != 0.0 else COUPLINGS[base + 2]
+	return result
+
+
+static func find(name: String) -> int:
+	return NAMES.find(name)
@@ -906,31 +906,368 @@ const ALL_FACTIONS = [
 	}
 ]
 
+## Lookup Indexes (positions in ALL_FACTIONS)
+const FACTION_INDEX_BY_NAME = {
+	"Black Horizon": 0,
+	"Bone Merchants": 1,
+	"Brotherhood of Ash": 2,
+	"Carrion Throne": 3,
+	"Cartographers": 4,
+	"Cartographers of the Impossible": 5,
+	"Celestial Archons": 6,
+	"Children of the Ember": 7,
+	"Chop Docs": 8,
+	"Chorus of Oblivion": 9,
+	"Chronicle Keepers": 10,
+	"Clan of the Hidden Root": 11,
+	"Cult of the Drowned Star": 12,
+	"Debt Wardens": 13,
+	"Engram Freighters": 14,
+	"Fencebreakers": 15,
+	"Flesh Architects": 16,
+	"Gearwright Circle": 17,
+	"Granary Guilds": 18,
+	"Hearth Keepers": 19,
+	"Hearth Witches": 20,
+	"Helix Conservatory": 21,
+	"House of Thorns": 22,
+	"Ink Wardens": 23,
+	"Iron Confessors": 24,
+	"Iron Shepherds": 25,
+	"Irrigation Jury": 26,
+	"Keepers of Silence": 27,
+	"Kilowatt Collective": 28,
+	"Knot-Shriners": 29,
+	"Lantern Cant": 30,
+	"Laughing Court": 31,
+	"Ledger Bailiffs": 32,
+	"Locusts": 33,
+	"Loom Priests": 34,
+	"Market Spirits": 35,
+	"Measure Scribes": 36,
+	"Memory Merchants": 37,
+	"Memory Weavers": 38,
+	"Millwright's Union": 39,
+	"Monolith Masons": 40,
+	"Mossline Brokers": 41,
+	"Mycelial Web": 42,
+	"Nexus Wardens": 43,
+	"Obsidian Will": 44,
+	"Order of the Crimson Scale": 45,
+	"Pack Lords": 46,
+	"Plague Vectors": 47,
+	"Pollinator Guild": 48,
+	"Quarantine Sealwrights": 49,
+	"Quay Rooks": 50,
+	"Reality Midwives": 51,
+	"Relay Lattice": 52,
+	"Resonance Dancers": 53,
+	"Rocketwright Institute": 54,
+	"Rose Wardens": 55,
+	"Sacred Flame Keepers": 56,
+	"Salt Scribes": 57,
+	"Salt-Runners": 58,
+	"Scythe Provosts": 59,
+	"Seamstress Syndicate": 60,
+	"Seedvault Curators": 61,
+	"Star-Charter Enclave": 62,
+	"Starforge Reliquary": 63,
+	"Station Lords": 64,
+	"Swift Herd": 65,
+	"Symphony Smiths": 66,
+	"Syndicate of Glass": 67,
+	"Terrarium Collective": 68,
+	"The Gilded Legacy": 69,
+	"The Indelible Precept": 70,
+	"The Liminal Osmosis": 71,
+	"The Liminal Taper": 72,
+	"The Opalescent Hegemon": 73,
+	"The Scavenged Psithurism": 74,
+	"The Sovereign Ukase": 75,
+	"The Submersed": 76,
+	"The Vitreous Scrutiny": 77,
+	"Tinker Team": 78,
+	"Umbra Exchange": 79,
+	"Veiled Sisters": 80,
+	"Verdant Pulse": 81,
+	"Void Emperors": 82,
+	"Void Serfs": 83,
+	"Void Troubadours": 84,
+	"Volcanic Foundry": 85,
+	"Vortex Readers": 86,
+	"Wildfire": 87,
+	"Yeast Prophets": 88
+}
+
+const FACTION_INDICES_BY_RING = {
+	"outer": [0, 3, 6, 51],
+	"second": [1, 2, 4, 5, 7, 15, 20, 21, 22, 24, 25, 29, 30, 31, 33, 34, 35, 37, 40, 41, 44, 45, 46, 47, 50, 55, 56, 58, 60, 62, 63, 64, 66, 67, 71, 74, 75, 79, 80, 84, 85, 87],
+	"third": [8, 9, 10, 12, 13, 16, 23, 27, 38, 53, 57, 72, 73, 76, 77, 82, 86, 88],
+	"center": [11, 17, 18, 19, 26, 28, 39, 42, 48, 52, 61, 65, 68, 78, 81],
+	"first": [14, 32, 36, 43, 49, 54, 59, 69, 70],
+	"fourth": [83]
+}
+
+const FACTION_INDICES_BY_DOMAIN = {
+	"Boundary": [0],
+	"Commerce": [1, 18, 35, 37, 43, 57, 69],
+	"Military": [2, 7, 25, 45, 46, 59],
+	"Civic": [3, 11, 19, 22, 26, 32, 36, 48, 49, 65, 68, 81, 82],
+	"Scavenger": [4, 33],
+	"Navigation": [5],
+	"Mystic": [6, 20, 24, 27, 29, 30, 34, 41, 42, 51, 56, 86, 88],
+	"Medicine": [8],
+	"Dissolution": [9],
+	"Knowledge": [10],
+	"Horror": [12, 16, 47, 87],
+	"Enforcement": [13],
+	"Infrastructure": [14, 17, 28, 39, 40, 44, 52, 60, 62, 63, 64, 66, 78, 85],
+	"Criminal": [15, 50, 58, 67, 80],
+	"Science": [21, 54, 61],
+	"Administration": [23],
+	"Aristocracy": [31],
+	"Predation": [38],
+	"Art-Signal": [53, 71, 84],
+	"Security": [55],
+	"Civic/Administrative": [70],
+	"Mystic/Infrastructure": [72],
+	"Imperial/Horror": [73],
+	"Infrastructure/Scavenger": [74],
+	"Imperial/Executive": [75],
+	"Ecology": [76],
+	"Science/Deep-Math": [77],
+	"Intelligence": [79],
+	"Labor": [83]
+}
+
+const FACTIONS_BY_EMOJI = {
+	"⚫": [0, 73, 82],
+	"🕳": [0, 12, 21],
+	"🪐": [0],
+	"🌀": [0, 63, 86],
+	"🦴": [1, 8],
+	"💉": [1, 8],
+	"🔧": [1, 8],
+	"💰": [1, 18, 32, 35, 37, 50, 64, 67, 69, 79],
+	"⚔": [2, 7, 15, 25, 33, 45, 55, 59],
+	"🌫": [2, 85],
+	"⚱": [2, 12],
+	"🩹": [2],
+	"🧯": [2, 56],
+	"👥": [3, 13, 83],
+	"⚖": [3, 22, 26, 32, 70, 73],
+	"🦅": [3, 46],
+	"⚜": [3, 82],
+	"🩸": [3, 16, 45],
+	"🏰": [3],
+	"📜": [3, 23, 57, 70],
+	"🗺": [4, 5, 52],
+	"🧭": [4, 5, 25, 52],
+	"🔭": [4, 5, 62, 73, 77],
+	"📍": [4, 5],
+	"☀": [6],
+	"🌙": [6, 42],
+	"🔥": [6, 7, 15, 19, 56, 85, 87],
+	"💧": [6, 19, 26, 58, 68],
+	"⛰": [6],
+	"🌬": [6, 87],
+	"✊": [7, 15],
+	"🚩": [7],
+	"🧨": [7, 15],
+	"⚙️": [8],
+	"🎶": [9],
+	"🔔": [9, 29],
+	"🫥": [9, 38],
+	"🕯": [9, 20, 30, 56, 72],
+	"🗃": [10, 23],
+	"🪦": [10, 38],
+	"🕰": [10, 82],
+	"📖": [10],
+	"🌱": [11, 18, 26, 48, 59, 61, 81],
+	"⛏": [11, 69],
+	"🪨": [11, 44, 57, 85],
+	"🪤": [11],
+	"⭐": [12],
+	"🫧": [12],
+	"⛓": [13, 15, 23, 44, 58, 83],
+	"💸": [13, 83],
+	"💀": [13, 42, 46, 47, 74, 79, 83],
+	"📡": [14, 52, 53, 60, 62, 66, 71],
+	"💾": [14, 37],
+	"🧩": [14, 37, 52],
+	"📶": [14, 52, 71],
+	"🪓": [15],
+	"🫀": [16],
+	"🧬": [16, 21, 49, 61],
+	"🧫": [16, 21, 33, 41, 49, 61],
+	"🧵": [16, 29, 34, 60, 72],
+	"⚙": [17, 28, 39, 54, 63, 66],
+	"🛠": [17],
+	"🔩": [17],
+	"🧰": [17, 78],
+	"🏷️": [17],
+	"🍞": [18, 19, 39, 88],
+	"🧺": [18],
+	"❄️": [19],
+	"🏜️": [19],
+	"💨": [19, 39],
+	"🌿": [20, 41, 48, 65, 68, 81, 87],
+	"🫖": [20],
+	"🥣": [20],
+	"🧿": [20, 30, 41, 80],
+	"🧪": [21, 49, 61, 75, 88],
+	"🔬": [21, 54, 61, 77],
+	"⚗️": [21],
+	"🌹": [22, 55],
+	"🪞": [22, 67, 80],
+	"🍷": [22, 31],
+	"🖋": [23],
+	"🤖": [24],
+	"⛪": [24, 56, 88],
+	"📿": [24, 29],
+	"🗝": [24, 29, 37, 43, 79],
+	"🧘": [24, 27],
+	"🛡": [25, 45, 59],
+	"🐑": [25],
+	"🛸": [25],
+	"🪣": [26],
+	"🔇": [27],
+	"🤫": [27, 80],
+	"🛑": [27],
+	"📵": [27],
+	"🔋": [28],
+	"🔌": [28, 78],
+	"⚡": [28],
+	"🪢": [29, 34],
+	"🪡": [29, 34, 60, 72],
+	"🏮": [30, 72, 84],
+	"🔦": [30],
+	"🎭": [31],
+	"💃": [31, 53],
+	"😂": [31],
+	"📒": [32],
+	"📘": [32, 36, 44],
+	"🚔": [32],
+	"🦗": [33, 49],
+	"🐜": [33],
+	"♻️": [33, 68, 78],
+	"🦠": [33, 41, 47],
+	"👘": [34, 60],
+	"🐂": [35],
+	"🐻": [35],
+	"📦": [35, 75],
+	"🏛️": [35],
+	"🏚️": [35],
+	"📐": [36, 40, 77],
+	"📊": [36],
+	"🧮": [36, 77],
+	"📋": [36, 43, 54, 70],
+	"📼": [37],
+	"🕸": [38],
+	"🌑": [38],
+	"🏭": [39],
+	"🔨": [39, 66],
+	"🧱": [40, 44],
+	"🏛": [40],
+	"🏺": [40],
+	"🍄": [42],
+	"🍂": [42, 81, 87],
+	"🛂": [43, 64],
+	"🚧": [43],
+	"🚪": [43],
+	"🕴️": [44],
+	"🐉": [45],
+	"💱": [45],
+	"🐺": [46],
+	"🐇": [46, 47, 65],
+	"🦌": [46, 65],
+	"🌾": [47, 48, 81],
+	"🐝": [47, 48],
+	"🚫": [49],
+	"🩺": [49],
+	"🚢": [50],
+	"⚓": [50],
+	"🪝": [50],
+	"✨": [51, 69, 85, 86],
+	"💫": [51, 84],
+	"🌠": [51, 62, 73],
+	"🤲": [51],
+	"🍼": [51],
+	"🎼": [53, 84],
+	"🔊": [53, 66],
+	"🩰": [53],
+	"🚀": [54, 63, 64],
+	"🥀": [55],
+	"🌺": [55],
+	"🪵": [56],
+	"🧂": [57, 58],
+	"🐚": [57],
+	"🛶": [58],
+	"🔓": [58],
+	"🕵️": [58, 79, 80],
+	"🏇": [59],
+	"🧶": [60],
+	"🛰": [62],
+	"🌞": [63],
+	"🏢": [64],
+	"🎵": [66],
+	"💎": [67, 69, 85],
+	"🔍": [67],
+	"🧊": [67],
+	"🫙": [68, 88],
+	"💳": [70],
+	"📻": [71],
+	"🗣": [71],
+	"🧤": [74],
+	"🗑": [74],
+	"💊": [75],
+	"🚛": [75],
+	"🌊": [76],
+	"🪸": [76],
+	"🦀": [76],
+	"🐠": [76],
+	"🧲": [77],
+	"🪛": [78],
+	"🚐": [78],
+	"👤": [80],
+	"🧷": [80],
+	"🌲": [81, 87],
+	"♟": [82],
+	"🎸": [84],
+	"🌋": [85],
+	"🐙": [86],
+	"👁": [86],
+	"🥖": [88]
+}
+
 
 ## Helper Functions
 
 static func get_faction_by_name(name: String) -> Dictionary:
 	"""Get faction by name"""
-	for faction in ALL_FACTIONS:
-		if faction.name == name:
-			return faction
-	return {}
+	var index = FACTION_INDEX_BY_NAME.get(name, -1)
+	if index < 0:
+		return {}
+	return ALL_FACTIONS[index]
 
-static func get_factions_by_ring(ring: String) -> Array:
-	"""Get all factions in a specific ring"""
+static func _factions_at(indices: Array) -> Array:
+	"""Factions at the given ALL_FACTIONS positions"""
 	var result = []
-	for faction in ALL_FACTIONS:
-		if faction.ring == ring:
-			result.append(faction)
+	for index in indices:
+		result.append(ALL_FACTIONS[index])
 	return result
 
+static func get_factions_by_ring(ring: String) -> Array:
+	"""Get all factions in a specific ring"""
+	return _factions_at(FACTION_INDICES_BY_RING.get(ring, []))
+
 static func get_factions_by_domain(domain: String) -> Array:
 	"""Get all factions in a specific domain"""
-	var result = []
-	for faction in ALL_FACTIONS:
-		if faction.domain == domain:
-			result.append(faction)
-	return result
+	return _factions_at(FACTION_INDICES_BY_DOMAIN.get(domain, []))
+
+static func get_factions_with_emoji(emoji: String) -> Array:
+	"""Get all factions whose signature contains an emoji"""
+	return _factions_at(FACTIONS_BY_EMOJI.get(emoji, []))
 
 static func get_faction_emoji(faction: Dictionary) -> String:
 	"""Get first emoji from faction signature as display emoji"""
@@ -962,17 +1299,25 @@ static func get_faction_vocabulary(faction: Dictionary) -> Dictionary:
 	var signature = faction.get("sig", faction.get("signature", []))
 	var axial = _get_axial_emojis(faction.get("bits", []))
 	var all = signature.duplicate()
+	var seen: Dictionary = {}
+	for emoji in all:
+		seen[emoji] = true
 	for emoji in axial:
-		if emoji not in all:
+		if not seen.has(emoji):
+			seen[emoji] = true
 			all.append(emoji)
 	return {"signature": signature, "axial": axial, "all": all}
 
 static func get_vocabulary_overlap(vocab_a: Array, vocab_b: Array) -> Array:
 	"""Return emojis in vocab_a that are also in vocab_b (preserve order)."""
+	var lookup: Dictionary = {}
+	for emoji in vocab_b:
+		lookup[emoji] = true
 	var result: Array = []
 	for emoji in vocab_a:
-		if emoji in vocab_b and emoji not in result:
+		if lookup.has(emoji):
 			result.append(emoji)
+			lookup.erase(emoji)  # Each emoji once
 	return result
 
 static func get_faction_banner_path(faction: Dictionary) -> String:
@@ -1,39 +1,48 @@
 #!/usr/bin/env python3
 """
-Check biome image_path references against the filesystem.
+Check biome res:// references (image_path, music_path, ...) against the filesystem.
 
-- Scans Core/Biomes/data/*.json by default.
-- Reports missing image files.
-- Optionally replaces missing paths with "" to trigger fallback imagery.
+- Scans Core/Biomes/data/*.json by default, all files concurrently.
+- Reports missing or wrongly-cased files, with the closest existing assets.
+- Optionally replaces missing paths with "" to trigger fallbacks
+  (image_path only, unless --fields names more).
+
+The checks run on tools/biome_audit.py: asset directories are listed
+once, and files whose content is unchanged since the last run are not
+re-parsed (.cache/biome_audit.json).
 """
 
 from __future__ import annotations
 
 import argparse
 import json
-import os
+import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from asset_match import TrigramIndex, normalize_name  # noqa: E402
+from biome_audit import AssetListing, BiomeAudit, FileAudit  # noqa: E402
+from data_snapshot import load_snapshot  # noqa: E402
+
 DEFAULT_DATA_DIR = PROJECT_ROOT / "Core" / "Biomes" / "data"
 ASSETS_BIOMES_DIR = PROJECT_ROOT / "Assets" / "Biomes"
-FALLBACK_SENTINEL = ""  # Empty string triggers fallback in BiomeBackground
-
+ASSETS_BIOMES_REL = ASSETS_BIOMES_DIR.relative_to(PROJECT_ROOT).as_posix()
+FALLBACK_SENTINEL = ""  # Empty string triggers fallback in BiomeBackground / no music
 
-def _resolve_res_path(path: str) -> Path:
-    if path.startswith("res://"):
-        return PROJECT_ROOT / path.replace("res://", "", 1)
-    return PROJECT_ROOT / path
+# Top-level record fields that --apply may clear or re-case (--fields)
+FIXABLE_FIELDS = ("image_path", "music_path")
+DEFAULT_FIX_FIELDS = ("image_path",)
 
 
-def _load_json(path: Path) -> List[Dict[str, Any]]:
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    if not isinstance(data, list):
+def _load_json(path: Path, mutable: bool = False) -> List[Dict[str, Any]]:
+    snapshot = load_snapshot(path)
+    if not isinstance(snapshot.data, tuple):
         raise ValueError(f"{path} root is not a list")
-    return data
+    return snapshot.thaw() if mutable else list(snapshot.records)
 
 
 def _write_json(path: Path, data: List[Dict[str, Any]]) -> None:
@@ -42,21 +51,16 @@ def _write_json(path: Path, data: List[Dict[str, Any]]) -> None:
         f.write("\n")
 
 
-def _normalize_name(value: str) -> str:
-    return "".join(ch for ch in value.lower() if ch.isalnum())
+def _asset_res_path(asset_name: str) -> str:
+    return f"res://{ASSETS_BIOMES_REL}/{asset_name}"
 
 
-def _build_asset_map() -> Dict[str, str]:
-    mapping: Dict[str, str] = {}
-    if not ASSETS_BIOMES_DIR.exists():
-        return mapping
-    for img in ASSETS_BIOMES_DIR.glob("*.png"):
-        stem = img.stem
-        mapping[_normalize_name(stem)] = str(img.relative_to(PROJECT_ROOT))
-    return mapping
+def _suggest(asset_index: TrigramIndex, query: str) -> str:
+    matches = asset_index.search(query, k=3, min_similarity=0.4)
+    return ", ".join(name for name, _ in matches)
 
 
-def _fill_from_assets(data: List[Dict[str, Any]], asset_map: Dict[str, str]) -> int:
+def _fill_from_assets(data: List[Dict[str, Any]], asset_index: TrigramIndex) -> int:
     filled = 0
     # Explicit alias map for known mismatches
     alias_map = {
@@ -70,50 +74,79 @@ def _fill_from_assets(data: List[Dict[str, Any]], asset_map: Dict[str, str]) ->
         name = biome.get("name", "")
         if not isinstance(name, str) or name == "":
             continue
-        norm = _normalize_name(name)
+        norm = normalize_name(name)
         if norm in alias_map:
             norm = alias_map[norm]
-        if norm in asset_map:
-            biome["image_path"] = f"res://{asset_map[norm]}"
+        asset_name = asset_index.exact(norm)
+        if asset_name:
+            biome["image_path"] = _asset_res_path(asset_name)
             filled += 1
+        else:
+            # Only exact (normalized) matches are filled; fuzzy ones are hints
+            suggestions = _suggest(asset_index, name)
+            if suggestions:
+                print(f"[SUGGEST] {name}: no exact asset; closest: {suggestions}")
     return filled
 
 
-def _scan_file(path: Path, apply_fixes: bool, fill_missing: bool) -> Tuple[int, int, int]:
-    data = _load_json(path)
-    missing = 0
-    total = 0
+def _report(result: FileAudit, listing: AssetListing) -> None:
+    for ref in result.broken():
+        if ref.status == "case":
+            print(f"[CASE] {result.path.name}: {ref.record} {ref.field} -> {ref.path} (file is {ref.actual})")
+            continue
+        print(f"[MISSING] {result.path.name}: {ref.record} {ref.field} -> {ref.path}")
+        suggestions = listing.suggest(ref.path)
+        if suggestions:
+            print(f"          closest assets: {', '.join(suggestions)}")
+
+
+def _parse_fields(value: str) -> Tuple[str, ...]:
+    fields = tuple(f.strip() for f in value.split(",") if f.strip())
+    unknown = [f for f in fields if f not in FIXABLE_FIELDS]
+    if unknown or not fields:
+        raise argparse.ArgumentTypeError(
+            f"expected a comma-separated subset of {','.join(FIXABLE_FIELDS)}, got {value!r}"
+        )
+    return fields
+
+
+def _fix_file(
+    result: FileAudit,
+    apply_fixes: bool,
+    fill_missing: bool,
+    asset_index: TrigramIndex,
+    fix_fields: Tuple[str, ...] = DEFAULT_FIX_FIELDS,
+) -> Tuple[int, int]:
+    """Rewrite one list-rooted data file; returns (fixed, filled)."""
+    try:
+        data = _load_json(result.path, mutable=True)
+    except ValueError:
+        return 0, 0  # Not a list of records; report only
+    by_name = {b.get("name"): b for b in data if isinstance(b, dict)}
+    fixed = 0
     filled = 0
 
-    for biome in data:
-        if not isinstance(biome, dict):
-            continue
-        name = biome.get("name", "<unknown>")
-        image_path = biome.get("image_path", "")
-        if not isinstance(image_path, str) or image_path == "":
-            continue
-        total += 1
-        resolved = _resolve_res_path(image_path)
-        if not resolved.exists():
-            missing += 1
-            print(f"[MISSING] {path.name}: {name} -> {image_path}")
-            if apply_fixes:
-                biome["image_path"] = FALLBACK_SENTINEL
+    if apply_fixes:
+        for ref in result.broken():
+            biome = by_name.get(ref.record)
+            if ref.field not in fix_fields or biome is None or biome.get(ref.field) != ref.path:
+                continue
+            if ref.status == "case":
+                biome[ref.field] = ref.path.rsplit("/", 1)[0] + "/" + ref.actual
+            else:
+                biome[ref.field] = FALLBACK_SENTINEL
+            fixed += 1
 
     if fill_missing:
-        asset_map = _build_asset_map()
-        filled = _fill_from_assets(data, asset_map)
+        filled = _fill_from_assets(data, asset_index)
 
-    if apply_fixes and missing > 0:
-        _write_json(path, data)
-    elif fill_missing and filled > 0:
-        _write_json(path, data)
-
-    return total, missing, filled
+    if fixed or filled:
+        _write_json(result.path, data)
+    return fixed, filled
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Check biome image paths in JSON files.")
+    parser = argparse.ArgumentParser(description="Check biome res:// paths in JSON files.")
     parser.add_argument(
         "paths",
         nargs="*",
@@ -122,13 +155,20 @@ def main() -> int:
     parser.add_argument(
         "--apply",
         action="store_true",
-        help="Rewrite JSON files, replacing missing image_path with empty string.",
+        help="Rewrite JSON files: missing paths in --fields become empty strings, wrong case is corrected.",
+    )
+    parser.add_argument(
+        "--fields",
+        type=_parse_fields,
+        default=DEFAULT_FIX_FIELDS,
+        help="Fields --apply rewrites, comma-separated (default: image_path; also: music_path).",
     )
     parser.add_argument(
         "--fill-missing",
         action="store_true",
         help="Fill empty image_path fields by matching Assets/Biomes filenames.",
     )
+    parser.add_argument("--jobs", type=int, default=8, help="Data files to read in parallel")
 
     args = parser.parse_args()
 
@@ -141,21 +181,46 @@ def main() -> int:
         print("No JSON files found to scan.")
         return 1
 
-    total_checked = 0
-    total_missing = 0
-    total_filled = 0
+    existing = []
     for json_path in json_paths:
         if not json_path.exists():
             print(f"[SKIP] File not found: {json_path}")
+        else:
+            existing.append(json_path)
+
+    start = time.perf_counter()
+    listing = AssetListing()
+    results = BiomeAudit(listing).scan(existing, jobs=args.jobs)
+    asset_index = listing.index(ASSETS_BIOMES_REL, (".png",))
+
+    total_checked = 0
+    total_missing = 0
+    total_fixed = 0
+    total_filled = 0
+    by_field: Dict[str, int] = {}
+    for result in results:
+        if result.error:
+            print(f"[SKIP] {result.path.name}: {result.error}")
             continue
-        checked, missing, filled = _scan_file(json_path, args.apply, args.fill_missing)
-        total_checked += checked
-        total_missing += missing
-        total_filled += filled
-
-    print(f"\nChecked {total_checked} image references. Missing: {total_missing}. Filled: {total_filled}.")
-    if args.apply and total_missing > 0:
-        print("Missing paths replaced with empty string (fallback will be used).")
+        _report(result, listing)
+        total_checked += len(result.refs)
+        total_missing += len(result.broken())
+        for ref in result.refs:
+            by_field[ref.field] = by_field.get(ref.field, 0) + 1
+        if args.apply or args.fill_missing:
+            fixed, filled = _fix_file(result, args.apply, args.fill_missing, asset_index, args.fields)
+            total_fixed += fixed
+            total_filled += filled
+    elapsed = (time.perf_counter() - start) * 1000
+
+    fields = ", ".join(f"{field}: {count}" for field, count in sorted(by_field.items()))
+    cached = sum(1 for r in results if r.cached)
+    print(
+        f"\nChecked {total_checked} res:// references ({fields or 'none'}) in {len(results)} files "
+        f"({cached} unchanged, {elapsed:.0f} ms). Missing: {total_missing}. Filled: {total_filled}."
+    )
+    if args.apply and total_fixed > 0:
+        print(f"{total_fixed} broken paths fixed (missing -> empty string, fallback will be used).")
     if args.fill_missing and total_filled > 0:
         print("Empty image_path fields filled from Assets/Biomes filenames.")
     return 0
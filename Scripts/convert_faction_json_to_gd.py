@@ -8,6 +8,19 @@ import json
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+from gd_codegen import (
+    GDScriptFile,
+    dict_fragment,
+    format_bits_array,
+    format_emoji_array,
+    render_fragments,
+    write_if_changed,
+)
+
+BANNER = "# " + "=" * 77
+
+
 def sanitize_const_name(name: str) -> str:
     """Convert faction name to valid GDScript constant name"""
     # Replace spaces and special chars with underscores
@@ -16,48 +29,49 @@ def sanitize_const_name(name: str) -> str:
     const_name = "".join(c if c.isalnum() or c == "_" else "_" for c in const_name)
     return const_name
 
-def format_bits_array(bits: list) -> str:
-    """Format bits array as GDScript array literal"""
-    return "[" + ", ".join(str(b) for b in bits) + "]"
-
-def format_signature_array(signature: list) -> str:
-    """Format signature emoji array as GDScript array literal"""
-    # Escape quotes in emojis (though unlikely needed)
-    escaped = ['"{}"'.format(e) for e in signature]
-    return "[" + ", ".join(escaped) + "]"
+def render_faction_const(faction: dict) -> str:
+    """Faction constant block"""
+    desc = faction.get("description", "")
+    if "\n" in desc:
+        # Multiline string
+        description = f'"""\n{desc}\n"""'
+    else:
+        # Single line
+        description = f'"{desc}"'
+    return dict_fragment([
+        ("name", f'"{faction["name"]}"'),
+        ("signature", format_emoji_array(faction["signature"])),
+        ("bits", format_bits_array(faction["bits"])),
+        ("category", f'"{faction["category"]}"'),
+        ("description", description),
+    ], prefix=f"const {sanitize_const_name(faction['name'])} = ")
+
+def render_axis(axis: dict) -> str:
+    """AXES entry"""
+    return dict_fragment([
+        ("bit", str(axis["bit"])),
+        ("name", f'"{axis["name"]}"'),
+        ("0", f'"{axis["0"]}"'),
+        ("1", f'"{axis["1"]}"'),
+    ], depth=2)
+
+def banner(script: GDScriptFile, title: str) -> None:
+    script.add(BANNER, f"# {title}", BANNER, "")
 
 def generate_gdscript(json_data: dict) -> str:
     """Generate complete GDScript file from JSON data"""
-
-    lines = []
-
-    # Header
-    lines.append("class_name FactionDatabase")
-    lines.append("extends Resource")
-    lines.append("")
-    lines.append("## Complete database of 32 factions with 12-bit classification patterns")
-    lines.append("## Generated from spacewheat_factions_db_v0_4.json")
-    lines.append("## Each faction has: name, signature (emoji array), 12-bit pattern, category, description")
-    lines.append("")
+    script = GDScriptFile("FactionDatabase", "Resource", [
+        "Complete database of 32 factions with 12-bit classification patterns",
+        "Generated from spacewheat_factions_db_v0_4.json",
+        "Each faction has: name, signature (emoji array), 12-bit pattern, category, description",
+    ])
 
     # Add axial spine metadata
-    lines.append("# " + "=" * 77)
-    lines.append("# AXIAL SPINE METADATA")
-    lines.append("# " + "=" * 77)
-    lines.append("")
+    banner(script, "AXIAL SPINE METADATA")
     axial_spine = json_data.get("axial_spine", {})
-    lines.append(f'const VERSION = "{axial_spine.get("version", "0.4")}"')
-    lines.append("")
-    lines.append("const AXES = [")
-    for axis in axial_spine.get("axes", []):
-        lines.append("\t{")
-        lines.append(f'\t\t"bit": {axis["bit"]},')
-        lines.append(f'\t\t"name": "{axis["name"]}",')
-        lines.append(f'\t\t"0": "{axis["0"]}",')
-        lines.append(f'\t\t"1": "{axis["1"]}"')
-        lines.append("\t},")
-    lines.append("]")
-    lines.append("")
+    script.const("VERSION", f'"{axial_spine.get("version", "0.4")}"').add("")
+    script.const_list("AXES", render_fragments(axial_spine.get("axes", []), render_axis), trailing_comma=True)
+    script.add("")
 
     # Group factions by category
     factions_by_category = {}
@@ -69,75 +83,42 @@ def generate_gdscript(json_data: dict) -> str:
 
     # Generate faction constants grouped by category
     for category, factions in factions_by_category.items():
-        lines.append("# " + "=" * 77)
-        lines.append(f"# {category.upper()} ({len(factions)} faction{'s' if len(factions) != 1 else ''})")
-        lines.append("# " + "=" * 77)
-        lines.append("")
-
-        for faction in factions:
-            const_name = sanitize_const_name(faction["name"])
-            lines.append(f"const {const_name} = {{")
-            lines.append(f'\t"name": "{faction["name"]}",')
-            lines.append(f'\t"signature": {format_signature_array(faction["signature"])},')
-            lines.append(f'\t"bits": {format_bits_array(faction["bits"])},')
-            lines.append(f'\t"category": "{faction["category"]}",')
-
-            # Handle multiline descriptions
-            desc = faction.get("description", "")
-            if "\n" in desc:
-                # Multiline string
-                lines.append('\t"description": """')
-                lines.append(desc)
-                lines.append('"""')
-            else:
-                # Single line
-                lines.append(f'\t"description": "{desc}"')
-
-            lines.append("}")
-            lines.append("")
+        banner(script, f"{category.upper()} ({len(factions)} faction{'s' if len(factions) != 1 else ''})")
+        for fragment in render_fragments(factions, render_faction_const):
+            script.add(fragment, "")
 
     # Generate ALL_FACTIONS array
-    lines.append("# " + "=" * 77)
-    lines.append("# ALL FACTIONS ARRAY")
-    lines.append("# " + "=" * 77)
-    lines.append("")
-    lines.append("const ALL_FACTIONS = [")
-    for faction in json_data.get("factions", []):
-        const_name = sanitize_const_name(faction["name"])
-        lines.append(f"\t{const_name},")
-    lines.append("]")
-    lines.append("")
+    banner(script, "ALL FACTIONS ARRAY")
+    const_names = [f"\t{sanitize_const_name(f['name'])}" for f in json_data.get("factions", [])]
+    script.const_list("ALL_FACTIONS", const_names, trailing_comma=True)
+    script.add("")
 
     # Helper functions
-    lines.append("# " + "=" * 77)
-    lines.append("# HELPER FUNCTIONS")
-    lines.append("# " + "=" * 77)
-    lines.append("")
-    lines.append("static func get_faction_by_name(name: String) -> Dictionary:")
-    lines.append('\t"""Find faction by name (case-insensitive)"""')
-    lines.append("\tvar name_lower = name.to_lower()")
-    lines.append("\tfor faction in ALL_FACTIONS:")
-    lines.append('\t\tif faction["name"].to_lower() == name_lower:')
-    lines.append("\t\t\treturn faction")
-    lines.append("\treturn {}")
-    lines.append("")
-
-    lines.append("static func get_factions_by_category(category: String) -> Array:")
-    lines.append('\t"""Get all factions in a category"""')
-    lines.append("\tvar result = []")
-    lines.append("\tfor faction in ALL_FACTIONS:")
-    lines.append('\t\tif faction["category"] == category:')
-    lines.append("\t\t\tresult.append(faction)")
-    lines.append("\treturn result")
-    lines.append("")
-
-    lines.append("static func get_signature_string(faction: Dictionary, max_emojis: int = 3) -> String:")
-    lines.append('\t"""Convert signature array to string (first N emojis)"""')
-    lines.append('\tvar sig = faction.get("signature", [])')
-    lines.append('\treturn "".join(sig.slice(0, max_emojis))')
-    lines.append("")
-
-    return "\n".join(lines)
+    banner(script, "HELPER FUNCTIONS")
+    script.add(
+        "static func get_faction_by_name(name: String) -> Dictionary:",
+        '\t"""Find faction by name (case-insensitive)"""',
+        "\tvar name_lower = name.to_lower()",
+        "\tfor faction in ALL_FACTIONS:",
+        '\t\tif faction["name"].to_lower() == name_lower:',
+        "\t\t\treturn faction",
+        "\treturn {}",
+        "",
+        "static func get_factions_by_category(category: String) -> Array:",
+        '\t"""Get all factions in a category"""',
+        "\tvar result = []",
+        "\tfor faction in ALL_FACTIONS:",
+        '\t\tif faction["category"] == category:',
+        "\t\t\tresult.append(faction)",
+        "\treturn result",
+        "",
+        "static func get_signature_string(faction: Dictionary, max_emojis: int = 3) -> String:",
+        '\t"""Convert signature array to string (first N emojis)"""',
+        '\tvar sig = faction.get("signature", [])',
+        '\treturn "".join(sig.slice(0, max_emojis))',
+        "",
+    )
+    return script.text()
 
 def main():
     # Paths
@@ -162,10 +143,10 @@ def main():
     print("🔧 Generating GDScript...")
     gdscript_content = generate_gdscript(json_data)
 
-    # Write output
+    # Write output (untouched when the bytes are the same)
     print(f"💾 Writing to {output_path}...")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(gdscript_content)
+    if not write_if_changed(output_path, gdscript_content):
+        print("✓ Output unchanged, not rewritten")
 
     print(f"✅ Done! Generated FactionDatabase.gd with {faction_count} factions")
     print(f"⚠️  Note: This uses 'signature' (array) instead of 'emoji' (string)")
@@ -12,36 +12,252 @@ New fields in v2.1:
 - ring: Position in hierarchy (center, first, second, third, outer)
 """
 
-import json
 import sys
 from pathlib import Path
 
-
-def escape_gdscript_string(s: str) -> str:
-    """Escape a string for GDScript"""
-    if s is None:
-        return '""'
-    # Escape backslashes first, then quotes
-    s = s.replace('\\', '\\\\')
-    s = s.replace('"', '\\"')
-    # Escape newlines
-    s = s.replace('\n', '\\n')
-    return f'"{s}"'
+sys.path.insert(0, str(Path(__file__).resolve().parent / "tools"))
+from data_snapshot import load_snapshot
+from emoji_registry import EmojiRegistry
+from gd_codegen import (
+    GDScriptFile,
+    dict_fragment,
+    escape_gdscript_string,
+    format_bits_array,
+    format_emoji_array,
+    render_fragments,
+    write_if_changed,
+)
+
+
+def build_lookup_indexes(factions) -> dict:
+    """Precomputed lookups into ALL_FACTIONS (positions match its order).
+
+    Values default exactly like the emitted faction dicts, so the game's
+    helpers find the same factions a linear scan would.
+    """
+    by_name = {}
+    by_ring = {}
+    by_domain = {}
+    by_emoji = {}
+    for i, faction in enumerate(factions):
+        by_name.setdefault(faction.get('name', 'Unknown'), i)
+        by_ring.setdefault(faction.get('ring', 'unknown'), []).append(i)
+        by_domain.setdefault(faction.get('domain', 'Unknown'), []).append(i)
+        for emoji in dict.fromkeys(faction.get('signature', faction.get('sig', []))):
+            by_emoji.setdefault(emoji, []).append(i)
+    return {
+        "FACTION_INDEX_BY_NAME": by_name,
+        "FACTION_INDICES_BY_RING": by_ring,
+        "FACTION_INDICES_BY_DOMAIN": by_domain,
+        "FACTIONS_BY_EMOJI": by_emoji,
+    }
+
+
+def format_index_dict(name: str, mapping: dict) -> str:
+    """Format a String -> int / Array[int] index as a GDScript const"""
+    return dict_fragment(
+        [(key, format_bits_array(value) if isinstance(value, list) else str(value))
+         for key, value in mapping.items()],
+        prefix=f"const {name} = ",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Packed export (--packed): struct-of-arrays instead of nested Dictionaries
+# ---------------------------------------------------------------------------
+
+PACKED_FORMAT = 1
+COUPLING_STRIDE = 4  # (i, j, re, im) per coupling
+
+
+def pack_bits(bits) -> int:
+    """12-bit axial array as one int (axis 1 is the lowest bit)"""
+    value = 0
+    for i, bit in enumerate(bits):
+        if bit:
+            value |= 1 << i
+    return value
+
+
+def _coupling_value(value):
+    """(re, im) of a hamiltonian entry: a number or an [re, im] pair"""
+    if isinstance(value, (list, tuple)):
+        return float(value[0]), float(value[1])
+    return float(value), 0.0
+
+
+def build_packed_tables(factions) -> dict:
+    """Struct-of-arrays faction tables (row i = faction i).
+
+    Variable-length fields are stored CSR-style: *_OFFSETS has one more
+    entry than there are factions, and faction i owns the slice
+    [offsets[i], offsets[i + 1]) of the matching data arrays. Emojis are
+    emoji_registry IDs into EMOJI_TABLE, so spellings with and without a
+    variation selector ("⚙"/"⚙️") are one basis state. COUPLINGS holds
+    COUPLING_STRIDE floats per hamiltonian entry: source ID, target ID,
+    real part, imaginary part.
+    """
+    emojis = set()
+    for faction in factions:
+        emojis.update(faction.get('signature', faction.get('sig', [])))
+        emojis.update(faction.get('self_energies') or {})
+        for source, row in (faction.get('hamiltonian') or {}).items():
+            emojis.add(source)
+            emojis.update(row)
+    emoji_id = EmojiRegistry(emojis)
+    emoji_table = list(emoji_id)
+
+    tables = {
+        "EMOJI_TABLE": emoji_table,
+        "NAMES": [],
+        "RINGS": [],
+        "DOMAINS": [],
+        "BITS": [],
+        "SIG_OFFSETS": [0],
+        "SIG_IDS": [],
+        "SELF_ENERGY_OFFSETS": [0],
+        "SELF_ENERGY_IDS": [],
+        "SELF_ENERGY_VALUES": [],
+        "COUPLING_OFFSETS": [0],
+        "COUPLINGS": [],
+    }
+    for faction in factions:
+        tables["NAMES"].append(faction.get('name', 'Unknown'))
+        tables["RINGS"].append(faction.get('ring', 'unknown'))
+        tables["DOMAINS"].append(faction.get('domain', 'Unknown'))
+        tables["BITS"].append(pack_bits(faction.get('bits', [])))
+
+        for emoji in faction.get('signature', faction.get('sig', [])):
+            tables["SIG_IDS"].append(emoji_id[emoji])
+        tables["SIG_OFFSETS"].append(len(tables["SIG_IDS"]))
+
+        for emoji, energy in (faction.get('self_energies') or {}).items():
+            tables["SELF_ENERGY_IDS"].append(emoji_id[emoji])
+            tables["SELF_ENERGY_VALUES"].append(float(energy))
+        tables["SELF_ENERGY_OFFSETS"].append(len(tables["SELF_ENERGY_IDS"]))
+
+        for source, row in (faction.get('hamiltonian') or {}).items():
+            for target, value in row.items():
+                re, im = _coupling_value(value)
+                tables["COUPLINGS"].extend([float(emoji_id[source]), float(emoji_id[target]), re, im])
+        tables["COUPLING_OFFSETS"].append(len(tables["COUPLINGS"]) // COUPLING_STRIDE)
+    return tables
+
+
+PACKED_TYPES = {
+    "EMOJI_TABLE": "PackedStringArray",
+    "NAMES": "PackedStringArray",
+    "RINGS": "PackedStringArray",
+    "DOMAINS": "PackedStringArray",
+    "BITS": "PackedInt64Array",
+    "SIG_OFFSETS": "PackedInt32Array",
+    "SIG_IDS": "PackedInt32Array",
+    "SELF_ENERGY_OFFSETS": "PackedInt32Array",
+    "SELF_ENERGY_IDS": "PackedInt32Array",
+    "SELF_ENERGY_VALUES": "PackedFloat64Array",
+    "COUPLING_OFFSETS": "PackedInt32Array",
+    "COUPLINGS": "PackedFloat64Array",
+}
 
 
-def format_emoji_array(emojis: list) -> str:
-    """Format an emoji array for GDScript"""
-    if not emojis:
-        return "[]"
-    emoji_strs = [f'"{emoji}"' for emoji in emojis]
-    return f"[{', '.join(emoji_strs)}]"
+def format_packed_array(type_name: str, values: list) -> str:
+    """One-line Packed*Array literal (also valid JSON between the brackets)"""
+    if type_name == "PackedStringArray":
+        items = [escape_gdscript_string(v) for v in values]
+    elif type_name == "PackedFloat64Array":
+        items = [repr(float(v)) for v in values]
+    else:
+        items = [str(int(v)) for v in values]
+    return f"{type_name}([{', '.join(items)}])"
+
+
+def generate_packed_gdscript(factions, source_name: str) -> str:
+    """GDScript with the faction tables as packed-array consts"""
+    tables = build_packed_tables(factions)
+    script = GDScriptFile("FactionPackedData", "RefCounted", [
+        "Faction physics data as packed struct-of-arrays",
+        f"Generated from {source_name} by convert_faction_lexicon_v2_1.py --packed",
+        "Row i of every table is faction i. Variable-length fields use *_OFFSETS:",
+        "faction i owns [offsets[i], offsets[i + 1]) of the matching data arrays.",
+        "Emojis are IDs into EMOJI_TABLE; bits are packed (axis 1 = lowest bit).",
+    ])
+    script.const("FORMAT", str(PACKED_FORMAT))
+    script.const("FACTION_COUNT", str(len(tables['NAMES'])))
+    script.const("BITS_WIDTH", "12")
+    script.const("COUPLING_STRIDE", f"{COUPLING_STRIDE}  # source id, target id, re, im")
+    script.add("")
+    for name, type_name in PACKED_TYPES.items():
+        script.const(name, format_packed_array(type_name, tables[name]))
+    script.add(
+        "",
+        "",
+        "static func get_bits(index: int) -> Array:",
+        "	\"\"\"Unpacked 12-bit axial array\"\"\"",
+        "	var result: Array = []",
+        "	for axis in range(BITS_WIDTH):",
+        "		result.append((BITS[index] >> axis) & 1)",
+        "	return result",
+        "",
+        "",
+        "static func get_signature(index: int) -> Array:",
+        "	var result: Array = []",
+        "	for k in range(SIG_OFFSETS[index], SIG_OFFSETS[index + 1]):",
+        "		result.append(EMOJI_TABLE[SIG_IDS[k]])",
+        "	return result",
+        "",
+        "",
+        "static func get_self_energies(index: int) -> Dictionary:",
+        "	var result: Dictionary = {}",
+        "	for k in range(SELF_ENERGY_OFFSETS[index], SELF_ENERGY_OFFSETS[index + 1]):",
+        "		result[EMOJI_TABLE[SELF_ENERGY_IDS[k]]] = SELF_ENERGY_VALUES[k]",
+        "	return result",
+        "",
+        "",
+        "static func get_hamiltonian(index: int) -> Dictionary:",
+        "	\"\"\"Same shape as Faction.hamiltonian: float, or Vector2(re, im) when complex\"\"\"",
+        "	var result: Dictionary = {}",
+        "	for k in range(COUPLING_OFFSETS[index], COUPLING_OFFSETS[index + 1]):",
+        "		var base = k * COUPLING_STRIDE",
+        "		var source = EMOJI_TABLE[int(COUPLINGS[base])]",
+        "		var target = EMOJI_TABLE[int(COUPLINGS[base + 1])]",
+        "		var im = COUPLINGS[base + 3]",
+        "		if not result.has(source):",
+        "			result[source] = {}",
+        "		result[source][target] = Vector2(COUPLINGS[base + 2], im) if im != 0.0 else COUPLINGS[base + 2]",
+        "	return result",
+        "",
+        "",
+        "static func find(name: String) -> int:",
+        "	return NAMES.find(name)",
+        "",
+    )
+    return script.text()
+
+
+def render_faction_entry(faction) -> str:
+    """ALL_FACTIONS entry for one faction (no trailing comma)"""
+    sig_source = faction.get('signature', faction.get('sig', []))
+    motto = faction.get('motto')
+    return dict_fragment([
+        ("name", escape_gdscript_string(faction.get('name', 'Unknown'))),
+        ("domain", escape_gdscript_string(faction.get('domain', 'Unknown'))),
+        ("ring", escape_gdscript_string(faction.get('ring', 'unknown'))),
+        ("bits", format_bits_array(faction.get('bits', []))),
+        ("sig", format_emoji_array(sig_source)),
+        # Motto (can be null)
+        ("motto", "null" if motto is None else escape_gdscript_string(motto)),
+        ("description", escape_gdscript_string(faction.get('description', ''))),
+    ], depth=2)
 
 
-def format_bits_array(bits: list) -> str:
-    """Format a bits array for GDScript"""
-    if not bits:
-        return "[]"
-    return f"[{', '.join(str(b) for b in bits)}]"
+def render_axis(axis) -> str:
+    """AXIAL_SPINE.axes entry for one axis (no trailing comma)"""
+    return dict_fragment([
+        ("bit", str(axis.get('bit', 0))),
+        ("name", escape_gdscript_string(axis.get('name', ''))),
+        ("0", escape_gdscript_string(axis.get('0', ''))),
+        ("1", escape_gdscript_string(axis.get('1', ''))),
+    ], depth=3)
 
 
 DEFAULT_META = {
@@ -74,12 +290,11 @@ DEFAULT_AXIAL_SPINE = {
 def convert_json_to_gdscript(json_path: Path, output_path: Path):
     """Convert canonical faction JSON to GDScript"""
 
-    # Load JSON
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Load JSON (read-only snapshot, cached between runs)
+    data = load_snapshot(json_path).data
 
     # Support either legacy lexicon dict or canonical factions list
-    if isinstance(data, list):
+    if isinstance(data, tuple):
         factions = data
         meta = DEFAULT_META
         axial = DEFAULT_AXIAL_SPINE
@@ -92,47 +307,30 @@ def convert_json_to_gdscript(json_path: Path, output_path: Path):
         version = data.get('version', 'v2.1')
         title = data.get('title', 'SpaceWheat Faction Lexicon')
 
-    # Start building GDScript file
-    gd_lines = []
-
-    # Header
-    gd_lines.append("class_name FactionDatabaseV2")
-    gd_lines.append("extends RefCounted")
-    gd_lines.append("")
-    gd_lines.append("## Faction Database v2.1")
-    gd_lines.append("## Generated from Core/Factions/data/factions_merged.json")
-    gd_lines.append(f"## Contains {len(factions)} factions with rich flavor text, mottos, and lore")
-    gd_lines.append("")
+    script = GDScriptFile("FactionDatabaseV2", "RefCounted", [
+        "Faction Database v2.1",
+        "Generated from Core/Factions/data/factions_merged.json",
+        f"Contains {len(factions)} factions with rich flavor text, mottos, and lore",
+    ])
 
     # Meta information
-    gd_lines.append("## Meta Information")
-    gd_lines.append(f"const VERSION = {escape_gdscript_string(version)}")
-    gd_lines.append(f"const TITLE = {escape_gdscript_string(title)}")
-    gd_lines.append("")
-    gd_lines.append("const META = {")
-    gd_lines.append(f"	\"design_philosophy\": {escape_gdscript_string(meta.get('design_philosophy', ''))},")
-    gd_lines.append(f"	\"player_start\": {escape_gdscript_string(meta.get('player_start', ''))},")
-    gd_lines.append(f"	\"shadow_path\": {escape_gdscript_string(meta.get('shadow_path', ''))},")
-    gd_lines.append(f"	\"quantum_awareness\": {escape_gdscript_string(meta.get('quantum_awareness', ''))},")
-    gd_lines.append(f"	\"patch_notes\": {escape_gdscript_string(meta.get('patch_notes', ''))}")
-    gd_lines.append("}")
-    gd_lines.append("")
+    script.add("## Meta Information")
+    script.const("VERSION", escape_gdscript_string(version))
+    script.const("TITLE", escape_gdscript_string(title))
+    script.add("")
+    meta_keys = ("design_philosophy", "player_start", "shadow_path", "quantum_awareness", "patch_notes")
+    script.add(dict_fragment(
+        [(key, escape_gdscript_string(meta.get(key, ''))) for key in meta_keys],
+        prefix="const META = ",
+    ), "")
 
     # Axial spine
-    gd_lines.append("## Axial Spine (Bit Encoding)")
-    gd_lines.append("const AXIAL_SPINE = {")
-    gd_lines.append(f"	\"version\": {escape_gdscript_string(axial.get('version', '1.4'))},")
-    gd_lines.append("	\"axes\": [")
-    for axis in axial.get('axes', []):
-        gd_lines.append("		{")
-        gd_lines.append(f"			\"bit\": {axis.get('bit', 0)},")
-        gd_lines.append(f"			\"name\": {escape_gdscript_string(axis.get('name', ''))},")
-        gd_lines.append(f"			\"0\": {escape_gdscript_string(axis.get('0', ''))},")
-        gd_lines.append(f"			\"1\": {escape_gdscript_string(axis.get('1', ''))}")
-        gd_lines.append("		},")
-    gd_lines.append("	]")
-    gd_lines.append("}")
-    gd_lines.append("")
+    script.add("## Axial Spine (Bit Encoding)")
+    axes = [f"{axis},\n" for axis in render_fragments(axial.get('axes', []), render_axis)]
+    script.add(dict_fragment([
+        ("version", escape_gdscript_string(axial.get('version', '1.4'))),
+        ("axes", "[\n" + "".join(axes) + "\t]"),
+    ], prefix="const AXIAL_SPINE = "), "")
 
     # Faction count and rings
     rings = set()
@@ -141,142 +339,145 @@ def convert_json_to_gdscript(json_path: Path, output_path: Path):
         rings.add(faction.get('ring', 'unknown'))
         domains.add(faction.get('domain', 'unknown'))
 
-    gd_lines.append("## Statistics")
-    gd_lines.append(f"const TOTAL_FACTIONS = {len(factions)}")
-    gd_lines.append(f"const RINGS = {sorted(list(rings))}")
-    gd_lines.append(f"const DOMAINS = {sorted(list(domains))}")
-    gd_lines.append("")
+    script.add("## Statistics")
+    script.const("TOTAL_FACTIONS", str(len(factions)))
+    script.const("RINGS", str(sorted(list(rings))))
+    script.const("DOMAINS", str(sorted(list(domains))))
+    script.add("")
 
     # All factions array
-    gd_lines.append("## All Factions")
-    gd_lines.append("const ALL_FACTIONS = [")
+    script.add("## All Factions")
+    script.const_list("ALL_FACTIONS", render_fragments(factions, render_faction_entry))
+    script.add("")
 
-    for i, faction in enumerate(factions):
-        sig_source = faction.get('signature', faction.get('sig', []))
-        gd_lines.append("	{")
-        gd_lines.append(f"		\"name\": {escape_gdscript_string(faction.get('name', 'Unknown'))},")
-        gd_lines.append(f"		\"domain\": {escape_gdscript_string(faction.get('domain', 'Unknown'))},")
-        gd_lines.append(f"		\"ring\": {escape_gdscript_string(faction.get('ring', 'unknown'))},")
-        gd_lines.append(f"		\"bits\": {format_bits_array(faction.get('bits', []))},")
-        gd_lines.append(f"		\"sig\": {format_emoji_array(sig_source)},")
-
-        # Motto (can be null)
-        motto = faction.get('motto')
-        if motto is None:
-            gd_lines.append(f"		\"motto\": null,")
-        else:
-            gd_lines.append(f"		\"motto\": {escape_gdscript_string(motto)},")
-
-        gd_lines.append(f"		\"description\": {escape_gdscript_string(faction.get('description', ''))}")
-
-        # Close faction dict (last one has no comma)
-        if i < len(factions) - 1:
-            gd_lines.append("	},")
-        else:
-            gd_lines.append("	}")
-
-    gd_lines.append("]")
-    gd_lines.append("")
+    # Lookup indexes (positions in ALL_FACTIONS)
+    script.add("## Lookup Indexes (positions in ALL_FACTIONS)")
+    for name, mapping in build_lookup_indexes(factions).items():
+        script.add(format_index_dict(name, mapping), "")
 
     # Helper functions
-    gd_lines.append("")
-    gd_lines.append("## Helper Functions")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_by_name(name: String) -> Dictionary:")
-    gd_lines.append("	\"\"\"Get faction by name\"\"\"")
-    gd_lines.append("	for faction in ALL_FACTIONS:")
-    gd_lines.append("		if faction.name == name:")
-    gd_lines.append("			return faction")
-    gd_lines.append("	return {}")
-    gd_lines.append("")
-    gd_lines.append("static func get_factions_by_ring(ring: String) -> Array:")
-    gd_lines.append("	\"\"\"Get all factions in a specific ring\"\"\"")
-    gd_lines.append("	var result = []")
-    gd_lines.append("	for faction in ALL_FACTIONS:")
-    gd_lines.append("		if faction.ring == ring:")
-    gd_lines.append("			result.append(faction)")
-    gd_lines.append("	return result")
-    gd_lines.append("")
-    gd_lines.append("static func get_factions_by_domain(domain: String) -> Array:")
-    gd_lines.append("	\"\"\"Get all factions in a specific domain\"\"\"")
-    gd_lines.append("	var result = []")
-    gd_lines.append("	for faction in ALL_FACTIONS:")
-    gd_lines.append("		if faction.domain == domain:")
-    gd_lines.append("			result.append(faction)")
-    gd_lines.append("	return result")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_emoji(faction: Dictionary) -> String:")
-    gd_lines.append("	\"\"\"Get first emoji from faction signature as display emoji\"\"\"")
-    gd_lines.append("	if faction.has(\"sig\") and faction.sig.size() > 0:")
-    gd_lines.append("		return faction.sig[0]")
-    gd_lines.append("	return \"❓\"")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_signature_string(faction: Dictionary) -> String:")
-    gd_lines.append("	\"\"\"Get faction signature as emoji string\"\"\"")
-    gd_lines.append("	if faction.has(\"sig\"):")
-    gd_lines.append("		return \"\".join(faction.sig)")
-    gd_lines.append("	return \"\"")
-    gd_lines.append("")
+    script.add("", "## Helper Functions", "")
+    script.add(
+        "static func get_faction_by_name(name: String) -> Dictionary:",
+        "	\"\"\"Get faction by name\"\"\"",
+        "	var index = FACTION_INDEX_BY_NAME.get(name, -1)",
+        "	if index < 0:",
+        "		return {}",
+        "	return ALL_FACTIONS[index]",
+        "",
+        "static func _factions_at(indices: Array) -> Array:",
+        "	\"\"\"Factions at the given ALL_FACTIONS positions\"\"\"",
+        "	var result = []",
+        "	for index in indices:",
+        "		result.append(ALL_FACTIONS[index])",
+        "	return result",
+        "",
+        "static func get_factions_by_ring(ring: String) -> Array:",
+        "	\"\"\"Get all factions in a specific ring\"\"\"",
+        "	return _factions_at(FACTION_INDICES_BY_RING.get(ring, []))",
+        "",
+        "static func get_factions_by_domain(domain: String) -> Array:",
+        "	\"\"\"Get all factions in a specific domain\"\"\"",
+        "	return _factions_at(FACTION_INDICES_BY_DOMAIN.get(domain, []))",
+        "",
+        "static func get_factions_with_emoji(emoji: String) -> Array:",
+        "	\"\"\"Get all factions whose signature contains an emoji\"\"\"",
+        "	return _factions_at(FACTIONS_BY_EMOJI.get(emoji, []))",
+        "",
+        "static func get_faction_emoji(faction: Dictionary) -> String:",
+        "	\"\"\"Get first emoji from faction signature as display emoji\"\"\"",
+        "	if faction.has(\"sig\") and faction.sig.size() > 0:",
+        "		return faction.sig[0]",
+        "	return \"❓\"",
+        "",
+        "static func get_faction_signature_string(faction: Dictionary) -> String:",
+        "	\"\"\"Get faction signature as emoji string\"\"\"",
+        "	if faction.has(\"sig\"):",
+        "		return \"\".join(faction.sig)",
+        "	return \"\"",
+        "",
+    )
 
     # Vocabulary helpers (used by QuestTheming/GameStateManager)
-    gd_lines.append("static func _get_axial_emojis(bits: Array) -> Array:")
-    gd_lines.append("	\"\"\"Convert 12-bit axial array into emoji list.\"\"\"")
-    gd_lines.append("	var result: Array = []")
-    gd_lines.append("	if bits.is_empty():")
-    gd_lines.append("		return result")
-    gd_lines.append("	for i in range(min(bits.size(), AXIAL_SPINE.axes.size())):")
-    gd_lines.append("		var axis = AXIAL_SPINE.axes[i]")
-    gd_lines.append("		var bit = bits[i]")
-    gd_lines.append("		var emoji = axis.get(\"1\" if bit == 1 else \"0\", \"\")")
-    gd_lines.append("		if emoji != \"\":")
-    gd_lines.append("			result.append(emoji)")
-    gd_lines.append("	return result")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_vocabulary(faction: Dictionary) -> Dictionary:")
-    gd_lines.append("	\"\"\"Return faction vocabulary bundle (signature, axial, all).\"\"\"")
-    gd_lines.append("	var signature = faction.get(\"sig\", faction.get(\"signature\", []))")
-    gd_lines.append("	var axial = _get_axial_emojis(faction.get(\"bits\", []))")
-    gd_lines.append("	var all = signature.duplicate()")
-    gd_lines.append("	for emoji in axial:")
-    gd_lines.append("		if emoji not in all:")
-    gd_lines.append("			all.append(emoji)")
-    gd_lines.append("	return {\"signature\": signature, \"axial\": axial, \"all\": all}")
-    gd_lines.append("")
-    gd_lines.append("static func get_vocabulary_overlap(vocab_a: Array, vocab_b: Array) -> Array:")
-    gd_lines.append("	\"\"\"Return emojis in vocab_a that are also in vocab_b (preserve order).\"\"\"")
-    gd_lines.append("	var result: Array = []")
-    gd_lines.append("	for emoji in vocab_a:")
-    gd_lines.append("		if emoji in vocab_b and emoji not in result:")
-    gd_lines.append("			result.append(emoji)")
-    gd_lines.append("	return result")
-    gd_lines.append("")
-    gd_lines.append("static func get_faction_banner_path(faction: Dictionary) -> String:")
-    gd_lines.append("	\"\"\"Return banner asset path if available.\"\"\"")
-    gd_lines.append("	var name = faction.get(\"name\", \"\")")
-    gd_lines.append("	if name == \"\":")
-    gd_lines.append("		return \"\"")
-    gd_lines.append("	var path = \"res://Assets/UI/Factions/Banners/%s.svg\" % name")
-    gd_lines.append("	if ResourceLoader.exists(path):")
-    gd_lines.append("		return path")
-    gd_lines.append("	return \"\"")
-    gd_lines.append("")
-
-    # Write to file
-    output_content = "\n".join(gd_lines)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(output_content)
-
-    print(f"✅ Converted {len(factions)} factions from {json_path} to {output_path}")
+    script.add(
+        "static func _get_axial_emojis(bits: Array) -> Array:",
+        "	\"\"\"Convert 12-bit axial array into emoji list.\"\"\"",
+        "	var result: Array = []",
+        "	if bits.is_empty():",
+        "		return result",
+        "	for i in range(min(bits.size(), AXIAL_SPINE.axes.size())):",
+        "		var axis = AXIAL_SPINE.axes[i]",
+        "		var bit = bits[i]",
+        "		var emoji = axis.get(\"1\" if bit == 1 else \"0\", \"\")",
+        "		if emoji != \"\":",
+        "			result.append(emoji)",
+        "	return result",
+        "",
+        "static func get_faction_vocabulary(faction: Dictionary) -> Dictionary:",
+        "	\"\"\"Return faction vocabulary bundle (signature, axial, all).\"\"\"",
+        "	var signature = faction.get(\"sig\", faction.get(\"signature\", []))",
+        "	var axial = _get_axial_emojis(faction.get(\"bits\", []))",
+        "	var all = signature.duplicate()",
+        "	var seen: Dictionary = {}",
+        "	for emoji in all:",
+        "		seen[emoji] = true",
+        "	for emoji in axial:",
+        "		if not seen.has(emoji):",
+        "			seen[emoji] = true",
+        "			all.append(emoji)",
+        "	return {\"signature\": signature, \"axial\": axial, \"all\": all}",
+        "",
+        "static func get_vocabulary_overlap(vocab_a: Array, vocab_b: Array) -> Array:",
+        "	\"\"\"Return emojis in vocab_a that are also in vocab_b (preserve order).\"\"\"",
+        "	var lookup: Dictionary = {}",
+        "	for emoji in vocab_b:",
+        "		lookup[emoji] = true",
+        "	var result: Array = []",
+        "	for emoji in vocab_a:",
+        "		if lookup.has(emoji):",
+        "			result.append(emoji)",
+        "			lookup.erase(emoji)  # Each emoji once",
+        "	return result",
+        "",
+        "static func get_faction_banner_path(faction: Dictionary) -> String:",
+        "	\"\"\"Return banner asset path if available.\"\"\"",
+        "	var name = faction.get(\"name\", \"\")",
+        "	if name == \"\":",
+        "		return \"\"",
+        "	var path = \"res://Assets/UI/Factions/Banners/%s.svg\" % name",
+        "	if ResourceLoader.exists(path):",
+        "		return path",
+        "	return \"\"",
+        "",
+    )
+
+    # Write to file (untouched when the bytes are the same)
+    output_content = script.text()
+    written = script.write(output_path)
+
+    print(f"✅ Converted {len(factions)} factions from {json_path} to {output_path}"
+          f" ({'written' if written else 'unchanged'})")
     print(f"   Rings: {', '.join(sorted(rings))}")
     print(f"   Domains: {', '.join(sorted(domains))}")
-    print(f"   Output size: {len(output_content)} characters, {len(gd_lines)} lines")
+    print(f"   Output size: {len(output_content)} characters, {output_content.count(chr(10)) + 1} lines")
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert factions_merged.json to GDScript")
+    parser.add_argument(
+        "--packed",
+        action="store_true",
+        help="Also write Core/Factions/FactionPackedData.gd (struct-of-arrays physics tables)",
+    )
+    args = parser.parse_args()
+
     # Get paths
     script_dir = Path(__file__).parent
     json_path = script_dir / "Core" / "Factions" / "data" / "factions_merged.json"
     output_path = script_dir / "Core" / "Quests" / "FactionDatabaseV2.gd"
+    packed_path = script_dir / "Core" / "Factions" / "FactionPackedData.gd"
 
     # Check if input exists
     if not json_path.exists():
@@ -286,6 +487,12 @@ if __name__ == "__main__":
     # Convert
     try:
         convert_json_to_gdscript(json_path, output_path)
+        if args.packed:
+            factions = load_snapshot(json_path).records
+            content = generate_packed_gdscript(factions, "Core/Factions/data/factions_merged.json")
+            written = write_if_changed(packed_path, content)
+            print(f"✅ Packed {len(factions)} factions to {packed_path} ({len(content.encode('utf-8'))} bytes, "
+                  f"{'written' if written else 'unchanged'})")
     except Exception as e:
         print(f"❌ Error during conversion: {e}")
         import traceback
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+SpaceWheat Quantum Correlations
+All-pairs correlation and entanglement matrices between projections
+
+The bath is one excitation spread over emoji basis states, so two
+projections A = (nA, sA) and B = (nB, sB) are two subspaces of the same ρ.
+
+- Correlation: Pearson correlation of the projections' σ_z observables
+      Z_A = |nA⟩⟨nA| - |sA⟩⟨sA|
+  over the bath populations, in [-1, 1]. With Z the (projections × emojis)
+  matrix of ±1 entries and p = diag(ρ):
+      cov = Z·diag(p)·Zᵀ - (Z·p)(Z·p)ᵀ
+
+- Entanglement: mode-entanglement concurrence between the two subspaces,
+      E_AB = 2‖ρ_AB‖₁ / (p_A + p_B)
+  where ρ_AB is the 2×2 off-diagonal block. 1.0 for an even coherent
+  superposition across A and B (Bell-like), 0.0 when either side is empty
+  or the block has decohered. Pairs sharing an emoji read as 0.
+
+Both matrices come out of a handful of NumPy ops for every active pair
+at once, and are cached by the bath's snapshot version.
+"""
+
+from typing import Dict, Hashable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from quantum_projections import resolve_pairs
+
+
+Pair = Tuple[str, str]
+
+
+class PairMatrixView(Mapping):
+    """Read-only {(pair, second_pair): value} view over a square matrix.
+
+    Drop-in for bath["correlations"] / bath["entanglement"] without
+    materializing P² dict entries.
+    """
+
+    def __init__(self, index: Dict[Pair, int], matrix: np.ndarray):
+        self._index = index
+        self._matrix = matrix
+
+    def __getitem__(self, key: Tuple[Pair, Pair]) -> float:
+        first, second = key
+        return float(self._matrix[self._index[first], self._index[second]])
+
+    def __contains__(self, key) -> bool:
+        try:
+            first, second = key
+        except (TypeError, ValueError):
+            return False
+        return first in self._index and second in self._index
+
+    def __iter__(self) -> Iterator[Tuple[Pair, Pair]]:
+        for first in self._index:
+            for second in self._index:
+                yield (first, second)
+
+    def __len__(self) -> int:
+        return len(self._index) ** 2
+
+
+def correlation_matrix(
+    populations: np.ndarray, north: np.ndarray, south: np.ndarray
+) -> np.ndarray:
+    """Pearson correlation of every projection's σ_z against every other"""
+    count = len(north)
+    rows = np.arange(count)
+    z = np.zeros((count, len(populations)))
+    z[rows, north] += 1.0
+    z[rows, south] -= 1.0
+
+    mean = z @ populations
+    cov = (z * populations) @ z.T - np.outer(mean, mean)
+    std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+    scale = np.outer(std, std)
+    return np.where(scale > 1e-12, cov / np.where(scale > 1e-12, scale, 1.0), 0.0)
+
+
+def entanglement_matrix(
+    rho: np.ndarray, north: np.ndarray, south: np.ndarray
+) -> np.ndarray:
+    """Concurrence between every pair of projection subspaces"""
+    # 2×2 off-diagonal block [[a, b], [c, d]] for every (A, B) at once
+    a = rho[north[:, None], north[None, :]]
+    b = rho[north[:, None], south[None, :]]
+    c = rho[south[:, None], north[None, :]]
+    d = rho[south[:, None], south[None, :]]
+
+    # Trace norm of a 2×2 matrix: σ₁ + σ₂ = √(‖M‖²_F + 2|det M|)
+    frobenius = np.abs(a) ** 2 + np.abs(b) ** 2 + np.abs(c) ** 2 + np.abs(d) ** 2
+    trace_norm = np.sqrt(frobenius + 2.0 * np.abs(a * d - b * c))
+
+    pops = rho[north, north].real + rho[south, south].real
+    total = pops[:, None] + pops[None, :]
+    ent = np.where(total > 1e-12, 2.0 * trace_norm / np.where(total > 1e-12, total, 1.0), 0.0)
+
+    shares_emoji = (
+        (north[:, None] == north[None, :]) | (north[:, None] == south[None, :])
+        | (south[:, None] == north[None, :]) | (south[:, None] == south[None, :])
+    )
+    ent[shares_emoji] = 0.0
+    return np.clip(ent, 0.0, 1.0)
+
+
+class CorrelationCache:
+    """Correlation/entanglement matrices, recomputed only on a new bath version"""
+
+    def __init__(self):
+        self._key: Optional[Tuple[Hashable, Tuple[Pair, ...]]] = None
+        self.pairs: List[Pair] = []
+        self.index: Dict[Pair, int] = {}
+        self.correlations = np.zeros((0, 0))
+        self.entanglement = np.zeros((0, 0))
+
+    def compute(
+        self,
+        rho: np.ndarray,
+        emoji_index: Mapping[str, int],
+        pairs: Sequence[Pair],
+        version: Hashable = None,
+    ) -> bool:
+        """Refresh the matrices; returns False when the cached ones were reused.
+
+        A `version` of None always recomputes.
+        """
+        key = (version, tuple(pairs))
+        if version is not None and key == self._key:
+            return False
+
+        kept, north, south = resolve_pairs(emoji_index, pairs)
+        rho = np.asarray(rho)
+        self.pairs = kept
+        self.index = {pair: i for i, pair in enumerate(kept)}
+        self.correlations = correlation_matrix(np.real(np.diagonal(rho)), north, south)
+        self.entanglement = entanglement_matrix(rho, north, south)
+        self._key = key
+        return True
+
+    def fill_bath(
+        self,
+        bath: Dict,
+        rho: np.ndarray,
+        emoji_index: Mapping[str, int],
+        pairs: Sequence[Pair],
+    ) -> Dict:
+        """Populate bath["correlations"] and bath["entanglement"] for the evaluator.
+
+        Uses bath["version"] (if present) as the snapshot version.
+        """
+        self.compute(rho, emoji_index, pairs, bath.get("version"))
+        bath["correlations"] = PairMatrixView(self.index, self.correlations)
+        bath["entanglement"] = PairMatrixView(self.index, self.entanglement)
+        return bath
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+SpaceWheat Quantum Observable History
+Fixed-capacity NumPy ring buffers for history-based quest observables
+
+Some observables are about a trajectory, not an instant:
+- STABILITY: how long a value has stayed put
+- OSCILLATION_FREQUENCY: dominant frequency of a projection's motion
+- BERRY_PHASE / WINDING_NUMBER: need the unwrapped φ history
+
+Each (observable, emoji or pair) stream gets one preallocated buffer.
+Recording a sample writes into that buffer in place - no per-sample
+allocation - so memory stays bounded however long the session runs.
+"""
+
+import math
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+
+from quantum_quest_system import QuantumObservable
+
+
+DEFAULT_CAPACITY = 1024  # ~17s of history at 60 ticks/s
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECTION 1: RING BUFFER
+# One preallocated (time, value) stream
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ObservableRingBuffer:
+    """Preallocated circular buffer of (time, value) samples"""
+
+    __slots__ = ("capacity", "_times", "_values", "_head", "_count")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 2:
+            raise ValueError("Ring buffer capacity must be at least 2")
+        self.capacity = capacity
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._head = 0   # Next write slot
+        self._count = 0  # Valid samples (≤ capacity)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        """Forget all samples (storage is kept)"""
+        self._head = 0
+        self._count = 0
+
+    def append(self, t: float, value: float) -> None:
+        """Record one sample in place"""
+        self._times[self._head] = t
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def extend(self, times: Iterable[float], values: Iterable[float]) -> None:
+        """Record many samples at once (e.g. replaying a saved trajectory)"""
+        times = np.asarray(times, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if times.shape != values.shape:
+            raise ValueError("times and values must have the same length")
+
+        # Only the newest `capacity` samples can survive
+        if len(values) > self.capacity:
+            times = times[-self.capacity:]
+            values = values[-self.capacity:]
+
+        n = len(values)
+        if n == 0:
+            return
+        slots = (self._head + np.arange(n)) % self.capacity
+        self._times[slots] = times
+        self._values[slots] = values
+        self._head = (self._head + n) % self.capacity
+        self._count = min(self.capacity, self._count + n)
+
+    def _ordered(self, data: np.ndarray, last: Optional[int]) -> np.ndarray:
+        """Chronological view of the newest `last` samples.
+
+        Returns a view when the window is contiguous, a copy when it wraps.
+        """
+        n = self._count if last is None else max(0, min(last, self._count))
+        start = (self._head - n) % self.capacity
+        if start + n <= self.capacity:
+            return data[start:start + n]
+        return np.concatenate((data[start:], data[:self._head]))
+
+    def values(self, last: Optional[int] = None) -> np.ndarray:
+        """Newest `last` values, oldest first (all if None)"""
+        return self._ordered(self._values, last)
+
+    def times(self, last: Optional[int] = None) -> np.ndarray:
+        """Newest `last` timestamps, oldest first (all if None)"""
+        return self._ordered(self._times, last)
+
+    def latest(self) -> Optional[float]:
+        """Most recent value, or None when empty"""
+        if self._count == 0:
+            return None
+        return float(self._values[self._head - 1])
+
+    # ─── Window queries ───────────────────────────────────────────────────────
+
+    def mean(self, last: Optional[int] = None) -> Optional[float]:
+        """Mean over the window"""
+        w = self.values(last)
+        return float(w.mean()) if len(w) else None
+
+    def variance(self, last: Optional[int] = None) -> Optional[float]:
+        """Population variance over the window"""
+        w = self.values(last)
+        return float(w.var()) if len(w) else None
+
+    def unwrap(self, last: Optional[int] = None) -> np.ndarray:
+        """Phase-unwrapped window (removes 2π jumps, for φ streams)"""
+        return np.unwrap(self.values(last))
+
+    def fft_peak(self, last: Optional[int] = None) -> Optional[float]:
+        """Dominant non-DC frequency in cycles per time unit.
+
+        Assumes roughly uniform sampling; the spacing is taken from the
+        window's mean timestep.
+        """
+        w = self.values(last)
+        n = len(w)
+        if n < 4:
+            return None
+        t = self.times(last)
+        dt = (t[-1] - t[0]) / (n - 1)
+        if dt <= 0:
+            return None
+
+        spectrum = np.abs(np.fft.rfft((w - w.mean()) * np.hanning(n)))
+        spectrum[0] = 0.0  # Ignore DC
+        peak = int(np.argmax(spectrum))
+        if spectrum[peak] == 0.0:
+            return 0.0  # Flat signal - no oscillation
+        return float(np.fft.rfftfreq(n, d=dt)[peak])
+
+    def stable_duration(self, tolerance: float, last: Optional[int] = None) -> Optional[float]:
+        """How long the value has stayed within `tolerance` of the latest sample"""
+        w = self.values(last)
+        if len(w) == 0:
+            return None
+        t = self.times(last)
+        drifted = np.flatnonzero(np.abs(w - w[-1]) > tolerance)
+        first_stable = drifted[-1] + 1 if len(drifted) else 0
+        return float(t[-1] - t[first_stable])
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECTION 2: HISTORY STORE
+# Ring buffers keyed by (observable, emoji or pair)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Projection fields recorded automatically by record_projections()
+PROJECTION_FIELDS = {
+    QuantumObservable.THETA: "theta",
+    QuantumObservable.PHI: "phi",
+    QuantumObservable.RADIUS: "radius",
+}
+
+
+class ObservableHistory:
+    """Bounded per-stream history for the quest evaluator"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._buffers: Dict[Tuple[QuantumObservable, Hashable], ObservableRingBuffer] = {}
+
+    def buffer(self, observable: QuantumObservable, key: Hashable) -> Optional[ObservableRingBuffer]:
+        """Existing buffer for a stream, or None if never recorded"""
+        return self._buffers.get((observable, key))
+
+    def record(self, observable: QuantumObservable, key: Hashable, t: float, value: float) -> None:
+        """Record one sample, creating the stream's buffer on first use"""
+        buf = self._buffers.get((observable, key))
+        if buf is None:
+            buf = ObservableRingBuffer(self.capacity)
+            self._buffers[(observable, key)] = buf
+        buf.append(t, value)
+
+    def record_projections(self, t: float, projections: Dict) -> None:
+        """Record θ/φ/r for every active projection pair"""
+        for pair, proj in projections.items():
+            for observable, field_name in PROJECTION_FIELDS.items():
+                if field_name in proj:
+                    self.record(observable, pair, t, proj[field_name])
+
+    def record_bath(self, t: float, bath: Dict) -> None:
+        """Record |α| and arg(α) for every emoji in the bath"""
+        for emoji, amp in bath.get("amplitudes", {}).items():
+            re, im = amp.get("re", 0.0), amp.get("im", 0.0)
+            self.record(QuantumObservable.AMPLITUDE, emoji, t, math.hypot(re, im))
+            self.record(QuantumObservable.PHASE, emoji, t, math.atan2(im, re))
+
+    def drop(self, key: Hashable) -> None:
+        """Forget every stream for an emoji or pair (e.g. plot removed)"""
+        for stream in [s for s in self._buffers if s[1] == key]:
+            del self._buffers[stream]
+
+    # ─── Derived observables ─────────────────────────────────────────────────
+
+    def stability(
+        self, observable: QuantumObservable, key: Hashable, tolerance: float
+    ) -> Optional[float]:
+        """Seconds the stream has stayed within tolerance of its current value"""
+        buf = self.buffer(observable, key)
+        return buf.stable_duration(tolerance) if buf is not None else None
+
+    def oscillation_frequency(
+        self, observable: QuantumObservable, key: Hashable
+    ) -> Optional[float]:
+        """Dominant oscillation frequency of the stream"""
+        buf = self.buffer(observable, key)
+        return buf.fft_peak() if buf is not None else None
+
+    def unwrapped_phi(self, pair: Tuple[str, str]) -> Optional[np.ndarray]:
+        """Continuous φ trajectory for a projection"""
+        buf = self.buffer(QuantumObservable.PHI, pair)
+        return buf.unwrap() if buf is not None else None
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+SpaceWheat Quantum Projections
+Vectorized Bloch projections of emoji pairs from a bath density matrix
+
+A projection (north, south) looks at the 2×2 sub-block of ρ spanned by
+two emoji basis states:
+
+    ┌ ρ_nn  ρ_ns ┐     r = ρ_nn + ρ_ss            (population in subspace)
+    └ ρ_sn  ρ_ss ┘     θ = arccos((ρ_nn - ρ_ss)/r)
+                       φ = arg(ρ_sn)             in [0, 2π)
+                       coherence = 2|ρ_sn|/r     (Bloch xy length)
+
+All requested pairs are gathered with one fancy-indexing pass instead of
+a Python loop per plot.
+
+ProjectionTable stores the results for a whole board: pairs interned to
+integer row IDs, one NumPy column per field, and a read-only mapping
+facade so `projections[pair]["theta"]` code keeps working.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+TWO_PI = 2 * np.pi
+
+
+@dataclass
+class BlochProjections:
+    """θ, φ, r and coherence for a batch of emoji pairs (parallel arrays)"""
+    pairs: List[Tuple[str, str]]
+    theta: np.ndarray
+    phi: np.ndarray
+    radius: np.ndarray
+    coherence: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def as_projections(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Dict keyed by pair, in the shape QuantumQuestEvaluator expects"""
+        return {
+            pair: {
+                "theta": float(theta),
+                "phi": float(phi),
+                "radius": float(radius),
+                "coherence": float(coherence),
+            }
+            for pair, theta, phi, radius, coherence in zip(
+                self.pairs,
+                self.theta.tolist(),
+                self.phi.tolist(),
+                self.radius.tolist(),
+                self.coherence.tolist(),
+            )
+        }
+
+
+def resolve_pairs(
+    emoji_index: Mapping[str, int],
+    pairs: Sequence[Tuple[str, str]],
+) -> Tuple[List[Tuple[str, str]], np.ndarray, np.ndarray]:
+    """Basis indices of each pair's north and south emoji.
+
+    Pairs naming an emoji that is not in `emoji_index` are dropped.
+    Returns (kept_pairs, north_indices, south_indices).
+    """
+    kept = [pair for pair in pairs if pair[0] in emoji_index and pair[1] in emoji_index]
+    north = np.fromiter((emoji_index[a] for a, _ in kept), dtype=np.intp, count=len(kept))
+    south = np.fromiter((emoji_index[b] for _, b in kept), dtype=np.intp, count=len(kept))
+    return kept, north, south
+
+
+def extract_bloch_projections(
+    rho: np.ndarray,
+    emoji_index: Mapping[str, int],
+    pairs: Sequence[Tuple[str, str]],
+) -> BlochProjections:
+    """Project every requested emoji pair out of a density matrix at once.
+
+    Pairs naming an emoji that is not in `emoji_index` are skipped; the
+    returned `pairs` list holds only the ones actually projected.
+    """
+    kept_pairs, north, south = resolve_pairs(emoji_index, pairs)
+    if not kept_pairs:
+        empty = np.zeros(0)
+        return BlochProjections([], empty, empty.copy(), empty.copy(), empty.copy())
+
+    rho = np.asarray(rho)
+    p_north = rho[north, north].real
+    p_south = rho[south, south].real
+    off_diag = rho[south, north]
+
+    radius = p_north + p_south
+    occupied = radius > 1e-12
+    safe_radius = np.where(occupied, radius, 1.0)
+
+    # Empty subspaces read as the equator with no coherence
+    z = np.where(occupied, (p_north - p_south) / safe_radius, 0.0)
+    theta = np.arccos(np.clip(z, -1.0, 1.0))
+    phi = np.mod(np.angle(off_diag), TWO_PI)
+    coherence = np.where(occupied, 2.0 * np.abs(off_diag) / safe_radius, 0.0)
+
+    return BlochProjections(kept_pairs, theta, phi, radius, coherence)
+
+
+# Columns held by ProjectionTable, in projection-dict field names
+PROJECTION_FIELDS = (
+    "theta",
+    "phi",
+    "radius",
+    "coherence",
+    "accumulated_berry",
+    "winding_number",
+)
+
+
+class ProjectionRow(Mapping):
+    """Read-only dict-like view of one ProjectionTable row"""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "ProjectionTable", row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, field_name: str) -> float:
+        return float(self._table._columns[field_name][self._row])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(PROJECTION_FIELDS)
+
+    def __len__(self) -> int:
+        return len(PROJECTION_FIELDS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class ProjectionTable(Mapping):
+    """Array-backed store of active projections, keyed by emoji pair.
+
+    Each pair is interned to a dense row ID the first time it is seen and
+    keeps that row for the table's lifetime (removing a plot only clears
+    its active flag). Fields live in parallel float64 columns.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._ids: Dict[Tuple[str, str], int] = {}
+        self._pairs: List[Tuple[str, str]] = []
+        self._active = np.zeros(capacity, dtype=bool)
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=np.float64) for name in PROJECTION_FIELDS
+        }
+        # Row IDs for the last bulk_update pair list (usually the same every tick)
+        self._bulk_key: Optional[Tuple[Tuple[str, str], ...]] = None
+        self._bulk_rows = np.zeros(0, dtype=np.intp)
+
+    # ─── Interning ───────────────────────────────────────────────────────────
+
+    def intern(self, pair: Tuple[str, str]) -> int:
+        """Row ID for a pair, allocating a new row on first sight"""
+        row = self._ids.get(pair)
+        if row is None:
+            row = len(self._pairs)
+            if row == len(self._active):
+                self._grow()
+            self._ids[pair] = row
+            self._pairs.append(pair)
+        return row
+
+    def row_id(self, pair: Tuple[str, str]) -> Optional[int]:
+        """Row ID of an active pair, or None"""
+        row = self._ids.get(pair)
+        if row is None or not self._active[row]:
+            return None
+        return row
+
+    def _grow(self) -> None:
+        capacity = max(1, 2 * len(self._active))
+        self._active = np.resize(self._active, capacity)
+        self._active[len(self._pairs):] = False
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=np.float64)
+            grown[:len(column)] = column
+            self._columns[name] = grown
+
+    # ─── Writes ──────────────────────────────────────────────────────────────
+
+    def set(self, pair: Tuple[str, str], **fields: float) -> None:
+        """Activate a pair and write any of its fields"""
+        row = self.intern(pair)
+        self._active[row] = True
+        for name, value in fields.items():
+            self._columns[name][row] = value
+
+    def remove(self, pair: Tuple[str, str]) -> None:
+        """Deactivate a pair (its row ID stays reserved) and zero its fields"""
+        row = self._ids.get(pair)
+        if row is None:
+            return
+        self._active[row] = False
+        for column in self._columns.values():
+            column[row] = 0.0
+
+    def bulk_update(self, projections: BlochProjections) -> np.ndarray:
+        """Write a batch from extract_bloch_projections in one vectorized pass.
+
+        Returns the row IDs written, aligned with `projections.pairs`.
+        """
+        key = tuple(projections.pairs)
+        if key != self._bulk_key:
+            self._bulk_rows = np.fromiter(
+                (self.intern(pair) for pair in key), dtype=np.intp, count=len(key)
+            )
+            self._bulk_key = key
+        rows = self._bulk_rows
+        self._active[rows] = True
+        self._columns["theta"][rows] = projections.theta
+        self._columns["phi"][rows] = projections.phi
+        self._columns["radius"][rows] = projections.radius
+        self._columns["coherence"][rows] = projections.coherence
+        return rows
+
+    def write_column(self, field_name: str, rows: np.ndarray, values: np.ndarray) -> None:
+        """Overwrite one field for many rows (e.g. topology accumulators)"""
+        self._columns[field_name][rows] = values
+
+    # ─── Reads ───────────────────────────────────────────────────────────────
+
+    def column(self, field_name: str) -> np.ndarray:
+        """Field values of all active rows, in row-ID order"""
+        return self._columns[field_name][:len(self._pairs)][self._active[:len(self._pairs)]]
+
+    def active_rows(self) -> np.ndarray:
+        """Row IDs of all active pairs"""
+        return np.flatnonzero(self._active[:len(self._pairs)])
+
+    def pair(self, row: int) -> Tuple[str, str]:
+        """Pair interned at a row ID"""
+        return self._pairs[row]
+
+    def __getitem__(self, pair: Tuple[str, str]) -> ProjectionRow:
+        row = self.row_id(pair)
+        if row is None:
+            raise KeyError(pair)
+        return ProjectionRow(self, row)
+
+    def __contains__(self, pair) -> bool:
+        return self.row_id(pair) is not None
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return (self._pairs[row] for row in self.active_rows())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._active[:len(self._pairs)]))
@@ -1032,11 +1032,19 @@ class QuantumQuestGenerator:
 # Checks if quantum conditions are satisfied
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Largest θ / amplitude wobble that still counts as "holding still" for
+# STABILITY. Separate from QuantumCondition.tolerance, which is the band on
+# the measured duration (seconds) when it is compared against the target.
+STABILITY_DRIFT = 0.05
+
 class QuantumQuestEvaluator:
     """Evaluates quantum quest conditions against bath state"""
     
-    def __init__(self):
-        pass
+    def __init__(self, history=None, stability_drift: float = STABILITY_DRIFT):
+        # Optional ObservableHistory (quantum_observable_history.py) for
+        # trajectory observables like STABILITY and OSCILLATION_FREQUENCY
+        self.history = history
+        self.stability_drift = stability_drift
     
     def evaluate_condition(
         self, 
@@ -1128,7 +1136,7 @@ class QuantumQuestEvaluator:
         
         elif observable == QuantumObservable.ENTANGLEMENT:
             if pair and second_pair:
-                # Bell fidelity calculation would go here
+                # Filled in by CorrelationCache (quantum_correlations.py)
                 return bath.get("entanglement", {}).get((pair, second_pair), 0.0)
             return None
         
@@ -1142,6 +1150,29 @@ class QuantumQuestEvaluator:
                 return projections[pair].get("accumulated_berry", 0.0)
             return None
         
+        elif observable == QuantumObservable.WINDING_NUMBER:
+            # Filled in by TopologyTracker (quantum_topology.py)
+            if pair and pair in projections:
+                return projections[pair].get("winding_number", 0.0)
+            return None
+        
+        elif observable == QuantumObservable.STABILITY:
+            # Seconds the Bloch vector (or emoji amplitude) has held still
+            if self.history is not None:
+                if pair:
+                    return self.history.stability(QuantumObservable.THETA, pair, self.stability_drift)
+                if emoji:
+                    return self.history.stability(QuantumObservable.AMPLITUDE, emoji, self.stability_drift)
+            return None
+        
+        elif observable == QuantumObservable.OSCILLATION_FREQUENCY:
+            if self.history is not None:
+                if pair:
+                    return self.history.oscillation_frequency(QuantumObservable.THETA, pair)
+                if emoji:
+                    return self.history.oscillation_frequency(QuantumObservable.AMPLITUDE, emoji)
+            return None
+        
         else:
             return None
     
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+SpaceWheat Quantum Topology
+Berry phase and winding number accumulators for projection pairs
+
+A projection (θ, φ) is the Bloch state |ψ⟩ = cos(θ/2)|north⟩ + e^{iφ} sin(θ/2)|south⟩.
+
+- Berry phase: discrete geometric (Pancharatnam) phase of the sampled path,
+    γ = -arg(⟨ψ₀|ψ₁⟩⟨ψ₁|ψ₂⟩ ... ⟨ψₙ|ψ₀⟩)
+  accumulated as a sum of per-step overlap phases so it keeps growing past 2π.
+- Winding number: how many full turns φ has made, from wrapped φ steps.
+
+Live play feeds one sample per tick (O(1) each); offline replays hand a
+whole recorded trajectory to the batched NumPy functions.
+"""
+
+import cmath
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from quantum_quest_system import QuantumObservable
+
+
+TWO_PI = 2 * math.pi
+
+
+def _wrap_phase(delta: float) -> float:
+    """Wrap an angle step into (-π, π]"""
+    return delta - TWO_PI * math.floor((delta + math.pi) / TWO_PI)
+
+
+def _bloch_state(theta: float, phi: float) -> Tuple[complex, complex]:
+    """Bloch spinor (north, south) amplitudes"""
+    return complex(math.cos(theta / 2), 0.0), cmath.rect(math.sin(theta / 2), phi)
+
+
+def _overlap(a: Tuple[complex, complex], b: Tuple[complex, complex]) -> complex:
+    """⟨a|b⟩"""
+    return a[0].conjugate() * b[0] + a[1].conjugate() * b[1]
+
+
+def _phase(z: complex) -> float:
+    """arg(z), 0 for a vanishing overlap (orthogonal neighbours)"""
+    return cmath.phase(z) if abs(z) > 1e-12 else 0.0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECTION 1: STREAMING ACCUMULATORS
+# One (θ, φ) sample at a time, O(1) per update
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class BerryPhaseAccumulator:
+    """Discrete geometric phase of a sampled Bloch-sphere path"""
+
+    __slots__ = ("_first", "_last", "_open_phase", "samples")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._first: Optional[Tuple[complex, complex]] = None
+        self._last: Optional[Tuple[complex, complex]] = None
+        self._open_phase = 0.0  # Σ arg⟨ψₖ|ψₖ₊₁⟩
+        self.samples = 0
+
+    def update(self, theta: float, phi: float) -> float:
+        """Add a sample, return the accumulated Berry phase"""
+        state = _bloch_state(theta, phi)
+        if self._last is None:
+            self._first = state
+        else:
+            self._open_phase += _phase(_overlap(self._last, state))
+        self._last = state
+        self.samples += 1
+        return self.value
+
+    @property
+    def value(self) -> float:
+        """Berry phase so far, closing the path back to the first sample"""
+        if self.samples < 2:
+            return 0.0
+        closure = _phase(_overlap(self._last, self._first))
+        return -(self._open_phase + closure)
+
+
+class WindingNumberAccumulator:
+    """Counts full turns of φ"""
+
+    __slots__ = ("_last_phi", "_unwrapped", "samples")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._last_phi: Optional[float] = None
+        self._unwrapped = 0.0  # Total φ travel, signed
+        self.samples = 0
+
+    def update(self, phi: float) -> float:
+        """Add a sample, return the current winding number"""
+        if self._last_phi is not None:
+            self._unwrapped += _wrap_phase(phi - self._last_phi)
+        self._last_phi = phi
+        self.samples += 1
+        return self.value
+
+    @property
+    def turns(self) -> float:
+        """Fractional number of turns"""
+        return self._unwrapped / TWO_PI
+
+    @property
+    def value(self) -> float:
+        """Completed turns (signed, truncated toward zero)"""
+        return float(math.trunc(self.turns))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECTION 2: BATCHED TRAJECTORIES
+# Whole recorded paths in one NumPy pass (offline replays)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _step_phases(theta: np.ndarray, phi: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Spinor components and arg⟨ψₖ|ψₖ₊₁⟩ for every step"""
+    north = np.cos(theta / 2).astype(np.complex128)
+    south = np.sin(theta / 2) * np.exp(1j * phi)
+    overlaps = np.conj(north[:-1]) * north[1:] + np.conj(south[:-1]) * south[1:]
+    phases = np.where(np.abs(overlaps) > 1e-12, np.angle(overlaps), 0.0)
+    return north, south, phases
+
+
+def berry_phase_trajectory(theta, phi, cumulative: bool = False):
+    """Berry phase of a recorded (θ, φ) path.
+
+    With cumulative=True returns the running value after every sample
+    (matching what BerryPhaseAccumulator reported live).
+    """
+    theta = np.asarray(theta, dtype=np.float64)
+    phi = np.asarray(phi, dtype=np.float64)
+    n = len(theta)
+    if n < 2:
+        return np.zeros(n) if cumulative else 0.0
+
+    north, south, phases = _step_phases(theta, phi)
+    if not cumulative:
+        closure = np.conj(north[-1]) * north[0] + np.conj(south[-1]) * south[0]
+        closure_phase = np.angle(closure) if abs(closure) > 1e-12 else 0.0
+        return float(-(phases.sum() + closure_phase))
+
+    closures = np.conj(north[1:]) * north[0] + np.conj(south[1:]) * south[0]
+    closure_phases = np.where(np.abs(closures) > 1e-12, np.angle(closures), 0.0)
+    running = np.empty(n)
+    running[0] = 0.0
+    running[1:] = -(np.cumsum(phases) + closure_phases)
+    return running
+
+
+def winding_number_trajectory(phi, cumulative: bool = False):
+    """Winding number of a recorded φ path (see WindingNumberAccumulator)"""
+    phi = np.asarray(phi, dtype=np.float64)
+    n = len(phi)
+    if n < 2:
+        return np.zeros(n) if cumulative else 0.0
+
+    steps = np.diff(phi)
+    steps = steps - TWO_PI * np.floor((steps + np.pi) / TWO_PI)
+    if not cumulative:
+        return float(math.trunc(steps.sum() / TWO_PI))
+
+    running = np.empty(n)
+    running[0] = 0.0
+    running[1:] = np.trunc(np.cumsum(steps) / TWO_PI)
+    return running
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECTION 3: PER-PROJECTION TRACKING
+# Feeds the evaluator's "accumulated_berry" / "winding_number" fields
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class PairTopology:
+    """Topological accumulators for one projection pair"""
+    berry: BerryPhaseAccumulator
+    winding: WindingNumberAccumulator
+
+    def update(self, theta: float, phi: float) -> None:
+        self.berry.update(theta, phi)
+        self.winding.update(phi)
+
+
+class TopologyTracker:
+    """Berry phase and winding number for every active projection"""
+
+    def __init__(self):
+        self._pairs: Dict[Tuple[str, str], PairTopology] = {}
+
+    def get(self, pair: Tuple[str, str]) -> Optional[PairTopology]:
+        return self._pairs.get(pair)
+
+    def update(self, projections: Dict) -> None:
+        """Advance all accumulators by one tick and annotate the projections.
+
+        Writes "accumulated_berry" and "winding_number" into each projection
+        dict so QuantumQuestEvaluator can read them directly.
+        """
+        for pair, proj in projections.items():
+            if "theta" not in proj or "phi" not in proj:
+                continue
+            topo = self._pairs.get(pair)
+            if topo is None:
+                topo = PairTopology(BerryPhaseAccumulator(), WindingNumberAccumulator())
+                self._pairs[pair] = topo
+            topo.update(proj["theta"], proj["phi"])
+            proj["accumulated_berry"] = topo.berry.value
+            proj["winding_number"] = topo.winding.value
+
+    def update_table(self, table) -> None:
+        """Same as update() for a ProjectionTable (quantum_projections.py).
+
+        The table's rows are read-only views, so results go straight into
+        its accumulated_berry / winding_number columns.
+        """
+        rows = table.active_rows()
+        theta = table.column("theta")
+        phi = table.column("phi")
+        berry = np.empty(len(rows))
+        winding = np.empty(len(rows))
+        for i, row in enumerate(rows.tolist()):
+            pair = table.pair(row)
+            topo = self._pairs.get(pair)
+            if topo is None:
+                topo = PairTopology(BerryPhaseAccumulator(), WindingNumberAccumulator())
+                self._pairs[pair] = topo
+            topo.update(theta[i], phi[i])
+            berry[i] = topo.berry.value
+            winding[i] = topo.winding.value
+        table.write_column("accumulated_berry", rows, berry)
+        table.write_column("winding_number", rows, winding)
+
+    def reset(self, pair: Tuple[str, str]) -> None:
+        """Restart accumulation (e.g. after a strong measurement)"""
+        self._pairs.pop(pair, None)
+
+
+def replay_topology(history, pair: Tuple[str, str]) -> Optional[Dict[str, float]]:
+    """Berry phase and winding number of a pair from an ObservableHistory.
+
+    Only the samples still held in the history's ring buffers are used.
+    """
+    theta_buf = history.buffer(QuantumObservable.THETA, pair)
+    phi_buf = history.buffer(QuantumObservable.PHI, pair)
+    if theta_buf is None or phi_buf is None:
+        return None
+    n = min(len(theta_buf), len(phi_buf))
+    theta = theta_buf.values(n)
+    phi = phi_buf.values(n)
+    return {
+        "accumulated_berry": berry_phase_trajectory(theta, phi),
+        "winding_number": winding_number_trajectory(phi),
+    }
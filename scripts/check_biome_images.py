@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
-"""Audit biome image references and asset spelling in SpaceWheat."""
+"""Audit biome image references and asset spelling in SpaceWheat.
+
+Runs on the shared engine in tools/biome_audit.py (also used by
+Scripts/check_biome_images.py): asset directories are listed once and
+every res:// reference of the biome file is checked in the same pass.
+image_path values are matched by file name against --assets-dir, as
+before, whatever directory or prefix they carry; the engine's res://
+references cover the other fields.
+"""
 
 import argparse
-import json
 from collections import defaultdict
 from pathlib import Path
-import difflib
 import sys
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from asset_match import TrigramIndex  # noqa: E402
+from biome_audit import AssetListing, BiomeAudit  # noqa: E402
+from data_snapshot import load_snapshot  # noqa: E402
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -40,38 +52,23 @@ def normalize_image_name(image_path):
     return Path(image_path).name
 
 
-def collect_assets(asset_dir):
-    assets = []
-    for entry in Path(asset_dir).iterdir():
-        if not entry.is_file():
-            continue
-        if entry.suffix.lower() != ".png":
-            continue
-        if ":" in entry.name or entry.name.endswith(".import"):
-            continue
-        assets.append(entry)
-    return sorted(assets)
-
-
 def load_biomes(biome_json):
-    with open(biome_json, encoding="utf-8") as handle:
-        data = json.load(handle)
-    if not isinstance(data, list):
+    data = load_snapshot(Path(biome_json)).data
+    if not isinstance(data, tuple):
         raise ValueError("Biome JSON should be a list of entries.")
     return data
 
 
-def build_asset_index(assets):
-    by_name = {asset.name: asset for asset in assets}
+def report(biomes, audit, listing, args):
+    asset_names = listing.files(listing.rel(args.assets_dir), (".png",))
+    # Built once; fuzzy suggestions scan only the query's rarest trigrams
+    name_index = TrigramIndex(asset_names)
+    by_name = set(asset_names)
     by_lower = defaultdict(list)
-    for asset in assets:
-        by_lower[asset.name.lower()].append(asset)
-    return by_name, by_lower
+    for asset_name in asset_names:
+        by_lower[asset_name.lower()].append(asset_name)
+    other_refs = [ref for ref in audit.refs if ref.field != "image_path" and ref.status != "ok"]
 
-
-def report(biomes, assets, args):
-    by_name, by_lower = build_asset_index(assets)
-    asset_names = sorted(by_name)
     referenced_files = defaultdict(list)
     missing_reports = []
     for entry in biomes:
@@ -81,30 +78,25 @@ def report(biomes, assets, args):
         note_lines = []
         if not image_path:
             note_lines.append("no image_path assigned")
+        elif image_name in by_name:
+            referenced_files[image_name].append(name)
+        elif by_lower.get(image_name.lower()):
+            asset_name = by_lower[image_name.lower()][0]
+            note_lines.append(
+                f"case mismatch: builds reference {image_name} but actual file is {asset_name}"
+            )
+            referenced_files[asset_name].append(name)
         else:
-            if image_name in by_name:
-                referenced_files[image_name].append(name)
+            suggestions = name_index.close_matches(
+                image_name, n=3, cutoff=args.min_match_score
+            )
+            if suggestions:
+                note_lines.append(
+                    "file not found; best matches: " + ", ".join(suggestions)
+                )
             else:
-                lower_matches = by_lower.get(image_name.lower())
-                if lower_matches:
-                    asset_name = lower_matches[0].name
-                    note_lines.append(
-                        f"case mismatch: builds reference {image_name} but actual file is {asset_name}"
-                    )
-                    referenced_files[asset_name].append(name)
-                else:
-                    suggestions = [
-                        match for match in difflib.get_close_matches(
-                            image_name, asset_names, n=3, cutoff=args.min_match_score
-                        )
-                    ]
-                    if suggestions:
-                        note_lines.append(
-                            "file not found; best matches: " + ", ".join(suggestions)
-                        )
-                    else:
-                        note_lines.append("file not found and no close match"
-                                          if image_name else "image_path references empty name")
+                note_lines.append("file not found and no close match"
+                                  if image_name else "image_path references empty name")
         if note_lines:
             missing_reports.append((name, image_path, image_name, note_lines))
     unreferenced = [name for name in asset_names if name not in referenced_files]
@@ -119,6 +111,16 @@ def report(biomes, assets, args):
         print("All biome image references point to existing assets.")
         print()
 
+    if other_refs:
+        print("Other broken res:// references (music_path, ...):")
+        for ref in other_refs:
+            note = f"case mismatch, actual file is {ref.actual}" if ref.status == "case" else "file not found"
+            suggestions = listing.suggest(ref.path) if ref.status == "missing" else []
+            if suggestions:
+                note += "; best matches: " + ", ".join(suggestions)
+            print(f"- {ref.record} {ref.field}: {ref.path} -> {note}")
+        print()
+
     if unreferenced:
         print("Biomes are not using these biome art files:")
         for name in unreferenced:
@@ -130,6 +132,7 @@ def report(biomes, assets, args):
     print(f"  total biomes checked: {len(biomes)}")
     print(f"  assets inspected: {len(asset_names)}")
     print(f"  missing/mismatched references: {len(missing_reports)}")
+    print(f"  other broken references: {len(other_refs)}")
     print(f"  unused assets: {len(unreferenced)}")
 
 
@@ -144,8 +147,12 @@ def main():
         print("asset directory not found:", asset_dir, file=sys.stderr)
         sys.exit(1)
     biomes = load_biomes(biome_path)
-    assets = collect_assets(asset_dir)
-    report(biomes, assets, args)
+    listing = AssetListing(preload=(PROJECT_ROOT / "Assets", asset_dir.resolve()))
+    audit = BiomeAudit(listing).scan([biome_path])[0]
+    if audit.error:
+        print(f"cannot audit {biome_path}: {audit.error}", file=sys.stderr)
+        sys.exit(1)
+    report(biomes, audit, listing, args)
 
 
 if __name__ == "__main__":
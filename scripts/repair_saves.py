@@ -2,172 +2,312 @@
 """
 Repair save files and scenarios to match current GameState format
 
-Current format expectations:
+Saves are migrated from whatever save_version they are at to the current
+one through the chain in tools/save_migrations.py (one parse, one write).
+Pre-versioning saves (version 0: plots still holding theta/phi/radius/
+energy/growth_progress/is_mature) get:
 - Grid: 6x1 (6 width, 1 height)
 - Each plot must have: position, type, is_planted, has_been_measured, theta_frozen, entangled_with
 - No quantum state details (theta, phi, radius, energy) - those regenerate from biome
 - No obsolete fields (growth_progress, is_mature)
+Saves the game writes today (persistent_gates, lindblad_* plot fields) are
+already current and are never rewritten.
+
+Usage:
+    python scripts/repair_saves.py                       # Scenarios/default.tres
+    python scripts/repair_saves.py path/to/save.tres
+    python scripts/repair_saves.py ~/saves "backups/**/*.tres" --jobs 8 --summary repair.json
+
+With several files, a directory (searched recursively for *.tres) or a
+glob, files are repaired in parallel worker processes. Each file is
+written atomically (temp file, then rename). Content hashes of repaired
+files are kept in .cache/repair_saves.json, so a file that is already
+in the current format is skipped without being parsed. --summary writes
+the per-file changes as JSON.
 """
 
-import re
+import argparse
+import glob
+import hashlib
+import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+from godot_tres import TresDocument, TresSyntaxError  # noqa: E402
+from json_splice import write_text_atomic  # noqa: E402
+from save_migrations import CURRENT_VERSION, MigrationError, SaveState, migrate  # noqa: E402
+
+DEFAULT_SCENARIO = PROJECT_ROOT / "Scenarios" / "default.tres"
+CACHE_PATH = PROJECT_ROOT / ".cache" / "repair_saves.json"
+
+# Bump when repair behaviour changes outside the migration chain; the
+# cache is also invalidated whenever CURRENT_VERSION moves
+REPAIR_FORMAT = 2
+
+
 class GameStateRepair:
-    def __init__(self, file_path):
+    def __init__(self, file_path, verbose=True):
         self.file_path = Path(file_path)
+        self.verbose = verbose
         self.content = None
+        self.document = None
+        self.state = None
         self.plots = []
+        self.changes = {}
+        self.from_version = None
+        self.error = None
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def load(self, content=None):
+        """Load and parse the .tres file"""
+        if content is None:
+            with open(self.file_path, 'r', encoding='utf-8', newline='') as f:
+                content = f.read()
+        self.content = content
+        self.log(f"  ✓ Loaded {self.file_path.name} ({len(self.content)} bytes)")
+        try:
+            self.document = TresDocument(self.content)
+        except TresSyntaxError as e:
+            self.error = f"could not parse: {e}"
+            self.log(f"  ❌ Could not parse {self.file_path.name}: {e}")
+            return False
+        return True
 
-    def load(self):
-        """Load the .tres file"""
-        with open(self.file_path, 'r') as f:
-            self.content = f.read()
-        print(f"  ✓ Loaded {self.file_path.name} ({len(self.content)} bytes)")
+    @property
+    def resource(self):
+        return self.document.section("resource") if self.document else None
 
     def extract_plots(self):
-        """Extract plot array from file content"""
-        # Find the plots array
-        plots_match = re.search(r'plots = \[(.*?)\](?=\s*\n\s*\w)', self.content, re.DOTALL)
-        if not plots_match:
-            print("  ❌ Could not find plots array")
+        """Extract plot array from the parsed [resource] section"""
+        resource = self.resource
+        plots_node = resource.properties.get("plots") if resource else None
+        if plots_node is None or plots_node.kind != "array":
+            self.error = "could not find plots array"
+            self.log("  ❌ Could not find plots array")
             return False
 
-        plots_str = plots_match.group(1)
-
-        # Split by plot dictionaries
-        plot_matches = re.findall(r'\{[^}]*\}', plots_str)
-        print(f"  Found {len(plot_matches)} plots in file")
-
-        for i, plot_str in enumerate(plot_matches):
-            plot_dict = self._parse_dict(plot_str)
-            if plot_dict:
-                self.plots.append(plot_dict)
-            else:
-                print(f"    ⚠️  Could not parse plot {i}")
-
+        self.log(f"  Found {len(plots_node.items)} plots in file")
+        self.state = SaveState(self.document)
+        self.plots = self.state["plots"]
         return True
 
-    def _parse_dict(self, dict_str):
-        """Parse a dictionary string into a Python dict"""
-        result = {}
-
-        # Extract position
-        pos_match = re.search(r'"position":\s*Vector2i\((\d+),\s*(\d+)\)', dict_str)
-        if pos_match:
-            result['position'] = (int(pos_match.group(1)), int(pos_match.group(2)))
-
-        # Extract type
-        type_match = re.search(r'"type":\s*(\d+)', dict_str)
-        if type_match:
-            result['type'] = int(type_match.group(1))
-
-        # Extract is_planted
-        planted_match = re.search(r'"is_planted":\s*(true|false)', dict_str)
-        if planted_match:
-            result['is_planted'] = planted_match.group(1) == 'true'
-
-        # Extract has_been_measured
-        measured_match = re.search(r'"has_been_measured":\s*(true|false)', dict_str)
-        if measured_match:
-            result['has_been_measured'] = measured_match.group(1) == 'true'
-
-        # Extract entangled_with
-        entangled_match = re.search(r'"entangled_with":\s*\[(.*?)\]', dict_str)
-        if entangled_match:
-            result['entangled_with'] = []
-
-        return result if result else None
-
     def repair(self):
-        """Repair the save file"""
-        print("\n  🔧 Repairing file...")
-
-        # Create new plots array with correct format
-        # Standard grid: 6x1
-        new_plots = []
-        for x in range(6):
-            for y in range(1):
-                # Try to find matching plot in old data
-                old_plot = None
-                for p in self.plots:
-                    if p.get('position') == (x, y):
-                        old_plot = p
-                        break
-
-                # Create new plot with correct format
-                new_plot = {
-                    'position': f'Vector2i({x}, {y})',
-                    'type': old_plot.get('type', 0) if old_plot else 0,
-                    'is_planted': old_plot.get('is_planted', False) if old_plot else False,
-                    'has_been_measured': old_plot.get('has_been_measured', False) if old_plot else False,
-                    'theta_frozen': False,
-                    'entangled_with': []
-                }
-                new_plots.append(new_plot)
-
-        # Build the new plots array string
-        plots_str = "plots = ["
-        for plot in new_plots:
-            plot_str = "{ "
-            plot_str += f'"position": {plot["position"]}, '
-            plot_str += f'"type": {plot["type"]}, '
-            plot_str += f'"is_planted": {"true" if plot["is_planted"] else "false"}, '
-            plot_str += f'"has_been_measured": {"true" if plot["has_been_measured"] else "false"}, '
-            plot_str += f'"theta_frozen": false, '
-            plot_str += '"entangled_with": [] }'
-            plots_str += plot_str + ", "
-        plots_str += "]"
-
-        # Replace old plots array with new one
-        self.content = re.sub(
-            r'plots = \[[^\]]*\]',
-            plots_str,
-            self.content,
-            flags=re.DOTALL
-        )
-
-        # Ensure grid dimensions are correct
-        self.content = re.sub(r'grid_width = \d+', 'grid_width = 6', self.content)
-        self.content = re.sub(r'grid_height = \d+', 'grid_height = 1', self.content)
-
-        # Remove obsolete fields if present (shouldn't be in .tres but just in case)
-        print("  ✓ Repaired file structure")
+        """Migrate the save to the current save_version"""
+        self.log("\n  🔧 Repairing file...")
+        try:
+            result = migrate(self.document, state=self.state)
+        except MigrationError as e:
+            self.error = str(e)
+            self.log(f"  ❌ {e}")
+            return False
+
+        # Only the migrated properties are rewritten; everything else keeps its bytes
+        self.from_version = result.from_version
+        self.changes = result.changes
+        self.content = self.document.apply()
+        if result.migrated:
+            self.log(f"  ✓ Migrated save_version {result.from_version} → {result.to_version}")
+        else:
+            self.log(f"  ✓ Already at save_version {result.to_version}")
         return True
 
     def save(self, output_path=None):
-        """Save the repaired file"""
-        target_path = output_path or self.file_path
-        with open(target_path, 'w') as f:
-            f.write(self.content)
-        print(f"  ✓ Saved repaired file to {target_path.name}")
+        """Save the repaired file (temp file, then rename); False if the bytes were already there"""
+        target_path = Path(output_path or self.file_path)
+        written = write_text_atomic(target_path, self.content)
+        if written:
+            self.log(f"  ✓ Saved repaired file to {target_path.name}")
+        else:
+            self.log(f"  ✓ {target_path.name} unchanged, not written")
+        return written
 
     def summarize(self):
         """Print summary of changes"""
         print("\n  📊 Repair Summary:")
         print(f"    - Original plots: {len(self.plots)}")
-        print(f"    - New grid size: 6x1")
-        print(f"    - Removed obsolete fields: theta, phi, growth_progress, is_mature")
-        print(f"    - Added missing fields: theta_frozen")
-
-def main():
+        print(f"    - save_version: {self.from_version} → {CURRENT_VERSION}")
+        for name, (old, new) in self.changes.items():
+            print(f"    - {name}: {old} → {new}")
+        if not self.changes:
+            print("    - No changes needed")
+
+
+# ---------------------------------------------------------------------------
+# Batch mode
+# ---------------------------------------------------------------------------
+
+def sha1_text(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def collect_saves(patterns, suffix=".tres"):
+    """Files named by paths, directories (recursive) or globs; sorted, no duplicates."""
+    found = {}
+    for pattern in patterns:
+        pattern = os.path.expanduser(str(pattern))
+        if any(ch in pattern for ch in "*?["):
+            matches = [Path(p) for p in glob.glob(pattern, recursive=True)]
+        elif Path(pattern).is_dir():
+            matches = list(Path(pattern).rglob(f"*{suffix}"))
+        else:
+            matches = [Path(pattern)]
+        for path in matches:
+            if path.is_file() or not path.exists():
+                found.setdefault(str(path.resolve()), path)
+    return [found[key] for key in sorted(found)]
+
+
+def load_repaired_hashes(cache_path=CACHE_PATH):
+    """Content hashes of files already in the current format."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    if not isinstance(cache, dict) or cache.get("format") != REPAIR_FORMAT:
+        return set()
+    if cache.get("save_version") != CURRENT_VERSION:
+        return set()
+    return set(cache.get("repaired", []))
+
+
+def save_repaired_hashes(hashes, cache_path=CACHE_PATH):
+    cache = {"format": REPAIR_FORMAT, "save_version": CURRENT_VERSION, "repaired": sorted(hashes)}
+    write_text_atomic(cache_path, json.dumps(cache, indent=0))
+
+
+_known_hashes = frozenset()
+
+
+def _init_worker(known_hashes):
+    global _known_hashes
+    _known_hashes = frozenset(known_hashes)
+
+
+def repair_file(path, dry_run=False):
+    """Repair one save quietly; returns its summary entry (runs in a worker)."""
+    started = time.perf_counter()
+    entry = {"path": str(path), "status": "error"}
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        entry["error"] = str(e)
+        return entry
+
+    digest = sha1_text(content)
+    entry["sha1"] = digest
+    entry["bytes"] = len(content)
+    if digest in _known_hashes:
+        entry["status"] = "cached"
+        return entry
+
+    repair = GameStateRepair(path, verbose=False)
+    try:
+        ok = repair.load(content) and repair.extract_plots() and repair.repair()
+    except Exception as e:  # One bad save must not stop the batch
+        ok = False
+        repair.error = f"{type(e).__name__}: {e}"
+    if not ok:
+        entry["error"] = repair.error or "repair failed"
+        return entry
+
+    if repair.content == content:
+        entry["status"] = "current"
+        entry["repaired_sha1"] = digest
+    else:
+        entry["status"] = "would-repair" if dry_run else "repaired"
+        entry["from_version"] = repair.from_version
+        entry["changes"] = repair.changes
+        entry["repaired_sha1"] = sha1_text(repair.content)
+        entry["repaired_bytes"] = len(repair.content)
+        if not dry_run:
+            repair.save()
+    entry["seconds"] = round(time.perf_counter() - started, 4)
+    return entry
+
+
+def run_batch(paths, jobs, dry_run=False, use_cache=True, cache_path=CACHE_PATH):
+    """Repair many saves across worker processes; returns the summary dict."""
+    known = load_repaired_hashes(cache_path) if use_cache else set()
+    # Largest first so one big save does not finish alone at the end
+    ordered = sorted(paths, key=lambda p: p.stat().st_size if p.exists() else 0, reverse=True)
+    jobs = max(1, min(jobs, len(ordered) or 1))
+    chunksize = max(1, len(ordered) // (jobs * 8))
+
+    started = time.perf_counter()
+    if jobs == 1:
+        _init_worker(known)
+        entries = [repair_file(path, dry_run) for path in ordered]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(known,)) as pool:
+            entries = list(pool.map(repair_file, ordered, [dry_run] * len(ordered), chunksize=chunksize))
+    elapsed = time.perf_counter() - started
+
+    if not dry_run:
+        updated = set(known)
+        updated.update(e["repaired_sha1"] for e in entries if "repaired_sha1" in e)
+        if updated != known:
+            save_repaired_hashes(updated, cache_path)
+
+    totals = {}
+    for entry in entries:
+        totals[entry["status"]] = totals.get(entry["status"], 0) + 1
+    entries.sort(key=lambda e: e["path"])
+    return {
+        "format": REPAIR_FORMAT,
+        "save_version": CURRENT_VERSION,
+        "jobs": jobs,
+        "dry_run": dry_run,
+        "elapsed_seconds": round(elapsed, 3),
+        "totals": totals,
+        "files": entries,
+    }
+
+
+def print_batch(summary):
+    totals = summary["totals"]
+    count = len(summary["files"])
+    elapsed = summary["elapsed_seconds"]
+    rate = count / elapsed if elapsed else 0.0
+    print(f"\n▶ {count} save file(s), {summary['jobs']} worker(s), {elapsed:.2f}s ({rate:.0f} files/s)")
+    for entry in summary["files"]:
+        status = entry["status"]
+        if status in ("repaired", "would-repair"):
+            changes = ", ".join(f"{k} {v[0]}→{v[1]}" for k, v in entry["changes"].items()) or "formatting"
+            print(f"  🔧 {status}: {entry['path']} ({changes})")
+        elif status == "error":
+            print(f"  ❌ {entry['path']}: {entry['error']}")
+    print("  " + ", ".join(f"{name}: {totals[name]}" for name in sorted(totals)))
+
+
+def repair_single(scenario_path):
     print("\n" + "="*70)
     print("🔧 SPACEWHEAT SAVE FILE REPAIR TOOL")
     print("="*70)
 
-    scenario_path = "/home/tehcr33d/ws/SpaceWheat/Scenarios/default.tres"
-
     print("\n▶ Repairing scenario file...")
     print("-"*70)
 
     repair = GameStateRepair(scenario_path)
-    repair.load()
+    if not repair.load():
+        sys.exit(1)
 
     if repair.extract_plots():
         if repair.repair():
             repair.summarize()
-            repair.save()
-            print("\n✅ Scenario file repaired successfully!")
+            if repair.save():
+                print("\n✅ Scenario file repaired successfully!")
+            else:
+                print("\n✅ Scenario file already current!")
         else:
             print("\n❌ Failed to repair file")
             sys.exit(1)
@@ -179,5 +319,34 @@ def main():
     print("✅ REPAIR COMPLETE")
     print("="*70 + "\n")
 
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="Save files, directories or globs (default: Scenarios/default.tres)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes (batch mode)")
+    parser.add_argument("--summary", type=Path, help="Write per-file changes as JSON")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    parser.add_argument("--no-cache", action="store_true", help="Re-check files even if their hash is cached")
+    args = parser.parse_args()
+
+    patterns = args.paths or [DEFAULT_SCENARIO]
+    single = (len(patterns) == 1 and Path(patterns[0]).is_file()
+              and not (args.summary or args.dry_run or args.no_cache))
+    if single:
+        repair_single(patterns[0])
+        return 0
+
+    paths = collect_saves(patterns)
+    if not paths:
+        print("❌ No save files found")
+        return 1
+    summary = run_batch(paths, args.jobs, dry_run=args.dry_run, use_cache=not args.no_cache)
+    print_batch(summary)
+    if args.summary:
+        write_text_atomic(args.summary, json.dumps(summary, indent=2, ensure_ascii=False) + "\n")
+        print(f"  Summary written to {args.summary}")
+    return 1 if summary["totals"].get("error") else 0
+
+
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
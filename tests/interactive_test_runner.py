@@ -3,23 +3,158 @@
 """
 Interactive Test Runner for Phase 6 v2 Overlays
 Simulates player input and captures game behavior
+
+Godot's stdout and stderr are drained continuously by a background
+reader (selectors over both pipes) into a ring buffer and a game log, so
+a chatty boot can never fill the pipe and stall the game. Tests wait on
+the log markers the game prints (e.g. "GAME READY") with timeouts
+instead of sleeping, so the suite takes as long as the real boot.
+
+Usage:
+    python tests/interactive_test_runner.py [--boot-timeout 60] [--marker-timeout 5]
+    python tests/interactive_test_runner.py --godot /path/to/godot
+    python tests/interactive_test_runner.py --windowed      # build the UI, wait on overlay markers
+    python tests/interactive_test_runner.py --fake          # tests/godot_stub.py, no Godot needed
+    python tests/interactive_test_runner.py --fake crash    # stub that dies during boot
 """
 
-import subprocess
-import time
+import argparse
+import collections
 import os
-import signal
+import re
+import selectors
+import subprocess
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+GODOT_STUB = Path(__file__).resolve().with_name("godot_stub.py")
+
+BOOT_MARKER = re.compile(r"GAME READY")
+HEADLESS_MARKER = re.compile(r"Headless mode detected - skipping UI")
+OVERLAY_MARKER = "Registered v2 overlay: {name}"
+ERROR_MARKER = re.compile(r"SCRIPT ERROR|^ERROR:|\[ERROR\]")
+
+
+class OutputReader:
+    """Drains a process's stdout/stderr on a background thread.
+
+    Lines land in a ring buffer (the last `capacity` lines, each with a
+    sequence number) and, if given, a log file. wait_for() blocks until a
+    matching line arrives, the process closes its pipes, or the timeout
+    runs out.
+    """
+
+    def __init__(self, process, log_path=None, capacity=5000):
+        self.process = process
+        self.lines = collections.deque(maxlen=capacity)  # (seq, stream, text)
+        self.seq = 0
+        self.closed = False
+        self._cond = threading.Condition()
+        self._log = open(log_path, "a", encoding="utf-8") if log_path else None
+        self._thread = threading.Thread(target=self._run, name="godot-output", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        selector = selectors.DefaultSelector()
+        partial = {}
+        for name, pipe in (("stdout", self.process.stdout), ("stderr", self.process.stderr)):
+            if pipe is not None:
+                os.set_blocking(pipe.fileno(), False)
+                selector.register(pipe, selectors.EVENT_READ, name)
+                partial[name] = b""
+        try:
+            while selector.get_map():
+                for key, _ in selector.select(timeout=0.5):
+                    name = key.data
+                    try:
+                        chunk = os.read(key.fileobj.fileno(), 65536)
+                    except BlockingIOError:
+                        continue
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        if partial[name]:
+                            self._add(name, [partial[name]])
+                        continue
+                    *complete, partial[name] = (partial[name] + chunk).split(b"\n")
+                    if complete:
+                        self._add(name, complete)
+        finally:
+            selector.close()
+            with self._cond:
+                self.closed = True
+                self._cond.notify_all()
+            if self._log:
+                self._log.close()
+
+    def _add(self, stream, raw_lines):
+        texts = [raw.decode("utf-8", errors="replace").rstrip("\r") for raw in raw_lines]
+        with self._cond:
+            for text in texts:
+                self.seq += 1
+                self.lines.append((self.seq, stream, text))
+            self._cond.notify_all()
+        if self._log:
+            prefix = "" if stream == "stdout" else "[stderr] "
+            self._log.writelines(f"{prefix}{text}\n" for text in texts)
+            self._log.flush()
+
+    def mark(self):
+        """Sequence number to pass as `since` so only newer lines match."""
+        with self._cond:
+            return self.seq
+
+    def find(self, pattern, since=0):
+        """Buffered lines after `since` matching a regex (or substring)."""
+        if isinstance(pattern, str):
+            pattern = re.compile(re.escape(pattern))
+        with self._cond:
+            return [text for seq, _, text in self.lines if seq > since and pattern.search(text)]
+
+    def wait_for(self, pattern, timeout, since=0):
+        """First line after `since` matching pattern, or None on timeout/EOF."""
+        if isinstance(pattern, str):
+            pattern = re.compile(re.escape(pattern))
+        deadline = time.monotonic() + timeout
+        checked = since
+        with self._cond:
+            while True:
+                for seq, _, text in self.lines:
+                    if seq > checked and pattern.search(text):
+                        return text
+                checked = self.seq
+                remaining = deadline - time.monotonic()
+                if self.closed or remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+    def tail(self, count=20):
+        with self._cond:
+            return [text for _, _, text in list(self.lines)[-count:]]
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+
 class InteractiveTestRunner:
-    def __init__(self):
-        self.project_dir = "/home/tehcr33d/ws/SpaceWheat"
-        self.godot_bin = "godot"
+    def __init__(self, boot_timeout=60.0, marker_timeout=5.0, fake=None, godot_bin=None, env=None, log_file=None,
+                 headless=True):
+        self.project_dir = PROJECT_DIR
+        self.godot_bin = str(GODOT_STUB) if fake else (godot_bin or os.environ.get("GODOT_BIN", "godot"))
+        self.headless = headless
+        self.boot_timeout = boot_timeout
+        self.marker_timeout = marker_timeout
+        self.fake = fake
+        self.env = dict(env or os.environ)
+        if fake:
+            self.env["GODOT_STUB_SCENARIO"] = fake
         self.game_process = None
+        self.output = None
         self.test_results = []
-        self.log_file = None
+        self.log_file = log_file
         self.start_time = None
 
     def log(self, message, level="INFO"):
@@ -44,28 +179,30 @@ class InteractiveTestRunner:
         """Start the Godot game engine with the main scene"""
         self.log("Starting game engine...", "TEST")
 
+        # Headless unless --windowed (a .py binary is a stub, run with this interpreter)
+        command = [sys.executable, self.godot_bin] if self.godot_bin.endswith(".py") else [self.godot_bin]
+        command += [*(["--headless", "--no-window"] if self.headless else []), "scenes/FarmView.tscn"]
+
         try:
-            # Run game in headless mode
             self.game_process = subprocess.Popen(
-                [
-                    self.godot_bin,
-                    "--headless",
-                    "--no-window",
-                    "scenes/FarmView.tscn"
-                ],
+                command,
                 cwd=self.project_dir,
+                env=self.env,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
             )
-
-            self.log(f"Game started with PID {self.game_process.pid}", "PASS")
-            return True
         except Exception as e:
             self.log(f"Failed to start game: {e}", "FAIL")
             return False
 
+        game_log = self.log_file.with_name(self.log_file.stem + "_game.log") if self.log_file else None
+        self.output = OutputReader(self.game_process, game_log)
+        self.log(f"Game started with PID {self.game_process.pid}", "PASS")
+        if game_log:
+            self.log(f"Game output: {game_log}", "INFO")
+        return True
+
     def stop_game(self):
         """Stop the running game process"""
         if self.game_process:
@@ -76,24 +213,35 @@ class InteractiveTestRunner:
                 self.log("Game stopped gracefully", "PASS")
             except subprocess.TimeoutExpired:
                 self.game_process.kill()
+                self.game_process.wait()
                 self.log("Game force-killed after timeout", "WARN")
+        if self.output:
+            self.output.join(timeout=5)
 
     def test_boot_sequence(self):
         """Test 1: Verify boot sequence completes without errors"""
         self.log("Test 1: Boot Sequence", "TEST")
 
-        # Wait for game to boot
-        time.sleep(8)
+        started = time.monotonic()
+        marker = self.output.wait_for(BOOT_MARKER, self.boot_timeout)
+        elapsed = time.monotonic() - started
 
-        # Check for boot completion in output
-        if self.game_process.poll() is None:
-            self.log("  → Game still running after boot", "PASS")
+        for line in self.output.find(ERROR_MARKER):
+            self.log(f"  → {line}", "WARN")
+
+        if marker and self.game_process.poll() is None:
+            self.log(f"  → Boot complete after {elapsed:.1f}s: {marker.strip()}", "PASS")
             self.test_results.append(("Boot Sequence", True))
             return True
+
+        if self.game_process.poll() is not None:
+            self.log(f"  → Game exited during boot (code {self.game_process.returncode})", "FAIL")
         else:
-            self.log("  → Game crashed during boot", "FAIL")
-            self.test_results.append(("Boot Sequence", False))
-            return False
+            self.log(f"  → No boot marker within {self.boot_timeout:.0f}s", "FAIL")
+        for line in self.output.tail(10):
+            self.log(f"    │ {line}", "INFO")
+        self.test_results.append(("Boot Sequence", False))
+        return False
 
     def test_overlay_registration(self):
         """Test 2: Verify all overlays are registered"""
@@ -102,15 +250,29 @@ class InteractiveTestRunner:
         overlays = ["inspector", "controls", "semantic_map", "quests", "biome_detail"]
         all_registered = True
 
+        # Headless boots skip the UI, so no overlay is created at runtime;
+        # fall back to checking that OverlayManager registers each one.
+        # Windowed runs (--windowed) wait for the registration log lines.
+        headless = self.headless or bool(self.output.find(HEADLESS_MARKER))
+        manager_source = ""
+        if headless:
+            self.log("  → Headless run: UI not built, checking registration in OverlayManager.gd", "INFO")
+            manager_path = self.project_dir / "UI" / "Managers" / "OverlayManager.gd"
+            manager_source = manager_path.read_text(encoding="utf-8") if manager_path.exists() else ""
+
         for overlay in overlays:
             self.log(f"  → Checking {overlay} overlay...", "INFO")
-            # In a real test with output capture, we'd check the game's output
-            # For now, we just verify the files exist
-
-            overlay_file = Path(self.project_dir) / "UI" / "Overlays" / f"{overlay.replace('_', '')}Overlay.gd".title().replace("_", "")
-
-            # Simplified check - just verify structure
-            self.log(f"    └─ {overlay} coded", "PASS")
+            if headless:
+                registered = f'register_v2_overlay("{overlay}"' in manager_source
+            else:
+                marker = OVERLAY_MARKER.format(name=overlay)
+                registered = self.output.wait_for(re.compile(re.escape(marker) + r"$"), self.marker_timeout) is not None
+
+            if registered:
+                self.log(f"    └─ {overlay} registered", "PASS")
+            else:
+                self.log(f"    └─ {overlay} not registered", "FAIL")
+                all_registered = False
 
         self.test_results.append(("Overlay Registration", all_registered))
         return all_registered
@@ -180,11 +342,13 @@ class InteractiveTestRunner:
         self.start_time = datetime.now()
 
         # Create log file
-        log_filename = f"phase6_interactive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        self.log_file = Path(self.project_dir) / "llm_outbox" / log_filename
+        if self.log_file is None:
+            log_filename = f"phase6_interactive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+            self.log_file = self.project_dir / "llm_outbox" / log_filename
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
         print("\n" + "="*100)
-        print("🎮 PHASE 6 INTERACTIVE TEST SUITE")
+        print("🎮 PHASE 6 INTERACTIVE TEST SUITE" + (f" (godot stub: {self.fake})" if self.fake else ""))
         print("="*100)
         print(f"Start time: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Log file: {self.log_file}")
@@ -195,29 +359,17 @@ class InteractiveTestRunner:
             if not self.start_game():
                 return False
 
-            # Wait for full boot
-            time.sleep(10)
-
-            # Run tests
-            self.test_boot_sequence()
-            time.sleep(1)
-
-            self.test_overlay_registration()
-            time.sleep(1)
-
-            self.test_tool_selection()
-            time.sleep(1)
-
-            self.test_input_routing()
-            time.sleep(1)
-
-            self.test_data_binding()
-            time.sleep(1)
+            # Run tests (boot waits on the game's own ready marker)
+            if self.test_boot_sequence():
+                self.test_overlay_registration()
+                self.test_tool_selection()
+                self.test_input_routing()
+                self.test_data_binding()
 
             # Print results
             self._print_results()
 
-            return True
+            return all(result for _, result in self.test_results)
 
         except KeyboardInterrupt:
             self.log("Test interrupted by user", "WARN")
@@ -262,7 +414,18 @@ class InteractiveTestRunner:
 
 def main():
     """Main entry point"""
-    runner = InteractiveTestRunner()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--boot-timeout", type=float, default=60.0, help="Seconds to wait for the GAME READY marker")
+    parser.add_argument("--marker-timeout", type=float, default=5.0, help="Seconds to wait for each later marker")
+    parser.add_argument("--godot", help="Godot binary (default: $GODOT_BIN or godot)")
+    parser.add_argument("--fake", nargs="?", const="ok", choices=("ok", "crash", "slow"),
+                        help="Run against tests/godot_stub.py instead of Godot")
+    parser.add_argument("--windowed", action="store_true",
+                        help="Run the game with a window so the UI is built and overlays log their registration")
+    args = parser.parse_args()
+
+    runner = InteractiveTestRunner(args.boot_timeout, args.marker_timeout, args.fake, args.godot,
+                                   headless=not args.windowed)
 
     try:
         success = runner.run_all_tests()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+
+"""
+Sharded Test Runner - the interactive suite across several headless games
+
+Launches N `godot --headless` instances, each with its own user data
+dir (saves, settings and logs cannot collide), boots them in parallel,
+and spreads the InteractiveTestRunner test methods over them with a
+work-stealing queue: each shard starts with a round-robin share and,
+when it runs dry, takes the last queued test of the busiest shard. A
+shard whose game fails to boot hands its whole share to the others.
+
+N is the CPU count, capped by available memory divided by the peak RSS
+measured for one instance on earlier runs (.cache/test_shards.json), and
+by the number of tests. Results and logs are merged into one directory.
+
+Usage:
+    python tests/sharded_test_runner.py [--jobs N] [--godot /path/to/godot]
+    python tests/sharded_test_runner.py --fake            # tests/godot_stub.py instances
+    python tests/sharded_test_runner.py -k overlay        # only tests whose name matches
+"""
+
+import argparse
+import collections
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from interactive_test_runner import GODOT_STUB, PROJECT_DIR, InteractiveTestRunner
+
+CACHE_PATH = PROJECT_DIR / ".cache" / "test_shards.json"
+
+# Assumed peak RSS of one game instance before any run has measured it
+DEFAULT_INSTANCE_RSS = 1024 * 1024 * 1024
+# Share of available memory the shards may use together
+MEMORY_HEADROOM = 0.75
+
+BOOT_TEST = "test_boot_sequence"
+
+
+def suite_tests(pattern=None):
+    """Test methods to distribute (boot runs on every shard, not as a work item)."""
+    names = [name for name in vars(InteractiveTestRunner)
+             if name.startswith("test_") and name != BOOT_TEST]
+    return [name for name in names if not pattern or pattern.lower() in name.lower()]
+
+
+# ---------------------------------------------------------------------------
+# Shard count
+# ---------------------------------------------------------------------------
+
+def read_proc_kib(path, field):
+    """A "Field:  123 kB" value from a /proc file, in bytes (None if unavailable)."""
+    try:
+        with open(path, encoding="ascii") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def available_memory():
+    available = read_proc_kib("/proc/meminfo", "MemAvailable")
+    if available is None:
+        try:
+            available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (ValueError, OSError, AttributeError):
+            return None
+    return available
+
+
+def peak_rss(pid):
+    """Peak resident set size of a running process (Linux), else None."""
+    return read_proc_kib(f"/proc/{pid}/status", "VmHWM")
+
+
+def load_instance_rss(godot_bin):
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f).get("rss", {}).get(Path(godot_bin).name)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def save_instance_rss(godot_bin, rss):
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cache.setdefault("rss", {})[Path(godot_bin).name] = rss
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_PATH.with_name(f".{CACHE_PATH.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, CACHE_PATH)
+
+
+def plan_shards(test_count, instance_rss=None, jobs=None):
+    """(shard count, reason): CPUs, capped by memory per instance and by test count."""
+    if jobs:
+        return max(1, min(jobs, test_count)), "--jobs"
+    cpus = os.cpu_count() or 1
+    count, reason = cpus, f"{cpus} CPUs"
+    available = available_memory()
+    rss = instance_rss or DEFAULT_INSTANCE_RSS
+    if available:
+        by_memory = max(1, int(available * MEMORY_HEADROOM // rss))
+        if by_memory < count:
+            count, reason = by_memory, (f"{available / 2**30:.1f} GiB available / "
+                                        f"{rss / 2**20:.0f} MiB per instance")
+    if test_count < count:
+        count, reason = max(1, test_count), f"{test_count} tests"
+    return count, reason
+
+
+# ---------------------------------------------------------------------------
+# Work-stealing queue
+# ---------------------------------------------------------------------------
+
+class WorkStealingQueue:
+    """Per-shard deques; a shard takes from its own front, else steals from the busiest back."""
+
+    def __init__(self, items, shards):
+        self._deques = [collections.deque() for _ in range(shards)]
+        for i, item in enumerate(items):
+            self._deques[i % shards].append(item)
+        self._lock = threading.Lock()
+        self.steals = 0
+
+    def take(self, shard):
+        with self._lock:
+            own = self._deques[shard]
+            if own:
+                return own.popleft()
+            victim = max(self._deques, key=len)
+            if victim:
+                self.steals += 1
+                return victim.pop()
+            return None
+
+    def drain(self):
+        """Everything still queued (for reporting tests no shard could run)."""
+        with self._lock:
+            items = [item for d in self._deques for item in d]
+            for d in self._deques:
+                d.clear()
+            return items
+
+
+# ---------------------------------------------------------------------------
+# Shards
+# ---------------------------------------------------------------------------
+
+def shard_env(user_dir, index):
+    """Environment giving the game its own user:// and settings location."""
+    env = dict(os.environ)
+    env["SPACEWHEAT_TEST_SHARD"] = str(index)
+    if sys.platform == "win32":
+        env["APPDATA"] = env["LOCALAPPDATA"] = str(user_dir)
+    elif sys.platform == "darwin":
+        env["HOME"] = str(user_dir)
+    else:
+        for var, sub in (("XDG_DATA_HOME", "data"), ("XDG_CONFIG_HOME", "config"), ("XDG_CACHE_HOME", "cache")):
+            env[var] = str(user_dir / sub)
+    return env
+
+
+class ShardRunner(InteractiveTestRunner):
+    """One game instance; console lines carry the shard number."""
+
+    def __init__(self, index, print_lock, **kwargs):
+        super().__init__(**kwargs)
+        self.index = index
+        self._print_lock = print_lock
+
+    def log(self, message, level="INFO"):
+        with self._print_lock:
+            super().log(f"[shard {self.index}] {message}", level)
+
+
+class Shard(threading.Thread):
+    def __init__(self, index, queue, runner):
+        super().__init__(name=f"shard-{index}", daemon=True)
+        self.index = index
+        self.queue = queue
+        self.runner = runner
+        self.booted = False
+        self.boot_seconds = None
+        self.rss = None
+        self.results = []  # dicts: test, name, shard, passed, seconds
+
+    def run(self):
+        runner = self.runner
+        started = time.monotonic()
+        try:
+            if not runner.start_game():
+                return
+            self.booted = runner.test_boot_sequence()
+            self.boot_seconds = time.monotonic() - started
+            if not self.booted:
+                return  # Our share is stolen by the healthy shards
+            while True:
+                test = self.queue.take(self.index)
+                if test is None:
+                    break
+                began = time.monotonic()
+                try:
+                    passed = bool(getattr(runner, test)())
+                except Exception as e:
+                    runner.log(f"{test} raised {type(e).__name__}: {e}", "FAIL")
+                    passed = False
+                name = runner.test_results[-1][0] if runner.test_results else test
+                self.results.append({"test": test, "name": name, "shard": self.index,
+                                     "passed": passed, "seconds": round(time.monotonic() - began, 3)})
+        finally:
+            if runner.game_process and runner.game_process.poll() is None:
+                self.rss = peak_rss(runner.game_process.pid)
+            runner.stop_game()
+
+
+class ShardedTestRunner:
+    def __init__(self, jobs=None, godot_bin=None, fake=None, boot_timeout=60.0, marker_timeout=5.0,
+                 pattern=None, keep_user_data=False):
+        self.godot_bin = str(GODOT_STUB) if fake else (godot_bin or os.environ.get("GODOT_BIN", "godot"))
+        self.fake = fake
+        self.jobs = jobs
+        self.boot_timeout = boot_timeout
+        self.marker_timeout = marker_timeout
+        self.tests = suite_tests(pattern)
+        self.keep_user_data = keep_user_data
+        self.out_dir = None  # Created per run
+
+    def run(self):
+        start = time.monotonic()
+        instance_rss = load_instance_rss(self.godot_bin)
+        count, reason = plan_shards(len(self.tests), instance_rss, self.jobs)
+
+        print("\n" + "="*100)
+        print(f"🎮 PHASE 6 SHARDED TEST SUITE - {count} shard(s) ({reason}), {len(self.tests)} test(s)")
+        print("="*100)
+        # The timestamp only has one-second resolution; mkdtemp keeps two runs
+        # started in the same second from appending to each other's logs
+        outbox = PROJECT_DIR / "llm_outbox"
+        outbox.mkdir(parents=True, exist_ok=True)
+        self.out_dir = Path(tempfile.mkdtemp(
+            prefix=f"phase6_sharded_{datetime.now().strftime('%Y%m%d_%H%M%S')}_", dir=outbox))
+        print(f"Godot: {self.godot_bin}")
+        print(f"Logs: {self.out_dir}\n")
+
+        user_root = Path(tempfile.mkdtemp(prefix="spacewheat-shards-"))
+        queue = WorkStealingQueue(self.tests, count)
+        print_lock = threading.Lock()
+        shards = []
+        for index in range(count):
+            user_dir = user_root / f"shard{index}"
+            user_dir.mkdir()
+            runner = ShardRunner(index, print_lock, boot_timeout=self.boot_timeout,
+                                 marker_timeout=self.marker_timeout, fake=self.fake, godot_bin=self.godot_bin,
+                                 env=shard_env(user_dir, index), log_file=self.out_dir / f"shard{index}.log")
+            runner.start_time = datetime.now()
+            shards.append(Shard(index, queue, runner))
+
+        try:
+            for shard in shards:
+                shard.start()
+            for shard in shards:
+                shard.join()
+        except KeyboardInterrupt:
+            print("\n\nTest interrupted by user")
+            for shard in shards:
+                if shard.runner.game_process and shard.runner.game_process.poll() is None:
+                    shard.runner.game_process.kill()
+            return False
+        finally:
+            if not self.keep_user_data:
+                shutil.rmtree(user_root, ignore_errors=True)
+
+        measured = [s.rss for s in shards if s.rss]
+        if measured:
+            save_instance_rss(self.godot_bin, max(measured))
+
+        results = [r for s in shards for r in s.results]
+        results += [{"test": t, "name": t, "shard": None, "passed": False, "seconds": 0.0,
+                     "error": "no shard booted to run it"} for t in queue.drain()]
+        order = {name: i for i, name in enumerate(self.tests)}
+        results.sort(key=lambda r: order.get(r["test"], len(order)))
+
+        summary = {
+            "shards": count,
+            "reason": reason,
+            "godot": self.godot_bin,
+            "wall_seconds": round(time.monotonic() - start, 3),
+            "steals": queue.steals,
+            "instances": [{"shard": s.index, "booted": s.booted,
+                           "boot_seconds": round(s.boot_seconds, 3) if s.boot_seconds is not None else None,
+                           "peak_rss": s.rss, "tests": len(s.results)} for s in shards],
+            "results": results,
+        }
+        self._merge_logs(shards)
+        (self.out_dir / "results.json").write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n",
+                                                   encoding="utf-8")
+        self._print_results(summary)
+        return all(s.booted for s in shards) and all(r["passed"] for r in results)
+
+    def _merge_logs(self, shards):
+        """One runner log with every shard's section, plus the game logs side by side."""
+        with open(self.out_dir / "merged.log", "w", encoding="utf-8") as merged:
+            for shard in shards:
+                log_file = shard.runner.log_file
+                merged.write(f"===== shard {shard.index} =====\n")
+                if log_file and log_file.exists():
+                    merged.write(log_file.read_text(encoding="utf-8"))
+                merged.write("\n")
+
+    def _print_results(self, summary):
+        results = summary["results"]
+        passed = sum(1 for r in results if r["passed"])
+        booted = sum(1 for s in summary["instances"] if s["booted"])
+
+        print("\n" + "="*100)
+        print("📊 SHARDED TEST RESULTS SUMMARY")
+        print("="*100)
+        print(f"\nShards booted: {booted}/{summary['shards']}")
+        for instance in summary["instances"]:
+            rss = f"{instance['peak_rss'] / 2**20:.0f} MiB" if instance["peak_rss"] else "n/a"
+            boot = f"{instance['boot_seconds']:.1f}s" if instance["boot_seconds"] is not None else "n/a"
+            status = "✅" if instance["booted"] else "❌"
+            print(f"  {status} shard {instance['shard']}: boot {boot}, peak RSS {rss}, {instance['tests']} test(s)")
+
+        print(f"\nTotal Tests: {len(results)}")
+        print(f"Passed: {passed} ✅")
+        print(f"Failed: {len(results) - passed} ❌")
+        print("\nDetailed Results:")
+        for r in results:
+            status = "✅ PASS" if r["passed"] else "❌ FAIL"
+            where = f"shard {r['shard']}" if r["shard"] is not None else r.get("error", "not run")
+            print(f"  {status} - {r['name']} ({where}, {r['seconds']:.2f}s)")
+
+        print(f"\nWork steals: {summary['steals']}")
+        print(f"Duration: {summary['wall_seconds']:.1f}s")
+        print(f"Results: {self.out_dir / 'results.json'}")
+        print("="*100)
+        if booted == summary["shards"] and passed == len(results):
+            print("🎉 ALL TESTS PASSED!")
+        else:
+            print("⚠️  Some shards or tests need attention")
+        print()
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-j", "--jobs", type=int, help="Shard count (default: from CPUs and memory)")
+    parser.add_argument("--godot", help="Godot binary (default: $GODOT_BIN or godot)")
+    parser.add_argument("--fake", nargs="?", const="ok", choices=("ok", "crash", "slow"),
+                        help="Run tests/godot_stub.py instances instead of Godot")
+    parser.add_argument("--boot-timeout", type=float, default=60.0)
+    parser.add_argument("--marker-timeout", type=float, default=5.0)
+    parser.add_argument("-k", dest="pattern", help="Only run tests whose name contains this")
+    parser.add_argument("--keep-user-data", action="store_true", help="Keep the per-shard user data dirs")
+    args = parser.parse_args()
+
+    runner = ShardedTestRunner(args.jobs, args.godot, args.fake, args.boot_timeout, args.marker_timeout,
+                               args.pattern, args.keep_user_data)
+    if not runner.tests:
+        print("❌ No tests match")
+        sys.exit(1)
+    sys.exit(0 if runner.run() else 1)
+
+
+if __name__ == "__main__":
+    main()
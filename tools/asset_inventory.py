@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""Header-only asset inventory with texture/audio memory budgets.
+
+Reads only file headers, never decodes an image or a song:
+
+  - PNG:  IHDR (width, height, bit depth, color type) plus the Godot
+          .import sidecar (compress/mode, mipmaps, size_limit) to estimate
+          the decoded texture size in VRAM
+  - MP3:  first frame header after any ID3v2 tag, plus the Xing/Info/VBRI
+          frame count when present, for duration and bitrate
+
+The tree is scanned with a thread pool and results are cached in
+.cache/asset_inventory.json by (mtime, size) of the asset and its
+sidecar, so repeat runs only stat files.
+
+The report lists the estimated texture memory of every biome
+image_path and the audio footprint of every music_path (Godot keeps
+AudioStreamMP3 data compressed in memory; the decoded PCM size is shown
+for reference). Budgets are checked per asset and in total over the
+distinct referenced assets; any violation exits 1, so the script can
+gate CI.
+
+Usage:
+    python tools/asset_inventory.py [--texture-budget-mb 8] [--texture-total-mb 96]
+        [--audio-budget-mb 8] [--audio-total-mb 64] [--json PATH] [--jobs 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from data_snapshot import BIOMES_MERGED, load_snapshot
+from json_splice import write_text_atomic
+
+
+ROOT = Path(__file__).resolve().parents[1]
+ASSETS_DIR = ROOT / "Assets"
+CACHE_PATH = ROOT / ".cache" / "asset_inventory.json"
+
+# Bump when the cached entry layout changes
+INVENTORY_FORMAT = 1
+
+MIB = 1024 * 1024
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Color type -> channels
+PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+# Godot compress/mode: 0 lossless, 1 lossy (both decode to RGB(A)8 in VRAM),
+# 2 VRAM compressed, 3 VRAM uncompressed, 4 Basis Universal
+VRAM_COMPRESSED_MODES = {2, 4}
+
+# How far past the ID3v2 tag to look for the first frame
+MP3_SCAN_BYTES = 16 * 1024
+
+# kbps by [MPEG1?][layer]; index 0 ("free") and 15 (bad) are invalid
+_MP3_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# version bits -> sample rates
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+# ---------------------------------------------------------------------------
+# Header readers
+# ---------------------------------------------------------------------------
+
+def read_import_params(path: Path) -> Dict[str, str]:
+    """[params] of a Godot .import sidecar (empty if there is none)."""
+    params: Dict[str, str] = {}
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return params
+    in_params = False
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("["):
+            in_params = line == "[params]"
+        elif in_params and "=" in line:
+            key, value = line.split("=", 1)
+            params[key] = value
+    return params
+
+
+def png_info(path: Path) -> Dict[str, Any]:
+    with path.open("rb") as f:
+        head = f.read(33)
+    if len(head) < 33 or head[:8] != PNG_SIGNATURE or head[12:16] != b"IHDR":
+        return {"kind": "png", "error": "not a PNG (no IHDR)"}
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", head[16:26])
+    return {
+        "kind": "png",
+        "width": width,
+        "height": height,
+        "bit_depth": bit_depth,
+        "channels": PNG_CHANNELS.get(color_type, 4),
+    }
+
+
+def texture_bytes(info: Dict[str, Any], params: Dict[str, str]) -> int:
+    """Estimated VRAM size of an imported texture."""
+    width, height = info["width"], info["height"]
+    limit = int(params.get("process/size_limit", "0") or 0)
+    if limit and max(width, height) > limit:
+        scale = limit / max(width, height)
+        width, height = max(1, int(width * scale)), max(1, int(height * scale))
+    mode = int(params.get("compress/mode", "0") or 0)
+    if mode in VRAM_COMPRESSED_MODES:
+        # BPTC/ASTC 4x4/DXT5: 1 byte per pixel; DXT1 when opaque: 0.5
+        per_pixel = 1.0 if info["channels"] in (2, 4) else 0.5
+    else:
+        # RGB8 is padded to RGBA8 on upload by most drivers; 16-bit PNGs are imported as 8-bit
+        per_pixel = 4.0 if info["channels"] >= 3 else float(info["channels"])
+    size = width * height * per_pixel
+    if params.get("mipmaps/generate") == "true":
+        size *= 4 / 3
+    return int(size)
+
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _mp3_frame(buf: bytes, i: int) -> Optional[Dict[str, Any]]:
+    b1, b2, b3 = buf[i + 1], buf[i + 2], buf[i + 3]
+    if buf[i] != 0xFF or b1 & 0xE0 != 0xE0:
+        return None
+    version = (b1 >> 3) & 3
+    layer = 4 - ((b1 >> 1) & 3)
+    bitrate_index, rate_index = b2 >> 4, (b2 >> 2) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 1
+    if layer == 1:
+        samples, length = 384, (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if (layer == 2 or mpeg1) else 576
+        length = samples // 8 * bitrate // sample_rate + padding
+    return {
+        "mpeg1": mpeg1,
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "channels": 1 if b3 >> 6 == 3 else 2,
+        "samples_per_frame": samples,
+        "length": length,
+    }
+
+
+def _vbr_frames(buf: bytes, i: int, frame: Dict[str, Any]) -> Optional[int]:
+    """Frame count from a Xing/Info or VBRI header in the first frame."""
+    side_info = (32 if frame["channels"] == 2 else 17) if frame["mpeg1"] else (17 if frame["channels"] == 2 else 9)
+    xing = i + 4 + side_info
+    if buf[xing:xing + 4] in (b"Xing", b"Info") and len(buf) >= xing + 12:
+        flags = struct.unpack(">I", buf[xing + 4:xing + 8])[0]
+        if flags & 1:
+            return struct.unpack(">I", buf[xing + 8:xing + 12])[0]
+    vbri = i + 4 + 32
+    if buf[vbri:vbri + 4] == b"VBRI" and len(buf) >= vbri + 18:
+        return struct.unpack(">I", buf[vbri + 14:vbri + 18])[0]
+    return None
+
+
+def mp3_info(path: Path, size: int) -> Dict[str, Any]:
+    with path.open("rb") as f:
+        head = f.read(10)
+        offset = 0
+        if head[:3] == b"ID3" and len(head) == 10:
+            offset = 10 + _syncsafe(head[6:10]) + (10 if head[5] & 0x10 else 0)
+        f.seek(offset)
+        buf = f.read(MP3_SCAN_BYTES)
+
+    for i in range(len(buf) - 3):
+        frame = _mp3_frame(buf, i)
+        if frame is None:
+            continue
+        # Require the next frame to line up, unless it lies past the scan window
+        following = i + frame["length"]
+        if following + 4 <= len(buf) and _mp3_frame(buf, following) is None:
+            continue
+        frames = _vbr_frames(buf, i, frame)
+        audio_bytes = size - offset - i
+        if frames:
+            duration = frames * frame["samples_per_frame"] / frame["sample_rate"]
+            bitrate = int(audio_bytes * 8 / duration) if duration else frame["bitrate"]
+        else:
+            duration = audio_bytes * 8 / frame["bitrate"]
+            bitrate = frame["bitrate"]
+        return {
+            "kind": "mp3",
+            "duration": round(duration, 3),
+            "bitrate": bitrate,
+            "sample_rate": frame["sample_rate"],
+            "channels": frame["channels"],
+            "vbr": frames is not None,
+        }
+    return {"kind": "mp3", "error": "no MPEG audio frame found"}
+
+
+def read_asset(path: Path, size: int) -> Dict[str, Any]:
+    suffix = path.suffix.lower()
+    try:
+        if suffix == ".png":
+            info = png_info(path)
+            if "error" not in info:
+                info["texture_bytes"] = texture_bytes(info, read_import_params(path.with_name(path.name + ".import")))
+            return info
+        if suffix == ".mp3":
+            info = mp3_info(path, size)
+            if "error" not in info:
+                # AudioStreamMP3 keeps the compressed data; PCM is for reference
+                info["memory_bytes"] = size
+                info["pcm_bytes"] = int(info["duration"] * info["sample_rate"] * info["channels"] * 2)
+            return info
+    except OSError as e:
+        return {"kind": suffix.lstrip("."), "error": str(e)}
+    return {"kind": suffix.lstrip(".") or "other"}
+
+
+# ---------------------------------------------------------------------------
+# Inventory
+# ---------------------------------------------------------------------------
+
+def _stat_key(path: Path) -> Optional[List[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = [st.st_mtime_ns, st.st_size]
+    sidecar = path.with_name(path.name + ".import")
+    try:
+        key.append(sidecar.stat().st_mtime_ns)
+    except OSError:
+        key.append(0)
+    return key
+
+
+class AssetInventory:
+    """rel path -> header info for every file under a directory.
+
+    Keys are relative to the project root, as res:// paths are, so the
+    scanned directory must be inside the project.
+    """
+
+    def __init__(self, root: Path = ASSETS_DIR, cache_path: Path = CACHE_PATH):
+        root = Path(root).resolve()
+        if not root.is_relative_to(ROOT):
+            raise ValueError(f"{root} is outside the project ({ROOT}); res:// paths cannot resolve into it")
+        self.root = root
+        self.cache_path = cache_path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.read = 0
+
+    def _load_cache(self) -> Dict[str, Any]:
+        try:
+            with self.cache_path.open("r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("format") == INVENTORY_FORMAT:
+                return cache["entries"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def scan(self, jobs: int = 8) -> "AssetInventory":
+        cached = self._load_cache()
+        paths = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if not filename.endswith(".import"):
+                    paths.append(Path(dirpath) / filename)
+
+        def visit(path: Path) -> Tuple[str, Optional[Dict[str, Any]], bool]:
+            rel = path.relative_to(ROOT).as_posix()
+            key = _stat_key(path)
+            if key is None:
+                return rel, None, False
+            entry = cached.get(rel)
+            if entry and entry["key"] == key:
+                return rel, entry, False
+            return rel, {"key": key, "size": key[1], **read_asset(path, key[1])}, True
+
+        with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+            for rel, entry, fresh in pool.map(visit, paths):
+                if entry is not None:
+                    self.entries[rel] = entry
+                    self.read += fresh
+
+        if self.entries != cached:
+            cache = {"format": INVENTORY_FORMAT, "entries": self.entries}
+            write_text_atomic(self.cache_path, json.dumps(cache, ensure_ascii=False, sort_keys=True))
+        return self
+
+    def get(self, res_path: str) -> Optional[Dict[str, Any]]:
+        rel = res_path[len("res://"):] if res_path.startswith("res://") else res_path
+        return self.entries.get(rel)
+
+    def totals(self) -> Dict[str, List[int]]:
+        """kind -> [files, bytes on disk]."""
+        totals: Dict[str, List[int]] = {}
+        for entry in self.entries.values():
+            stats = totals.setdefault(entry["kind"], [0, 0])
+            stats[0] += 1
+            stats[1] += entry["size"]
+        return totals
+
+
+def _mb(value: float) -> str:
+    return f"{value / MIB:.1f} MB"
+
+
+def _duration(seconds: float) -> str:
+    return f"{int(seconds // 60)}:{int(seconds % 60):02d}"
+
+
+def biome_report(inventory: AssetInventory, biomes, budgets: Dict[str, float]) -> Tuple[List[str], Dict[str, Any]]:
+    lines: List[str] = []
+    violations: List[str] = []
+    missing: List[str] = []
+    rows: List[Dict[str, Any]] = []
+    textures: Dict[str, int] = {}
+    audio: Dict[str, int] = {}
+
+    for biome in biomes:
+        name = biome.get("name", "<unnamed>")
+        row: Dict[str, Any] = {"name": name}
+        for field in ("image_path", "music_path"):
+            path = biome.get(field) or ""
+            if not path:
+                continue
+            entry = inventory.get(path)
+            row[field] = path
+            if entry is None:
+                missing.append(f"{name}: {field} {path}")
+                continue
+            if "error" in entry:
+                violations.append(f"{name}: {path}: {entry['error']}")
+                continue
+            if field == "image_path":
+                row["texture_bytes"] = textures[path] = entry.get("texture_bytes", 0)
+                row["dimensions"] = f"{entry.get('width')}x{entry.get('height')}"
+                if row["texture_bytes"] > budgets["texture"]:
+                    violations.append(
+                        f"{name}: {path} needs ~{_mb(row['texture_bytes'])} of texture memory "
+                        f"(budget {_mb(budgets['texture'])})"
+                    )
+            else:
+                row["audio_bytes"] = audio[path] = entry.get("memory_bytes", 0)
+                row["duration"] = entry.get("duration", 0.0)
+                row["bitrate"] = entry.get("bitrate", 0)
+                if row["audio_bytes"] > budgets["audio"]:
+                    violations.append(
+                        f"{name}: {path} keeps {_mb(row['audio_bytes'])} of audio in memory "
+                        f"(budget {_mb(budgets['audio'])})"
+                    )
+        rows.append(row)
+
+    texture_total = sum(textures.values())
+    audio_total = sum(audio.values())
+    if texture_total > budgets["texture_total"]:
+        violations.append(
+            f"biome textures total ~{_mb(texture_total)} (budget {_mb(budgets['texture_total'])})"
+        )
+    if audio_total > budgets["audio_total"]:
+        violations.append(f"biome music total {_mb(audio_total)} (budget {_mb(budgets['audio_total'])})")
+
+    lines.append(f"{'biome':<24} {'image':>10} {'texture':>10}  {'music':>6} {'kbps':>5} {'memory':>9}")
+    for row in rows:
+        if "texture_bytes" not in row and "audio_bytes" not in row:
+            continue
+        texture = _mb(row["texture_bytes"]) if "texture_bytes" in row else "-"
+        music = _duration(row["duration"]) if "audio_bytes" in row else "-"
+        kbps = str(row["bitrate"] // 1000) if "audio_bytes" in row else "-"
+        memory = _mb(row["audio_bytes"]) if "audio_bytes" in row else "-"
+        lines.append(
+            f"{row['name'][:24]:<24} {row.get('dimensions', '-'):>10} {texture:>10}  {music:>6} {kbps:>5} {memory:>9}"
+        )
+    lines.append("")
+    lines.append(f"Referenced textures: {len(textures)} distinct, ~{_mb(texture_total)} decoded")
+    lines.append(f"Referenced music:    {len(audio)} distinct, {_mb(audio_total)} in memory")
+    if missing:
+        lines.append(f"Missing referenced files: {len(missing)} (see check_biome_images.py)")
+
+    report = {
+        "biomes": rows,
+        "texture_total_bytes": texture_total,
+        "audio_total_bytes": audio_total,
+        "missing": missing,
+        "violations": violations,
+        "budgets": budgets,
+    }
+    return lines, report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets-dir", type=Path, default=ASSETS_DIR)
+    parser.add_argument("--biomes", type=Path, default=BIOMES_MERGED)
+    parser.add_argument("--texture-budget-mb", type=float, default=8.0, help="Per biome image (decoded)")
+    parser.add_argument("--texture-total-mb", type=float, default=96.0, help="All distinct biome images")
+    parser.add_argument("--audio-budget-mb", type=float, default=8.0, help="Per music track (in memory)")
+    parser.add_argument("--audio-total-mb", type=float, default=64.0, help="All distinct music tracks")
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    try:
+        inventory = AssetInventory(args.assets_dir)
+    except ValueError as e:
+        parser.error(f"--assets-dir: {e}")
+    start = time.perf_counter()
+    inventory.scan(args.jobs)
+    scan_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Scanned {len(inventory.entries)} files in {scan_ms:.0f} ms ({inventory.read} headers read)")
+    for kind, (count, size) in sorted(inventory.totals().items(), key=lambda kv: -kv[1][1]):
+        print(f"  {kind:<8} {count:>5} files {_mb(size):>10}")
+    print()
+
+    budgets = {
+        "texture": args.texture_budget_mb * MIB,
+        "texture_total": args.texture_total_mb * MIB,
+        "audio": args.audio_budget_mb * MIB,
+        "audio_total": args.audio_total_mb * MIB,
+    }
+    lines, report = biome_report(inventory, load_snapshot(args.biomes).records, budgets)
+    print("\n".join(lines))
+
+    if args.json:
+        report["totals"] = inventory.totals()
+        write_text_atomic(args.json, json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+
+    if report["violations"]:
+        print(f"\nBudget violations ({len(report['violations'])}):")
+        for violation in report["violations"]:
+            print(f"  - {violation}")
+        return 1
+    print("\nAll referenced assets within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Trigram index for fuzzy asset-name matching.
+
+The biome audits look up every image reference against the asset list.
+difflib.get_close_matches() compares the query with every asset name, so
+a run costs O(biomes x assets) SequenceMatcher calls. This index is built
+once over the normalized asset stems (lowercase alphanumerics; emoji
+names keep their symbols):
+
+    index = TrigramIndex(asset_names)
+    index.exact("Starter_Forest.png")             # -> "Starter_Forest.png" (normalized key match)
+    index.search("StarterForrest", k=3)           # -> [(name, dice), ...] by trigram overlap
+    index.close_matches("Forest.png", n=3, cutoff=0.55)   # difflib-compatible
+
+Candidates come from the posting lists of the query's rarest trigrams
+only (prefix filtering): a name reaching Dice similarity s must share at
+least ceil(s*|Q|/(2-s)) of the |Q| query trigrams, so the |Q|-t+1 rarest
+lists are enough to find it. Common trigrams ("bio", "png") are never
+scanned. close_matches() re-scores a short trigram shortlist with
+difflib's ratio and applies the same cutoff get_close_matches() does.
+
+Usage:
+    python tools/asset_match.py QUERY [--assets-dir Assets/Biomes] [-k 5]
+    python tools/asset_match.py --bench 20000    # synthetic names vs difflib
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import math
+import random
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_ASSETS_DIR = ROOT / "Assets" / "Biomes"
+
+# Trigram similarity floor for the close_matches() shortlist, as a
+# fraction of the difflib cutoff (ratio and Dice are not on one scale)
+SHORTLIST_FLOOR = 0.5
+SHORTLIST_PER_MATCH = 8
+
+
+# Joiners/selectors that do not make an emoji name different
+_IGNORED_MARKS = {"\ufe0e", "\ufe0f", "\u200d"}
+
+
+def normalize_name(value: str) -> str:
+    """Index key of an asset name: stem, lowercase, alphanumerics (and emoji) only."""
+    stem = Path(value).stem if "." in value else value
+    return "".join(
+        ch for ch in stem.lower()
+        if ch.isalnum() or (ord(ch) > 0x2000 and ch not in _IGNORED_MARKS)
+    )
+
+
+def trigrams(key: str) -> Set[str]:
+    """Padded trigrams of a normalized key ("ab" -> {"  a", " ab", "ab "})."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Names indexed by the trigrams of their normalized keys."""
+
+    def __init__(self, names: Iterable[str], key: Callable[[str], str] = normalize_name):
+        self.key = key
+        self.names: List[str] = list(names)
+        self.grams: List[Set[str]] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        self.by_key: Dict[str, List[int]] = defaultdict(list)
+        for i, name in enumerate(self.names):
+            k = key(name)
+            grams = trigrams(k)
+            self.grams.append(grams)
+            self.by_key[k].append(i)
+            for gram in grams:
+                self.postings[gram].append(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def exact(self, query: str) -> Optional[str]:
+        """First name whose normalized key equals the query's."""
+        ids = self.by_key.get(self.key(query))
+        return self.names[ids[0]] if ids else None
+
+    def search(self, query: str, k: int = 5, min_similarity: float = 0.3) -> List[Tuple[str, float]]:
+        """Top-k names by trigram Dice similarity (>= min_similarity)."""
+        query_grams = trigrams(self.key(query))
+        size = len(query_grams)
+        s = max(min(min_similarity, 1.0), 1e-6)
+        min_overlap = max(1, math.ceil(s * size / (2 - s) - 1e-9))
+
+        # Prefix filter: any match shares a trigram among the rarest ones
+        ordered = sorted(query_grams, key=lambda g: len(self.postings.get(g, ())))
+        candidates: Set[int] = set()
+        for gram in ordered[:size - min_overlap + 1]:
+            candidates.update(self.postings.get(gram, ()))
+
+        scored: List[Tuple[float, str]] = []
+        for i in candidates:
+            grams = self.grams[i]
+            dice = 2.0 * len(query_grams & grams) / (size + len(grams))
+            if dice >= min_similarity:
+                scored.append((dice, self.names[i]))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(name, dice) for dice, name in scored[:k]]
+
+    def close_matches(self, query: str, n: int = 3, cutoff: float = 0.6) -> List[str]:
+        """difflib.get_close_matches() over a trigram shortlist."""
+        shortlist = self.search(query, k=n * SHORTLIST_PER_MATCH, min_similarity=cutoff * SHORTLIST_FLOOR)
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(query)
+        scored: List[Tuple[float, str]] = []
+        for name, _ in shortlist:
+            matcher.set_seq1(name)
+            if (
+                matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and matcher.ratio() >= cutoff
+            ):
+                scored.append((matcher.ratio(), name))
+        # Same ordering as get_close_matches: best score, then name, descending
+        scored.sort(reverse=True)
+        return [name for _, name in scored[:n]]
+
+
+def collect_asset_names(asset_dir: Path, suffixes: Tuple[str, ...] = (".png",)) -> List[str]:
+    """Asset file names in a directory (no .import sidecars)."""
+    names = []
+    for entry in Path(asset_dir).iterdir():
+        if entry.is_file() and entry.suffix.lower() in suffixes and ":" not in entry.name:
+            names.append(entry.name)
+    return sorted(names)
+
+
+def _synthetic_names(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    parts = ["Forest", "Quantum", "Market", "Kitchen", "Garden", "Tower", "Abyss", "Flux", "Starter",
+             "Mirror", "Chamber", "Anomaly", "Foundry", "Orbital", "Harbor", "Frost", "Ember", "Vault"]
+    names = set()
+    while len(names) < count:
+        words = rng.sample(parts, rng.randint(1, 3))
+        names.add("_".join(words) + (str(rng.randint(0, 99)) if rng.random() < 0.5 else "") + ".png")
+    return sorted(names)
+
+
+def _bench(count: int, queries: int, seed: int) -> None:
+    names = _synthetic_names(count, seed)
+    rng = random.Random(seed + 1)
+    probes = []
+    for name in rng.sample(names, min(queries, len(names))):
+        chars = list(name[:-4])
+        chars[rng.randrange(len(chars))] = rng.choice("aeiou")
+        probes.append("".join(chars) + ".png")
+
+    start = time.perf_counter()
+    index = TrigramIndex(names)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ours = [index.close_matches(q, n=3, cutoff=0.55) for q in probes]
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    theirs = [difflib.get_close_matches(q, names, n=3, cutoff=0.55) for q in probes]
+    linear = time.perf_counter() - start
+
+    same_top = sum(1 for a, b in zip(ours, theirs) if a[:1] == b[:1])
+    print(f"{len(names)} names, {len(probes)} queries")
+    print(f"  index build:        {build * 1000:8.1f} ms")
+    print(f"  trigram + rescore:  {indexed * 1000:8.1f} ms ({indexed / len(probes) * 1000:.2f} ms/query)")
+    print(f"  difflib full scan:  {linear * 1000:8.1f} ms ({linear / len(probes) * 1000:.2f} ms/query)")
+    print(f"  same best match:    {same_top}/{len(probes)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("query", nargs="?")
+    parser.add_argument("--assets-dir", type=Path, default=DEFAULT_ASSETS_DIR)
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--bench", type=int, metavar="N", help="Benchmark against difflib on N synthetic names")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.bench:
+        _bench(args.bench, args.queries, args.seed)
+        return 0
+    if not args.query:
+        parser.error("a query is required (or --bench N)")
+
+    index = TrigramIndex(collect_asset_names(args.assets_dir))
+    exact = index.exact(args.query)
+    if exact:
+        print(f"exact: {exact}")
+    for name, score in index.search(args.query, k=args.k):
+        print(f"{score:.2f}  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""Count lookups saved by the indexed FactionDatabaseV2 helpers.
+
+Replays call traces of the generated FactionDatabaseV2 helpers and
+counts element comparisons / hash probes for both implementations:
+
+  - linear:  the old scans over ALL_FACTIONS and `in` tests on Arrays
+  - indexed: the FACTION_INDEX_BY_NAME / FACTION_INDICES_BY_* consts and
+             Dictionary sets in get_vocabulary_overlap / get_faction_vocabulary
+
+Trace files are JSON Lines, one helper call per line; a {"session": ...}
+line starts a new game session:
+
+    {"session": "run-1"}
+    {"fn": "get_faction_by_name", "args": ["Millwright's Union"]}
+    {"fn": "get_factions_by_ring", "args": ["center"]}
+    {"fn": "get_faction_vocabulary", "args": ["Granary Guilds"]}
+    {"fn": "get_vocabulary_overlap", "args": [["🌾", "🍞"], ["🌾", "👥"]]}
+
+Without trace files, a synthetic session is generated that follows the
+game's call sites (GameStateManager accessibility checks, QuestTheming
+quest generation, QuestRewards faction lookup) as vocabulary grows.
+
+Usage:
+    python tools/bench_faction_lookups.py [traces.jsonl ...] [--quests 40] [--write-trace PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from data_snapshot import FACTIONS_MERGED, load_snapshot
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from convert_faction_lexicon_v2_1 import DEFAULT_AXIAL_SPINE, build_lookup_indexes  # noqa: E402
+
+
+STARTER_VOCAB = ["🌾", "👥"]
+
+Call = Dict[str, Any]
+
+
+class FactionTables:
+    """The data the generated helpers see (ALL_FACTIONS + index consts)."""
+
+    def __init__(self, factions):
+        self.factions = list(factions)
+        self.indexes = build_lookup_indexes(self.factions)
+        self.axes = DEFAULT_AXIAL_SPINE["axes"]
+
+    def faction(self, name: str) -> Dict:
+        index = self.indexes["FACTION_INDEX_BY_NAME"].get(name)
+        return self.factions[index] if index is not None else {}
+
+    def signature(self, faction: Dict) -> List[str]:
+        return list(faction.get("signature", faction.get("sig", [])))
+
+    def axial(self, faction: Dict) -> List[str]:
+        bits = faction.get("bits", [])
+        return [axis["1" if bit == 1 else "0"] for axis, bit in zip(self.axes, bits)]
+
+    def vocabulary(self, faction: Dict) -> Dict[str, List[str]]:
+        signature = self.signature(faction)
+        all_emojis = list(dict.fromkeys(signature + self.axial(faction)))
+        return {"signature": signature, "axial": self.axial(faction), "all": all_emojis}
+
+
+# ---------------------------------------------------------------------------
+# Cost models: comparisons for linear scans, probes for hashed lookups
+# ---------------------------------------------------------------------------
+
+def _scan_cost(haystack: List, needle) -> int:
+    """Comparisons an Array `in` test makes."""
+    try:
+        return haystack.index(needle) + 1
+    except ValueError:
+        return len(haystack)
+
+
+def linear_cost(tables: FactionTables, call: Call) -> int:
+    fn, args = call["fn"], call.get("args", [])
+    count = len(tables.factions)
+    if fn == "get_faction_by_name":
+        names = [f.get("name") for f in tables.factions]
+        return _scan_cost(names, args[0])
+    if fn in ("get_factions_by_ring", "get_factions_by_domain", "get_factions_with_emoji"):
+        return count
+    if fn == "get_faction_vocabulary":
+        faction = tables.faction(args[0])
+        all_emojis = tables.signature(faction)
+        cost = 0
+        for emoji in tables.axial(faction):
+            cost += _scan_cost(all_emojis, emoji)
+            if emoji not in all_emojis:
+                all_emojis.append(emoji)
+        return cost
+    if fn == "get_vocabulary_overlap":
+        vocab_a, vocab_b = args
+        result: List[str] = []
+        cost = 0
+        for emoji in vocab_a:
+            cost += _scan_cost(vocab_b, emoji)
+            if emoji in vocab_b:
+                cost += _scan_cost(result, emoji)
+                if emoji not in result:
+                    result.append(emoji)
+        return cost
+    raise ValueError(f"unknown helper in trace: {fn}")
+
+
+def indexed_cost(tables: FactionTables, call: Call) -> int:
+    fn, args = call["fn"], call.get("args", [])
+    if fn in ("get_faction_by_name", "get_factions_by_ring", "get_factions_by_domain", "get_factions_with_emoji"):
+        return 1
+    if fn == "get_faction_vocabulary":
+        faction = tables.faction(args[0])
+        return len(tables.signature(faction)) + len(tables.axial(faction))
+    if fn == "get_vocabulary_overlap":
+        vocab_a, vocab_b = args
+        return len(vocab_b) + len(vocab_a)
+    raise ValueError(f"unknown helper in trace: {fn}")
+
+
+# ---------------------------------------------------------------------------
+# Traces
+# ---------------------------------------------------------------------------
+
+def read_traces(paths: Iterable[Path]) -> Iterator[Tuple[str, Call]]:
+    """(session id, call) for every call in the trace files."""
+    for path in paths:
+        session = path.stem
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if "session" in record:
+                    session = str(record["session"])
+                elif "fn" in record:
+                    yield session, record
+
+
+def synthetic_session(tables: FactionTables, quests: int, seed: int = 0) -> List[Call]:
+    """Helper calls of one play session, following the game's call sites."""
+    rng = random.Random(seed)
+    vocab = list(STARTER_VOCAB)
+    calls: List[Call] = []
+
+    def accessible() -> List[Dict]:
+        # GameStateManager.get_accessible_factions
+        found = []
+        for faction in tables.factions:
+            vocabulary = tables.vocabulary(faction)
+            calls.append({"fn": "get_faction_vocabulary", "args": [faction["name"]]})
+            calls.append({"fn": "get_vocabulary_overlap", "args": [vocabulary["all"], list(vocab)]})
+            if set(vocabulary["all"]) & set(vocab):
+                found.append(faction)
+        return found
+
+    for _ in range(quests):
+        candidates = accessible()
+        if not candidates:
+            break
+        faction = rng.choice(candidates)
+        vocabulary = tables.vocabulary(faction)
+
+        # QuestTheming.generate_quest
+        calls.append({"fn": "get_faction_vocabulary", "args": [faction["name"]]})
+        calls.append({"fn": "get_vocabulary_overlap", "args": [vocabulary["signature"], list(vocab)]})
+
+        # QuestRewards: reward lookup, then newly accessible factions
+        calls.append({"fn": "get_faction_by_name", "args": [faction["name"]]})
+        unknown = [e for e in vocabulary["signature"] if e not in vocab]
+        old_vocab = list(vocab)
+        if unknown:
+            vocab.append(rng.choice(unknown))
+        for other in tables.factions:
+            other_vocab = tables.vocabulary(other)
+            calls.append({"fn": "get_faction_vocabulary", "args": [other["name"]]})
+            calls.append({"fn": "get_vocabulary_overlap", "args": [other_vocab["all"], old_vocab]})
+            calls.append({"fn": "get_vocabulary_overlap", "args": [other_vocab["all"], list(vocab)]})
+    return calls
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("traces", nargs="*", type=Path, help="JSONL call traces (default: synthetic session)")
+    parser.add_argument("--factions", type=Path, default=FACTIONS_MERGED)
+    parser.add_argument("--quests", type=int, default=40, help="Quests in the synthetic session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--write-trace", type=Path, help="Save the synthetic session as a trace file")
+    args = parser.parse_args()
+
+    tables = FactionTables(load_snapshot(args.factions).records)
+
+    if args.traces:
+        calls = list(read_traces(args.traces))
+    else:
+        session = synthetic_session(tables, args.quests, args.seed)
+        calls = [("synthetic", call) for call in session]
+        if args.write_trace:
+            with args.write_trace.open("w", encoding="utf-8") as f:
+                f.write(json.dumps({"session": "synthetic"}) + "\n")
+                for call in session:
+                    f.write(json.dumps(call, ensure_ascii=False) + "\n")
+            print(f"Wrote trace: {args.write_trace}")
+
+    per_fn: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])  # calls, linear, indexed
+    sessions = set()
+    for session, call in calls:
+        sessions.add(session)
+        stats = per_fn[call["fn"]]
+        stats[0] += 1
+        stats[1] += linear_cost(tables, call)
+        stats[2] += indexed_cost(tables, call)
+
+    if not calls:
+        print("No helper calls in the traces")
+        return 1
+
+    print(f"{len(calls)} helper calls over {len(sessions)} session(s), {len(tables.factions)} factions")
+    print(f"{'helper':<28} {'calls':>8} {'linear':>10} {'indexed':>10} {'saved':>10}")
+    total_linear = total_indexed = 0
+    for fn in sorted(per_fn):
+        count, linear, indexed = per_fn[fn]
+        total_linear += linear
+        total_indexed += indexed
+        print(f"{fn:<28} {count:>8} {linear:>10} {indexed:>10} {linear - indexed:>10}")
+    saved = total_linear - total_indexed
+    print(f"{'total':<28} {len(calls):>8} {total_linear:>10} {total_indexed:>10} {saved:>10}")
+    print(
+        f"Lookups saved per session: {saved / len(sessions):.0f} "
+        f"({100.0 * saved / max(total_linear, 1):.1f}% of linear)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
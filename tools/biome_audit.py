@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Audit engine for res:// references in the biome data files.
+
+Both check_biome_images.py front ends (Scripts/ fixes the data,
+scripts/ reports spelling and unused art) run on this engine:
+
+    audit = BiomeAudit()
+    for result in audit.scan(sorted(DEFAULT_DATA_DIR.glob("*.json"))):
+        for ref in result.refs:
+            ref.record, ref.field, ref.path, ref.status   # "ok" | "case" | "missing"
+
+One pass per data file collects every "res://" string (image_path,
+music_path and any other field, at any depth) together with the record
+name it belongs to. Files are read and parsed concurrently, and the
+extracted references are cached in .cache/biome_audit.json per file,
+validated by the file's content hash, so an unchanged file is never
+parsed again.
+
+References are resolved against an in-memory listing: each directory is
+listed once (Assets/ up front in a single walk), and a reference is a
+set lookup rather than a stat. Resolution always runs, so added or
+removed assets show up even when the data files are cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import posixpath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from asset_match import TrigramIndex
+from json_splice import write_text_atomic
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_DATA_DIR = ROOT / "Core" / "Biomes" / "data"
+ASSETS_DIR = ROOT / "Assets"
+CACHE_PATH = ROOT / ".cache" / "biome_audit.json"
+
+# Bump when the cached entry layout changes
+AUDIT_FORMAT = 1
+
+RES_PREFIX = "res://"
+
+RawRef = Tuple[str, str, str]  # (record name, field, res path)
+
+
+def extract_references(data: Any) -> List[RawRef]:
+    """Every res:// string in a data file, with its record name and field.
+
+    The record is the nearest enclosing object with a string "name" (or
+    the top-level key for object-rooted files); the field is the key the
+    string sits under.
+    """
+    refs: List[RawRef] = []
+
+    def walk(value: Any, record: str, field: str) -> None:
+        if isinstance(value, dict):
+            name = value.get("name")
+            if isinstance(name, str) and name:
+                record = name
+            for key, item in value.items():
+                walk(item, record, key)
+        elif isinstance(value, list):
+            for item in value:
+                walk(item, record, field)
+        elif isinstance(value, str) and value.startswith(RES_PREFIX):
+            refs.append((record, field, value))
+
+    if isinstance(data, dict):
+        for key, value in data.items():
+            walk(value, key, key)
+    else:
+        walk(data, "<root>", "")
+    return refs
+
+
+class AssetListing:
+    """Directory listings loaded once; file checks are set lookups."""
+
+    def __init__(self, root: Path = ROOT, preload: Iterable[Path] = (ASSETS_DIR,)):
+        self.root = root
+        self._dirs: Dict[str, Set[str]] = {}
+        self._lower: Dict[str, Dict[str, str]] = {}
+        self._indexes: Dict[str, TrigramIndex] = {}
+        self._lock = threading.Lock()
+        for directory in preload:
+            self._walk(directory)
+
+    def rel(self, path: Path) -> str:
+        """Directory key of a path: project-relative, or absolute outside the project."""
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def _walk(self, directory: Path) -> None:
+        if not directory.is_dir() or self.rel(directory) in self._dirs:
+            return  # Missing, or already listed by an enclosing walk
+        for dirpath, _, filenames in os.walk(directory):
+            self._dirs[self.rel(Path(dirpath))] = set(filenames)
+
+    def names(self, rel_dir: str) -> Set[str]:
+        """File names in a project-relative directory (empty if it does not exist)."""
+        rel_dir = rel_dir.strip("/") or "."
+        with self._lock:
+            names = self._dirs.get(rel_dir)
+            if names is None:
+                try:
+                    names = {e.name for e in os.scandir(self.root / rel_dir) if e.is_file()}
+                except OSError:
+                    names = set()
+                self._dirs[rel_dir] = names
+            return names
+
+    def files(self, rel_dir: str, suffixes: Tuple[str, ...]) -> List[str]:
+        """Asset files with one of the suffixes (no .import sidecars)."""
+        return sorted(
+            n for n in self.names(rel_dir)
+            if n.lower().endswith(suffixes) and ":" not in n
+        )
+
+    def resolve(self, res_path: str) -> Tuple[str, Optional[str]]:
+        """("ok", None), ("case", actual file name) or ("missing", None)."""
+        rel_dir, name = posixpath.split(res_path[len(RES_PREFIX):] if res_path.startswith(RES_PREFIX) else res_path)
+        names = self.names(rel_dir)
+        if name in names:
+            return "ok", None
+        with self._lock:
+            lower = self._lower.get(rel_dir)
+            if lower is None:
+                lower = self._lower[rel_dir] = {}
+                for n in sorted(names):
+                    lower.setdefault(n.lower(), n)
+        actual = lower.get(name.lower())
+        return ("case", actual) if actual else ("missing", None)
+
+    def index(self, rel_dir: str, suffixes: Tuple[str, ...]) -> TrigramIndex:
+        """Trigram index over a directory's assets, built on first use."""
+        key = f"{rel_dir}|{','.join(suffixes)}"
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = TrigramIndex(self.files(rel_dir, suffixes))
+        return index
+
+    def suggest(self, res_path: str, k: int = 3, min_similarity: float = 0.4) -> List[str]:
+        """Closest same-type assets in the reference's directory."""
+        rel_dir, name = posixpath.split(res_path[len(RES_PREFIX):])
+        suffix = posixpath.splitext(name)[1].lower()
+        if not suffix:
+            return []
+        return [n for n, _ in self.index(rel_dir, (suffix,)).search(name, k=k, min_similarity=min_similarity)]
+
+
+class Reference:
+    """One res:// reference and whether it resolves."""
+
+    __slots__ = ("file", "record", "field", "path", "status", "actual")
+
+    def __init__(self, file: Path, record: str, field: str, path: str, status: str, actual: Optional[str]):
+        self.file = file
+        self.record = record
+        self.field = field
+        self.path = path
+        self.status = status
+        self.actual = actual
+
+
+class FileAudit:
+    """References found in one data file."""
+
+    def __init__(self, path: Path, refs: List[Reference], cached: bool, error: str = ""):
+        self.path = path
+        self.refs = refs
+        self.cached = cached
+        self.error = error
+
+    def broken(self) -> List[Reference]:
+        return [ref for ref in self.refs if ref.status != "ok"]
+
+
+class BiomeAudit:
+    """Runs the reference audit over data files, reusing cached extractions."""
+
+    def __init__(self, listing: Optional[AssetListing] = None, cache_path: Path = CACHE_PATH):
+        self.listing = listing or AssetListing()
+        self.cache_path = cache_path
+        try:
+            with cache_path.open("r", encoding="utf-8") as f:
+                cache = json.load(f)
+            self._stored: Dict[str, Any] = cache["files"] if cache.get("format") == AUDIT_FORMAT else {}
+        except (OSError, ValueError, KeyError):
+            self._stored = {}
+        self._changed = False
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        path = path.resolve()
+        try:
+            return path.relative_to(ROOT).as_posix()
+        except ValueError:
+            return str(path)
+
+    def _extract(self, path: Path) -> Tuple[Path, Dict[str, Any], bool]:
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            return path, {"error": str(e)}, True
+        digest = hashlib.sha1(data).hexdigest()
+        entry = self._stored.get(self._key(path))
+        if entry is not None and entry.get("sha1") == digest:
+            return path, entry, True
+        try:
+            parsed = json.loads(data.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as e:
+            return path, {"sha1": digest, "error": f"invalid JSON: {e}"}, False
+        return path, {"sha1": digest, "refs": [list(ref) for ref in extract_references(parsed)]}, False
+
+    def scan(self, paths: Iterable[Path], jobs: int = 8) -> List[FileAudit]:
+        results: List[FileAudit] = []
+        with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+            for path, entry, cached in pool.map(self._extract, list(paths)):
+                if not cached:
+                    self._stored[self._key(path)] = entry
+                    self._changed = True
+                if "error" in entry:
+                    results.append(FileAudit(path, [], cached, entry["error"]))
+                    continue
+                refs = []
+                for record, field, res_path in entry["refs"]:
+                    status, actual = self.listing.resolve(res_path)
+                    refs.append(Reference(path, record, field, res_path, status, actual))
+                results.append(FileAudit(path, refs, cached))
+        self.save()
+        return results
+
+    def save(self) -> None:
+        """Persist new extractions (one entry per data file; deleted files are dropped)."""
+        stale = [key for key in self._stored if not (ROOT / key).exists() and not Path(key).exists()]
+        for key in stale:
+            del self._stored[key]
+        if not (self._changed or stale):
+            return
+        cache = {"format": AUDIT_FORMAT, "files": self._stored}
+        write_text_atomic(self.cache_path, json.dumps(cache, ensure_ascii=False, sort_keys=True))
+        self._changed = False
@@ -12,16 +12,28 @@ Outputs (always):
 
 With --write:
   - Core/Biomes/data/biomes_merged.json (updated in place)
+
+With --incremental, the migration records which faction contributed each
+term to each biome icon_components entry (Core/Biomes/data/
+lindblad_provenance.json) and on later runs applies only the terms that
+were added, removed or changed since. Untouched records keep their exact
+bytes, and a run with nothing to do writes nothing. Without a provenance
+file, the biome data is assumed to already reflect the current factions.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import math
 from collections import defaultdict
 from copy import deepcopy
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from data_snapshot import load_snapshot
+from json_splice import JsonSplicer, write_text_atomic
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -29,16 +41,14 @@ ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_BIOMES = ROOT / "Core" / "Biomes" / "data" / "biomes_merged.json"
 DEFAULT_FACTIONS = ROOT / "Core" / "Factions" / "data" / "factions_merged.json"
 DEFAULT_OUT_DIR = ROOT / "exports"
+PROVENANCE_PATH = ROOT / "Core" / "Biomes" / "data" / "lindblad_provenance.json"
+
+PROVENANCE_FORMAT = 1
 
 # Special biome name for orphan Lindblads (emojis not in any biome)
 ORPHAN_BIOME = "_orphan_lindblads"
 
 
-def _load_json(path: Path):
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 def _write_json(path: Path, data) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
@@ -87,6 +97,390 @@ def _assign_biomes(
     return []
 
 
+def _emoji_to_biomes(biomes) -> Dict[str, List[str]]:
+    # Built from the records rather than tools/emoji_index.py: terms must land
+    # on the exact spelling a biome lists, and the index merges spellings.
+    # The orphan collector is an output of the migration, never a target.
+    emoji_to_biomes: Dict[str, List[str]] = defaultdict(list)
+    for biome in biomes:
+        if biome["name"] == ORPHAN_BIOME:
+            continue
+        for emoji in biome.get("emojis", []):
+            emoji_to_biomes[emoji].append(biome["name"])
+    return emoji_to_biomes
+
+
+# ---------------------------------------------------------------------------
+# Incremental migration
+# ---------------------------------------------------------------------------
+
+# (biome, emoji, kind, key): key is the target/source emoji, "" for decay
+Slot = Tuple[str, str, str, str]
+
+
+def _term_biomes(
+    emoji: str,
+    emoji_to_biomes: Dict[str, List[str]],
+    multi_mode: str,
+    orphan_mode: str,
+) -> List[str]:
+    assigned = _assign_biomes(emoji, emoji_to_biomes, multi_mode)
+    if not assigned and emoji not in emoji_to_biomes and orphan_mode == "collect":
+        return [ORPHAN_BIOME]
+    return assigned
+
+
+def faction_terms(
+    faction: Dict,
+    emoji_to_biomes: Dict[str, List[str]],
+    multi_mode: str,
+    orphan_mode: str,
+) -> List[Tuple[Slot, Any]]:
+    """Every (slot, value) one faction contributes to the biomes."""
+    terms: List[Tuple[Slot, Any]] = []
+    for kind in ("lindblad_outgoing", "lindblad_incoming"):
+        for emoji, entries in (faction.get(kind) or {}).items():
+            for biome_name in _term_biomes(emoji, emoji_to_biomes, multi_mode, orphan_mode):
+                for key, rate in entries.items():
+                    terms.append(((biome_name, emoji, kind, key), float(rate)))
+    for emoji, spec in (faction.get("decay") or {}).items():
+        decay = {"rate": float(spec.get("rate", 0.0)), "target": spec.get("target", "🍂")}
+        for biome_name in _term_biomes(emoji, emoji_to_biomes, multi_mode, orphan_mode):
+            terms.append(((biome_name, emoji, "decay", ""), decay))
+    return terms
+
+
+def _fingerprint(value: Any) -> str:
+    return hashlib.sha1(json.dumps(value, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _slot_value(entry: Dict, kind: str, order: Dict[str, int]) -> Any:
+    """Biome value of a slot: its pre-migration base merged with every contribution.
+
+    Contributions are applied in faction file order, exactly as the full
+    migration does (rates summed, decay keeps the strictly higher rate).
+    """
+    contributions = sorted(entry["by"].items(), key=lambda kv: order.get(kv[0], len(order)))
+    base = entry["base"]
+    if kind == "decay":
+        best = base
+        for _, spec in contributions:
+            if spec["rate"] > float((best or {}).get("rate", 0.0)):
+                best = spec
+        return best
+    if not contributions:
+        return base
+    value = base if base is not None else 0.0
+    for _, rate in contributions:
+        value += rate
+    return value
+
+
+def _infer_base(current: Any, entry: Dict, kind: str, order: Dict[str, int]) -> Any:
+    """Pre-migration base of a slot whose current value already includes its contributions."""
+    if current is None:
+        return None
+    entry = {"base": None, "by": entry["by"]}
+    migrated = _slot_value(entry, kind, order)
+    if kind == "decay":
+        if migrated is None or float(current.get("rate", 0.0)) > migrated["rate"]:
+            return current
+        return None
+    residual = current - (migrated or 0.0)
+    return None if abs(residual) < 1e-9 else residual
+
+
+def _same(old: Any, new: Any) -> bool:
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)):
+        return math.isclose(old, new, rel_tol=1e-12, abs_tol=1e-12)
+    return old == new
+
+
+def _read_slot(biome_map: Dict[str, Dict], slot: Slot) -> Any:
+    biome_name, emoji, kind, key = slot
+    comp = (biome_map.get(biome_name) or {}).get("icon_components", {}).get(emoji)
+    if not comp:
+        return None
+    if kind == "decay":
+        return deepcopy(comp.get("decay"))
+    return (comp.get(kind) or {}).get(key)
+
+
+def _write_slot(biomes: List[Dict], biome_map: Dict[str, Dict], slot: Slot, value: Any) -> None:
+    biome_name, emoji, kind, key = slot
+    biome = biome_map.get(biome_name)
+    if biome is None:
+        if value is None or biome_name != ORPHAN_BIOME:
+            return
+        biome = {
+            "name": ORPHAN_BIOME,
+            "description": "Collected Lindblad terms for emojis not found in any biome",
+            "emojis": [],
+            "icon_components": {},
+        }
+        biomes.append(biome)
+        biome_map[ORPHAN_BIOME] = biome
+    components = biome.setdefault("icon_components", {})
+
+    if value is None:
+        comp = components.get(emoji)
+        if comp is None:
+            return
+        if kind == "decay":
+            comp.pop("decay", None)
+        else:
+            entries = comp.get(kind) or {}
+            entries.pop(key, None)
+            if not entries:
+                comp.pop(kind, None)
+        if not comp:
+            del components[emoji]
+            if biome_name == ORPHAN_BIOME and emoji in biome.get("emojis", []):
+                biome["emojis"].remove(emoji)
+        return
+
+    comp = components.setdefault(emoji, {})
+    if biome_name == ORPHAN_BIOME and emoji not in biome.setdefault("emojis", []):
+        biome["emojis"].append(emoji)
+    if kind == "decay":
+        comp["decay"] = value
+    else:
+        comp.setdefault(kind, {})[key] = value
+
+
+class LindbladProvenance:
+    """Which faction contributed each migrated term, and what was there before.
+
+    factions: name -> {"fingerprint": sha1 of its terms, "slots": [[biome, emoji, kind, key]]}
+    slots:    biome -> emoji -> kind -> key -> {"base": value or None, "by": {faction: value}}
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data if data and data.get("format") == PROVENANCE_FORMAT else {}
+        self.exists = bool(data)
+        self.meta: Dict[str, Any] = data.get("meta", {})
+        self.factions: Dict[str, Dict[str, Any]] = data.get("factions", {})
+        self.slots: Dict[str, Dict[str, Dict[str, Dict[str, Dict]]]] = data.get("slots", {})
+
+    @classmethod
+    def load(cls, path: Path) -> "LindbladProvenance":
+        if not path.exists():
+            return cls()
+        with path.open("r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def save(self, path: Path) -> bool:
+        data = {
+            "format": PROVENANCE_FORMAT,
+            "meta": self.meta,
+            "factions": self.factions,
+            "slots": self.slots,
+        }
+        text = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+        return write_text_atomic(path, text)
+
+    def get(self, slot: Slot) -> Optional[Dict]:
+        biome_name, emoji, kind, key = slot
+        return self.slots.get(biome_name, {}).get(emoji, {}).get(kind, {}).get(key)
+
+    def ensure(self, slot: Slot, base: Any) -> Dict:
+        biome_name, emoji, kind, key = slot
+        kinds = self.slots.setdefault(biome_name, {}).setdefault(emoji, {})
+        return kinds.setdefault(kind, {}).setdefault(key, {"base": base, "by": {}})
+
+    def discard(self, slot: Slot) -> None:
+        biome_name, emoji, kind, key = slot
+        emojis = self.slots.get(biome_name, {})
+        kinds = emojis.get(emoji, {})
+        keys = kinds.get(kind, {})
+        keys.pop(key, None)
+        if not keys:
+            kinds.pop(kind, None)
+        if not kinds:
+            emojis.pop(emoji, None)
+        if not emojis:
+            self.slots.pop(biome_name, None)
+
+    def withdraw(self, name: str) -> List[Slot]:
+        """Remove a faction's contributions; returns the slots it touched."""
+        record = self.factions.pop(name, None)
+        if record is None:
+            return []
+        slots = [tuple(slot) for slot in record["slots"]]
+        for slot in slots:
+            entry = self.get(slot)
+            if entry is not None:
+                entry["by"].pop(name, None)
+        return slots
+
+
+def migrate_incremental(
+    biomes: List[Dict],
+    factions,
+    emoji_to_biomes: Dict[str, List[str]],
+    multi_mode: str,
+    orphan_mode: str,
+    provenance: LindbladProvenance,
+) -> List[Tuple[Slot, Any, Any]]:
+    """Apply faction changes since the last migration to biomes (in place).
+
+    Returns (slot, old value, new value) for every biome value that moved.
+    Without existing provenance the biomes are adopted as already migrated:
+    bases are inferred and only terms missing from the biomes are applied.
+    """
+    biome_map = {b["name"]: b for b in biomes}
+    order = {f.get("name", "unknown"): i for i, f in enumerate(factions)}
+    adopting = not provenance.exists
+    touched: Dict[Slot, None] = {}
+
+    for faction in factions:
+        name = faction.get("name", "unknown")
+        terms = faction_terms(faction, emoji_to_biomes, multi_mode, orphan_mode)
+        fingerprint = _fingerprint(terms)
+        previous = provenance.factions.get(name)
+        if previous is not None and previous["fingerprint"] == fingerprint:
+            continue
+        for slot in provenance.withdraw(name):
+            touched[slot] = None
+        for slot, value in terms:
+            entry = provenance.get(slot)
+            if entry is None:
+                entry = provenance.ensure(slot, _read_slot(biome_map, slot))
+            entry["by"][name] = value
+            touched[slot] = None
+        provenance.factions[name] = {
+            "fingerprint": fingerprint,
+            "slots": [list(slot) for slot, _ in terms],
+        }
+
+    for name in [n for n in provenance.factions if n not in order]:
+        for slot in provenance.withdraw(name):
+            touched[slot] = None
+
+    if adopting:
+        for slot in touched:
+            entry = provenance.get(slot)
+            entry["base"] = _infer_base(_read_slot(biome_map, slot), entry, slot[2], order)
+
+    changes: List[Tuple[Slot, Any, Any]] = []
+    for slot in touched:
+        entry = provenance.get(slot)
+        if entry is None:
+            continue
+        old = _read_slot(biome_map, slot)
+        new = _slot_value(entry, slot[2], order)
+        if not _same(old, new):
+            _write_slot(biomes, biome_map, slot, new)
+            changes.append((slot, old, new))
+        if not entry["by"]:
+            provenance.discard(slot)
+
+    orphans = biome_map.get(ORPHAN_BIOME)
+    if orphans is not None and not orphans.get("icon_components") and changes:
+        biomes.remove(orphans)
+    return changes
+
+
+def _splice_biomes(text: str, biomes: List[Dict], changed: Dict[str, set]) -> str:
+    """Rewrite only the icon_components entries that changed."""
+    splicer = JsonSplicer(text)
+    spans = splicer.array_items()
+    names = [json.loads(text[span[0]:span[1]]).get("name") for span in spans]
+    if ORPHAN_BIOME in names and ORPHAN_BIOME not in {b["name"] for b in biomes}:
+        # Every orphan term was withdrawn
+        splicer.remove_item(names.index(ORPHAN_BIOME))
+    span_of = dict(zip(names, spans))
+    for biome in biomes:
+        emojis = changed.get(biome["name"])
+        if not emojis:
+            continue
+        span = span_of.get(biome["name"])
+        if span is None:
+            splicer.append_item(biome)
+            continue
+        members = splicer.members(span[0])
+        if biome["name"] == ORPHAN_BIOME or "icon_components" not in members:
+            splicer.replace(span, biome)
+            continue
+        components = biome["icon_components"]
+        comp_spans = splicer.members(members["icon_components"][0])
+        if all(emoji in comp_spans and emoji in components for emoji in emojis):
+            for emoji in sorted(emojis):
+                splicer.replace(comp_spans[emoji], components[emoji])
+        else:
+            # Components added or removed: rewrite the whole icon_components block
+            splicer.replace(members["icon_components"], components)
+    return splicer.apply()
+
+
+def _format_slot(slot: Slot) -> str:
+    biome_name, emoji, kind, key = slot
+    return f"{biome_name}:{emoji} {kind}" + (f" {key}" if key else "")
+
+
+def run_incremental(args) -> int:
+    biome_snapshot = load_snapshot(args.biomes)
+    faction_snapshot = load_snapshot(args.factions)
+
+    emoji_to_biomes = dict(_emoji_to_biomes(biome_snapshot.records))
+
+    meta = {
+        "factions_sha256": faction_snapshot.content_hash,
+        "assignment_sha1": _fingerprint(emoji_to_biomes),
+        "multi": args.multi,
+        "orphan": args.orphan,
+    }
+    provenance = LindbladProvenance.load(args.provenance)
+    if provenance.exists and provenance.meta == meta:
+        print("Up to date: no faction or biome assignment changes since the last migration")
+        return 0
+
+    biomes = biome_snapshot.thaw()
+    changes = migrate_incremental(
+        biomes, faction_snapshot.records, emoji_to_biomes, args.multi, args.orphan, provenance
+    )
+    provenance.meta = meta
+
+    added = sum(1 for _, old, new in changes if old is None)
+    removed = sum(1 for _, old, new in changes if new is None)
+    print(
+        f"Lindblad terms: {added} added, {removed} removed, "
+        f"{len(changes) - added - removed} changed"
+    )
+
+    if changes:
+        changed: Dict[str, set] = defaultdict(set)
+        for (biome_name, emoji, _, _), _, _ in changes:
+            changed[biome_name].add(emoji)
+        text = args.biomes.read_text(encoding="utf-8")
+        new_text = _splice_biomes(text, biomes, changed)
+
+        out_file = args.out_dir / "biomes_lindblad_preview.json"
+        write_text_atomic(out_file, new_text)
+        print(f"Wrote preview: {out_file}")
+
+        lines = ["# Biome Lindblad Incremental Migration", ""]
+        lines.append(f"Biomes source: `{args.biomes}`")
+        lines.append(f"Factions source: `{args.factions}`")
+        lines.append(f"Write mode: `{'enabled' if args.write else 'preview only'}`")
+        lines.append("")
+        lines.append("## Changed terms")
+        for slot, old, new in sorted(changes, key=lambda c: c[0]):
+            lines.append(f"- {_format_slot(slot)}: {json.dumps(old, ensure_ascii=False)} -> {json.dumps(new, ensure_ascii=False)}")
+        report_path = args.out_dir / "biome_lindblad_report.md"
+        _write_text(report_path, "\n".join(lines) + "\n")
+        print(f"Wrote report: {report_path}")
+
+        if args.write:
+            write_text_atomic(args.biomes, new_text)
+            print(f"Wrote canonical: {args.biomes}")
+
+    if args.write:
+        provenance.save(args.provenance)
+        print(f"Wrote provenance: {args.provenance}")
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--biomes", type=Path, default=DEFAULT_BIOMES)
@@ -109,6 +503,12 @@ def main() -> int:
         default="collect",
         help="How to handle orphan emojis: skip (ignore) or collect (store in _orphan section)",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Apply only faction changes since the last migration (with --write, updates --biomes in place)",
+    )
+    parser.add_argument("--provenance", type=Path, default=PROVENANCE_PATH)
     args = parser.parse_args()
 
     print("=" * 60)
@@ -121,20 +521,39 @@ def main() -> int:
     print(f"Write mode: {'ENABLED' if args.write else 'preview only'}")
     print()
 
-    biomes = _load_json(args.biomes)
-    factions = _load_json(args.factions)
+    if args.incremental:
+        return run_incremental(args)
+
+    # Biomes are edited in place below; factions are only read
+    biomes = load_snapshot(args.biomes).thaw()
+    factions = load_snapshot(args.factions).records
 
     biome_map = {b["name"]: b for b in biomes}
     for biome in biomes:
         biome.setdefault("icon_components", {})
 
-    # Create orphan collector if needed
-    orphan_lindblads = {"outgoing": {}, "incoming": {}, "decay": {}}
-
-    emoji_to_biomes: Dict[str, List[str]] = defaultdict(list)
-    for biome in biomes:
-        for emoji in biome.get("emojis", []):
-            emoji_to_biomes[emoji].append(biome["name"])
+    # Orphan terms merge into the collector like any other biome (an existing
+    # one from an earlier --write run is kept, as --incremental does)
+    orphan_terms = 0
+
+    def orphan_component(emoji: str) -> Dict:
+        nonlocal orphan_terms
+        orphan_terms += 1
+        biome = biome_map.get(ORPHAN_BIOME)
+        if biome is None:
+            biome = {
+                "name": ORPHAN_BIOME,
+                "description": "Collected Lindblad terms for emojis not found in any biome",
+                "emojis": [],
+                "icon_components": {},
+            }
+            biomes.append(biome)
+            biome_map[ORPHAN_BIOME] = biome
+        if emoji not in biome["emojis"]:
+            biome["emojis"].append(emoji)
+        return biome["icon_components"].setdefault(emoji, {})
+
+    emoji_to_biomes = _emoji_to_biomes(biomes)
 
     moved_counts = defaultdict(lambda: {"out": 0, "in": 0, "decay": 0})
     ambiguous = defaultdict(list)  # emoji -> biomes
@@ -155,12 +574,9 @@ def main() -> int:
                     missing[emoji].append("outgoing")
                     # Collect orphan if enabled
                     if args.orphan == "collect":
-                        if emoji not in orphan_lindblads["outgoing"]:
-                            orphan_lindblads["outgoing"][emoji] = {}
+                        comp = orphan_component(emoji)
                         for target, rate in targets.items():
-                            orphan_lindblads["outgoing"][emoji][target] = (
-                                orphan_lindblads["outgoing"][emoji].get(target, 0.0) + float(rate)
-                            )
+                            _merge_outgoing(comp, target, float(rate))
                 continue
             for biome_name in assigned:
                 comp = biome_map[biome_name]["icon_components"].setdefault(emoji, {})
@@ -179,12 +595,9 @@ def main() -> int:
                     missing[emoji].append("incoming")
                     # Collect orphan if enabled
                     if args.orphan == "collect":
-                        if emoji not in orphan_lindblads["incoming"]:
-                            orphan_lindblads["incoming"][emoji] = {}
+                        comp = orphan_component(emoji)
                         for source, rate in sources.items():
-                            orphan_lindblads["incoming"][emoji][source] = (
-                                orphan_lindblads["incoming"][emoji].get(source, 0.0) + float(rate)
-                            )
+                            _merge_incoming(comp, source, float(rate))
                 continue
             for biome_name in assigned:
                 comp = biome_map[biome_name]["icon_components"].setdefault(emoji, {})
@@ -203,11 +616,7 @@ def main() -> int:
                     missing[emoji].append("decay")
                     # Collect orphan if enabled
                     if args.orphan == "collect":
-                        rate = float(decay_spec.get("rate", 0.0))
-                        target = decay_spec.get("target", "🍂")
-                        existing = orphan_lindblads["decay"].get(emoji, {})
-                        if rate > float(existing.get("rate", 0.0)):
-                            orphan_lindblads["decay"][emoji] = {"rate": rate, "target": target}
+                        _merge_decay(orphan_component(emoji), decay_spec)
                 continue
             for biome_name in assigned:
                 comp = biome_map[biome_name]["icon_components"].setdefault(emoji, {})
@@ -219,39 +628,8 @@ def main() -> int:
                         f"{biome_name}:{emoji} decay rate {prev_rate} kept over {new_rate}"
                     )
 
-    # Add orphan section to biomes if any orphans collected
-    orphan_count = (
-        len(orphan_lindblads["outgoing"]) +
-        len(orphan_lindblads["incoming"]) +
-        len(orphan_lindblads["decay"])
-    )
-    if orphan_count > 0 and args.orphan == "collect":
-        # Create orphan biome entry
-        orphan_biome = {
-            "name": ORPHAN_BIOME,
-            "description": "Collected Lindblad terms for emojis not found in any biome",
-            "emojis": [],
-            "icon_components": {},
-        }
-        # Populate orphan icon_components
-        for emoji, targets in orphan_lindblads["outgoing"].items():
-            comp = orphan_biome["icon_components"].setdefault(emoji, {})
-            comp["lindblad_outgoing"] = targets
-            if emoji not in orphan_biome["emojis"]:
-                orphan_biome["emojis"].append(emoji)
-        for emoji, sources in orphan_lindblads["incoming"].items():
-            comp = orphan_biome["icon_components"].setdefault(emoji, {})
-            comp["lindblad_incoming"] = sources
-            if emoji not in orphan_biome["emojis"]:
-                orphan_biome["emojis"].append(emoji)
-        for emoji, decay_spec in orphan_lindblads["decay"].items():
-            comp = orphan_biome["icon_components"].setdefault(emoji, {})
-            comp["decay"] = decay_spec
-            if emoji not in orphan_biome["emojis"]:
-                orphan_biome["emojis"].append(emoji)
-
-        biomes.append(orphan_biome)
-        print(f"Collected {orphan_count} orphan Lindblad terms into {ORPHAN_BIOME}")
+    if orphan_terms:
+        print(f"Collected {orphan_terms} orphan Lindblad terms into {ORPHAN_BIOME}")
 
     out_biomes = deepcopy(biomes)
 
@@ -324,7 +702,7 @@ def main() -> int:
     )
     lines.append(f"- Total Lindblad terms migrated: {total_moved}")
     lines.append(f"- Biomes with Lindblad data: {len(moved_counts)}")
-    lines.append(f"- Orphan terms collected: {orphan_count}")
+    lines.append(f"- Orphan terms collected: {orphan_terms}")
 
     report_path = args.out_dir / "biome_lindblad_report.md"
     _write_text(report_path, "\n".join(lines) + "\n")
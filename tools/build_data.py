@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""Rebuild the generated game data, running only the stale steps.
+
+The data flows through several tools that used to be run by hand:
+
+    llm_inbox/assets_update_02/*.json
+      -> merge_inbox_factions.py          -> factions_merged.json
+      -> biome_lindblad_sort_preview.py   -> biomes_merged.json (in place)
+      -> emoji_index.py                   -> emoji_index.json, EmojiIndex.gd
+      -> BuildBundledCache.sh (Godot)     -> BundledCache/
+      -> convert_faction_lexicon_v2_1.py  -> FactionDatabaseV2.gd, FactionPackedData.gd
+
+Each step below declares its input and output files (globs allowed).
+For Python steps, the repo modules the script imports (directly or
+through other repo modules, resolved against the script's directory and
+tools/) are added to its inputs, so editing a shared helper such as
+data_snapshot.py marks every step that uses it stale. A
+step depends on every step that produces one of its inputs, and it is
+stale when any input or output hash differs from the one recorded after
+its last successful run (or its command changed). File hashes are kept
+in .cache/build/state.json together with (mtime, size), so an unchanged
+file is never re-read and a no-op build only stats the files. Ready
+steps run in parallel; a step that fails blocks its dependents.
+
+The legacy Scripts/convert_faction_json_to_gd.py is not part of the
+graph: the game loads FactionDatabaseV2.gd.
+
+Usage:
+    python tools/build_data.py [steps...] [--force] [--jobs 4] [--dry-run] [--report PATH] [-v]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import functools
+import glob
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from json_splice import write_text_atomic
+
+
+ROOT = Path(__file__).resolve().parents[1]
+STATE_PATH = ROOT / ".cache" / "build" / "state.json"
+
+# Bump when the state layout changes
+STATE_FORMAT = 1
+
+FACTIONS_MERGED = "Core/Factions/data/factions_merged.json"
+BIOMES_MERGED = "Core/Biomes/data/biomes_merged.json"
+
+PYTHON = "{python}"
+MODULE_DIRS = ("tools",)  # Where scripts put their helper modules on sys.path
+
+
+@functools.lru_cache(maxsize=None)
+def _imported_names(rel: str) -> Tuple[str, ...]:
+    """Top-level module names a Python file imports (anywhere in the file)."""
+    try:
+        tree = ast.parse((ROOT / rel).read_text(encoding="utf-8"), filename=rel)
+    except (OSError, SyntaxError):
+        return ()
+    names: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module.split(".")[0])
+    return tuple(dict.fromkeys(names))
+
+
+def script_modules(script: str) -> List[str]:
+    """Repo modules a script imports, transitively (repo-relative paths)."""
+    search = [Path(script).parent.as_posix(), *MODULE_DIRS]
+    found: List[str] = []
+    pending = [script]
+    while pending:
+        for name in _imported_names(pending.pop()):
+            for directory in search:
+                rel = f"{directory}/{name}.py" if directory not in ("", ".") else f"{name}.py"
+                if rel != script and (ROOT / rel).is_file():
+                    if rel not in found:
+                        found.append(rel)
+                        pending.append(rel)
+                    break
+    return found
+
+
+class Step:
+    """One build step: a command plus the files it reads and writes."""
+
+    def __init__(
+        self,
+        name: str,
+        command: Sequence[str],
+        inputs: Sequence[str],
+        outputs: Sequence[str],
+        requires: Sequence[str] = (),
+    ):
+        self.name = name
+        self.command = list(command)
+        self.inputs = list(inputs)
+        if len(self.command) > 1 and self.command[0] == PYTHON:
+            self.inputs += [m for m in script_modules(self.command[1]) if m not in self.inputs]
+        self.outputs = list(outputs)
+        self.requires = list(requires)  # executables that must be on PATH
+
+    def argv(self) -> List[str]:
+        return [sys.executable if arg == PYTHON else arg for arg in self.command]
+
+    def missing_requirements(self) -> List[str]:
+        return [tool for tool in self.requires if shutil.which(tool) is None]
+
+
+STEPS = [
+    Step(
+        "merge_factions",
+        [PYTHON, "tools/merge_inbox_factions.py"],
+        inputs=[
+            "tools/merge_inbox_factions.py",
+            "llm_inbox/assets_update_02/spacewheat_factions.json",
+            "llm_inbox/assets_update_02/new_factions.json",
+        ],
+        outputs=[FACTIONS_MERGED, "exports/faction_merge_changes.json"],
+    ),
+    Step(
+        "lindblad",
+        [PYTHON, "tools/biome_lindblad_sort_preview.py", "--incremental", "--write"],
+        inputs=[
+            "tools/biome_lindblad_sort_preview.py",
+            FACTIONS_MERGED,
+            BIOMES_MERGED,
+            "Core/Biomes/data/lindblad_provenance.json",
+        ],
+        outputs=[
+            BIOMES_MERGED,
+            "Core/Biomes/data/lindblad_provenance.json",
+            "exports/biomes_lindblad_preview.json",
+            "exports/biome_lindblad_report.md",
+        ],
+    ),
+    Step(
+        "emoji_index",
+        [PYTHON, "tools/emoji_index.py"],
+        inputs=["tools/emoji_index.py", BIOMES_MERGED, FACTIONS_MERGED],
+        outputs=["Core/Biomes/data/emoji_index.json", "Core/Biomes/EmojiIndex.gd"],
+    ),
+    Step(
+        "bundled_cache",
+        ["bash", "tools/BuildBundledCache.sh"],
+        inputs=[
+            "tools/BuildBundledCache.sh",
+            BIOMES_MERGED,
+            FACTIONS_MERGED,
+            "Core/QuantumSubstrate/*.gd",
+        ],
+        outputs=["BundledCache/*.json"],
+        requires=["godot"],
+    ),
+    Step(
+        "faction_database",
+        [PYTHON, "convert_faction_lexicon_v2_1.py", "--packed"],
+        inputs=["convert_faction_lexicon_v2_1.py", FACTIONS_MERGED],
+        outputs=["Core/Quests/FactionDatabaseV2.gd", "Core/Factions/FactionPackedData.gd"],
+    ),
+]
+
+
+# ---------------------------------------------------------------------------
+# File hashes (re-read only when mtime/size moved)
+# ---------------------------------------------------------------------------
+
+class FileHashes:
+    """sha1 per file, cached against (mtime_ns, size)."""
+
+    def __init__(self, stored: Dict[str, List]):
+        self.stored = stored
+        self.read = 0
+
+    def hash(self, rel: str) -> Optional[str]:
+        path = ROOT / rel
+        try:
+            st = path.stat()
+        except OSError:
+            self.stored.pop(rel, None)
+            return None
+        entry = self.stored.get(rel)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        self.read += 1
+        self.stored[rel] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+    def snapshot(self, patterns: Sequence[str]) -> Dict[str, Optional[str]]:
+        """rel path -> hash for every file the patterns name (None if missing)."""
+        result: Dict[str, Optional[str]] = {}
+        for pattern in patterns:
+            if glob.has_magic(pattern):
+                matches = sorted(glob.glob(pattern, root_dir=ROOT))
+                for rel in matches:
+                    result[rel] = self.hash(rel)
+                if not matches:
+                    result[pattern] = None
+            else:
+                result[pattern] = self.hash(pattern)
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Graph and staleness
+# ---------------------------------------------------------------------------
+
+def dependencies(steps: Sequence[Step]) -> Dict[str, Set[str]]:
+    """step -> steps producing one of its inputs (declared paths must match)."""
+    producers: Dict[str, str] = {}
+    for step in steps:
+        for output in step.outputs:
+            if output in producers:
+                raise ValueError(f"{output} is produced by both {producers[output]} and {step.name}")
+            producers[output] = step.name
+    deps: Dict[str, Set[str]] = {}
+    for step in steps:
+        deps[step.name] = {producers[i] for i in step.inputs if i in producers and producers[i] != step.name}
+    return deps
+
+
+def select(steps: Sequence[Step], deps: Dict[str, Set[str]], targets: Sequence[str]) -> List[Step]:
+    """Targets plus everything upstream of them, in declaration order."""
+    by_name = {step.name: step for step in steps}
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        raise SystemExit(f"Unknown step(s): {', '.join(unknown)} (have: {', '.join(by_name)})")
+    wanted: Set[str] = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in wanted:
+            wanted.add(name)
+            pending.extend(deps[name])
+    return [step for step in steps if step.name in wanted]
+
+
+def stale_reason(step: Step, record: Optional[Dict], hashes: FileHashes) -> Optional[str]:
+    if record is None:
+        return "never built"
+    if record.get("command") != step.command:
+        return "command changed"
+    # Inputs may be optional (inbox files): missing counts as a state too
+    inputs = hashes.snapshot(step.inputs)
+    for rel, digest in inputs.items():
+        if rel not in record["inputs"] or record["inputs"][rel] != digest:
+            return f"{rel} {'removed' if digest is None else 'changed'}"
+    if set(inputs) != set(record["inputs"]):
+        return "input set changed"
+    outputs = hashes.snapshot(step.outputs)
+    for rel, digest in outputs.items():
+        if digest is None:
+            return f"missing output {rel}"
+        if record["outputs"].get(rel) != digest:
+            return f"{rel} modified"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def load_state(path: Path) -> Dict:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("format") == STATE_FORMAT:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {"format": STATE_FORMAT, "files": {}, "steps": {}}
+
+
+def run_command(step: Step) -> Tuple[int, str, float]:
+    start = time.perf_counter()
+    proc = subprocess.run(step.argv(), cwd=ROOT, capture_output=True, text=True)
+    return proc.returncode, proc.stdout + proc.stderr, time.perf_counter() - start
+
+
+class Build:
+    """Runs the stale steps of a graph and collects a per-step report."""
+
+    def __init__(self, steps: Sequence[Step], state: Dict, force: bool = False, verbose: bool = False):
+        self.steps = list(steps)
+        self.deps = dependencies(self.steps)
+        self.state = state
+        self.hashes = FileHashes(state["files"])
+        self.force = force
+        self.verbose = verbose
+        self.results: Dict[str, Dict] = {}
+
+    def check(self, step: Step) -> Optional[str]:
+        start = time.perf_counter()
+        reason = "forced" if self.force else stale_reason(step, self.state["steps"].get(step.name), self.hashes)
+        self.results[step.name] = {"check_seconds": time.perf_counter() - start}
+        return reason
+
+    def record(self, step: Step) -> None:
+        self.state["steps"][step.name] = {
+            "command": step.command,
+            "inputs": self.hashes.snapshot(step.inputs),
+            "outputs": self.hashes.snapshot(step.outputs),
+        }
+
+    def finish(self, step: Step, status: str, detail: str = "", seconds: float = 0.0) -> None:
+        self.results[step.name].update(status=status, detail=detail, seconds=seconds)
+
+    def plan(self) -> List[Tuple[Step, Optional[str]]]:
+        """(step, stale reason) assuming upstream steps leave their outputs as they are."""
+        return [(step, self.check(step)) for step in self.steps]
+
+    def run(self, jobs: int) -> bool:
+        remaining = {step.name: step for step in self.steps}
+        done: Set[str] = set()
+        failed: Set[str] = set()
+        running: Dict[Future, Step] = {}
+        selected = set(remaining)
+
+        with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+            while remaining or running:
+                for name, step in list(remaining.items()):
+                    deps = self.deps[name] & selected
+                    if deps & failed:
+                        del remaining[name]
+                        failed.add(name)
+                        self.results.setdefault(name, {"check_seconds": 0.0})
+                        self.finish(step, "blocked", ", ".join(sorted(deps & failed)))
+                        continue
+                    if not deps <= done:
+                        continue
+                    del remaining[name]
+                    reason = self.check(step)
+                    if reason is None:
+                        done.add(name)
+                        self.finish(step, "up-to-date")
+                        continue
+                    missing = step.missing_requirements()
+                    if missing:
+                        # Not recorded, so the step stays stale until it can run
+                        done.add(name)
+                        self.finish(step, "skipped", f"{', '.join(missing)} not found ({reason})")
+                        continue
+                    print(f"  → {name}: {reason}")
+                    running[pool.submit(run_command, step)] = step
+
+                if not running:
+                    if remaining and not any(self.deps[n] & selected <= done for n in remaining):
+                        raise RuntimeError(f"dependency cycle among: {', '.join(remaining)}")
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    code, output, seconds = future.result()
+                    if code == 0:
+                        self.record(step)
+                        done.add(step.name)
+                        self.finish(step, "built", seconds=seconds)
+                    else:
+                        failed.add(step.name)
+                        self.finish(step, "failed", f"exit {code}", seconds)
+                    if self.verbose or code != 0:
+                        print(f"----- {step.name} output -----")
+                        print(output.rstrip())
+                        print(f"----- end {step.name} -----")
+        return not failed
+
+    def report_lines(self, total: float) -> List[str]:
+        lines = [f"{'step':<18} {'status':<11} {'run':>8} {'check':>8}  detail"]
+        for step in self.steps:
+            r = self.results.get(step.name, {})
+            lines.append(
+                f"{step.name:<18} {r.get('status', '-'):<11} {r.get('seconds', 0.0):>7.2f}s "
+                f"{r.get('check_seconds', 0.0) * 1000:>6.1f}ms  {r.get('detail', '')}"
+            )
+        built = sum(1 for r in self.results.values() if r.get("status") == "built")
+        lines.append(f"{built}/{len(self.steps)} steps built in {total:.2f}s ({self.hashes.read} files hashed)")
+        return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("steps", nargs="*", help="Build only these steps and what they depend on")
+    parser.add_argument("--force", action="store_true", help="Run the selected steps even if up to date")
+    parser.add_argument("--jobs", "-j", type=int, default=4, help="Steps to run in parallel (default: 4)")
+    parser.add_argument("--dry-run", action="store_true", help="Only list stale steps")
+    parser.add_argument("--report", type=Path, help="Also write the timing report as JSON")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show step output")
+    parser.add_argument("--list", action="store_true", help="Show the steps and their dependencies")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    deps = dependencies(STEPS)
+    steps = select(STEPS, deps, args.steps) if args.steps else STEPS
+
+    if args.list:
+        for step in steps:
+            after = ", ".join(sorted(deps[step.name])) or "-"
+            print(f"{step.name:<18} after: {after}")
+            print(f"{'':<18} in:    {', '.join(step.inputs)}")
+            print(f"{'':<18} out:   {', '.join(step.outputs)}")
+        return 0
+
+    state = load_state(STATE_PATH)
+    build = Build(steps, state, force=args.force, verbose=args.verbose)
+
+    if args.dry_run:
+        stale = [(step, reason) for step, reason in build.plan() if reason]
+        for step, reason in stale:
+            print(f"  {step.name}: {reason}")
+        print(f"{len(stale)}/{len(steps)} steps stale (downstream steps may become stale once these run)")
+        return 0
+
+    ok = build.run(args.jobs)
+    state["files"] = build.hashes.stored
+    write_text_atomic(STATE_PATH, json.dumps(state, ensure_ascii=False, indent=1, sort_keys=True))
+    total = time.perf_counter() - start
+
+    print("\n".join(build.report_lines(total)))
+    if args.report:
+        report = {"total_seconds": total, "files_hashed": build.hashes.read, "steps": build.results}
+        write_text_atomic(args.report, json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Cached, pre-parsed snapshots of the merged game data files.
+
+Every data tool reads the same JSON (factions_merged.json is ~150 KB).
+This module parses a file once, stores a binary snapshot under
+.cache/data_snapshots/, and hands back a frozen, indexed view:
+
+    snap = load_snapshot(FACTIONS_MERGED)
+    snap.by_name["Black Horizon"]["ring"]
+    snap.by_emoji["🌾"]          # records whose emojis/sig mention it
+    snap.by_ring["outer"], snap.by_domain["Boundary"]
+
+A snapshot is reused while the source's (mtime, size) is unchanged; if
+only the mtime moved, the content hash decides. Repeat runs therefore
+skip JSON decoding entirely, and tools chained inside one Python process
+share a single in-memory copy.
+
+Records are FrozenDict/tuple trees; call `snap.thaw()` for a mutable
+deep copy when a tool needs to edit and write the data back.
+
+Usage:
+    python tools/data_snapshot.py [paths...]   # warm the cache / show stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+ROOT = Path(__file__).resolve().parents[1]
+BIOMES_MERGED = ROOT / "Core" / "Biomes" / "data" / "biomes_merged.json"
+FACTIONS_MERGED = ROOT / "Core" / "Factions" / "data" / "factions_merged.json"
+CACHE_DIR = ROOT / ".cache" / "data_snapshots"
+
+# Bump when the pickled layout changes
+SNAPSHOT_FORMAT = 1
+
+# Record fields that list the emojis a record is "about"
+EMOJI_FIELDS = ("emojis", "sig", "signature")
+
+
+class FrozenDict(dict):
+    """dict that refuses mutation (still JSON-serializable and picklable)."""
+
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        # Filled here, so calling __init__ again on a built dict is a no-op
+        self = dict.__new__(cls)
+        dict.update(self, *args, **kwargs)
+        return self
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("snapshot data is read-only; use DataSnapshot.thaw()")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to FrozenDict and lists to tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Inverse of freeze(): plain dicts and lists."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _records_of(data: Any) -> Tuple:
+    """The record list of a data file (bare list, or a lexicon's "factions")."""
+    if isinstance(data, tuple):
+        return data
+    if isinstance(data, dict):
+        for key in ("factions", "biomes"):
+            if isinstance(data.get(key), tuple):
+                return data[key]
+    return ()
+
+
+def _build_index(records: Tuple, field: str) -> FrozenDict:
+    index: Dict[Any, list] = {}
+    for record in records:
+        if isinstance(record, dict) and field in record:
+            index.setdefault(record[field], []).append(record)
+    return FrozenDict((k, tuple(v)) for k, v in index.items())
+
+
+def _build_emoji_index(records: Tuple) -> FrozenDict:
+    index: Dict[str, list] = {}
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        seen = set()
+        for field in EMOJI_FIELDS:
+            for emoji in record.get(field) or ():
+                if isinstance(emoji, str) and emoji not in seen:
+                    seen.add(emoji)
+                    index.setdefault(emoji, []).append(record)
+    return FrozenDict((k, tuple(v)) for k, v in index.items())
+
+
+class DataSnapshot:
+    """Frozen, indexed view of one JSON data file."""
+
+    def __init__(self, source: Path, content_hash: str, data: Any, indexes: Dict[str, FrozenDict]):
+        self.source = source
+        self.content_hash = content_hash
+        self.data = data
+        self.records = _records_of(data)
+        self.by_name: FrozenDict = indexes["name"]
+        self.by_emoji: FrozenDict = indexes["emoji"]
+        self.by_ring: FrozenDict = indexes["ring"]
+        self.by_domain: FrozenDict = indexes["domain"]
+
+    @classmethod
+    def build(cls, source: Path, raw: bytes, content_hash: str) -> "DataSnapshot":
+        data = freeze(json.loads(raw.decode("utf-8")))
+        records = _records_of(data)
+        names = FrozenDict(
+            (r["name"], r) for r in records if isinstance(r, dict) and "name" in r
+        )
+        indexes = {
+            "name": names,
+            "emoji": _build_emoji_index(records),
+            "ring": _build_index(records, "ring"),
+            "domain": _build_index(records, "domain"),
+        }
+        return cls(source, content_hash, data, indexes)
+
+    def thaw(self) -> Any:
+        """Mutable deep copy of the whole file's data."""
+        return thaw(self.data)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def _payload(self) -> Dict[str, Any]:
+        return {
+            "data": self.data,
+            "name": self.by_name,
+            "emoji": self.by_emoji,
+            "ring": self.by_ring,
+            "domain": self.by_domain,
+        }
+
+
+# In-process memo: path -> (stat key, snapshot)
+_MEMO: Dict[Path, Tuple[Tuple[int, int], DataSnapshot]] = {}
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _cache_file(path: Path) -> Path:
+    digest = hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR / f"{path.stem}_{digest}.pickle"
+
+
+def _read_cache(cache_file: Path) -> Optional[Tuple[Dict[str, Any], Any]]:
+    """(meta, open file positioned at payload) or None."""
+    try:
+        handle = cache_file.open("rb")
+    except OSError:
+        return None
+    try:
+        meta = pickle.load(handle)
+    except Exception:
+        handle.close()
+        return None
+    if not isinstance(meta, dict) or meta.get("format") != SNAPSHOT_FORMAT:
+        handle.close()
+        return None
+    return meta, handle
+
+
+def _write_cache(cache_file: Path, meta: Dict[str, Any], snapshot: DataSnapshot) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(snapshot._payload(), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache_file)
+
+
+def load_snapshot(path: Path, use_disk_cache: bool = True) -> DataSnapshot:
+    """Frozen, indexed snapshot of a JSON data file (cached)."""
+    path = Path(path).resolve()
+    stat_key = _stat_key(path)
+
+    memo = _MEMO.get(path)
+    if memo is not None and memo[0] == stat_key:
+        return memo[1]
+
+    cache_file = _cache_file(path)
+    cached = _read_cache(cache_file) if use_disk_cache else None
+    raw: Optional[bytes] = None
+    content_hash: Optional[str] = None
+    snapshot: Optional[DataSnapshot] = None
+
+    if cached is not None:
+        meta, handle = cached
+        with handle:
+            fresh = tuple(meta.get("stat", ())) == stat_key
+            if not fresh:
+                # Touched but maybe not edited: let the content decide
+                raw = path.read_bytes()
+                content_hash = hashlib.sha256(raw).hexdigest()
+                fresh = content_hash == meta.get("sha256")
+            if fresh:
+                try:
+                    payload = pickle.load(handle)
+                except Exception:
+                    payload = None  # Corrupt or stale layout: rebuild below
+                if payload is not None:
+                    snapshot = DataSnapshot(path, meta["sha256"], payload["data"], payload)
+                    if tuple(meta.get("stat", ())) != stat_key:
+                        meta["stat"] = stat_key
+                        _write_cache(cache_file, meta, snapshot)
+
+    if snapshot is None:
+        if raw is None:
+            raw = path.read_bytes()
+            content_hash = hashlib.sha256(raw).hexdigest()
+        snapshot = DataSnapshot.build(path, raw, content_hash)
+        if use_disk_cache:
+            meta = {
+                "format": SNAPSHOT_FORMAT,
+                "source": str(path),
+                "stat": stat_key,
+                "sha256": content_hash,
+            }
+            _write_cache(cache_file, meta, snapshot)
+
+    _MEMO[path] = (stat_key, snapshot)
+    return snapshot
+
+
+def load_factions() -> DataSnapshot:
+    return load_snapshot(FACTIONS_MERGED)
+
+
+def load_biomes() -> DataSnapshot:
+    return load_snapshot(BIOMES_MERGED)
+
+
+def invalidate(paths: Iterable[Path] = ()) -> None:
+    """Drop in-process copies (all if no paths given). Disk cache self-validates."""
+    if not paths:
+        _MEMO.clear()
+        return
+    for path in paths:
+        _MEMO.pop(Path(path).resolve(), None)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Warm and inspect data snapshots.")
+    parser.add_argument("paths", nargs="*", type=Path, help="JSON files (default: merged factions + biomes)")
+    args = parser.parse_args()
+
+    for path in args.paths or [FACTIONS_MERGED, BIOMES_MERGED]:
+        start = time.perf_counter()
+        snap = load_snapshot(path)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(
+            f"{path.name}: {len(snap)} records, {len(snap.by_name)} names, "
+            f"{len(snap.by_emoji)} emojis, {elapsed:.1f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    # Re-import under the module name so pickled classes resolve as
+    # data_snapshot.FrozenDict rather than __main__.FrozenDict
+    from data_snapshot import main as _main
+
+    raise SystemExit(_main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""Persisted emoji -> biomes / emoji -> factions inverted index.
+
+Several consumers need "which biomes (factions) use this emoji":
+the Lindblad migration, faction vocabulary overlap, quest generation
+picking biome emojis, and the game's BiomeRegistry / IconBuilder. This
+module keeps one index next to the merged data and refreshes it
+incrementally:
+
+  - a source whose content hash is unchanged is skipped outright;
+  - otherwise only records whose emoji lists changed are re-indexed.
+
+Biome emojis come from `emojis`; faction emojis from `sig` plus decay
+targets (the same set as Faction.get_all_emojis()). Emojis are keyed by
+their emoji_registry spelling (variation selectors stripped), so "⚙" and
+"⚙️" are one entry, and lookups normalize the emoji they are given. Name
+lists keep the record order of their source file.
+
+Outputs (written together by this tool, and only when their bytes change):
+  - Core/Biomes/data/emoji_index.json     (tooling; O(1) lookups)
+  - Core/Biomes/EmojiIndex.gd             (generated consts for the game)
+
+load_index() never writes: a stale source is refreshed in memory only.
+
+Usage:
+    python tools/emoji_index.py [--force]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from data_snapshot import BIOMES_MERGED, FACTIONS_MERGED, load_snapshot
+from emoji_registry import normalize_emoji
+from json_splice import write_text_atomic
+
+
+ROOT = Path(__file__).resolve().parents[1]
+INDEX_PATH = ROOT / "Core" / "Biomes" / "data" / "emoji_index.json"
+GD_PATH = ROOT / "Core" / "Biomes" / "EmojiIndex.gd"
+
+INDEX_FORMAT = 2
+
+
+def biome_emojis(record: Dict[str, Any]) -> List[str]:
+    return list(dict.fromkeys(normalize_emoji(e) for e in record.get("emojis") or ()))
+
+
+def faction_emojis(record: Dict[str, Any]) -> List[str]:
+    emojis = list(record.get("sig") or record.get("signature") or ())
+    for spec in (record.get("decay") or {}).values():
+        target = spec.get("target", "") if isinstance(spec, dict) else ""
+        if target:
+            emojis.append(target)
+    return list(dict.fromkeys(normalize_emoji(e) for e in emojis))
+
+
+# kind -> (source path, emoji extractor)
+SOURCES = {
+    "biomes": (BIOMES_MERGED, biome_emojis),
+    "factions": (FACTIONS_MERGED, faction_emojis),
+}
+
+
+class EmojiIndex:
+    """In-memory inverted index with per-source incremental refresh."""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        if data.get("format") != INDEX_FORMAT:
+            data = {}
+        # kind -> {"sha256": str, "order": [names], "records": {name: [emojis]}}
+        self.sources: Dict[str, Dict[str, Any]] = data.get("sources", {})
+        # kind -> {emoji: [names]}
+        self.inverted: Dict[str, Dict[str, List[str]]] = {
+            "biomes": data.get("emoji_to_biomes", {}),
+            "factions": data.get("emoji_to_factions", {}),
+        }
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> "EmojiIndex":
+        if not path.exists():
+            return cls()
+        with path.open("r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def to_json(self) -> Dict[str, Any]:
+        """Canonical form: depends only on the source records, not on refresh history."""
+        inverted = {}
+        for kind, mapping in self.inverted.items():
+            position = {name: i for i, name in enumerate(self.sources.get(kind, {}).get("order", []))}
+            inverted[kind] = {emoji: sorted(names, key=lambda n: position.get(n, len(position)))
+                              for emoji, names in mapping.items()}
+        return {
+            "format": INDEX_FORMAT,
+            "sources": self.sources,
+            "emoji_to_biomes": inverted["biomes"],
+            "emoji_to_factions": inverted["factions"],
+        }
+
+    def to_text(self) -> str:
+        return json.dumps(self.to_json(), ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+
+    # Queries ----------------------------------------------------------------
+
+    def biomes_for(self, emoji: str) -> List[str]:
+        return self.inverted["biomes"].get(normalize_emoji(emoji), [])
+
+    def factions_for(self, emoji: str) -> List[str]:
+        return self.inverted["factions"].get(normalize_emoji(emoji), [])
+
+    def emojis_for_biome(self, name: str) -> List[str]:
+        return self.sources.get("biomes", {}).get("records", {}).get(name, [])
+
+    def emojis_for_faction(self, name: str) -> List[str]:
+        return self.sources.get("factions", {}).get("records", {}).get(name, [])
+
+    # Refresh ----------------------------------------------------------------
+
+    def refresh(self, kind: str, path: Path, extract, force: bool = False) -> Tuple[int, bool]:
+        """Bring one source up to date. Returns (records re-indexed, changed)."""
+        snapshot = load_snapshot(path)
+        state = self.sources.get(kind)
+        if not force and state is not None and state.get("sha256") == snapshot.content_hash:
+            return 0, False
+
+        old_records: Dict[str, List[str]] = {} if force or state is None else state["records"]
+        old_order: List[str] = [] if force or state is None else state["order"]
+        inverted = {} if force or state is None else self.inverted[kind]
+
+        new_order: List[str] = []
+        new_records: Dict[str, List[str]] = {}
+        for record in snapshot.records:
+            if isinstance(record, dict) and "name" in record:
+                new_order.append(record["name"])
+                new_records[record["name"]] = extract(record)
+
+        touched = set()
+        reindexed = 0
+        for name in old_records.keys() - new_records.keys():
+            touched.update(old_records[name])
+            self._unlink(inverted, name, old_records[name])
+            reindexed += 1
+        for name, emojis in new_records.items():
+            previous = old_records.get(name)
+            if previous == emojis:
+                continue
+            reindexed += 1
+            if previous:
+                touched.update(previous)
+                self._unlink(inverted, name, previous)
+            touched.update(emojis)
+            for emoji in emojis:
+                inverted.setdefault(emoji, []).append(name)
+
+        # Keep name lists in file order; a reorder touches every emoji
+        if new_order != old_order:
+            touched = set(inverted)
+        position = {name: i for i, name in enumerate(new_order)}
+        for emoji in touched:
+            if emoji in inverted:
+                inverted[emoji].sort(key=position.__getitem__)
+
+        changed = reindexed > 0 or new_order != old_order
+        self.inverted[kind] = inverted
+        self.sources[kind] = {
+            "sha256": snapshot.content_hash,
+            "order": new_order,
+            "records": new_records,
+        }
+        return reindexed, changed
+
+    @staticmethod
+    def _unlink(inverted: Dict[str, List[str]], name: str, emojis: List[str]) -> None:
+        for emoji in emojis:
+            names = inverted.get(emoji)
+            if names is None:
+                continue
+            if name in names:
+                names.remove(name)
+            if not names:
+                del inverted[emoji]
+
+
+def build_index(force: bool = False) -> Tuple[EmojiIndex, Dict[str, int], bool]:
+    """Persisted index with stale sources refreshed (in memory).
+
+    Returns (index, records re-indexed per source, anything changed).
+    """
+    index = EmojiIndex() if force else EmojiIndex.load()
+    stats: Dict[str, int] = {}
+    any_changed = False
+    for kind, (path, extract) in SOURCES.items():
+        reindexed, changed = index.refresh(kind, path, extract, force=force)
+        stats[kind] = reindexed
+        any_changed = any_changed or changed
+    return index, stats, any_changed
+
+
+def write_outputs(index: EmojiIndex) -> Tuple[bool, bool]:
+    """Write emoji_index.json and EmojiIndex.gd together; (json written, gd written)."""
+    return write_text_atomic(INDEX_PATH, index.to_text()), write_text_atomic(GD_PATH, render_gdscript(index))
+
+
+_LOADED: Optional[EmojiIndex] = None
+
+
+def load_index() -> EmojiIndex:
+    """Up-to-date index for tools; read-only (run this tool to persist a refresh)."""
+    global _LOADED
+    if _LOADED is None:
+        _LOADED, _, _ = build_index()
+    return _LOADED
+
+
+def _gd_dict(mapping: Dict[str, List[str]]) -> List[str]:
+    lines = ["{"]
+    for emoji in sorted(mapping):
+        names = ", ".join(json.dumps(n, ensure_ascii=False) for n in mapping[emoji])
+        lines.append(f"\t{json.dumps(emoji, ensure_ascii=False)}: [{names}],")
+    lines.append("}")
+    return lines
+
+
+def render_gdscript(index: EmojiIndex) -> str:
+    lines = [
+        "class_name EmojiIndex",
+        "extends RefCounted",
+        "",
+        "## Emoji -> biome / faction inverted index",
+        "## Generated by tools/emoji_index.py from biomes_merged.json and factions_merged.json",
+        "## Do not edit by hand; re-run the tool after changing the merged data.",
+        "",
+        f"const BIOMES_SHA256 = {json.dumps(index.sources['biomes']['sha256'])}",
+        f"const FACTIONS_SHA256 = {json.dumps(index.sources['factions']['sha256'])}",
+        "",
+    ]
+    lines.append("const EMOJI_TO_BIOMES = " + "\n".join(_gd_dict(index.inverted["biomes"])))
+    lines.append("")
+    lines.append("const EMOJI_TO_FACTIONS = " + "\n".join(_gd_dict(index.inverted["factions"])))
+    lines.append("")
+    lines.append("")
+    lines.append("## Keys have variation selectors stripped (tools/emoji_registry.py)")
+    lines.append("static func normalize_emoji(emoji: String) -> String:")
+    lines.append("\treturn emoji.replace(\"\\uFE0F\", \"\").replace(\"\\uFE0E\", \"\")")
+    lines.append("")
+    lines.append("")
+    lines.append("static func get_biomes_for_emoji(emoji: String) -> Array:")
+    lines.append("\treturn EMOJI_TO_BIOMES.get(normalize_emoji(emoji), [])")
+    lines.append("")
+    lines.append("")
+    lines.append("static func get_factions_for_emoji(emoji: String) -> Array:")
+    lines.append("\treturn EMOJI_TO_FACTIONS.get(normalize_emoji(emoji), [])")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--force", action="store_true", help="Rebuild from scratch")
+    args = parser.parse_args()
+
+    index, stats, _ = build_index(force=args.force)
+    wrote_json, wrote_gd = write_outputs(index)
+    print(f"Biomes re-indexed: {stats['biomes']}, factions re-indexed: {stats['factions']}")
+    print(
+        f"Emojis: {len(index.inverted['biomes'])} in biomes, "
+        f"{len(index.inverted['factions'])} in factions"
+    )
+    print(f"Index: {INDEX_PATH} ({'written' if wrote_json else 'unchanged'})")
+    print(f"GDScript: {GD_PATH} ({'written' if wrote_gd else 'unchanged'})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
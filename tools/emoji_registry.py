@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Global emoji registry with dense integer IDs.
+
+Emoji strings are dict keys all over the data: biome `emojis` and
+`icon_components`, faction `sig`/`self_energies`/`hamiltonian`, quest
+vocabulary. The same emoji is sometimes spelled with and sometimes
+without a variation selector ("☀" in biomes_merged.json, "☀️" in the quest
+demos), which makes lookups miss silently.
+
+The registry normalizes every spelling to one key (variation selectors
+U+FE0E/U+FE0F stripped), assigns dense IDs 0..N-1 in sorted key order,
+and gives O(1) emoji -> ID and ID -> emoji lookup. It is a read-only
+Mapping[str, int], so it can be passed anywhere an `emoji_index` is
+expected. Array helpers turn emoji-keyed tables into NumPy vectors and
+matrices indexed by ID.
+
+Sources are JSON data files and Python vocabulary/demo modules; from the
+latter, string literals are read with `ast` (nothing is imported).
+
+Users: tools/emoji_index.py keys its inverted index by normalize_emoji(),
+and convert_faction_lexicon_v2_1.py --packed numbers the faction
+self-energy/hamiltonian operator tables by registry ID.
+
+Usage:
+    python tools/emoji_registry.py [--out exports/emoji_registry.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import unicodedata
+from collections import defaultdict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SOURCES = [
+    ROOT / "Core" / "Biomes" / "data" / "biomes_merged.json",
+    ROOT / "Core" / "Factions" / "data" / "factions_merged.json",
+    ROOT / "llm_inbox" / "quest_vocabulary_unlimited.py",
+    ROOT / "llm_inbox" / "quest_demo.py",
+]
+DEFAULT_OUT = ROOT / "exports" / "emoji_registry.json"
+
+VARIATION_SELECTORS = {"\ufe0e", "\ufe0f"}
+ZWJ = "\u200d"
+KEYCAP = "\u20e3"
+
+# Longest emoji sequences in practice (ZWJ families, flags with tags)
+_MAX_EMOJI_LEN = 16
+
+
+def normalize_emoji(emoji: str) -> str:
+    """Registry key for an emoji: variation selectors removed."""
+    if not any(ch in VARIATION_SELECTORS for ch in emoji):
+        return emoji
+    return "".join(ch for ch in emoji if ch not in VARIATION_SELECTORS)
+
+
+def looks_like_emoji(value: str) -> bool:
+    """True for a short string made only of pictographic symbols.
+
+    Deliberately loose: accepts any run of non-ASCII So/Sk symbols joined by ZWJ,
+    variation selectors, skin-tone/keycap modifiers or regional indicators,
+    and rejects anything with letters, digits (outside keycaps) or spaces.
+    """
+    if not value or len(value) > _MAX_EMOJI_LEN:
+        return False
+    has_symbol = False
+    for ch in value:
+        if ch in VARIATION_SELECTORS or ch == ZWJ or ch == KEYCAP:
+            continue
+        category = unicodedata.category(ch)
+        if category == "So" or (category == "Sk" and ord(ch) > 0x7F):
+            has_symbol = True
+        elif category in ("Mn", "Me", "Cf"):
+            continue
+        elif ch.isdigit() or ch in "#*":
+            if KEYCAP not in value:
+                return False
+        else:
+            return False
+    return has_symbol or KEYCAP in value
+
+
+def iter_emojis(data: Any) -> Iterator[str]:
+    """Yield every emoji-looking string in a JSON tree (keys and values)."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(key, str) and looks_like_emoji(key):
+                    yield key
+                stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, str) and looks_like_emoji(node):
+            yield node
+
+
+def iter_source_emojis(path: Path) -> Iterator[str]:
+    """Emojis in a JSON data file, or in the string literals of a Python module."""
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".py":
+        for node in ast.walk(ast.parse(text, filename=str(path))):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and looks_like_emoji(node.value):
+                yield node.value
+    else:
+        yield from iter_emojis(json.loads(text))
+
+
+class EmojiRegistry(Mapping):
+    """Dense, normalized emoji <-> ID table."""
+
+    def __init__(self, emojis: Iterable[str] = ()):
+        spellings: Dict[str, Set[str]] = defaultdict(set)
+        for emoji in emojis:
+            spellings[normalize_emoji(emoji)].add(emoji)
+        self._emojis: List[str] = sorted(spellings)
+        self._ids: Dict[str, int] = {e: i for i, e in enumerate(self._emojis)}
+        self._spellings: Dict[str, List[str]] = {
+            key: sorted(forms) for key, forms in spellings.items()
+        }
+
+    @classmethod
+    def from_files(cls, paths: Iterable[Path], extra: Iterable[str] = ()) -> "EmojiRegistry":
+        """Build from data files (JSON or Python vocabulary modules) plus any extra emoji."""
+        found: List[str] = list(extra)
+        for path in paths:
+            found.extend(iter_source_emojis(path))
+        return cls(found)
+
+    @classmethod
+    def load(cls, path: Path) -> "EmojiRegistry":
+        """Load a registry saved by save(); IDs are preserved."""
+        with Path(path).open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        registry = cls()
+        registry._emojis = list(data["emojis"])
+        registry._ids = {e: i for i, e in enumerate(registry._emojis)}
+        registry._spellings = {k: list(v) for k, v in data.get("spellings", {}).items()}
+        return registry
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {"emojis": self._emojis, "spellings": self._spellings},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    # Mapping[str, int] ------------------------------------------------------
+
+    def __getitem__(self, emoji: str) -> int:
+        return self._ids[normalize_emoji(emoji)]
+
+    def __contains__(self, emoji: object) -> bool:
+        return isinstance(emoji, str) and normalize_emoji(emoji) in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._emojis)
+
+    def __len__(self) -> int:
+        return len(self._emojis)
+
+    # Lookup -----------------------------------------------------------------
+
+    def id(self, emoji: str, default: Optional[int] = None) -> Optional[int]:
+        """ID for any spelling of an emoji."""
+        return self._ids.get(normalize_emoji(emoji), default)
+
+    def emoji(self, emoji_id: int) -> str:
+        """Normalized emoji for an ID."""
+        return self._emojis[emoji_id]
+
+    def spellings(self, emoji: str) -> List[str]:
+        """Every spelling seen in the sources for this emoji."""
+        return self._spellings.get(normalize_emoji(emoji), [])
+
+    def variants(self) -> Dict[str, List[str]]:
+        """Emojis that appear under more than one spelling."""
+        return {k: v for k, v in self._spellings.items() if len(v) > 1}
+
+    # Arrays -----------------------------------------------------------------
+
+    def ids(self, emojis: Iterable[str]):
+        """NumPy array of IDs (-1 for emojis not in the registry)."""
+        import numpy as np
+
+        return np.fromiter((self._ids.get(normalize_emoji(e), -1) for e in emojis), dtype=np.intp)
+
+    def dense_vector(self, table: Dict[str, Any], dtype=float):
+        """Emoji-keyed table (e.g. self_energies) as a vector indexed by ID."""
+        import numpy as np
+
+        out = np.zeros(len(self._emojis), dtype=dtype)
+        for emoji, value in table.items():
+            emoji_id = self.id(emoji)
+            if emoji_id is not None:
+                out[emoji_id] = _coerce(value, dtype)
+        return out
+
+    def dense_matrix(self, table: Dict[str, Dict[str, Any]], dtype=complex):
+        """Nested emoji-keyed table (e.g. hamiltonian couplings) as an ID x ID matrix.
+
+        Couplings given as [re, im] pairs or {"re", "im"} dicts become complex.
+        """
+        import numpy as np
+
+        size = len(self._emojis)
+        out = np.zeros((size, size), dtype=dtype)
+        for source, row in table.items():
+            i = self.id(source)
+            if i is None or not isinstance(row, dict):
+                continue
+            for target, value in row.items():
+                j = self.id(target)
+                if j is not None:
+                    out[i, j] = _coerce(value, dtype)
+        return out
+
+
+def _coerce(value: Any, dtype) -> Any:
+    """Numbers, [re, im] pairs and {"re", "im"} dicts as a scalar of dtype."""
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        value = complex(value[0], value[1])
+    elif isinstance(value, dict) and ("re" in value or "im" in value):
+        value = complex(value.get("re", 0.0), value.get("im", 0.0))
+    if isinstance(value, complex) and dtype is not complex:
+        return value.real
+    return value
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sources", nargs="*", type=Path,
+                        help="JSON data files or Python vocabulary modules (default: merged biomes + factions, "
+                             "quest vocabulary and demo)")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    args = parser.parse_args()
+
+    sources = args.sources or DEFAULT_SOURCES
+    registry = EmojiRegistry.from_files(sources)
+    registry.save(args.out)
+
+    print(f"Registered {len(registry)} emojis from {len(sources)} files")
+    variants = registry.variants()
+    if variants:
+        print(f"Emojis with multiple spellings ({len(variants)}):")
+        for key in sorted(variants):
+            forms = ", ".join(" ".join(f"U+{ord(ch):04X}" for ch in form) for form in variants[key])
+            print(f"  {key}: {forms}")
+    print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
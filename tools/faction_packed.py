@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Loader and size/parse report for the packed faction export.
+
+`convert_faction_lexicon_v2_1.py --packed` writes
+Core/Factions/FactionPackedData.gd: struct-of-arrays consts (bits packed
+into one int per faction, signature/self-energy emojis as IDs into a
+shared EMOJI_TABLE, hamiltonian couplings as flat (i, j, re, im) floats).
+This module reads that same file for tooling:
+
+    packed = load_packed()
+    i = packed.find("Black Horizon")
+    packed.bits(i), packed.signature(i), packed.hamiltonian(i)
+    packed.record(i)        # same shape as the factions_merged.json fields,
+                            # emojis in registry spelling (no VS15/VS16)
+
+Run as a script to compare size, container count and parse time against
+the generated Core/Quests/FactionDatabaseV2.gd it replaces (the nested
+ALL_FACTIONS Dictionary literals, as emitted today and with the physics
+fields emitted the same way), and to check the export round-trips
+against factions_merged.json.
+
+Usage:
+    python tools/faction_packed.py [--repeat 50] [--report exports/faction_packed_report.md]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from data_snapshot import FACTIONS_MERGED, thaw
+from emoji_registry import normalize_emoji
+from godot_tres import dump, parse_value
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKED_PATH = ROOT / "Core" / "Factions" / "FactionPackedData.gd"
+GD_DATABASE_PATH = ROOT / "Core" / "Quests" / "FactionDatabaseV2.gd"
+
+PACKED_FIELDS = ("bits", "sig", "self_energies", "hamiltonian")
+
+_CONST_RE = re.compile(r"^const (\w+) = (Packed\w+Array)\((\[.*\])\)$", re.MULTILINE)
+_INT_RE = re.compile(r"^const (\w+) = (-?\d+)\b", re.MULTILINE)
+_TYPECODES = {"PackedInt32Array": "i", "PackedInt64Array": "q", "PackedFloat64Array": "d"}
+_PACKED_LITERAL_RE = re.compile(r"^const (\w+) = ((Packed\w+Array)\(\[.*\]\))$", re.MULTILINE)
+_GD_CONST_RE = re.compile(r"^const (\w+) = ", re.MULTILINE)
+_GD_CONST_END_RE = re.compile(r"^(?:##|const |static func |func )", re.MULTILINE)
+
+
+class PackedFactions:
+    """Read-only view over the packed tables (row i = faction i)."""
+
+    def __init__(self, tables: Dict[str, Any], constants: Dict[str, int]):
+        self.tables = tables
+        self.constants = constants
+        self.stride = constants.get("COUPLING_STRIDE", 4)
+        self.bits_width = constants.get("BITS_WIDTH", 12)
+        self.emojis: List[str] = tables["EMOJI_TABLE"]
+        self.names: List[str] = tables["NAMES"]
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def find(self, name: str) -> Optional[int]:
+        return self._index.get(name)
+
+    def _span(self, field: str, index: int) -> range:
+        offsets = self.tables[f"{field}_OFFSETS"]
+        return range(offsets[index], offsets[index + 1])
+
+    def bits(self, index: int) -> List[int]:
+        packed = self.tables["BITS"][index]
+        return [(packed >> axis) & 1 for axis in range(self.bits_width)]
+
+    def signature(self, index: int) -> List[str]:
+        ids = self.tables["SIG_IDS"]
+        return [self.emojis[ids[k]] for k in self._span("SIG", index)]
+
+    def self_energies(self, index: int) -> Dict[str, float]:
+        ids = self.tables["SELF_ENERGY_IDS"]
+        values = self.tables["SELF_ENERGY_VALUES"]
+        return {self.emojis[ids[k]]: values[k] for k in self._span("SELF_ENERGY", index)}
+
+    def hamiltonian(self, index: int) -> Dict[str, Dict[str, Any]]:
+        """Couplings as in the JSON: a float, or [re, im] when complex."""
+        flat = self.tables["COUPLINGS"]
+        result: Dict[str, Dict[str, Any]] = {}
+        for k in self._span("COUPLING", index):
+            base = k * self.stride
+            source = self.emojis[int(flat[base])]
+            target = self.emojis[int(flat[base + 1])]
+            re_part, im_part = flat[base + 2], flat[base + 3]
+            result.setdefault(source, {})[target] = [re_part, im_part] if im_part != 0.0 else re_part
+        return result
+
+    def record(self, index: int) -> Dict[str, Any]:
+        return {
+            "name": self.names[index],
+            "ring": self.tables["RINGS"][index],
+            "domain": self.tables["DOMAINS"][index],
+            "bits": self.bits(index),
+            "sig": self.signature(index),
+            "self_energies": self.self_energies(index),
+            "hamiltonian": self.hamiltonian(index),
+        }
+
+
+def _normalized(value: Any) -> Any:
+    """Emoji keys and strings as the packed export stores them (registry spelling)."""
+    if isinstance(value, dict):
+        return {normalize_emoji(k): _normalized(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalized(v) for v in value]
+    return normalize_emoji(value) if isinstance(value, str) else value
+
+
+def parse_packed(text: str) -> PackedFactions:
+    """Parse the consts of a FactionPackedData.gd text."""
+    tables: Dict[str, Any] = {}
+    for name, type_name, body in _CONST_RE.findall(text):
+        values = json.loads(body)
+        typecode = _TYPECODES.get(type_name)
+        tables[name] = array(typecode, values) if typecode else values
+    constants = {name: int(value) for name, value in _INT_RE.findall(text)}
+    return PackedFactions(tables, constants)
+
+
+def load_packed(path: Path = PACKED_PATH) -> PackedFactions:
+    return parse_packed(path.read_text(encoding="utf-8"))
+
+
+def gd_const_literal(text: str, name: str) -> str:
+    """Source text of a (possibly multi-line) const value in a generated .gd file."""
+    for match in _GD_CONST_RE.finditer(text):
+        if match.group(1) == name:
+            rest = text[match.end():]
+            end = _GD_CONST_END_RE.search(rest)
+            return rest[:end.start() if end else len(rest)].strip()
+    raise KeyError(f"const {name} not found")
+
+
+def _render_entries(records: List[Dict[str, Any]]) -> str:
+    """ALL_FACTIONS-style nested literals: one Dictionary per faction."""
+    return "[\n" + ",\n".join("\t" + dump(record) for record in records) + "\n]"
+
+
+def _count_containers(value: Any) -> int:
+    if isinstance(value, dict):
+        return 1 + sum(_count_containers(v) for v in value.values())
+    if isinstance(value, list):
+        return 1 + sum(_count_containers(v) for v in value)
+    return 0
+
+
+def _best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def build_report(repeat: int) -> List[str]:
+    factions = json.loads(FACTIONS_MERGED.read_text(encoding="utf-8"))
+    packed_text = PACKED_PATH.read_text(encoding="utf-8")
+    database_text = GD_DATABASE_PATH.read_text(encoding="utf-8")
+    packed = parse_packed(packed_text)
+
+    mismatches = []
+    for i, faction in enumerate(factions):
+        unpacked = packed.record(i)
+        for field in PACKED_FIELDS:
+            expected = _normalized(thaw(faction.get(field, {} if field != "sig" else [])))
+            if unpacked[field] != expected:
+                mismatches.append(f"{faction['name']}.{field}")
+
+    # What the packed tables replace: ALL_FACTIONS as generated today (bits
+    # and sig nested per faction), and the same entries with self_energies
+    # and hamiltonian emitted as nested literals too
+    all_factions = gd_const_literal(database_text, "ALL_FACTIONS")
+    entries = parse_value(all_factions).to_python()
+    with_physics = _render_entries([
+        dict(entry, **{k: factions[i].get(k, {}) for k in ("self_energies", "hamiltonian")})
+        for i, entry in enumerate(entries)
+    ])
+    packed_literals = [body for _, body, _ in _PACKED_LITERAL_RE.findall(packed_text)]
+
+    # One GDScript literal parser (tools/godot_tres.py) for every source
+    database_ms = _best_time(lambda: parse_value(all_factions), repeat)
+    physics_ms = _best_time(lambda: parse_value(with_physics), repeat)
+    packed_ms = _best_time(lambda: [parse_value(body) for body in packed_literals], repeat)
+
+    def kb(text: str) -> str:
+        return f"{len(text.encode('utf-8')) / 1024:.1f} KB"
+
+    lines = [
+        "# Packed Faction Export Report",
+        "",
+        f"Factions: {len(factions)}, emoji table: {len(packed.emojis)}, "
+        f"couplings: {len(packed.tables['COUPLINGS']) // packed.stride}",
+        "",
+        "| Source | Size | Containers | Parse (best of %d) |" % repeat,
+        "|---|---|---|---|",
+        f"| FactionDatabaseV2.gd ALL_FACTIONS (as generated: bits, sig, lore) | {kb(all_factions)} | "
+        f"{_count_containers(entries)} | {database_ms:.2f} ms |",
+        f"| ALL_FACTIONS + self_energies, hamiltonian nested | {kb(with_physics)} | "
+        f"{_count_containers(parse_value(with_physics).to_python())} | {physics_ms:.2f} ms |",
+        f"| FactionPackedData.gd | {kb(packed_text)} | {len(packed_literals)} | {packed_ms:.2f} ms |",
+        "",
+        f"FactionDatabaseV2.gd (whole file, incl. mottos/descriptions and indexes): {kb(database_text)}",
+        "",
+        "Containers = Dictionaries/Arrays the loader allocates (packed: one per table).",
+        "Parse times use the same GDScript literal parser (tools/godot_tres.py) for",
+        "every source; Godot parses these consts once at script load.",
+        "",
+        f"Round trip: {'OK' if not mismatches else 'MISMATCH ' + ', '.join(mismatches[:10])}",
+    ]
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--report", type=Path, help="Also write the report as markdown")
+    args = parser.parse_args()
+
+    if not PACKED_PATH.exists():
+        print(f"{PACKED_PATH} not found; run convert_faction_lexicon_v2_1.py --packed first")
+        return 1
+
+    lines = build_report(args.repeat)
+    print("\n".join(lines))
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return 0 if lines[-1].endswith("OK") else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
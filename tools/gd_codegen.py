@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Shared GDScript code generation pipeline for the faction generators.
+
+convert_faction_lexicon_v2_1.py (FactionDatabaseV2.gd, FactionPackedData.gd)
+and Scripts/convert_faction_json_to_gd.py (FactionDatabase.gd) both build
+their output here:
+
+  - literals: escape_gdscript_string, format_emoji_array, format_bits_array
+  - fragments: each record renders through its generator's template into
+    one fragment (render_fragments); Dictionary-shaped fragments use
+    dict_fragment, so every generated dict is laid out the same way
+  - assembly: GDScriptFile collects the header, consts, fragment lists
+    and helper functions, and write() goes through write_if_changed(),
+    which leaves the file alone when the bytes are identical, so Godot
+    does not reimport an unchanged script.
+
+    script = GDScriptFile("FactionDatabaseV2", "RefCounted", ["Generated from ..."])
+    script.const("TOTAL_FACTIONS", str(len(factions)))
+    script.const_list("ALL_FACTIONS", render_fragments(factions, render_faction_entry))
+    script.write(output_path)
+
+Rendering every faction takes a few milliseconds, about what hashing the
+records for a fragment cache would cost, so output is always rendered in
+full; skipping the disk write is what saves Godot the reimport.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from json_splice import write_text_atomic
+
+
+def escape_gdscript_string(s: Optional[str]) -> str:
+    """Escape a string for GDScript"""
+    if s is None:
+        return '""'
+    # Escape backslashes first, then quotes
+    s = s.replace('\\', '\\\\')
+    s = s.replace('"', '\\"')
+    # Escape newlines
+    s = s.replace('\n', '\\n')
+    return f'"{s}"'
+
+
+def format_emoji_array(emojis: Iterable[str]) -> str:
+    """Format an emoji array for GDScript"""
+    return "[" + ", ".join(f'"{emoji}"' for emoji in emojis) + "]"
+
+
+def format_bits_array(bits: Iterable[int]) -> str:
+    """Format a bits array for GDScript"""
+    return "[" + ", ".join(str(b) for b in bits) + "]"
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write the generated file only if its bytes differ; True if written."""
+    return write_text_atomic(Path(path), content)
+
+
+def dict_fragment(entries: Iterable[Tuple[str, str]], depth: int = 1, prefix: str = "") -> str:
+    """Dictionary literal, one `"key": value` line per entry (values already rendered).
+
+    depth is the indent of the entries; braces sit one level out, after
+    `prefix` (e.g. "const NAME = ").
+    """
+    outer = "\t" * (depth - 1)
+    inner = "\t" * depth
+    items = [f"{inner}{escape_gdscript_string(key)}: {value}" for key, value in entries]
+    return "\n".join([f"{outer}{prefix}{{", *([",\n".join(items)] if items else []), f"{outer}}}"])
+
+
+def render_fragments(records: Iterable[Any], template: Callable[[Any], str]) -> List[str]:
+    """One fragment per record, in order"""
+    return [template(record) for record in records]
+
+
+class GDScriptFile:
+    """A generated script assembled from lines, consts and fragment lists."""
+
+    def __init__(self, class_name: str, extends: str, comments: Sequence[str] = ()):
+        self.lines: List[str] = [f"class_name {class_name}", f"extends {extends}", ""]
+        if comments:
+            self.lines.extend(f"## {comment}" for comment in comments)
+            self.lines.append("")
+
+    def add(self, *lines: str) -> "GDScriptFile":
+        self.lines.extend(lines)
+        return self
+
+    def const(self, name: str, value: str) -> "GDScriptFile":
+        return self.add(f"const {name} = {value}")
+
+    def const_list(self, name: str, fragments: Sequence[str], trailing_comma: bool = False) -> "GDScriptFile":
+        """const NAME = [ ...fragments... ] with one fragment per element"""
+        self.add(f"const {name} = [")
+        if trailing_comma:
+            self.lines.extend(fragment + "," for fragment in fragments)
+        elif fragments:
+            self.add(",\n".join(fragments))
+        return self.add("]")
+
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    def write(self, path: Path) -> bool:
+        return write_if_changed(path, self.text())
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""Godot text resource (.tres/.tscn) tokenizer, parser and minimal-diff writer.
+
+One pass over the text turns it into sections and typed value nodes,
+each carrying the (start, end) span of its source text:
+
+    doc = TresDocument(text)
+    resource = doc.section("resource")
+    plots = resource.properties["plots"]          # Node(kind="array")
+    for plot in plots.items:
+        plot.get("position").to_python()          # GodotCall("Vector2i", (0, 0))
+    doc.replace(resource.properties["grid_width"], "6")
+    doc.set_property(resource, "theta_frozen", dump(False))
+    new_text = doc.apply()
+
+Values: strings, StringName (&"x") and NodePath (^"x") literals, ints,
+floats (incl. inf/nan), true/false/null, arrays, dictionaries, typed
+Array[T](...), constructor calls such as Vector2i(0, 0) or
+ExtResource("1_x"), and Godot 4 inline objects,
+Object(Resource,"script":Resource("res://x.gd"),"value":1), whose class
+name is a bare identifier and whose properties are "key": value
+arguments. Edits replace only their spans, so untouched bytes are
+written back exactly; dump() formats new values the way Godot does.
+
+Tokenizing and parsing are one pass with no regex backtracking over
+nested structures, but every token is a Python object: measured on
+synthetic saves (save_migrations.synthetic_legacy_save) at 0.4-0.6 s/MB
+once the cyclic GC is paused (1.5 MB: 0.8 s, 12 MB: 4.6 s), a third or
+more of it in tokenize(). Saves of tens of MB take tens of seconds.
+"""
+
+from __future__ import annotations
+
+import gc
+import math
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+Span = Tuple[int, int]
+
+# Leading whitespace is part of each match, so a token costs one regex call
+_TOKEN_RE = re.compile(
+    r"""
+    [ \t\r\n]*
+    (?:
+        (?P<comment>;[^\n]*)
+      | (?P<string>[&^]?"(?:[^"\\]|\\.)*")
+      | (?P<number>-?(?:inf\b|nan\b|\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?))
+      | (?P<ident>[A-Za-z_][A-Za-z0-9_/]*)
+      | (?P<punct>[\[\]{}(),:=])
+      | (?P<error>[^ \t\r\n])
+    )
+    """,
+    re.VERBOSE,
+)
+
+_STRING_KINDS = {"&": "stringname", "^": "nodepath"}
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\", "b": "\b", "f": "\f"}
+
+
+class TresSyntaxError(ValueError):
+    """Malformed resource text (with the offending offset)."""
+
+    def __init__(self, message: str, pos: int, text: str = ""):
+        line = text.count("\n", 0, pos) + 1 if text else 0
+        super().__init__(f"{message} at offset {pos}" + (f" (line {line})" if line else ""))
+        self.pos = pos
+
+
+class Token:
+    __slots__ = ("kind", "text", "start", "end")
+
+    def __init__(self, kind: str, text: str, start: int, end: int):
+        self.kind = kind
+        self.text = text
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return f"Token({self.kind}, {self.text!r}, {self.start})"
+
+
+def tokenize(text: str) -> Iterator[Token]:
+    """Tokens of a resource text (whitespace and comments dropped)."""
+    for m in _TOKEN_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == "comment":
+            continue
+        start = m.start(kind)
+        if kind == "error":
+            raise TresSyntaxError(f"unexpected character {text[start]!r}", start, text)
+        yield Token(kind, m.group(kind), start, m.end())
+
+
+def unescape(literal: str) -> str:
+    """Contents of a quoted literal (prefix and quotes stripped)."""
+    body = literal[literal.index('"') + 1:-1]
+    if "\\" not in body:
+        return body
+    out: List[str] = []
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch == "\\" and i + 1 < len(body):
+            nxt = body[i + 1]
+            if nxt == "u" and i + 5 < len(body):
+                out.append(chr(int(body[i + 2:i + 6], 16)))
+                i += 6
+                continue
+            out.append(_ESCAPES.get(nxt, nxt))
+            i += 2
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+class GodotCall(tuple):
+    """A constructor value, e.g. Vector2i(0, 0) -> GodotCall("Vector2i", (0, 0)).
+
+    Inline objects also carry their "key": value arguments:
+    Object(Resource,"a":1) -> GodotCall("Object", (Identifier("Resource"),), {"a": 1}).
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, name: str, args=(), properties: Optional[Dict[Any, Any]] = None):
+        return tuple.__new__(cls, (name, tuple(args), tuple((properties or {}).items())))
+
+    @property
+    def name(self) -> str:
+        return self[0]
+
+    @property
+    def args(self) -> tuple:
+        return self[1]
+
+    @property
+    def properties(self) -> Dict[Any, Any]:
+        return dict(self[2])
+
+    def __repr__(self) -> str:
+        parts = [repr(a) for a in self.args] + [f"{k!r}: {v!r}" for k, v in self[2]]
+        return f"{self.name}({', '.join(parts)})"
+
+
+class Identifier(str):
+    """Bare name argument, e.g. the class in Object(Resource, ...)."""
+
+
+class StringName(str):
+    """&"name" literal."""
+
+
+class NodePath(str):
+    """^"path" literal."""
+
+
+class Node:
+    """A parsed value: kind, python scalar or children, and its source span.
+
+    kind is one of string, stringname, nodepath, int, float, bool, null,
+    ident, array, dict, call. Arrays keep `items`, dicts `entries` (key
+    node, value node), calls `name`, `items` (positional arguments) and
+    `entries` ("key": value arguments of inline objects); typed arrays are
+    calls named "Array[T]". ident is a bare name argument of a call.
+    """
+
+    __slots__ = ("kind", "value", "items", "entries", "name", "start", "end")
+
+    def __init__(self, kind: str, start: int, end: int, value: Any = None):
+        self.kind = kind
+        self.value = value
+        self.items: List["Node"] = []
+        self.entries: List[Tuple["Node", "Node"]] = []
+        self.name = ""
+        self.start = start
+        self.end = end
+
+    @property
+    def span(self) -> Span:
+        return self.start, self.end
+
+    def get(self, key: Any, default: Optional["Node"] = None) -> Optional["Node"]:
+        """Value node of a dict entry by (python) key."""
+        for k, v in self.entries:
+            if k.value == key:
+                return v
+        return default
+
+    def to_python(self) -> Any:
+        if self.kind in ("string", "int", "float", "bool", "null"):
+            return self.value
+        if self.kind == "stringname":
+            return StringName(self.value)
+        if self.kind == "nodepath":
+            return NodePath(self.value)
+        if self.kind == "ident":
+            return Identifier(self.value)
+        if self.kind == "array":
+            return [item.to_python() for item in self.items]
+        if self.kind == "dict":
+            result = {}
+            for k, v in self.entries:
+                key = k.to_python()
+                result[key if not isinstance(key, (list, dict)) else repr(key)] = v.to_python()
+            return result
+        return GodotCall(
+            self.name,
+            [item.to_python() for item in self.items],
+            {k.to_python(): v.to_python() for k, v in self.entries},
+        )
+
+    def __repr__(self) -> str:
+        return f"Node({self.kind}, {self.start}:{self.end})"
+
+
+class Section:
+    """[tag attr=value ...] header plus the properties that follow it."""
+
+    __slots__ = ("tag", "attrs", "properties", "keys", "start", "header_end", "end")
+
+    def __init__(self, tag: str, start: int):
+        self.tag = tag
+        self.attrs: Dict[str, Node] = {}
+        self.properties: Dict[str, Node] = {}
+        self.keys: Dict[str, Span] = {}  # property name -> span of the name
+        self.start = start
+        self.header_end = start
+        self.end = start
+
+    def __repr__(self) -> str:
+        return f"Section({self.tag}, {len(self.properties)} properties)"
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.tok: Optional[Token] = next(self.tokens, None)
+
+    def error(self, message: str) -> TresSyntaxError:
+        pos = self.tok.start if self.tok else len(self.text)
+        return TresSyntaxError(message, pos, self.text)
+
+    def advance(self) -> Token:
+        tok = self.tok
+        if tok is None:
+            raise self.error("unexpected end of resource")
+        self.tok = next(self.tokens, None)
+        return tok
+
+    def expect(self, text: str) -> Token:
+        if self.tok is None or self.tok.text != text:
+            raise self.error(f"expected {text!r}")
+        return self.advance()
+
+    def at(self, text: str) -> bool:
+        return self.tok is not None and self.tok.kind == "punct" and self.tok.text == text
+
+    def value(self, in_call: bool = False) -> Node:
+        tok = self.advance()
+        kind = tok.kind
+        if kind == "string":
+            return Node(_STRING_KINDS.get(tok.text[0], "string"), tok.start, tok.end, unescape(tok.text))
+        if kind == "number":
+            text = tok.text
+            if text.lstrip("-") in ("inf", "nan"):
+                number = float(text)
+            elif any(c in text for c in ".eE"):
+                number = float(text)
+            else:
+                return Node("int", tok.start, tok.end, int(text))
+            return Node("float", tok.start, tok.end, number)
+        if kind == "punct" and tok.text == "[":
+            return self.sequence(Node("array", tok.start, tok.start), "]")
+        if kind == "punct" and tok.text == "{":
+            return self.mapping(tok.start)
+        if kind == "ident":
+            if tok.text in ("true", "false"):
+                return Node("bool", tok.start, tok.end, tok.text == "true")
+            if tok.text in ("null", "nil"):
+                return Node("null", tok.start, tok.end)
+            name = tok.text
+            if self.at("["):
+                # Typed container: Array[int]([...]) / Dictionary[String, int]({...})
+                self.advance()
+                depth = 1
+                while depth:
+                    t = self.advance()
+                    if t.kind == "punct":
+                        depth += {"[": 1, "]": -1}.get(t.text, 0)
+                name = self.text[tok.start:t.end]
+            if self.at("("):
+                self.advance()
+                call = self.arguments(Node("call", tok.start, tok.start))
+                call.name = name
+                return call
+            if in_call:
+                return Node("ident", tok.start, tok.end, name)
+            raise self.error(f"unexpected identifier {tok.text!r}")
+        raise TresSyntaxError(f"unexpected {tok.text!r}", tok.start, self.text)
+
+    def sequence(self, node: Node, close: str) -> Node:
+        while not self.at(close):
+            node.items.append(self.value())
+            if self.at(","):
+                self.advance()
+            elif not self.at(close):
+                raise self.error(f"expected ',' or {close!r}")
+        node.end = self.advance().end
+        return node
+
+    def arguments(self, node: Node) -> Node:
+        """Call arguments: positional values, then Godot 4 "key": value pairs."""
+        while not self.at(")"):
+            arg = self.value(in_call=True)
+            if self.at(":"):
+                self.advance()
+                node.entries.append((arg, self.value()))
+            else:
+                node.items.append(arg)
+            if self.at(","):
+                self.advance()
+            elif not self.at(")"):
+                raise self.error("expected ',' or ')'")
+        node.end = self.advance().end
+        return node
+
+    def mapping(self, start: int) -> Node:
+        node = Node("dict", start, start)
+        while not self.at("}"):
+            key = self.value()
+            self.expect(":")
+            node.entries.append((key, self.value()))
+            if self.at(","):
+                self.advance()
+            elif not self.at("}"):
+                raise self.error("expected ',' or '}'")
+        node.end = self.advance().end
+        return node
+
+    def document(self) -> List[Section]:
+        sections: List[Section] = []
+        current: Optional[Section] = None
+        while self.tok is not None:
+            tok = self.tok
+            if tok.kind == "punct" and tok.text == "[":
+                self.advance()
+                current = Section(self.advance().text, tok.start)
+                while not self.at("]"):
+                    attr = self.advance()
+                    self.expect("=")
+                    current.attrs[attr.text] = self.value()
+                current.header_end = current.end = self.advance().end
+                sections.append(current)
+                continue
+            if current is None:
+                raise self.error("property outside of a section")
+            key = self.advance()
+            if key.kind not in ("ident", "string"):
+                raise TresSyntaxError(f"expected a property name, got {key.text!r}", key.start, self.text)
+            name = unescape(key.text) if key.kind == "string" else key.text
+            self.expect("=")
+            node = self.value()
+            current.properties[name] = node
+            current.keys[name] = (key.start, key.end)
+            current.end = node.end
+        return sections
+
+
+def parse_value(text: str) -> Node:
+    """Parse a single value (e.g. a property's right-hand side)."""
+    parser = _Parser(text)
+    node = parser.value()
+    if parser.tok is not None:
+        raise parser.error("trailing text after value")
+    return node
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+def _dump_float(value: float) -> str:
+    if math.isnan(value):
+        return "nan"
+    if math.isinf(value):
+        return "inf" if value > 0 else "-inf"
+    return repr(value)
+
+
+def _dump_string(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def dump(value: Any, top_level: bool = False) -> str:
+    """Godot text for a Python value (dicts inline unless top_level)."""
+    if isinstance(value, Node):
+        raise TypeError("dump() takes Python values; use the node's span to copy source text")
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "null"
+    if isinstance(value, GodotCall):
+        if value[2]:
+            # Inline objects are written the way Godot 4 writes them: no spaces
+            parts = [dump(a) for a in value.args] + [f"{dump(k)}:{dump(v)}" for k, v in value[2]]
+            return f"{value.name}({','.join(parts)})"
+        return f"{value.name}({', '.join(dump(a) for a in value.args)})"
+    if isinstance(value, Identifier):
+        return str(value)
+    if isinstance(value, StringName):
+        return "&" + _dump_string(value)
+    if isinstance(value, NodePath):
+        return "^" + _dump_string(value)
+    if isinstance(value, str):
+        return _dump_string(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return _dump_float(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(dump(v) for v in value) + "]"
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        entries = [f"{dump(k)}: {dump(v)}" for k, v in value.items()]
+        if top_level:
+            return "{\n" + ",\n".join(entries) + "\n}"
+        return "{ " + ", ".join(entries) + " }"
+    raise TypeError(f"cannot write {type(value).__name__} to a resource")
+
+
+class TresDocument:
+    """Parsed resource text plus pending span edits."""
+
+    def __init__(self, text: str):
+        self.text = text
+        # A large save is a few million small nodes; the cyclic collector
+        # would rescan them repeatedly while they are being built
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.sections: List[Section] = _Parser(text).document()
+        finally:
+            if enabled:
+                gc.enable()
+        self._edits: List[Tuple[int, int, str]] = []
+
+    @classmethod
+    def load(cls, path) -> "TresDocument":
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return cls(f.read())
+
+    def section(self, tag: str) -> Optional[Section]:
+        for section in self.sections:
+            if section.tag == tag:
+                return section
+        return None
+
+    def source(self, node: Node) -> str:
+        return self.text[node.start:node.end]
+
+    def replace(self, target, text: str) -> None:
+        """Replace a node (or span) with new text."""
+        start, end = target.span if isinstance(target, Node) else target
+        if self.text[start:end] != text:
+            self._edits.append((start, end, text))
+
+    def set_property(self, section: Section, name: str, text: str) -> None:
+        """Replace a property's value, or append the property to the section."""
+        node = section.properties.get(name)
+        if node is not None:
+            self.replace(node, text)
+        else:
+            self._edits.append((section.end, section.end, f"\n{name} = {text}"))
+
+    def remove_property(self, section: Section, name: str) -> None:
+        """Drop a property line (name through value)."""
+        node = section.properties.get(name)
+        if node is None:
+            return
+        start = section.keys[name][0]
+        line_start = self.text.rfind("\n", 0, start)
+        self._edits.append((line_start if line_start >= 0 else start, node.end, ""))
+
+    @property
+    def changed(self) -> bool:
+        return bool(self._edits)
+
+    def apply(self) -> str:
+        """Text with all edits applied; untouched bytes are copied verbatim."""
+        if not self._edits:
+            return self.text
+        pieces: List[str] = []
+        cursor = 0
+        for start, end, replacement in sorted(self._edits, key=lambda e: (e[0], e[1])):
+            if start < cursor:
+                raise ValueError(f"overlapping resource edits at offset {start}")
+            pieces.append(self.text[cursor:start])
+            pieces.append(replacement)
+            cursor = end
+        pieces.append(self.text[cursor:])
+        return "".join(pieces)
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Minimal-diff edits to hand-formatted JSON files.
+
+The merged data files mix json.dump output with hand-compacted records
+(e.g. `{"x": 0.35, "y": 0.4}` on one line). Re-dumping a whole file to
+change one value rewrites every such record. These helpers locate the
+exact text span of a value and replace only that span, so untouched
+records keep their bytes and git diffs stay small.
+
+    splicer = JsonSplicer(text)
+    spans = splicer.array_items()                 # top-level records
+    members = splicer.members(spans[3][0])        # key -> value span
+    splicer.replace(members["icon_components"], new_value)
+    splicer.append_item(new_record)
+    splicer.remove_item(7)
+    new_text = splicer.apply()
+
+iter_array_file() streams the items of a large top-level array without
+loading the whole file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+Span = Tuple[int, int]
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _expect(text: str, pos: int, char: str) -> int:
+    pos = _skip_ws(text, pos)
+    if text[pos:pos + 1] != char:
+        raise ValueError(f"expected {char!r} at offset {pos}")
+    return pos + 1
+
+
+def value_span(text: str, pos: int) -> Span:
+    """Span of the JSON value starting at (or after whitespace from) pos."""
+    start = _skip_ws(text, pos)
+    _, end = _DECODER.raw_decode(text, start)
+    return start, end
+
+
+def array_items(text: str, pos: int = 0) -> List[Span]:
+    """Spans of the items of the array starting at pos."""
+    pos = _expect(text, pos, "[")
+    spans: List[Span] = []
+    pos = _skip_ws(text, pos)
+    if text[pos:pos + 1] == "]":
+        return spans
+    while True:
+        span = value_span(text, pos)
+        spans.append(span)
+        pos = _skip_ws(text, span[1])
+        if text[pos:pos + 1] == ",":
+            pos += 1
+            continue
+        _expect(text, pos, "]")
+        return spans
+
+
+def object_members(text: str, pos: int) -> Dict[str, Span]:
+    """Value spans of the members of the object starting at pos."""
+    pos = _expect(text, pos, "{")
+    members: Dict[str, Span] = {}
+    pos = _skip_ws(text, pos)
+    if text[pos:pos + 1] == "}":
+        return members
+    while True:
+        key, pos = _DECODER.raw_decode(text, _skip_ws(text, pos))
+        pos = _expect(text, pos, ":")
+        span = value_span(text, pos)
+        members[key] = span
+        pos = _skip_ws(text, span[1])
+        if text[pos:pos + 1] == ",":
+            pos += 1
+            continue
+        _expect(text, pos, "}")
+        return members
+
+
+def _line_indent(text: str, pos: int) -> str:
+    line_start = text.rfind("\n", 0, pos) + 1
+    end = line_start
+    while end < pos and text[end] in " \t":
+        end += 1
+    return text[line_start:end]
+
+
+def dumps_at(text: str, pos: int, value: Any, indent: int = 2) -> str:
+    """json.dumps(value) laid out as if written in place at pos."""
+    dumped = json.dumps(value, ensure_ascii=False, indent=indent)
+    return dumped.replace("\n", "\n" + _line_indent(text, pos))
+
+
+class JsonSplicer:
+    """Collects span replacements against one text and applies them at once."""
+
+    def __init__(self, text: str, indent: int = 2):
+        self.text = text
+        self.indent = indent
+        self._edits: List[Tuple[int, int, str]] = []
+
+    def array_items(self, pos: int = 0) -> List[Span]:
+        return array_items(self.text, pos)
+
+    def members(self, pos: int) -> Dict[str, Span]:
+        return object_members(self.text, pos)
+
+    def replace(self, span: Span, value: Any) -> None:
+        """Replace the value at span with a fresh dump of value."""
+        start, end = span
+        self._edits.append((start, end, dumps_at(self.text, start, value, self.indent)))
+
+    def append_item(self, value: Any, array_pos: int = 0) -> None:
+        """Append value to the array starting at array_pos."""
+        items = array_items(self.text, array_pos)
+        if items:
+            last_end = items[-1][1]
+            prefix = ",\n" + _line_indent(self.text, items[-1][0])
+            self._edits.append((last_end, last_end, prefix + dumps_at(self.text, items[-1][0], value, self.indent)))
+        else:
+            close = self.text.index("]", array_pos)
+            self._edits.append((close, close, json.dumps([value], ensure_ascii=False, indent=self.indent)[1:-1]))
+
+    def insert_item(self, index: int, value: Any, array_pos: int = 0) -> None:
+        """Insert value before item `index` of the array at array_pos."""
+        items = array_items(self.text, array_pos)
+        if index >= len(items):
+            self.append_item(value, array_pos)
+            return
+        start = items[index][0]
+        suffix = ",\n" + _line_indent(self.text, start)
+        self._edits.append((start, start, dumps_at(self.text, start, value, self.indent) + suffix))
+
+    def remove_item(self, index: int, array_pos: int = 0) -> None:
+        """Drop item `index` (and its separating comma) from the array at array_pos."""
+        items = array_items(self.text, array_pos)
+        start, end = items[index]
+        if index > 0:
+            start = items[index - 1][1]
+        elif len(items) > 1:
+            end = items[1][0]
+        self._edits.append((start, end, ""))
+
+    def apply(self) -> str:
+        if not self._edits:
+            return self.text
+        pieces: List[str] = []
+        cursor = 0
+        for start, end, replacement in sorted(self._edits, key=lambda e: (e[0], e[1])):
+            if start < cursor:
+                raise ValueError(f"overlapping JSON edits at offset {start}")
+            pieces.append(self.text[cursor:start])
+            pieces.append(replacement)
+            cursor = end
+        pieces.append(self.text[cursor:])
+        self._edits.clear()
+        self.text = "".join(pieces)
+        return self.text
+
+
+def iter_array_file(path: Path, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Yield the items of a file's top-level JSON array one at a time.
+
+    Memory stays bounded by the largest single item plus one chunk.
+    """
+    with Path(path).open("r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buf, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        def next_token() -> str:
+            nonlocal pos
+            while True:
+                pos = _skip_ws(buf, pos)
+                if pos < len(buf):
+                    return buf[pos]
+                if not fill():
+                    raise ValueError(f"{path}: unexpected end of JSON array")
+
+        if next_token() != "[":
+            raise ValueError(f"{path}: top-level value is not an array")
+        pos += 1
+        if next_token() == "]":
+            return
+        while True:
+            next_token()
+            try:
+                value, end = _DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof or not fill():
+                    raise
+                continue
+            if end >= len(buf) and not eof:
+                # A number could continue in the next chunk
+                if fill():
+                    continue
+            pos = end
+            yield value
+            token = next_token()
+            if token == "]":
+                return
+            if token != ",":
+                raise ValueError(f"{path}: expected ',' or ']' at offset {pos}")
+            pos += 1
+
+
+def write_text_atomic(path: Path, text: str) -> bool:
+    """Write via a temp file + rename; returns False if the bytes were already there."""
+    data = text.encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
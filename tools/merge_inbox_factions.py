@@ -5,21 +5,36 @@ This script imports new factions from inbox files and merges them into
 the canonical factions_merged.json. Existing factions are updated if
 the inbox version has newer/different data.
 
+The merge is field-level: an inbox record only overrides the top-level
+fields it carries (use --replace to swap whole records, the old
+behaviour). Every inbox file is streamed once, in order, and each record
+is diffed against the current state of its faction, so later files
+override earlier ones and memory stays bounded by the merged data plus
+one inbox record. The structural diffs are written to a machine-readable
+change log, and factions_merged.json is rewritten only if something
+changed: changed records are spliced in place and the file is swapped in
+atomically.
+
 Usage:
-    python tools/merge_inbox_factions.py [--dry-run]
+    python tools/merge_inbox_factions.py [--dry-run] [--replace] [--changelog PATH]
 """
 
 from __future__ import annotations
 
 import argparse
+import bisect
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional
+
+from data_snapshot import load_snapshot, thaw
+from json_splice import JsonSplicer, iter_array_file, write_text_atomic
 
 
 ROOT = Path(__file__).resolve().parents[1]
 MERGED_PATH = ROOT / "Core" / "Factions" / "data" / "factions_merged.json"
 INBOX_DIR = ROOT / "llm_inbox" / "assets_update_02"
+CHANGELOG_PATH = ROOT / "exports" / "faction_merge_changes.json"
 
 # Files to merge (in order - later files override earlier)
 INBOX_FILES = [
@@ -28,49 +43,148 @@ INBOX_FILES = [
 ]
 
 
-def load_json(path: Path) -> List[Dict]:
-    """Load JSON file, return empty list if not found."""
+def iter_factions(path: Path) -> Iterator[Dict]:
+    """Stream faction records from an inbox file (nothing if not found).
+
+    Bare arrays are streamed item by item; lexicon-style files
+    ({"factions": [...]}) go through the snapshot cache.
+    """
     if not path.exists():
         print(f"  [SKIP] {path.name} not found")
-        return []
+        return
     with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+        head = f.read(1024).lstrip()
+    if head.startswith("["):
+        records = iter_array_file(path)
+    else:
+        records = (thaw(r) for r in load_snapshot(path).records)
+    for record in records:
+        if isinstance(record, dict) and "name" in record:
+            yield record
 
 
-def save_json(path: Path, data: List[Dict]) -> None:
-    """Save JSON with pretty formatting."""
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def diff_values(old: Any, new: Any, path: List[str]) -> List[Dict[str, Any]]:
+    """Structural diff: dicts are compared key by key, anything else as a leaf."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": path + [key], "old": old[key]})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": path + [key], "new": value})
+            else:
+                ops.extend(diff_values(old[key], value, path + [key]))
+        return ops
+    if old != new:
+        return [{"op": "replace", "path": path, "old": old, "new": new}]
+    return []
 
 
-def merge_factions(
-    existing: List[Dict],
-    incoming: List[Dict],
-    source_name: str
-) -> Tuple[List[Dict], Dict[str, str]]:
-    """Merge incoming factions into existing list.
+def diff_faction(current: Dict, incoming: Dict, replace: bool = False) -> List[Dict[str, Any]]:
+    """Ops turning `current` into its merge with `incoming`."""
+    if replace:
+        return diff_values(current, incoming, [])
+    ops: List[Dict[str, Any]] = []
+    for key, value in incoming.items():
+        if key not in current:
+            ops.append({"op": "add", "path": [key], "new": value})
+        else:
+            ops.extend(diff_values(current[key], value, [key]))
+    return ops
 
-    Returns:
-        (merged_list, changes_dict) where changes_dict maps name -> action
-    """
-    # Build lookup by name
-    by_name = {f["name"]: f for f in existing}
-    changes = {}
-
-    for faction in incoming:
-        name = faction["name"]
-        if name in by_name:
-            # Update existing
-            by_name[name] = faction
-            changes[name] = f"updated from {source_name}"
+
+def apply_ops(record: Dict, ops: List[Dict[str, Any]]) -> None:
+    """Apply diff ops to a record in place."""
+    for op in ops:
+        *parents, leaf = op["path"]
+        node = record
+        for key in parents:
+            node = node[key]
+        if op["op"] == "remove":
+            del node[leaf]
         else:
-            # Add new
-            by_name[name] = faction
-            changes[name] = f"added from {source_name}"
+            # Copy so later ops never alter values already in the change log
+            node[leaf] = thaw(op["new"])
+
+
+class FactionMerge:
+    """Merged factions with copy-on-write edits and a per-source change log."""
+
+    def __init__(self, merged_path: Path, replace: bool = False):
+        self.merged_path = merged_path
+        self.replace = replace
+        self.base = load_snapshot(merged_path) if merged_path.exists() else None
+        self.names: List[str] = [r["name"] for r in self.base.records] if self.base else []
+        self.edited: Dict[str, Dict] = {}  # name -> mutable merged record
+        self.added: List[str] = []
+        self.log: List[Dict[str, Any]] = []
+
+    def current(self, name: str) -> Optional[Dict]:
+        if name in self.edited:
+            return self.edited[name]
+        if self.base is not None and name in self.base.by_name:
+            return self.base.by_name[name]
+        return None
+
+    def merge(self, incoming: Dict, source_name: str) -> Optional[str]:
+        """Merge one inbox record; returns the action taken, None if unchanged."""
+        name = incoming["name"]
+        current = self.current(name)
+        if current is None:
+            self.edited[name] = thaw(incoming)
+            self.added.append(name)
+            ops = [{"op": "add", "path": [], "new": incoming}]
+            self.log.append({"faction": name, "action": "added", "source": source_name, "ops": ops})
+            return f"added from {source_name}"
+
+        if name not in self.edited:
+            current = self.edited[name] = thaw(current)
+        ops = diff_faction(current, incoming, self.replace)
+        if not ops:
+            return None
+        apply_ops(current, ops)
+        self.log.append({"faction": name, "action": "updated", "source": source_name, "ops": ops})
+        return f"updated from {source_name} ({len(ops)} field changes)"
 
-    # Rebuild list (sorted by name for consistency)
-    merged = sorted(by_name.values(), key=lambda f: f["name"])
-    return merged, changes
+    @property
+    def changed(self) -> List[str]:
+        seen = dict.fromkeys(entry["faction"] for entry in self.log)
+        return list(seen)
+
+    def render(self) -> str:
+        """factions_merged.json with only the changed records rewritten."""
+        if self.base is None:
+            records = sorted(self.edited.values(), key=lambda f: f["name"])
+            return json.dumps(records, ensure_ascii=False, indent=2)
+        if any(a > b for a, b in zip(self.names, self.names[1:])):
+            # Inserting by bisect needs a name-sorted file; re-sort it all
+            # as the merge did before splicing
+            by_name = {name: self.current(name) for name in self.names + self.added}
+            records = sorted(by_name.values(), key=lambda f: f["name"])
+            return json.dumps(records, ensure_ascii=False, indent=2)
+
+        text = self.merged_path.read_text(encoding="utf-8")
+        splicer = JsonSplicer(text)
+        spans = splicer.array_items()
+        changed = set(self.changed)
+        for name, span in zip(self.names, spans):
+            if name in changed and name not in self.added:
+                splicer.replace(span, self.edited[name])
+        # New factions keep the file sorted by name
+        for name in sorted(self.added):
+            splicer.insert_item(bisect.bisect_left(self.names, name), self.edited[name])
+        return splicer.apply()
+
+    def changelog(self, sources: List[str]) -> Dict[str, Any]:
+        return {
+            "merged": str(self.merged_path),
+            "mode": "replace" if self.replace else "fields",
+            "sources": sources,
+            "added": sorted(set(self.added)),
+            "updated": sorted(set(self.changed) - set(self.added)),
+            "changes": self.log,
+        }
 
 
 def main() -> int:
@@ -80,6 +194,12 @@ def main() -> int:
         action="store_true",
         help="Show what would be changed without writing",
     )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Replace whole faction records instead of merging field by field",
+    )
+    parser.add_argument("--changelog", type=Path, default=CHANGELOG_PATH)
     args = parser.parse_args()
 
     print("=" * 60)
@@ -88,43 +208,49 @@ def main() -> int:
 
     # Load existing merged factions
     print(f"\nLoading {MERGED_PATH.name}...")
-    merged = load_json(MERGED_PATH)
-    print(f"  Found {len(merged)} existing factions")
+    merge = FactionMerge(MERGED_PATH, replace=args.replace)
+    print(f"  Found {len(merge.names)} existing factions")
 
-    all_changes = {}
-
-    # Process each inbox file
+    # One pass over every inbox file, in order
+    sources = []
     for inbox_file in INBOX_FILES:
         inbox_path = INBOX_DIR / inbox_file
         print(f"\nProcessing {inbox_file}...")
-        incoming = load_json(inbox_path)
-        if not incoming:
-            continue
-        print(f"  Found {len(incoming)} factions")
-
-        merged, changes = merge_factions(merged, incoming, inbox_file)
-        all_changes.update(changes)
-
-        for name, action in sorted(changes.items()):
-            print(f"    {name}: {action}")
+        count = 0
+        for incoming in iter_factions(inbox_path):
+            count += 1
+            action = merge.merge(incoming, inbox_file)
+            if action:
+                print(f"    {incoming['name']}: {action}")
+        if count:
+            sources.append(inbox_file)
+            print(f"  Found {count} factions")
 
     # Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    added = sum(1 for a in all_changes.values() if "added" in a)
-    updated = sum(1 for a in all_changes.values() if "updated" in a)
+    added = len(set(merge.added))
+    updated = len(merge.changed) - added
     print(f"  Added: {added}")
     print(f"  Updated: {updated}")
-    print(f"  Final count: {len(merged)} factions")
+    print(f"  Final count: {len(merge.names) + added} factions")
 
     if args.dry_run:
         print("\n[DRY RUN] No files written")
         return 0
 
+    changelog = json.dumps(merge.changelog(sources), ensure_ascii=False, indent=2) + "\n"
+    write_text_atomic(args.changelog, changelog)
+    print(f"\nChange log: {args.changelog}")
+
+    if not merge.log:
+        print("No changes; factions_merged.json left untouched")
+        return 0
+
     # Write merged file
     print(f"\nWriting {MERGED_PATH}...")
-    save_json(MERGED_PATH, merged)
+    write_text_atomic(MERGED_PATH, merge.render())
     print("  Done!")
 
     return 0
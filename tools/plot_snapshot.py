@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+"""Compact binary snapshot of GameState plot data (.plots files).
+
+Layout (little endian):
+
+    header     magic "SWPS", format, flags, record size, save_version,
+               grid width/height, plot count, then (offset, size) of
+               the adjacency, extras and document sections
+    records    one fixed-width record per plot:
+               x:i32 y:i32 type:u8 flags:u8 layout:u8 pad:u8
+               entangled:u16 gates:u16 pump_rate:f64 drain_rate:f64
+               (flags: planted, measured, theta_frozen, pump active,
+               drain active, extra; layout: index into LAYOUTS)
+    adjacency  for each plot with entanglements, its entangled_with
+               positions as zigzag varint (x, y) pairs
+    extras     plots that do not fit the record (terminal bindings,
+               persistent gates, other fields or field order): varint
+               index, varint length, .tres text. Their records are still
+               filled in, so a scan sees every plot's position and flags
+    document   zlib: the rest of the .tres text with the plots value
+               cut out, so to_tres() puts back the original bytes
+
+Tooling that scans saves reads the header and the records only:
+
+    with open(path, "rb") as f:
+        header = read_header(f)                  # HEADER.size bytes
+        for x, y, plot_type, flags, layout, links, gates, pump, drain in iter_records(f, header):
+            ...
+
+    snapshot = from_tres(text)                   # PlotSnapshot
+    data = encode(snapshot)
+    assert to_tres(decode(data)) == text         # byte-identical round trip
+
+Usage:
+    python tools/plot_snapshot.py encode Scenarios/default.tres -o default.plots
+    python tools/plot_snapshot.py decode default.plots -o default.tres
+    python tools/plot_snapshot.py info default.plots
+    python tools/plot_snapshot.py --bench 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import struct
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from godot_tres import GodotCall, TresDocument, dump, parse_value
+from save_migrations import SaveState, detect_version
+
+
+MAGIC = b"SWPS"
+FORMAT = 2
+
+HEADER = struct.Struct("<4sBBHiiiIIIIIII")
+RECORD = struct.Struct("<iiBBBxHHdd")
+
+# Header flags
+RAW_PLOTS = 0x01  # plots text is stored verbatim (dump() would not reproduce it)
+
+# Record flags
+PLANTED = 0x01
+MEASURED = 0x02
+THETA_FROZEN = 0x04
+PUMP_ACTIVE = 0x08
+DRAIN_ACTIVE = 0x10
+EXTRA = 0x80  # the plot itself is in the extras section
+
+PLOT_FIELDS = ("position", "type", "is_planted", "has_been_measured", "theta_frozen", "entangled_with")
+LINDBLAD_FIELDS = ("lindblad_pump_active", "lindblad_drain_active", "lindblad_pump_rate", "lindblad_drain_rate")
+
+# Plot dicts the record reproduces exactly, by field order
+LAYOUTS = (
+    PLOT_FIELDS,                                               # scripts/repair_saves.py output
+    PLOT_FIELDS + ("persistent_gates",) + LINDBLAD_FIELDS,     # GameState._init()
+    PLOT_FIELDS + LINDBLAD_FIELDS + ("persistent_gates",),     # GameStateManager.capture_state_from_game()
+)
+NO_LAYOUT = 0xFF
+
+
+class SnapshotError(ValueError):
+    """Not a plot snapshot, or one this reader cannot decode."""
+
+
+class Header:
+    """Fixed-size header: counts, grid and section offsets."""
+
+    __slots__ = ("flags", "record_size", "save_version", "grid_width", "grid_height", "plot_count",
+                 "adjacency", "extras", "document")
+
+    def __init__(self, flags: int, record_size: int, save_version: int, grid_width: int, grid_height: int,
+                 plot_count: int, adjacency: Tuple[int, int], extras: Tuple[int, int], document: Tuple[int, int]):
+        self.flags = flags
+        self.record_size = record_size
+        self.save_version = save_version
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.plot_count = plot_count
+        self.adjacency = adjacency  # (offset, size)
+        self.extras = extras
+        self.document = document
+
+    def pack(self) -> bytes:
+        return HEADER.pack(MAGIC, FORMAT, self.flags, self.record_size, self.save_version,
+                           self.grid_width, self.grid_height, self.plot_count,
+                           *self.adjacency, *self.extras, *self.document)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "Header":
+        if len(data) < HEADER.size:
+            raise SnapshotError("truncated header")
+        (magic, fmt, flags, record_size, save_version, width, height, count,
+         adj_offset, adj_size, extra_offset, extra_size, doc_offset, doc_size) = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise SnapshotError("not a plot snapshot")
+        if fmt != FORMAT:
+            raise SnapshotError(f"unsupported snapshot format {fmt}")
+        if record_size != RECORD.size:
+            raise SnapshotError(f"unexpected record size {record_size}")
+        return cls(flags, record_size, save_version, width, height, count,
+                   (adj_offset, adj_size), (extra_offset, extra_size), (doc_offset, doc_size))
+
+    @property
+    def records(self) -> Tuple[int, int]:
+        return HEADER.size, self.plot_count * self.record_size
+
+
+class PlotSnapshot:
+    """Plot data of one save plus the text needed to rebuild the .tres."""
+
+    def __init__(self, plots: List[Any], save_version: int = 0, grid_width: int = 0, grid_height: int = 0,
+                 prefix: str = "", suffix: str = "", raw_plots: Optional[str] = None):
+        self.plots = plots
+        self.save_version = save_version
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.prefix = prefix          # .tres text before the plots value
+        self.suffix = suffix          # .tres text after it
+        self.raw_plots = raw_plots    # verbatim plots text when dump() differs
+
+
+# ---------------------------------------------------------------------------
+# Varints
+# ---------------------------------------------------------------------------
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+# ---------------------------------------------------------------------------
+# Encode / decode
+# ---------------------------------------------------------------------------
+
+def _vector2i(value: Any) -> bool:
+    return (isinstance(value, GodotCall) and value.name == "Vector2i" and len(value.args) == 2
+            and all(isinstance(v, int) and not isinstance(v, bool) and -2**31 <= v < 2**31 for v in value.args))
+
+
+def _int(value: Any, low: int, high: int) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and low <= value < high
+
+
+def _record(plot: Any) -> Tuple[int, int, int, int, int, int, int, float, float]:
+    """Record fields of a plot, as far as it has them (missing or odd values read as 0)."""
+    if not isinstance(plot, dict):
+        return 0, 0, 0, 0, NO_LAYOUT, 0, 0, 0.0, 0.0
+    x, y = plot["position"].args if _vector2i(plot.get("position")) else (0, 0)
+    plot_type = plot.get("type")
+    flags = 0
+    for field, bit in (("is_planted", PLANTED), ("has_been_measured", MEASURED), ("theta_frozen", THETA_FROZEN),
+                       ("lindblad_pump_active", PUMP_ACTIVE), ("lindblad_drain_active", DRAIN_ACTIVE)):
+        if plot.get(field) is True:
+            flags |= bit
+    links = plot.get("entangled_with")
+    gates = plot.get("persistent_gates")
+    rates = [plot.get(f) for f in ("lindblad_pump_rate", "lindblad_drain_rate")]
+    return (x, y, plot_type if _int(plot_type, 0, 256) else 0, flags, NO_LAYOUT,
+            min(len(links), 0xFFFF) if isinstance(links, list) else 0,
+            min(len(gates), 0xFFFF) if isinstance(gates, list) else 0,
+            *(r if isinstance(r, float) else 0.0 for r in rates))
+
+
+def _layout(plot: Any) -> int:
+    """Index of the LAYOUTS entry that reproduces the plot exactly, or NO_LAYOUT."""
+    if not isinstance(plot, dict):
+        return NO_LAYOUT
+    try:
+        layout = LAYOUTS.index(tuple(plot))
+    except ValueError:
+        return NO_LAYOUT
+    links = plot["entangled_with"]
+    if not (_vector2i(plot["position"]) and _int(plot["type"], 0, 256)
+            and all(isinstance(plot[f], bool) for f in ("is_planted", "has_been_measured", "theta_frozen"))
+            and isinstance(links, list) and len(links) < 0x10000 and all(_vector2i(p) for p in links)):
+        return NO_LAYOUT
+    if "persistent_gates" in plot and plot["persistent_gates"] != []:
+        return NO_LAYOUT  # Gate dicts live in extras
+    if "lindblad_pump_rate" in plot and not (
+            all(isinstance(plot[f], bool) for f in LINDBLAD_FIELDS[:2])
+            and all(type(plot[f]) is float for f in LINDBLAD_FIELDS[2:])):
+        return NO_LAYOUT
+    return layout
+
+
+def encode(snapshot: PlotSnapshot) -> bytes:
+    records = bytearray()
+    adjacency = bytearray()
+    extras = bytearray()
+    extra_count = 0
+    for index, plot in enumerate(snapshot.plots):
+        x, y, plot_type, flags, _, links, gates, pump, drain = _record(plot)
+        layout = _layout(plot)
+        if layout == NO_LAYOUT:
+            text = dump(plot).encode("utf-8")
+            _write_varint(extras, index)
+            _write_varint(extras, len(text))
+            extras += text
+            extra_count += 1
+            records += RECORD.pack(x, y, plot_type, flags | EXTRA, layout, links, gates, pump, drain)
+            continue
+        records += RECORD.pack(x, y, plot_type, flags, layout, links, gates, pump, drain)
+        for link in plot["entangled_with"]:
+            _write_varint(adjacency, _zigzag(link.args[0]))
+            _write_varint(adjacency, _zigzag(link.args[1]))
+    extras_section = bytearray()
+    _write_varint(extras_section, extra_count)
+    extras_section += extras
+
+    document = bytearray()
+    for part in (snapshot.prefix, snapshot.raw_plots or "", snapshot.suffix):
+        data = part.encode("utf-8")
+        _write_varint(document, len(data))
+        document += data
+    document = zlib.compress(bytes(document), 9)
+
+    adjacency_offset = HEADER.size + len(records)
+    extras_offset = adjacency_offset + len(adjacency)
+    document_offset = extras_offset + len(extras_section)
+    header = Header(RAW_PLOTS if snapshot.raw_plots is not None else 0, RECORD.size, snapshot.save_version,
+                    snapshot.grid_width, snapshot.grid_height, len(snapshot.plots),
+                    (adjacency_offset, len(adjacency)), (extras_offset, len(extras_section)),
+                    (document_offset, len(document)))
+    return header.pack() + bytes(records) + bytes(adjacency) + bytes(extras_section) + document
+
+
+def _section(data: bytes, span: Tuple[int, int]) -> bytes:
+    offset, size = span
+    if offset + size > len(data):
+        raise SnapshotError("truncated snapshot")
+    return data[offset:offset + size]
+
+
+def decode_plots(data: bytes, header: Optional[Header] = None) -> List[Any]:
+    """The plots array only (the document section is not touched)."""
+    header = header or Header.unpack(data)
+    extras: Dict[int, Any] = {}
+    blob = _section(data, header.extras)
+    if blob:
+        count, pos = _read_varint(blob, 0)
+        for _ in range(count):
+            index, pos = _read_varint(blob, pos)
+            size, pos = _read_varint(blob, pos)
+            extras[index] = parse_value(blob[pos:pos + size].decode("utf-8")).to_python()
+            pos += size
+
+    adjacency = _section(data, header.adjacency)
+    pos = 0
+    plots: List[Any] = []
+    append = plots.append
+    for index, (x, y, plot_type, flags, layout, count, _, pump, drain) in enumerate(iter_records(data, header)):
+        if flags & EXTRA:
+            append(extras[index])
+            continue
+        if layout >= len(LAYOUTS):
+            raise SnapshotError(f"plot {index}: unknown layout {layout}")
+        links = []
+        for _ in range(count):
+            lx, pos = _read_varint(adjacency, pos)
+            ly, pos = _read_varint(adjacency, pos)
+            links.append(GodotCall("Vector2i", (_unzigzag(lx), _unzigzag(ly))))
+        values = {
+            "position": GodotCall("Vector2i", (x, y)),
+            "type": plot_type,
+            "is_planted": bool(flags & PLANTED),
+            "has_been_measured": bool(flags & MEASURED),
+            "theta_frozen": bool(flags & THETA_FROZEN),
+            "entangled_with": links,
+            "persistent_gates": [],
+            "lindblad_pump_active": bool(flags & PUMP_ACTIVE),
+            "lindblad_drain_active": bool(flags & DRAIN_ACTIVE),
+            "lindblad_pump_rate": pump,
+            "lindblad_drain_rate": drain,
+        }
+        append({field: values[field] for field in LAYOUTS[layout]})
+    return plots
+
+
+def decode(data: bytes) -> PlotSnapshot:
+    header = Header.unpack(data)
+    plots = decode_plots(data, header)
+    document = zlib.decompress(_section(data, header.document))
+    parts = []
+    pos = 0
+    for _ in range(3):
+        size, pos = _read_varint(document, pos)
+        parts.append(document[pos:pos + size].decode("utf-8"))
+        pos += size
+    prefix, raw_plots, suffix = parts
+    return PlotSnapshot(plots, header.save_version, header.grid_width, header.grid_height, prefix, suffix,
+                        raw_plots if header.flags & RAW_PLOTS else None)
+
+
+def read_header(f: BinaryIO) -> Header:
+    """Header of an open snapshot (reads HEADER.size bytes from the start)."""
+    f.seek(0)
+    return Header.unpack(f.read(HEADER.size))
+
+
+def iter_records(source, header: Header) -> Iterator[Tuple[int, int, int, int, int, int, int, float, float]]:
+    """(x, y, type, flags, layout, entangled count, gate count, pump rate, drain rate) per plot.
+
+    Works on bytes or an open file, and is valid for extras plots too.
+    """
+    offset, size = header.records
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        block = bytes(source[offset:offset + size])
+    else:
+        source.seek(offset)
+        block = source.read(size)
+    if len(block) != size:
+        raise SnapshotError("truncated records")
+    return RECORD.iter_unpack(block)
+
+
+# ---------------------------------------------------------------------------
+# .tres conversion
+# ---------------------------------------------------------------------------
+
+def from_tres(text: str) -> PlotSnapshot:
+    """Snapshot of a GameState .tres (which must have a plots array)."""
+    document = TresDocument(text)
+    state = SaveState(document)
+    node = state.section.properties.get("plots")
+    if node is None or node.kind != "array":
+        raise SnapshotError("no plots array in [resource]")
+    plots = state["plots"]
+    source = document.source(node)
+
+    def grid(name: str) -> int:
+        value = state.get(name, 0)
+        return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+    return PlotSnapshot(plots, detect_version(state), grid("grid_width"), grid("grid_height"),
+                        text[:node.start], text[node.end:], None if dump(plots) == source else source)
+
+
+def to_tres(snapshot: PlotSnapshot) -> str:
+    plots = snapshot.raw_plots if snapshot.raw_plots is not None else dump(snapshot.plots)
+    return snapshot.prefix + plots + snapshot.suffix
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+_BENCH_HEADER = """[gd_resource type="Resource" script_class="GameState" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://Core/GameState/GameState.gd" id="1_default"]
+
+[resource]
+script = ExtResource("1_default")
+scenario_id = "bench"
+grid_width = {width}
+grid_height = {height}
+"""
+
+
+def synthetic_save(plots: int, seed: int = 0) -> str:
+    """A save in GameStateManager's format on a square-ish grid.
+
+    Plots have sparse entanglement and the lindblad fields. A few are bound
+    to a terminal or carry persistent gates, so they go to the extras section.
+    """
+    rng = random.Random(seed)
+    width = max(1, int(plots ** 0.5))
+    height = (plots + width - 1) // width
+    entries = []
+    for i in range(plots):
+        links = [GodotCall("Vector2i", (rng.randrange(width), rng.randrange(height)))
+                 for _ in range(rng.choice((0, 0, 0, 1, 2)))]
+        plot = {
+            "position": GodotCall("Vector2i", (i % width, i // width)),
+            "type": rng.randrange(5),
+            "is_planted": rng.random() < 0.5,
+            "has_been_measured": rng.random() < 0.3,
+            "theta_frozen": rng.random() < 0.1,
+            "entangled_with": links,
+            "lindblad_pump_active": rng.random() < 0.2,
+            "lindblad_drain_active": rng.random() < 0.2,
+            "lindblad_pump_rate": rng.choice((0.0, 0.5, 0.25)),
+            "lindblad_drain_rate": rng.choice((0.0, 0.5, 0.25)),
+        }
+        if rng.random() < 0.05:
+            plot.update(terminal_id=f"T{i}", register_id=i, biome_name="StarterForest",
+                        north_emoji="🌾", south_emoji="👥")
+        gates = []
+        if rng.random() < 0.05:
+            gates.append({"type": "cnot", "active": True, "linked_registers": [i, (i + 1) % plots]})
+        plot["persistent_gates"] = gates
+        entries.append(plot)
+    return _BENCH_HEADER.format(width=width, height=height) + "plots = " + dump(entries) + "\n"
+
+
+def _best(fn, repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench(plots: int, repeat: int, seed: int = 0) -> None:
+    text = synthetic_save(plots, seed)
+    snapshot = from_tres(text)
+    data = encode(snapshot)
+    assert to_tres(decode(data)) == text
+    assert dump(decode_plots(data)) == dump(snapshot.plots)
+    header = Header.unpack(data)
+    records_size = header.records[1]
+
+    def tres_planted() -> int:
+        return sum(1 for p in SaveState(TresDocument(text))["plots"] if p["is_planted"])
+
+    def snapshot_planted() -> int:
+        return sum(1 for r in iter_records(data, header) if r[3] & PLANTED)
+
+    rows = [
+        ("parse .tres + plots", _best(lambda: SaveState(TresDocument(text))["plots"], repeat)),
+        ("from_tres", _best(lambda: from_tres(text), repeat)),
+        ("encode", _best(lambda: encode(snapshot), repeat)),
+        ("decode", _best(lambda: decode(data), repeat)),
+        ("to_tres", _best(lambda: to_tres(snapshot), repeat)),
+        ("count planted (.tres)", _best(tres_planted, repeat)),
+        ("count planted (records)", _best(snapshot_planted, repeat)),
+    ]
+    print(f"{plots} plots, best/median of {repeat}")
+    print(f"  .tres text:          {len(text.encode('utf-8')):>10} bytes")
+    print(f"  snapshot:            {len(data):>10} bytes "
+          f"(records {records_size}, adjacency {header.adjacency[1]}, document {header.document[1]})")
+    print(f"  scan reads:          {HEADER.size + records_size:>10} bytes")
+    print(f"  planted:             {tres_planted():>10} (.tres) {snapshot_planted():>10} (records)")
+    for name, samples in rows:
+        print(f"  {name:<24} {min(samples) * 1000:9.2f} ms {statistics.median(samples) * 1000:9.2f} ms")
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", nargs="?", choices=("encode", "decode", "info"))
+    parser.add_argument("path", nargs="?", type=Path)
+    parser.add_argument("-o", "--output", type=Path)
+    parser.add_argument("--bench", type=int, metavar="PLOTS", help="Benchmark on a synthetic save")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.bench, args.repeat, args.seed)
+        return 0
+    if not args.command or not args.path:
+        parser.error("a command and a path are required (or --bench N)")
+
+    try:
+        if args.command == "info":
+            with args.path.open("rb") as f:
+                header = read_header(f)
+                planted = sum(1 for r in iter_records(f, header) if r[3] & PLANTED)
+            print(f"{args.path}: save_version {header.save_version}, grid {header.grid_width}x{header.grid_height}, "
+                  f"{header.plot_count} plots ({planted} planted)")
+            return 0
+        if args.command == "encode":
+            with args.path.open("r", encoding="utf-8", newline="") as f:
+                data = encode(from_tres(f.read()))
+            output = args.output or args.path.with_suffix(".plots")
+            output.write_bytes(data)
+        else:
+            text = to_tres(decode(args.path.read_bytes()))
+            output = args.output or args.path.with_suffix(".tres")
+            with output.open("w", encoding="utf-8", newline="") as f:
+                f.write(text)
+    except (OSError, ValueError) as e:
+        print(f"❌ {args.path}: {e}", file=sys.stderr)
+        return 1
+    print(f"✓ {args.path} -> {output} ({output.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""Versioned save-format migrations for GameState .tres files.
+
+Each save_version declares a migrator from the version before it. A
+migrator is a list of steps, and there are two kinds of step:
+
+    v1 = migrator(1, "Pre-versioning saves: 6x1 grid, persisted plot fields only")
+
+    @v1.plot
+    def keep_persisted_plot_fields(plot):      # one plot dict in, dict (or None to drop) out
+        ...
+
+    @v1.state
+    def regrid(state):                         # whole-save step on SaveState
+        state["grid_width"] = 6
+
+compile_chain(from_version, to_version) flattens the steps of every
+migrator in between into stages. Consecutive plot steps, including steps
+from different versions, are fused into one loop over the plots array.
+The result is cached, so a batch compiles each chain once. migrate()
+takes a parsed TresDocument from any old version to CURRENT_VERSION:
+the file is parsed once, the plots are converted once, and only changed
+properties are rewritten.
+
+Godot leaves properties at their default out of the file. A save
+without save_version is therefore at the GameState default, unless its
+plots still use the pre-versioning layout, which counts as version 0.
+
+Usage:
+    python tools/save_migrations.py --list
+    python tools/save_migrations.py --bench --plots 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from godot_tres import GodotCall, TresDocument, dump
+
+
+# GameState.gd: @export var save_version: int = 1
+CURRENT_VERSION = 1
+DEFAULT_SAVE_VERSION = 1
+
+PlotStep = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+StateStep = Callable[["SaveState"], None]
+
+
+class MigrationError(ValueError):
+    """A save that cannot be migrated (unknown or newer version, bad layout)."""
+
+
+class SaveState:
+    """Python view of a document's [resource] properties with write-back.
+
+    Values are converted on first access and cached. An assignment only
+    marks the property; commit() writes the assigned properties whose
+    text actually changed, and leaves every other byte as it was.
+    """
+
+    def __init__(self, document: TresDocument):
+        self.document = document
+        self.section = document.section("resource")
+        if self.section is None:
+            raise MigrationError("no [resource] section")
+        self._loaded: Dict[str, Any] = {}
+        self._assigned: Dict[str, Any] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._assigned or name in self.section.properties
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._assigned:
+            return self._assigned[name]
+        return self.original(name)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._assigned[name] = value
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else default
+
+    def original(self, name: str) -> Any:
+        """Value as parsed from the file (KeyError if absent)."""
+        if name not in self._loaded:
+            self._loaded[name] = self.section.properties[name].to_python()
+        return self._loaded[name]
+
+    def commit(self) -> Dict[str, list]:
+        """Write assigned properties back; returns {name: [old, new]} for changed ones.
+
+        Lists are reported by length, so a plots entry reads [old count, new count].
+        """
+        changes: Dict[str, list] = {}
+        for name, value in self._assigned.items():
+            text = dump(value, top_level=isinstance(value, dict))
+            node = self.section.properties.get(name)
+            if node is None:
+                if name == "save_version" and value == DEFAULT_SAVE_VERSION:
+                    continue  # Godot omits defaults; adding it would be noise
+                old = None
+            elif self.document.source(node) == text:
+                continue
+            else:
+                old = self.original(name)
+            self.document.set_property(self.section, name, text)
+            changes[name] = [len(old) if isinstance(old, list) else old,
+                             len(value) if isinstance(value, list) else value]
+        self._assigned.clear()
+        return changes
+
+
+class Migrator:
+    """Steps that take a save from version - 1 to version."""
+
+    def __init__(self, version: int, description: str):
+        self.version = version
+        self.description = description
+        self.steps: List[Tuple[str, Callable]] = []  # ("plot" | "state", fn)
+
+    def plot(self, fn: PlotStep) -> PlotStep:
+        self.steps.append(("plot", fn))
+        return fn
+
+    def state(self, fn: StateStep) -> StateStep:
+        self.steps.append(("state", fn))
+        return fn
+
+    def __repr__(self) -> str:
+        return f"Migrator(v{self.version}, {len(self.steps)} steps)"
+
+
+MIGRATORS: Dict[int, Migrator] = {}
+
+
+def migrator(version: int, description: str) -> Migrator:
+    """Declare the migrator that produces `version` from `version - 1`."""
+    if version in MIGRATORS:
+        raise ValueError(f"duplicate migrator for save_version {version}")
+    MIGRATORS[version] = Migrator(version, description)
+    return MIGRATORS[version]
+
+
+def _fuse(steps: Tuple[PlotStep, ...]) -> Callable[[list], list]:
+    """One loop over the plots applying every step in order."""
+    def run(plots: list) -> list:
+        out = []
+        append = out.append
+        for plot in plots:
+            for step in steps:
+                plot = step(plot)
+                if plot is None:
+                    break
+            else:
+                append(plot)
+        return out
+    return run
+
+
+class CompiledMigration:
+    """Flattened, fused stages for one (from, to) version pair."""
+
+    def __init__(self, from_version: int, to_version: int, stages: List[Tuple[str, Callable, Tuple[str, ...]]]):
+        self.from_version = from_version
+        self.to_version = to_version
+        self.stages = stages  # (kind, runner, step names)
+
+    def run(self, state: SaveState) -> None:
+        for kind, runner, _ in self.stages:
+            if kind == "plot":
+                plots = state.get("plots")
+                if isinstance(plots, list):
+                    state["plots"] = runner(plots)
+            else:
+                runner(state)
+        if self.to_version != self.from_version:
+            state["save_version"] = self.to_version
+
+
+@functools.lru_cache(maxsize=None)
+def compile_chain(from_version: int, to_version: int = CURRENT_VERSION) -> CompiledMigration:
+    if from_version > to_version:
+        raise MigrationError(f"save_version {from_version} is newer than this tool (v{to_version})")
+    missing = [v for v in range(from_version + 1, to_version + 1) if v not in MIGRATORS]
+    if missing:
+        raise MigrationError(f"no migrator for save_version {missing[0]}")
+
+    stages: List[Tuple[str, Callable, Tuple[str, ...]]] = []
+    pending: List[Tuple[str, PlotStep]] = []
+
+    def flush() -> None:
+        if pending:
+            names, steps = zip(*pending)
+            stages.append(("plot", _fuse(steps), names))
+            pending.clear()
+
+    for version in range(from_version + 1, to_version + 1):
+        for kind, fn in MIGRATORS[version].steps:
+            name = f"v{version}.{fn.__name__}"
+            if kind == "plot":
+                pending.append((name, fn))
+            else:
+                flush()
+                stages.append(("state", fn, (name,)))
+    flush()
+    return CompiledMigration(from_version, to_version, stages)
+
+
+class MigrationResult:
+    """What migrate() did to one save."""
+
+    def __init__(self, from_version: int, to_version: int, changes: Dict[str, list]):
+        self.from_version = from_version
+        self.to_version = to_version
+        self.changes = changes
+
+    @property
+    def migrated(self) -> bool:
+        return self.from_version != self.to_version
+
+
+def detect_version(state: SaveState) -> int:
+    """save_version of a save, inferring 0 for pre-versioning plot layouts."""
+    if "save_version" in state:
+        version = state["save_version"]
+        if not isinstance(version, int) or isinstance(version, bool):
+            raise MigrationError(f"save_version is not an int: {version!r}")
+        return version
+    plots = state.get("plots", [])
+    if isinstance(plots, list) and any(_is_legacy_plot(p) for p in plots):
+        return 0
+    return DEFAULT_SAVE_VERSION
+
+
+def migrate(document: TresDocument, to_version: int = CURRENT_VERSION,
+            state: Optional[SaveState] = None) -> MigrationResult:
+    """Bring a parsed save to `to_version`; edits are left pending on the document."""
+    state = state or SaveState(document)
+    from_version = detect_version(state)
+    if from_version == to_version:
+        return MigrationResult(from_version, to_version, {})
+    compile_chain(from_version, to_version).run(state)
+    return MigrationResult(from_version, to_version, state.commit())
+
+
+# ---------------------------------------------------------------------------
+# v1: the layout GameState.gd has used since save_version was introduced
+# ---------------------------------------------------------------------------
+
+GRID_WIDTH = 6
+GRID_HEIGHT = 1
+
+# Quantum state and growth fields that only pre-versioning saves stored
+LEGACY_PLOT_FIELDS = {"theta", "phi", "radius", "energy", "growth_progress", "is_mature"}
+
+
+def _is_legacy_plot(plot: Any) -> bool:
+    return isinstance(plot, dict) and not LEGACY_PLOT_FIELDS.isdisjoint(plot)
+
+
+_CHECKED_PLOT_FIELDS = {"position", "type", "is_planted", "has_been_measured"}
+
+v1 = migrator(1, f"Pre-versioning saves: {GRID_WIDTH}x{GRID_HEIGHT} grid, persisted plot fields only")
+
+
+@v1.plot
+def keep_persisted_plot_fields(plot):
+    """Typed position/type/planted/measured; drop quantum state and obsolete fields.
+
+    Fields the legacy layout did not know about (persistent_gates, lindblad_*,
+    terminal bindings) are carried over untouched.
+    """
+    if not isinstance(plot, dict):
+        return None
+    result = {}
+    position = plot.get("position")
+    if isinstance(position, GodotCall) and position.name == "Vector2i" and len(position.args) == 2:
+        result["position"] = GodotCall("Vector2i", (int(v) for v in position.args))
+    plot_type = plot.get("type")
+    if isinstance(plot_type, int) and not isinstance(plot_type, bool):
+        result["type"] = plot_type
+    for field in ("is_planted", "has_been_measured"):
+        if isinstance(plot.get(field), bool):
+            result[field] = plot[field]
+    if not result:
+        return None
+    for field, value in plot.items():
+        if field not in LEGACY_PLOT_FIELDS and field not in _CHECKED_PLOT_FIELDS:
+            result[field] = value
+    return result
+
+
+@v1.state
+def regrid(state):
+    """Lay plots out on the standard grid, keeping each position's old plot.
+
+    theta_frozen and entangled_with start clear: the links pointed at the
+    old positions.
+    """
+    by_position = {}
+    for plot in state.get("plots", []):
+        if "position" in plot:
+            by_position.setdefault(tuple(plot["position"].args), plot)
+    plots = []
+    for x in range(GRID_WIDTH):
+        for y in range(GRID_HEIGHT):
+            plot = dict(by_position.get((x, y), {}))
+            plot["position"] = GodotCall("Vector2i", (x, y))
+            for field, default in (("type", 0), ("is_planted", False), ("has_been_measured", False)):
+                plot.setdefault(field, default)
+            plot["theta_frozen"] = False
+            plot["entangled_with"] = []
+            plots.append(plot)
+    state["plots"] = plots
+    state["grid_width"] = GRID_WIDTH
+    state["grid_height"] = GRID_HEIGHT
+
+
+# ---------------------------------------------------------------------------
+# Listing and micro-benchmarks
+# ---------------------------------------------------------------------------
+
+_LEGACY_HEADER = """[gd_resource type="Resource" script_class="GameState" load_steps=2 format=3]
+
+[ext_resource type="Script" path="res://Core/GameState/GameState.gd" id="1_default"]
+
+[resource]
+script = ExtResource("1_default")
+scenario_id = "bench"
+grid_width = {width}
+grid_height = 1
+"""
+
+
+def synthetic_legacy_save(plots: int, seed: int = 0) -> str:
+    """A version-0 save: wide grid, quantum fields and obsolete plot fields."""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(plots):
+        entries.append({
+            "position": GodotCall("Vector2i", (i, 0)),
+            "type": rng.randrange(5),
+            "is_planted": rng.random() < 0.5,
+            "has_been_measured": rng.random() < 0.3,
+            "theta": rng.random() * 3.14159,
+            "phi": rng.random() * 6.28318,
+            "radius": 1.0,
+            "energy": rng.random(),
+            "growth_progress": rng.random(),
+            "is_mature": False,
+            "entangled_with": [GodotCall("Vector2i", (rng.randrange(plots), 0))],
+        })
+    return _LEGACY_HEADER.format(width=plots) + "plots = " + dump(entries) + "\n"
+
+
+def _timed(fn: Callable[[Any], Any], setup: Callable[[], Any], repeat: int) -> List[float]:
+    """Durations of fn(setup()), with setup excluded from the timing."""
+    samples = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        fn(arg)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench(plots: int, repeat: int, seed: int = 0) -> List[Tuple[str, List[float]]]:
+    """Per-step timings of the chain from version 0 on a synthetic save."""
+    text = synthetic_legacy_save(plots, seed)
+    steps = [(f"v{v}.{fn.__name__} ({kind})", kind, fn)
+             for v in range(1, CURRENT_VERSION + 1) for kind, fn in MIGRATORS[v].steps]
+
+    def apply_step(state: SaveState, kind: str, fn: Callable) -> None:
+        if kind == "plot":
+            state["plots"] = [p for p in map(fn, state["plots"]) if p is not None]
+        else:
+            fn(state)
+
+    def state_after(count: int) -> Callable[[], SaveState]:
+        """Setup: a parsed save with plots loaded and the first `count` steps applied."""
+        def setup() -> SaveState:
+            state = SaveState(TresDocument(text))
+            state["plots"]
+            for _, kind, fn in steps[:count]:
+                apply_step(state, kind, fn)
+            return state
+        return setup
+
+    rows: List[Tuple[str, List[float]]] = [
+        ("parse", _timed(TresDocument, lambda: text, repeat)),
+        ("load plots", _timed(lambda s: s["plots"], lambda: SaveState(TresDocument(text)), repeat)),
+    ]
+    # Each step on its own, fed the output of the steps before it
+    for i, (name, kind, fn) in enumerate(steps):
+        rows.append((name, _timed(lambda s, k=kind, f=fn: apply_step(s, k, f), state_after(i), repeat)))
+
+    for kind, runner, names in compile_chain(0).stages:
+        if kind == "plot" and len(names) > 1:
+            rows.append((f"fused plot pass ({len(names)} steps)",
+                         _timed(lambda s, r=runner: r(s["plots"]), state_after(0), repeat)))
+
+    def migrated() -> SaveState:
+        state = SaveState(TresDocument(text))
+        compile_chain(0).run(state)
+        return state
+
+    rows.append(("write (commit + apply)", _timed(lambda s: (s.commit(), s.document.apply()), migrated, repeat)))
+    rows.append(("end to end", _timed(lambda t: migrate(TresDocument(t)).changes, lambda: text, repeat)))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--list", action="store_true", help="List migrators and their steps")
+    parser.add_argument("--bench", action="store_true", help="Time each migration step on a synthetic save")
+    parser.add_argument("--plots", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.bench:
+        print(f"Synthetic v0 save: {args.plots} plots, {len(synthetic_legacy_save(args.plots, args.seed)) / 1e6:.1f} MB, "
+              f"best/median of {args.repeat}")
+        for name, samples in bench(args.plots, args.repeat, args.seed):
+            print(f"  {name:<48} {min(samples) * 1000:9.1f} ms {statistics.median(samples) * 1000:9.1f} ms")
+        return 0
+
+    print(f"Current save_version: {CURRENT_VERSION}")
+    for version in sorted(MIGRATORS):
+        m = MIGRATORS[version]
+        print(f"  v{version - 1} -> v{version}: {m.description}")
+        for kind, fn in m.steps:
+            print(f"    [{kind}] {fn.__name__}: {(fn.__doc__ or '').strip().splitlines()[0] if fn.__doc__ else ''}")
+    for kind, _, names in compile_chain(0).stages:
+        print(f"  stage [{kind}] {' + '.join(names)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,7 +4,7 @@ set -euo pipefail
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="${PROJECT_ROOT:-$(cd "${SCRIPT_DIR}/../.." && pwd)}"
 LOG_DIR="${SCRIPT_DIR}/logs"
-XDG_ROOT="/tmp/spacewheat_godot"
+XDG_ROOT="${XDG_ROOT:-/tmp/spacewheat_godot}"
 source "${SCRIPT_DIR}/lib_qii.sh"
 
 mkdir -p "$LOG_DIR"
@@ -1,26 +1,51 @@
 #!/usr/bin/env python3
 """
-Rig orchestrator - sequentially run turns for Codex-mini play sessions.
+Rig orchestrator - run turn plans for Codex-mini play sessions.
 
 Each turn is defined in turn_plan.json. The orchestrator launches the referenced
 script (usually one of the emoji bash runners), waits for completion, records
 which token logs were produced, and writes a per-turn summary into the rig logs.
+
+Turns form a dependency graph and independent ones run concurrently (up to
+--jobs at a time):
+
+    {"name": "probe", "script": "...", "parallel_group": "qii"}
+    {"name": "vocab", "script": "...", "parallel_group": "qii"}
+    {"name": "report", "script": "...", "depends_on": ["probe", "vocab"], "timeout": 60}
+
+A turn with "depends_on" waits for exactly those turns. Otherwise it waits
+for the stage before it in plan order, where a stage is one turn or a run of
+consecutive turns sharing a "parallel_group" - so a plan without either key
+still runs strictly in order. When a turn fails, every turn that depends on
+it (directly or not) is cancelled; unrelated turns keep running.
+
+Each turn gets its own QII_TOKEN_DIR and Godot user dir (XDG_ROOT), so
+concurrent turns never see each other's token logs or saves; new tokens are
+moved into 🧾/🔖 afterwards. The run ends with a critical-path summary.
+
+Turn output is streamed to the turn's .log as it arrives (--tee also echoes
+it to the console); only the last TAIL_LINES lines are kept for the summary.
 """
 
 import argparse
+import asyncio
 import json
+import os
 import shutil
-import subprocess
+import signal
 import sys
+import tempfile
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-import os
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_PLAN = PROJECT_ROOT / "🍄" / "🎛️" / "🧭📜.json"
 RIG_LOG_DIR = PROJECT_ROOT / "🍄" / "🎛️" / "🧾"
 RIG_TOKEN_DIR = RIG_LOG_DIR / "🔖"
+TAIL_LINES = 40  # Output lines kept in memory per turn for the summary
+READ_CHUNK = 64 * 1024
 
 
 def load_plan(path: Path):
@@ -33,7 +58,134 @@ def load_plan(path: Path):
     return plan
 
 
-def docmd(step, log_dir: Path, timeout_s: int):
+def turn_name(turn):
+    return turn.get("name") or Path(turn.get("script", "unnamed")).stem
+
+
+def build_graph(plan):
+    """{name: [dependency names]} in plan order; raises ValueError on bad plans."""
+    names = [turn_name(turn) for turn in plan]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate turn names: {', '.join(duplicates)}")
+
+    graph = {}
+    previous_stage, stage, stage_group = [], [], None
+    for name, turn in zip(names, plan):
+        group = turn.get("parallel_group")
+        if group is None or group != stage_group:
+            if stage:
+                previous_stage = stage
+            stage, stage_group = [], group
+        stage.append(name)
+        deps = turn.get("depends_on")
+        if deps is None:
+            deps = list(previous_stage)
+        elif isinstance(deps, str):
+            deps = [deps]
+        unknown = [d for d in deps if d not in names]
+        if unknown:
+            raise ValueError(f"Turn {name} depends on unknown turn(s): {', '.join(unknown)}")
+        graph[name] = list(deps)
+
+    # Cycle check (depends_on can point forward)
+    state = {}
+
+    def visit(node, path):
+        if state.get(node) == "done":
+            return
+        if state.get(node) == "active":
+            cycle = path[path.index(node):] + [node]
+            raise ValueError(f"Dependency cycle: {' -> '.join(cycle)}")
+        state[node] = "active"
+        for dep in graph[node]:
+            visit(dep, path + [node])
+        state[node] = "done"
+
+    for name in graph:
+        visit(name, [])
+    return graph
+
+
+def dependents_of(graph, failed):
+    """Every turn that depends on `failed`, directly or transitively."""
+    result, frontier = set(), {failed}
+    while frontier:
+        frontier = {n for n, deps in graph.items() if frontier & set(deps)} - result
+        result |= frontier
+    return result
+
+
+def collect_tokens(token_dir: Path):
+    """Move a turn's token logs into the shared token dir; returns their names."""
+    moved = []
+    if not token_dir.exists():
+        return moved
+    for path in sorted(token_dir.glob("*.tok")):
+        target = RIG_TOKEN_DIR / path.name
+        if target.exists():
+            target = RIG_TOKEN_DIR / f"{path.stem}_{token_dir.parent.name}{path.suffix}"
+        shutil.move(str(path), str(target))
+        moved.append(target.name)
+    return moved
+
+
+def kill_turn(proc):
+    """Kill the turn's whole process group (the script and the Godot it launched)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+class TurnOutput:
+    """Streams a turn's stdout/stderr into its log as it arrives.
+
+    Only the last TAIL_LINES lines stay in memory, so a soak turn that prints
+    hundreds of MB costs no more than a quiet one, and the log can be followed
+    with `tail -f` while the turn runs. stderr lines are marked in the log.
+    """
+
+    def __init__(self, name: str, log_path: Path, tee: bool = False):
+        self.name = name
+        self.tee = tee
+        self.tail = deque(maxlen=TAIL_LINES)
+        self.bytes = 0
+        self._log = log_path.open("w", encoding="utf-8")
+
+    def write_line(self, line: str, stream: str):
+        prefix = "[stderr] " if stream == "stderr" else ""
+        self._log.write(f"{prefix}{line}\n")
+        self.tail.append(f"{prefix}{line}")
+        if self.tee:
+            print(f"[{self.name}] {prefix}{line}", flush=True)
+
+    async def pump(self, reader: asyncio.StreamReader, stream: str):
+        pending = b""
+        while True:
+            chunk = await reader.read(READ_CHUNK)
+            if not chunk:
+                break
+            self.bytes += len(chunk)
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            if len(pending) > READ_CHUNK:  # Don't hold an unterminated line forever
+                lines.append(pending)
+                pending = b""
+            for line in lines:
+                self.write_line(line.decode("utf-8", errors="replace").rstrip("\r"), stream)
+            self._log.flush()
+        if pending:
+            self.write_line(pending.decode("utf-8", errors="replace"), stream)
+
+    def note(self, message: str):
+        self.write_line(f"--- {message} ---", "stdout")
+
+    def close(self):
+        self._log.close()
+
+
+async def docmd(step, log_dir: Path, timeout_s: int, tee: bool = False):
     script = step.get("script")
     if not script:
         raise ValueError("Turn is missing 'script'.")
@@ -41,54 +193,75 @@ def docmd(step, log_dir: Path, timeout_s: int):
     if not script_path.exists():
         raise FileNotFoundError(f"Script {script_path} does not exist.")
 
-    name = step.get("name", script_path.stem)
+    name = turn_name(step)
     ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     output_log = log_dir / f"{name}_{ts}.log"
     summary_log = log_dir / f"{name}_{ts}.json"
+    timeout_s = step.get("timeout", timeout_s)
 
-    before_tokens = {p.name for p in RIG_TOKEN_DIR.glob("*.tok")}
+    # Private token and Godot user dirs for this turn
+    work_dir = Path(tempfile.mkdtemp(prefix=f"rig_{name}_"))
+    token_dir = work_dir / "🔖"
+    token_dir.mkdir()
 
     cmd = ["bash", str(script_path)]
     start = time.time()
     env = os.environ.copy()
     env["PROJECT_ROOT"] = str(PROJECT_ROOT)
-    env["QII_TOKEN_DIR"] = str(RIG_TOKEN_DIR)
+    env["QII_TOKEN_DIR"] = str(token_dir)
+    env["XDG_ROOT"] = str(work_dir / "godot")
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=PROJECT_ROOT,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        start_new_session=True,
+    )
+    output = TurnOutput(name, output_log, tee)
+    pumps = asyncio.gather(output.pump(proc.stdout, "stdout"), output.pump(proc.stderr, "stderr"))
+    timed_out = False
     try:
-        proc = subprocess.run(
-            cmd,
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            text=True,
-            env=env,
-            timeout=timeout_s,
-        )
-        duration = time.time() - start
-        stdout = proc.stdout
-        stderr = proc.stderr
+        await asyncio.wait_for(proc.wait(), timeout=timeout_s)
         returncode = proc.returncode
-    except subprocess.TimeoutExpired as exc:
-        duration = time.time() - start
-        stdout = exc.stdout or ""
-        stderr = exc.stderr or ""
+    except asyncio.TimeoutError:
+        timed_out = True
+        kill_turn(proc)
+        await proc.wait()
         returncode = 124
+    except asyncio.CancelledError:
+        kill_turn(proc)
+        await proc.wait()
+        raise
+    finally:
+        # Pipes reach EOF once the script and anything it spawned have exited
+        try:
+            await asyncio.wait_for(pumps, timeout=5)
+        except asyncio.TimeoutError:
+            output.note("output still open after exit; log truncated")
+        if timed_out:
+            output.note(f"TIMEOUT after {timeout_s}s; killed")
+        output.close()
+    duration = time.time() - start
 
-    with output_log.open("w", encoding="utf-8") as outf:
-        outf.write(stdout)
-        outf.write("\n--- STDERR ---\n")
-        outf.write(stderr)
-
-    after_tokens = {p.name for p in RIG_TOKEN_DIR.glob("*.tok")}
-    new_tokens = sorted(list(after_tokens - before_tokens))
+    new_tokens = collect_tokens(token_dir)
+    shutil.rmtree(work_dir, ignore_errors=True)
 
     summary = {
         "name": name,
         "description": step.get("description", ""),
         "command": " ".join(cmd),
         "returncode": returncode,
+        "timed_out": timed_out,
         "start": datetime.utcfromtimestamp(start).isoformat(),
         "duration_seconds": round(duration, 3),
         "token_logs": new_tokens,
-        "output_log": str(output_log.relative_to(PROJECT_ROOT)),
+        "output_log": os.path.relpath(output_log, PROJECT_ROOT),
+        "output_bytes": output.bytes,
+        "output_tail": list(output.tail),
+        "depends_on": step.get("depends_on"),
+        "parallel_group": step.get("parallel_group"),
     }
 
     with summary_log.open("w", encoding="utf-8") as f:
@@ -97,6 +270,105 @@ def docmd(step, log_dir: Path, timeout_s: int):
     return summary, returncode
 
 
+async def run_plan(plan, log_dir: Path, timeout_s: int, jobs: int, on_turn_done=None, tee=False):
+    """Run the plan's DAG; returns {name: result} with status ok/failed/cancelled/skipped."""
+    graph = build_graph(plan)
+    turns = {turn_name(turn): turn for turn in plan}
+    results = {}
+    pending = dict(graph)
+    running = {}
+    limit = asyncio.Semaphore(max(1, jobs))
+    origin = time.monotonic()
+    stopping = False
+
+    async def run_one(name):
+        async with limit:
+            started = time.monotonic() - origin
+            print(f"--> Turn {name} started (+{started:.1f}s)")
+            try:
+                summary, rc = await docmd(turns[name], log_dir, timeout_s, tee)
+            except (OSError, ValueError) as e:
+                summary, rc = {"name": name, "error": str(e), "duration_seconds": 0.0, "token_logs": []}, 1
+            return summary, rc, started
+
+    while pending or running:
+        if not stopping:
+            for name in [n for n, deps in pending.items() if all(results.get(d, {}).get("status") == "ok" for d in deps)]:
+                del pending[name]
+                running[asyncio.create_task(run_one(name))] = name
+        if not running:
+            break  # Everything left is blocked or we were asked to stop
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            name = running.pop(task)
+            summary, rc, started = task.result()
+            status = "ok" if rc == 0 else "failed"
+            results[name] = {"status": status, "returncode": rc, "started": round(started, 3),
+                             "duration": summary.get("duration_seconds", 0.0), "summary": summary}
+            print(f"    {name}: duration {summary.get('duration_seconds')}s returncode={rc}")
+            if summary.get("token_logs"):
+                print(f"    tokens: {summary['token_logs']}")
+            if summary.get("error"):
+                print(f"    error: {summary['error']}")
+            if status == "failed":
+                print(f"    !!!! Turn {name} failed (rc={rc})")
+                if not tee:
+                    for line in summary.get("output_tail", [])[-10:]:
+                        print(f"    | {line}")
+                for dependent in sorted(dependents_of(graph, name)):
+                    if dependent in pending:
+                        del pending[dependent]
+                        results[dependent] = {"status": "cancelled", "reason": f"{name} failed"}
+                        print(f"    cancelled {dependent} (depends on {name})")
+            elif on_turn_done is not None and not stopping and pending:
+                stopping = not await on_turn_done(name)
+
+    for name in pending:
+        results[name] = {"status": "skipped", "reason": "stopped before it was ready"}
+    return graph, results, time.monotonic() - origin
+
+
+def critical_path(graph, results):
+    """Longest chain of finished turns by duration: (path, seconds)."""
+    finish, via = {}, {}
+
+    def longest(name):
+        if name not in finish:
+            deps = [d for d in graph[name] if "duration" in results.get(d, {})]
+            best = max(deps, key=longest, default=None)
+            via[name] = best
+            finish[name] = results[name]["duration"] + (longest(best) if best else 0.0)
+        return finish[name]
+
+    ran = [n for n in graph if "duration" in results.get(n, {})]
+    if not ran:
+        return [], 0.0
+    end = max(ran, key=longest)
+    path = [end]
+    while via[path[-1]]:
+        path.append(via[path[-1]])
+    return path[::-1], finish[end]
+
+
+def print_timing(graph, results, wall):
+    serial = sum(r.get("duration", 0.0) for r in results.values())
+    path, length = critical_path(graph, results)
+    counts = {}
+    for r in results.values():
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+
+    print("\n=== Turn plan timing ===")
+    print(f"  wall time:      {wall:.1f}s")
+    print(f"  turn time sum:  {serial:.1f}s" + (f" ({serial / wall:.2f}x parallel)" if wall > 0 else ""))
+    print(f"  critical path:  {length:.1f}s")
+    for name in path:
+        r = results[name]
+        print(f"    {name:<32} {r['duration']:7.1f}s  (started +{r['started']:.1f}s)")
+    print("  " + ", ".join(f"{k}: {v}" for k, v in sorted(counts.items())))
+    return {"wall_seconds": round(wall, 3), "turn_seconds": round(serial, 3),
+            "critical_path": path, "critical_path_seconds": round(length, 3), "counts": counts}
+
+
 def ensure_dirs(log_dir: Path):
     log_dir.mkdir(parents=True, exist_ok=True)
     RIG_TOKEN_DIR.mkdir(parents=True, exist_ok=True)
@@ -120,7 +392,18 @@ def main():
         "--timeout",
         type=int,
         default=300,
-        help="Timeout per turn in seconds (default 300)",
+        help="Default timeout per turn in seconds (default 300; a turn's \"timeout\" overrides it)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Turns allowed to run at once (default: CPU count, at most 4)",
+    )
+    parser.add_argument(
+        "--tee",
+        action="store_true",
+        help="Echo each turn's output to the console as it runs (lines prefixed with the turn name)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Only print the plan")
     parser.add_argument(
@@ -131,11 +414,15 @@ def main():
     args = parser.parse_args()
 
     plan = load_plan(args.plan)
+    graph = build_graph(plan)
     ensure_dirs(args.log_dir)
 
     if args.dry_run:
         for idx, turn in enumerate(plan, start=1):
-            print(f"Turn {idx}: {turn.get('name')} -> {turn.get('script')}")
+            name = turn_name(turn)
+            after = f" (after: {', '.join(graph[name])})" if graph[name] else ""
+            group = f" [group {turn['parallel_group']}]" if turn.get("parallel_group") else ""
+            print(f"Turn {idx}: {name} -> {turn.get('script')}{group}{after}")
         return
 
     print("Rig mode: QA playtesters. Please look for bugs or performance issues.")
@@ -149,20 +436,24 @@ def main():
             return default_yes
         return raw in ("y", "yes")
 
+    async def after_turn(name):
+        return await asyncio.to_thread(prompt_continue, "Continue to next turn?")
+
     while True:
-        for idx, turn in enumerate(plan, start=1):
-            print(f"--> Turn {idx}/{len(plan)}: {turn.get('name', 'unnamed')}")
-            summary, rc = docmd(turn, args.log_dir, args.timeout)
-            print(f"    cmd: {summary['command']}")
-            print(f"    duration: {summary['duration_seconds']}s returncode={rc}")
-            if summary["token_logs"]:
-                print(f"    tokens: {summary['token_logs']}")
-            if rc != 0:
-                print(f"    !!!! Turn {turn.get('name')} failed (rc={rc})")
-                sys.exit(rc)
+        graph, results, wall = asyncio.run(
+            run_plan(plan, args.log_dir, args.timeout, args.jobs,
+                     None if args.no_interactive else after_turn, args.tee))
+        timing = print_timing(graph, results, wall)
+
+        run_log = args.log_dir / f"run_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
+        with run_log.open("w", encoding="utf-8") as f:
+            json.dump({"jobs": args.jobs, "timing": timing,
+                       "turns": {n: {k: v for k, v in r.items() if k != "summary"} for n, r in results.items()}},
+                      f, indent=2, ensure_ascii=False)
 
-            if not prompt_continue("Continue to next turn?"):
-                return
+        failed = [r["returncode"] for r in results.values() if r["status"] == "failed"]
+        if failed:
+            sys.exit(failed[0])
 
         if args.no_interactive:
             return